@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark merging a directory of UPF fragments (UPFParser.parse_directory).
+
+Writes directories of generated v1 fragments of increasing size and reports
+the time spent parsing the files and merging them. Merging is a single pass,
+so its time per fragment should stay flat as the directory grows.
+
+Usage:
+    python scripts/benchmark_merge.py [--fragments 100 200 400 800] [--rules 20]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import yaml
+
+from promptrek.core.parser import UPFParser, _PromptMerger
+
+
+def write_fragments(directory: Path, count: int, rules: int) -> None:
+    """Write count fragments with the given number of rules each."""
+    for i in range(count):
+        data = {
+            "schema_version": "1.0.0",
+            "metadata": {
+                "title": f"Fragment {i}",
+                "description": f"Generated fragment {i}",
+            },
+            "targets": ["claude", "cursor", "copilot"][: i % 3 + 1],
+            "context": {
+                "project_type": "library",
+                "technologies": ["python", f"package-{i % 50}"],
+            },
+            "instructions": {
+                "general": [f"Fragment {i} rule {n}" for n in range(rules)],
+                "testing": [f"Fragment {i} test rule"],
+            },
+            "examples": {f"example_{i}": f"print({i})"},
+            "variables": {f"VAR_{i}": str(i)},
+        }
+        path = directory / f"fragment-{i:05d}.promptrek.yaml"
+        path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def benchmark(count: int, rules: int) -> None:
+    """Time parsing and merging a directory of fragments."""
+    parser = UPFParser()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        write_fragments(directory, count, rules)
+        files = sorted(parser.find_upf_files(directory))
+
+        start = time.perf_counter()
+        prompts = [parser.parse_file(path) for path in files]
+        parsed = time.perf_counter()
+
+        merger = _PromptMerger()
+        for prompt in prompts:
+            merger.add(prompt)
+        merged = merger.result()
+        end = time.perf_counter()
+
+    general = merged.instructions.general if merged.instructions else None
+    assert general is not None and len(general) == count * rules
+    merge_ms = (end - parsed) * 1000
+    print(
+        f"{count:>9} {(parsed - start) * 1000:>10.1f} {merge_ms:>10.1f} "
+        f"{merge_ms * 1000 / count:>14.1f}"
+    )
+
+
+def main(argv: List[str]) -> int:
+    """Run the benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    arg_parser.add_argument(
+        "--fragments",
+        type=int,
+        nargs="+",
+        default=[100, 200, 400, 800],
+        help="Directory sizes to benchmark",
+    )
+    arg_parser.add_argument(
+        "--rules", type=int, default=20, help="General rules per fragment"
+    )
+    args = arg_parser.parse_args(argv)
+
+    print(f"{'fragments':>9} {'parse ms':>10} {'merge ms':>10} {'merge us/file':>14}")
+    for count in args.fragments:
+        benchmark(count, args.rules)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -7,16 +7,45 @@ A universal AI Editor prompt storage solution that allows developers to:
 3. Support multiple AI editors and tools with different prompt formats
 """
 
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__version__ = importlib.metadata.version("promptrek")
+if TYPE_CHECKING:
+    from .api import generate, render
+    from .core.models import UniversalPrompt
+    from .core.parser import UPFParser
+    from .core.validator import UPFValidator
 
-from .core.models import UniversalPrompt
-from .core.parser import UPFParser
-from .core.validator import UPFValidator
+# Public names (and __version__) are resolved on first access so light entry
+# points such as the daemon client don't pay for loading pydantic models.
+_LAZY_ATTRIBUTES = {
+    "UniversalPrompt": ".core.models",
+    "UPFParser": ".core.parser",
+    "UPFValidator": ".core.validator",
+    "generate": ".api",
+    "render": ".api",
+}
 
 __all__ = [
     "UniversalPrompt",
     "UPFParser",
     "UPFValidator",
+    "generate",
+    "render",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        package_version = version("promptrek")
+        globals()["__version__"] = package_version
+        return package_version
+
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
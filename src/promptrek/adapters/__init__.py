@@ -1,117 +1,267 @@
-"""Editor adapters for PromptTrek."""
+"""
+Editor adapters for PromptTrek.
+
+Adapter classes are registered by reference and imported on first use, so
+listing editors or checking generated files does not load adapter code.
+"""
+
+from typing import Any
 
-from .amazon_q import AmazonQAdapter
 from .base import EditorAdapter
-from .claude import ClaudeAdapter
-from .cline import ClineAdapter
-from .continue_adapter import ContinueAdapter
-from .copilot import CopilotAdapter
-from .cursor import CursorAdapter
-from .jetbrains import JetBrainsAdapter
-from .kiro import KiroAdapter
-from .registry import AdapterCapability, AdapterRegistry, registry
-from .windsurf import WindsurfAdapter
-
-# Register built-in adapters with their capabilities
+from .registry import (
+    AdapterCapability,
+    AdapterDescriptor,
+    AdapterRegistry,
+    registry,
+)
+
+# Adapter classes exported by this package, imported on first access
+_ADAPTER_CLASSES = {
+    "AmazonQAdapter": "promptrek.adapters.amazon_q:AmazonQAdapter",
+    "ClaudeAdapter": "promptrek.adapters.claude:ClaudeAdapter",
+    "ClineAdapter": "promptrek.adapters.cline:ClineAdapter",
+    "ContinueAdapter": "promptrek.adapters.continue_adapter:ContinueAdapter",
+    "CopilotAdapter": "promptrek.adapters.copilot:CopilotAdapter",
+    "CursorAdapter": "promptrek.adapters.cursor:CursorAdapter",
+    "JetBrainsAdapter": "promptrek.adapters.jetbrains:JetBrainsAdapter",
+    "KiroAdapter": "promptrek.adapters.kiro:KiroAdapter",
+    "WindsurfAdapter": "promptrek.adapters.windsurf:WindsurfAdapter",
+}
+
+# Register built-in adapters with their capabilities and descriptors
 
 # Tools that generate project-level configuration files
-registry.register_class(
+registry.register_lazy(
     "copilot",
-    CopilotAdapter,
+    _ADAPTER_CLASSES["CopilotAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        merged=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".github/copilot-instructions.md",
+            ".github/instructions/{name}.instructions.md",
+            ".github/prompts/{name}.prompt.md",
+            ".vscode/mcp.json",
+        ],
+        context_paths=[".github/copilot-instructions.md"],
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "cursor",
-    CursorAdapter,
+    _ADAPTER_CLASSES["CursorAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        merged=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".cursor/rules/index.mdc",
+            ".cursor/rules/{name}.mdc",
+            ".cursor/mcp-servers.json",
+            ".cursor/agent-schemas/{name}.json",
+            ".cursor/agent-functions/{name}.json",
+            "AGENTS.md",
+        ],
+        context_paths=[
+            ".cursor/rules/index.mdc",
+            ".cursor/rules/{name}.mdc",
+            "AGENTS.md",
+        ],
+        max_file_lines=500,
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "continue",
-    ContinueAdapter,
+    _ADAPTER_CLASSES["ContinueAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".continue/config.yaml",
+            ".continue/rules/general.md",
+            ".continue/rules/{name}.md",
+            ".continue/prompts/{name}.md",
+            ".continue/mcpServers/{name}.yaml",
+        ],
+        context_paths=[
+            ".continue/rules/general.md",
+            ".continue/rules/{name}.md",
+        ],
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "claude",
-    ClaudeAdapter,
+    _ADAPTER_CLASSES["ClaudeAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
         AdapterCapability.MULTIPLE_FILE_GENERATION,
     ],
+    AdapterDescriptor(
+        headless=True,
+        multiple=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".claude/CLAUDE.md",
+            ".claude/commands/{name}.md",
+            ".claude/agents/{name}.md",
+            ".claude/settings.local.json",
+            ".claude/hooks.yaml",
+            ".mcp.json",
+        ],
+        context_paths=[".claude/CLAUDE.md"],
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "cline",
-    ClineAdapter,
+    _ADAPTER_CLASSES["ClineAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="user",
+        output_paths=[
+            ".clinerules/default-rules.md",
+            ".clinerules/{name}.md",
+            ".clinerules/workflows/{name}.md",
+        ],
+        context_paths=[
+            ".clinerules/default-rules.md",
+            ".clinerules/{name}.md",
+        ],
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "kiro",
-    KiroAdapter,
+    _ADAPTER_CLASSES["KiroAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".kiro/steering/project.md",
+            ".kiro/steering/{name}.md",
+            ".kiro/settings/mcp.json",
+        ],
+        context_paths=[
+            ".kiro/steering/project.md",
+            ".kiro/steering/{name}.md",
+        ],
+        max_file_lines=500,
+    ),
 )
 
 # Tools that only support global configuration (don't generate project files)
-registry.register_class(
+registry.register_lazy(
     "amazon-q",
-    AmazonQAdapter,
+    _ADAPTER_CLASSES["AmazonQAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="project",
+        output_paths=[
+            ".amazonq/rules/{name}.md",
+            ".amazonq/prompts/{name}.md",
+            ".amazonq/cli-agents/{name}.json",
+            ".amazonq/mcp.json",
+        ],
+        context_paths=[".amazonq/rules/{name}.md"],
+    ),
 )
 
-registry.register_class(
+registry.register_lazy(
     "jetbrains",
-    JetBrainsAdapter,
+    _ADAPTER_CLASSES["JetBrainsAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        output_paths=[".assistant/rules/{name}.md"],
+        context_paths=[".assistant/rules/{name}.md"],
+    ),
 )
 
 # Windsurf - generates project-level rules files
-registry.register_class(
+registry.register_lazy(
     "windsurf",
-    WindsurfAdapter,
+    _ADAPTER_CLASSES["WindsurfAdapter"],
     [
         AdapterCapability.GENERATES_PROJECT_FILES,
         AdapterCapability.SUPPORTS_VARIABLES,
         AdapterCapability.SUPPORTS_CONDITIONALS,
     ],
+    AdapterDescriptor(
+        headless=True,
+        sync=True,
+        plugins=True,
+        mcp_scope="user",
+        output_paths=[
+            ".windsurf/rules/general.md",
+            ".windsurf/rules/{name}.md",
+        ],
+        context_paths=[
+            ".windsurf/rules/general.md",
+            ".windsurf/rules/{name}.md",
+        ],
+        max_file_chars=6000,
+    ),
 )
 
 __all__ = [
     "EditorAdapter",
     "AdapterRegistry",
     "AdapterCapability",
+    "AdapterDescriptor",
     "registry",
     "CopilotAdapter",
     "CursorAdapter",
@@ -123,3 +273,18 @@ __all__ = [
     "AmazonQAdapter",
     "JetBrainsAdapter",
 ]
+
+
+# Third-party adapters installed through entry points, found on first use
+registry.discover_on_use()
+
+
+def __getattr__(name: str) -> Any:
+    """Import adapter classes on first access."""
+    if name in _ADAPTER_CLASSES:
+        from .discovery import import_reference
+
+        adapter_class = import_reference(_ADAPTER_CLASSES[name])
+        globals()[name] = adapter_class
+        return adapter_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,15 @@
 Amazon Q adapter implementation.
 """
 
+import fnmatch
 import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from ..utils.outputs import echo, ensure_directory, write_generated_file
+from ..utils.tokens import estimate_tokens
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
 from .sync_mixin import MarkdownSyncMixin
@@ -17,6 +18,9 @@ from .sync_mixin import MarkdownSyncMixin
 # Maximum number of instructions to include in agent configuration
 MAX_AGENT_INSTRUCTIONS = 3
 
+# Estimated tokens of rules an agent may load before generation warns
+AGENT_RESOURCE_BUDGET = 8000
+
 
 class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
     """Adapter for Amazon Q AI assistant."""
@@ -103,60 +107,48 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         rules_dir = output_dir / ".amazonq" / "rules"
         created_files = []
 
-        # If documents field is present, generate separate rule files
-        if prompt.documents:
-            for doc in prompt.documents:
-                # Apply variable substitution
-                content = doc.content
-                if variables:
-                    for var_name, var_value in variables.items():
-                        placeholder = "{{{ " + var_name + " }}}"
-                        content = content.replace(placeholder, var_value)
-
-                # Generate filename from document name
-                filename = (
-                    f"{doc.name}.md" if not doc.name.endswith(".md") else doc.name
+        for name, content in self._rule_documents(prompt, variables).items():
+            created_files.extend(
+                self.write_rule_file(
+                    rules_dir / f"{name}.md", content, dry_run, verbose
                 )
-                output_file = rules_dir / filename
+            )
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
-                    if verbose:
-                        preview = (
-                            content[:200] + "..." if len(content) > 200 else content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(output_file)
-                else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {output_file}")
-                    created_files.append(output_file)
+        return created_files
+
+    def _rule_documents(
+        self,
+        prompt: Union[UniversalPromptV2, UniversalPromptV3],
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """
+        Get the rule files generated from a v2/v3 prompt.
+
+        Args:
+            prompt: The universal prompt
+            variables: Variables to substitute
+
+        Returns:
+            Rule file name (without .md) mapped to its content: one file per
+            document, or general.md with the main content if there are none
+        """
+        if prompt.documents:
+            sources = [
+                (doc.name[:-3] if doc.name.endswith(".md") else doc.name, doc.content)
+                for doc in prompt.documents
+            ]
         else:
-            # No documents, use main content as general.md
-            content = prompt.content
+            sources = [("general", prompt.content)]
+
+        rules = {}
+        for name, content in sources:
+            # Apply variable substitution
             if variables:
                 for var_name, var_value in variables.items():
                     placeholder = "{{{ " + var_name + " }}}"
                     content = content.replace(placeholder, var_value)
-
-            output_file = rules_dir / "general.md"
-
-            if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
-                if verbose:
-                    preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
-                created_files.append(output_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
-                created_files.append(output_file)
-
-        return created_files
+            rules[name] = content
+        return rules
 
     def _generate_plugins(
         self,
@@ -219,6 +211,7 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 dry_run,
                 verbose,
                 variables,
+                rules=self._rule_documents(prompt, variables),
             )
             created_files.extend(agent_files)
         elif hooks:
@@ -260,7 +253,7 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             if existing_config:
                 # Merge with existing config
                 if verbose:
-                    click.echo("  ℹ️  Merging MCP servers with existing Amazon Q config")
+                    echo("  ℹ️  Merging MCP servers with existing Amazon Q config")
                 merged_config = self.merge_mcp_config(
                     existing_config, mcp_config, format_style="standard"
                 )
@@ -327,15 +320,15 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             output_file = prompts_dir / f"{cmd.name}.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
                     preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(output_file)
             else:
-                prompts_dir.mkdir(parents=True, exist_ok=True)
-                output_file.write_text(content, encoding="utf-8")
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(prompts_dir)
+                write_generated_file(output_file, content)
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
@@ -393,6 +386,7 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         dry_run: bool,
         verbose: bool,
         variables: Optional[Dict[str, Any]] = None,
+        rules: Optional[Dict[str, str]] = None,
     ) -> List[Path]:
         """Generate .amazonq/cli-agents/*.json from v3 agents field."""
         agents_dir = output_dir / ".amazonq" / "cli-agents"
@@ -413,7 +407,7 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             # Add resources pointing to rules (using relative path from agent config location)
             # Agent configs are in .amazonq/cli-agents/, rules are in .amazonq/rules/
             # So we need to go up one level: ../rules/**/*.md
-            agent_config["resources"] = ["file://../rules/**/*.md"]
+            agent_config["resources"] = self._agent_resources(agent, rules or {})
 
             # Inject hooks scoped to this agent
             if hooks:
@@ -433,21 +427,58 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             output_file = agents_dir / f"{agent.name}.json"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
                     preview = json.dumps(agent_config, indent=2)[:200]
-                    click.echo(f"    {preview}...")
+                    echo(f"    {preview}...")
                 created_files.append(output_file)
             else:
-                agents_dir.mkdir(parents=True, exist_ok=True)
-                output_file.write_text(
-                    json.dumps(agent_config, indent=2), encoding="utf-8"
-                )
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(agents_dir)
+                write_generated_file(output_file, json.dumps(agent_config, indent=2))
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
 
+    def _agent_resources(self, agent: Any, rules: Dict[str, str]) -> List[str]:
+        """
+        Resolve the rule files an agent loads, warning if they exceed its budget.
+
+        Args:
+            agent: Agent configuration
+            rules: Generated rule files (name without .md mapped to content)
+
+        Returns:
+            Amazon Q resource URIs, relative to the agent configuration
+        """
+        if agent.resources is None:
+            names = list(rules)
+            resources = ["file://../rules/**/*.md"]
+        else:
+            names = []
+            for pattern in agent.resources:
+                name = pattern[:-3] if pattern.endswith(".md") else pattern
+                matches = [rule for rule in rules if fnmatch.fnmatchcase(rule, name)]
+                if not matches:
+                    echo(
+                        f"⚠️  Agent '{agent.name}' lists resource '{pattern}', "
+                        "which matches no rule document",
+                        err=True,
+                    )
+                names.extend(rule for rule in matches if rule not in names)
+            resources = [f"file://../rules/{name}.md" for name in names]
+
+        budget = agent.max_resource_tokens or AGENT_RESOURCE_BUDGET
+        tokens = sum(estimate_tokens(rules[name]) for name in names)
+        if tokens > budget:
+            echo(
+                f"⚠️  Agent '{agent.name}' loads ~{tokens:,} tokens of rules "
+                f"(budget: {budget:,}); list only the documents it needs in "
+                "its 'resources'",
+                err=True,
+            )
+        return resources
+
     def _generate_default_agent_with_hooks(
         self,
         hooks: list,
@@ -491,17 +522,15 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         output_file = agents_dir / "default.json"
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file}")
+            echo(f"  📁 Would create: {output_file}")
             if verbose:
                 preview = json.dumps(default_agent, indent=2)[:200]
-                click.echo(f"    {preview}...")
+                echo(f"    {preview}...")
             return [output_file]
         else:
-            agents_dir.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(
-                json.dumps(default_agent, indent=2), encoding="utf-8"
-            )
-            click.echo(f"✅ Generated: {output_file}")
+            ensure_directory(agents_dir)
+            write_generated_file(output_file, json.dumps(default_agent, indent=2))
+            echo(f"✅ Generated: {output_file}")
             return [output_file]
 
     def _generate_rules_system(
@@ -538,20 +567,19 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {general_file}")
+                echo(f"  📁 Would create: {general_file}")
                 if verbose:
                     preview = (
                         general_content[:200] + "..."
                         if len(general_content) > 200
                         else general_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(general_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(general_file, "w", encoding="utf-8") as f:
-                    f.write(general_content)
-                click.echo(f"✅ Generated: {general_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(general_file, general_content)
+                echo(f"✅ Generated: {general_file}")
                 created_files.append(general_file)
 
         # Generate code style rules
@@ -566,20 +594,19 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {style_file}")
+                echo(f"  📁 Would create: {style_file}")
                 if verbose:
                     preview = (
                         style_content[:200] + "..."
                         if len(style_content) > 200
                         else style_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(style_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(style_file, "w", encoding="utf-8") as f:
-                    f.write(style_content)
-                click.echo(f"✅ Generated: {style_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(style_file, style_content)
+                echo(f"✅ Generated: {style_file}")
                 created_files.append(style_file)
 
         # Generate testing rules
@@ -594,20 +621,19 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {testing_file}")
+                echo(f"  📁 Would create: {testing_file}")
                 if verbose:
                     preview = (
                         testing_content[:200] + "..."
                         if len(testing_content) > 200
                         else testing_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(testing_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(testing_file, "w", encoding="utf-8") as f:
-                    f.write(testing_content)
-                click.echo(f"✅ Generated: {testing_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(testing_file, testing_content)
+                echo(f"✅ Generated: {testing_file}")
                 created_files.append(testing_file)
 
         # Generate security rules if defined
@@ -622,20 +648,19 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {security_file}")
+                echo(f"  📁 Would create: {security_file}")
                 if verbose:
                     preview = (
                         security_content[:200] + "..."
                         if len(security_content) > 200
                         else security_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(security_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(security_file, "w", encoding="utf-8") as f:
-                    f.write(security_content)
-                click.echo(f"✅ Generated: {security_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(security_file, security_content)
+                echo(f"✅ Generated: {security_file}")
                 created_files.append(security_file)
 
         # Generate technology-specific rules
@@ -649,20 +674,19 @@ class AmazonQAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 tech_content = self._build_tech_rules_content(tech, prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
+                    echo(f"  📁 Would create: {tech_file}")
                     if verbose:
                         preview = (
                             tech_content[:200] + "..."
                             if len(tech_content) > 200
                             else tech_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(tech_file)
                 else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
+                    ensure_directory(rules_dir)
+                    write_generated_file(tech_file, tech_content)
+                    echo(f"✅ Generated: {tech_file}")
                     created_files.append(tech_file)
 
         return created_files
@@ -6,9 +6,11 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from ..core.exceptions import ValidationError
+from ..core.exceptions import AdapterNotFoundError, ValidationError
 from ..core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
 from ..utils import ConditionalProcessor, VariableSubstitution
+from ..utils.outputs import echo, ensure_directory, write_generated_file
+from ..utils.splitter import part_path, split_content
 
 
 class EditorAdapter(ABC):
@@ -177,6 +179,68 @@ class EditorAdapter(ABC):
 
         return self._conditional_processor.process_conditions(prompt, eval_variables)
 
+    def split_rule_file(self, path: Path, content: str) -> List[Tuple[Path, str]]:
+        """
+        Split a rule file that exceeds the editor's declared size limits.
+
+        Args:
+            path: Path of the rule file
+            content: Content of the rule file
+
+        Returns:
+            (path, content) of each file to write: the file itself if it is
+            within the limits, otherwise its numbered parts
+        """
+        from .registry import registry
+
+        try:
+            descriptor = registry.get_descriptor(self.name)
+        except AdapterNotFoundError:
+            return [(path, content)]
+
+        parts = split_content(
+            content, descriptor.max_file_chars, descriptor.max_file_lines
+        )
+        if len(parts) == 1:
+            return [(path, content)]
+        return [
+            (part_path(path, number), part)
+            for number, part in enumerate(parts, start=1)
+        ]
+
+    def write_rule_file(
+        self, path: Path, content: str, dry_run: bool, verbose: bool
+    ) -> List[Path]:
+        """
+        Write a rule file, split into numbered parts if it is too large.
+
+        Args:
+            path: Path of the rule file
+            content: Content of the rule file
+            dry_run: If True, only show what would be created
+            verbose: Show a preview of each file in a dry run
+
+        Returns:
+            Paths of the files created (or that would be created)
+        """
+        created_files = []
+        for part_file, part_content in self.split_rule_file(path, content):
+            if dry_run:
+                echo(f"  📁 Would create: {part_file}")
+                if verbose:
+                    preview = (
+                        part_content[:200] + "..."
+                        if len(part_content) > 200
+                        else part_content
+                    )
+                    echo(f"    {preview}")
+            else:
+                ensure_directory(part_file.parent)
+                write_generated_file(part_file, part_content)
+                echo(f"✅ Generated: {part_file}")
+            created_files.append(part_file)
+        return created_files
+
     def generate_multiple(
         self,
         prompt_files: List[
@@ -7,13 +7,19 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import click
 import yaml
 
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import Agent, UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from ..utils.markdown import parse_frontmatter, split_frontmatter
+from ..utils.outputs import (
+    echo,
+    ensure_directory,
+    update_generated_file,
+    write_generated_file,
+)
 from .base import EditorAdapter
-from .sync_mixin import SingleFileMarkdownSyncMixin
+from .sync_mixin import SingleFileMarkdownSyncMixin, is_unchanged_file
 
 
 class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
@@ -22,6 +28,9 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
     _description = "Claude Code (context-based)"
     _file_patterns = [".claude/CLAUDE.md", "CLAUDE.md", ".claude-context.md"]
 
+    # settings.local.json key listing the hooks written by promptrek
+    GENERATED_HOOKS_KEY = "promptrekGeneratedHooks"
+
     def __init__(self) -> None:
         super().__init__(
             name="claude",
@@ -70,17 +79,16 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
             content = self._build_content(processed_prompt, conditional_content)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file}")
+            echo(f"  📁 Would create: {output_file}")
             if verbose:
-                click.echo("  📄 Content preview:")
+                echo("  📄 Content preview:")
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
             # Create directory and file
-            claude_dir.mkdir(exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file}")
+            ensure_directory(claude_dir)
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file}")
 
         generated_files = [output_file]
 
@@ -121,7 +129,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
             # Only support v1 prompts in generate_multiple (for now)
             # V2/V3 prompts should use the main generate() method
             if isinstance(prompt, (UniversalPromptV2, UniversalPromptV3)):
-                click.echo(
+                echo(
                     f"⚠️  Skipping v2/v3 prompt from {source_file} (use generate() instead)"
                 )
                 continue
@@ -148,17 +156,16 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
             output_file = claude_dir / f"{base_name}.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
-                    click.echo("  📄 Content preview:")
+                    echo("  📄 Content preview:")
                     preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
             else:
                 # Create directory and file
-                claude_dir.mkdir(exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(claude_dir)
+                write_generated_file(output_file, content)
+                echo(f"✅ Generated: {output_file}")
 
             generated_files.append(output_file)
 
@@ -271,6 +278,8 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
 
         agents = []
         for agent_file in agents_dir.glob("*.md"):
+            if is_unchanged_file(agent_file):
+                continue
             try:
                 with open(agent_file, "r", encoding="utf-8") as f:
                     content = f.read()
@@ -402,7 +411,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                 agents.append(agent)
 
             except Exception as e:
-                click.echo(f"⚠️  Error parsing agent file {agent_file}: {e}")
+                echo(f"⚠️  Error parsing agent file {agent_file}: {e}")
 
         return agents if agents else None
 
@@ -416,6 +425,8 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
 
         commands = []
         for command_file in commands_dir.glob("*.md"):
+            if is_unchanged_file(command_file):
+                continue
             try:
                 with open(command_file, "r", encoding="utf-8") as f:
                     content = f.read()
@@ -506,7 +517,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                 commands.append(command)
 
             except Exception as e:
-                click.echo(f"⚠️  Error parsing command file {command_file}: {e}")
+                echo(f"⚠️  Error parsing command file {command_file}: {e}")
 
         return commands if commands else None
 
@@ -538,7 +549,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                     return hooks if hooks else None
 
             except Exception as e:
-                click.echo(f"⚠️  Error parsing hooks.yaml file: {e}")
+                echo(f"⚠️  Error parsing hooks.yaml file: {e}")
 
         # Try settings.local.json (Claude Code native format)
         settings_file = source_dir / ".claude" / "settings.local.json"
@@ -584,7 +595,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                 return hooks if hooks else None
 
             except Exception as e:
-                click.echo(f"⚠️  Error parsing settings.local.json hooks: {e}")
+                echo(f"⚠️  Error parsing settings.local.json hooks: {e}")
                 return None
 
         return None
@@ -619,7 +630,7 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
             return servers if servers else None
 
         except Exception as e:
-            click.echo(f"⚠️  Error parsing MCP config file: {e}")
+            echo(f"⚠️  Error parsing MCP config file: {e}")
             return None
 
     def _extract_frontmatter_from_content(
@@ -633,70 +644,18 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
         Returns:
             Tuple of (frontmatter_dict, remaining_content)
         """
-        if not content.startswith("---"):
-            return None, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+        frontmatter_text, remaining = split_frontmatter(content)
+        if frontmatter_text is None:
             return None, content
 
-        frontmatter_text = parts[1]
-        remaining = parts[2].strip()
-
-        # Try standard YAML parsing first
+        # Lenient parsing falls back to line-based parsing for Claude Code
+        # native files whose values are not valid YAML
         try:
-            frontmatter = yaml.safe_load(frontmatter_text)
-            return frontmatter, remaining
-        except yaml.YAMLError:
-            # Fallback: manual parsing for Claude Code native format
-            try:
-                frontmatter = self._parse_frontmatter_manually(frontmatter_text)
-                return frontmatter, remaining
-            except Exception as e:
-                click.echo(f"⚠️  Error parsing frontmatter: {e}")
-                return None, content
-
-    def _parse_frontmatter_manually(self, frontmatter_text: str) -> Dict[str, Any]:
-        """
-        Manually parse frontmatter that may contain YAML-incompatible content.
-
-        This handles Claude Code native format where fields like 'description'
-        may contain unquoted strings with colons and special characters.
-        """
-        frontmatter: Dict[str, Any] = {}
-        current_key: Optional[str] = None
-        current_value_lines: List[str] = []
-
-        for line in frontmatter_text.split("\n"):
-            # Check if this line starts a new key-value pair (no leading whitespace)
-            if ": " in line and line.lstrip() == line:
-                # Save previous key-value if exists
-                if current_key:
-                    value = "\n".join(current_value_lines).strip()
-                    # Try to parse as YAML for structured values (lists, dicts)
-                    try:
-                        frontmatter[current_key] = yaml.safe_load(value)
-                    except (yaml.YAMLError, ValueError, TypeError):
-                        # If YAML parsing fails, keep as string
-                        frontmatter[current_key] = value
-
-                # Start new key-value pair
-                key, value = line.split(": ", 1)
-                current_key = key.strip()
-                current_value_lines = [value]
-            elif current_key:
-                # Continuation of current value
-                current_value_lines.append(line)
-
-        # Save the last key-value pair
-        if current_key:
-            value = "\n".join(current_value_lines).strip()
-            try:
-                frontmatter[current_key] = yaml.safe_load(value)
-            except (yaml.YAMLError, ValueError, TypeError):
-                frontmatter[current_key] = value
-
-        return frontmatter
+            frontmatter = parse_frontmatter(frontmatter_text, lenient=True)
+        except Exception as e:
+            echo(f"⚠️  Error parsing frontmatter: {e}")
+            return None, content
+        return frontmatter, remaining.strip()
 
     def _generate_plugins(
         self,
@@ -729,20 +688,16 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
             if prompt.plugins.commands:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("commands")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("commands"))
                 commands = prompt.plugins.commands
             if prompt.plugins.agents:
-                click.echo(DeprecationWarnings.v3_nested_plugin_field_warning("agents"))
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("agents"))
                 agents = prompt.plugins.agents
             if prompt.plugins.hooks:
-                click.echo(DeprecationWarnings.v3_nested_plugin_field_warning("hooks"))
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("hooks"))
                 hooks = prompt.plugins.hooks
 
         # Generate MCP server configurations
@@ -774,14 +729,13 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
             mcp_config = {"mcpServers": mcp_servers_config}
 
             if dry_run:
-                click.echo(f"  📁 Would create: {mcp_file}")
+                echo(f"  📁 Would create: {mcp_file}")
                 if verbose:
-                    click.echo(f"    {json.dumps(mcp_config, indent=2)[:200]}...")
+                    echo(f"    {json.dumps(mcp_config, indent=2)[:200]}...")
             else:
                 # MCP file goes in project root, no need to create claude_dir
-                with open(mcp_file, "w", encoding="utf-8") as f:
-                    json.dump(mcp_config, f, indent=2)
-                click.echo(f"✅ Generated: {mcp_file}")
+                write_generated_file(mcp_file, json.dumps(mcp_config, indent=2))
+                echo(f"✅ Generated: {mcp_file}")
             created_files.append(mcp_file)
 
         # Generate slash commands
@@ -799,17 +753,16 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                 content = self._build_command_content(command, command_prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {command_file}")
+                    echo(f"  📁 Would create: {command_file}")
                     if verbose:
                         preview = (
                             content[:200] + "..." if len(content) > 200 else content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                 else:
-                    commands_dir.mkdir(parents=True, exist_ok=True)
-                    with open(command_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {command_file}")
+                    ensure_directory(commands_dir)
+                    write_generated_file(command_file, content)
+                    echo(f"✅ Generated: {command_file}")
                 created_files.append(command_file)
 
         # Generate agents
@@ -827,131 +780,202 @@ class ClaudeAdapter(SingleFileMarkdownSyncMixin, EditorAdapter):
                 content = self._build_agent_content(agent, agent_prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {agent_file}")
+                    echo(f"  📁 Would create: {agent_file}")
                     if verbose:
                         preview = (
                             content[:200] + "..." if len(content) > 200 else content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                 else:
-                    agents_dir.mkdir(parents=True, exist_ok=True)
-                    with open(agent_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {agent_file}")
+                    ensure_directory(agents_dir)
+                    write_generated_file(agent_file, content)
+                    echo(f"✅ Generated: {agent_file}")
                 created_files.append(agent_file)
 
         # Generate hooks
-        if hooks:
-            # Separate hooks by type: those with matchers go to settings.local.json,
-            # others go to hooks.yaml
-            hooks_with_matchers = []
-            hooks_without_matchers = []
-
-            for hook in hooks:
-                if hook.conditions and "matcher" in hook.conditions:
-                    hooks_with_matchers.append(hook)
-                else:
-                    hooks_without_matchers.append(hook)
-
-            # Generate settings.local.json for hooks with matchers (Claude Code native format)
-            if hooks_with_matchers:
-                settings_file = claude_dir / "settings.local.json"
-
-                # Group hooks by event type
-                hooks_by_event: Dict[str, List[Any]] = {}
-                for hook in hooks_with_matchers:
-                    event = hook.event
-                    if event not in hooks_by_event:
-                        hooks_by_event[event] = []
-
-                    # Build Claude Code format (conditions already validated above)
-                    if not hook.conditions or "matcher" not in hook.conditions:
-                        continue  # Skip if conditions invalid
-
-                    hook_config = {
-                        "matcher": hook.conditions["matcher"],
-                        "hooks": [
-                            {
-                                "type": "command",
-                                "command": hook.command,
-                            }
-                        ],
-                    }
-                    hooks_by_event[event].append(hook_config)
-
-                settings_config = {"hooks": hooks_by_event}
-
-                if dry_run:
-                    click.echo(f"  📁 Would create: {settings_file}")
-                    if verbose:
-                        click.echo(
-                            f"    {json.dumps(settings_config, indent=2)[:200]}..."
-                        )
-                else:
-                    claude_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Merge with existing settings.local.json if it exists
-                    if settings_file.exists():
-                        try:
-                            with open(settings_file, "r", encoding="utf-8") as f:
-                                existing_config = json.load(f)
-                            # Merge hooks section
-                            if "hooks" in existing_config:
-                                for event, event_hooks in hooks_by_event.items():
-                                    if event in existing_config["hooks"]:
-                                        existing_config["hooks"][event].extend(
-                                            event_hooks
-                                        )
-                                    else:
-                                        existing_config["hooks"][event] = event_hooks
-                                settings_config = existing_config
-                            else:
-                                settings_config.update(existing_config)
-                        except Exception as e:
-                            click.echo(
-                                f"⚠️  Error reading existing settings.local.json: {e}"
-                            )
-
-                    with open(settings_file, "w", encoding="utf-8") as f:
-                        json.dump(settings_config, f, indent=2)
-                    click.echo(f"✅ Generated: {settings_file}")
-                created_files.append(settings_file)
-
-            # Generate hooks.yaml for hooks without matchers (PrompTrek format)
-            if hooks_without_matchers:
-                hooks_file = claude_dir / "hooks.yaml"
-                hooks_config = {
+        # Separate hooks by type: those with matchers go to settings.local.json,
+        # others go to hooks.yaml
+        hooks_with_matchers = []
+        hooks_without_matchers = []
+
+        for hook in hooks or []:
+            if hook.conditions and "matcher" in hook.conditions:
+                hooks_with_matchers.append(hook)
+            else:
+                hooks_without_matchers.append(hook)
+
+        # Generate settings.local.json for hooks with matchers (Claude Code
+        # native format); without any, previously generated hooks are dropped
+        settings_file = claude_dir / "settings.local.json"
+        if hooks_with_matchers or self._has_generated_hooks(settings_file):
+            # Group hooks by event type
+            hooks_by_event: Dict[str, List[Any]] = {}
+            for hook in hooks_with_matchers:
+                event = hook.event
+                if event not in hooks_by_event:
+                    hooks_by_event[event] = []
+
+                # Build Claude Code format (conditions already validated above)
+                if not hook.conditions or "matcher" not in hook.conditions:
+                    continue  # Skip if conditions invalid
+
+                hook_config = {
+                    "matcher": hook.conditions["matcher"],
                     "hooks": [
                         {
-                            "name": hook.name,
-                            "event": hook.event,
+                            "type": "command",
                             "command": hook.command,
-                            **(
-                                {"conditions": hook.conditions}
-                                if hook.conditions
-                                else {}
-                            ),
-                            "requires_reapproval": hook.requires_reapproval,
                         }
-                        for hook in hooks_without_matchers
-                    ]
+                    ],
                 }
+                hooks_by_event[event].append(hook_config)
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {hooks_file}")
-                    if verbose:
-                        click.echo(
-                            f"    {yaml.dump(hooks_config, default_flow_style=False)[:200]}..."
-                        )
-                else:
-                    claude_dir.mkdir(parents=True, exist_ok=True)
-                    with open(hooks_file, "w", encoding="utf-8") as f:
-                        yaml.dump(hooks_config, f, default_flow_style=False)
-                    click.echo(f"✅ Generated: {hooks_file}")
-                created_files.append(hooks_file)
+            settings_config = {"hooks": hooks_by_event}
+
+            if dry_run:
+                echo(
+                    f"  📁 Would {'create' if hooks_by_event else 'update'}: {settings_file}"
+                )
+                if verbose:
+                    echo(f"    {json.dumps(settings_config, indent=2)[:200]}...")
+            else:
+                ensure_directory(claude_dir)
+
+                # Merge with existing settings.local.json under its lock
+                update_generated_file(
+                    settings_file,
+                    lambda existing: self._merge_settings_hooks(
+                        existing, hooks_by_event
+                    ),
+                )
+                echo(f"✅ Generated: {settings_file}")
+            created_files.append(settings_file)
+
+        # Generate hooks.yaml for hooks without matchers (PrompTrek format)
+        if hooks_without_matchers:
+            hooks_file = claude_dir / "hooks.yaml"
+            hooks_config = {
+                "hooks": [
+                    {
+                        "name": hook.name,
+                        "event": hook.event,
+                        "command": hook.command,
+                        **({"conditions": hook.conditions} if hook.conditions else {}),
+                        "requires_reapproval": hook.requires_reapproval,
+                    }
+                    for hook in hooks_without_matchers
+                ]
+            }
+
+            if dry_run:
+                echo(f"  📁 Would create: {hooks_file}")
+                if verbose:
+                    echo(
+                        f"    {yaml.dump(hooks_config, default_flow_style=False)[:200]}..."
+                    )
+            else:
+                ensure_directory(claude_dir)
+                write_generated_file(
+                    hooks_file, yaml.dump(hooks_config, default_flow_style=False)
+                )
+                echo(f"✅ Generated: {hooks_file}")
+            created_files.append(hooks_file)
 
         return created_files
 
+    def _has_generated_hooks(self, settings_file: Path) -> bool:
+        """Check whether settings.local.json lists hooks promptrek generated."""
+        try:
+            settings_config = json.loads(settings_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        return isinstance(settings_config, dict) and bool(
+            settings_config.get(self.GENERATED_HOOKS_KEY)
+        )
+
+    def _merge_settings_hooks(
+        self, existing: Optional[str], hooks_by_event: Dict[str, List[Any]]
+    ) -> str:
+        """
+        Merge generated hooks into the content of settings.local.json.
+
+        Hooks are keyed by (event, matcher, command). The keys of the
+        generated hooks are recorded under GENERATED_HOOKS_KEY, so on the next
+        run previously generated hooks are replaced (or dropped if they were
+        removed from the prompt) while hooks added by the user are kept. The
+        merge is idempotent: generating again gives the same file.
+
+        Args:
+            existing: Current file content, or None if it does not exist
+            hooks_by_event: Generated hook entries grouped by event
+
+        Returns:
+            The merged settings as JSON
+        """
+        settings_config: Dict[str, Any] = {}
+        if existing is not None:
+            try:
+                loaded = json.loads(existing)
+                if isinstance(loaded, dict):
+                    settings_config = loaded
+            except ValueError as e:
+                echo(f"⚠️  Error reading existing settings.local.json: {e}")
+
+        generated = [
+            (event, entry["matcher"], hook["command"])
+            for event, entries in hooks_by_event.items()
+            for entry in entries
+            for hook in entry["hooks"]
+        ]
+        owned = {
+            (item.get("event"), item.get("matcher"), item.get("command"))
+            for item in settings_config.get(self.GENERATED_HOOKS_KEY) or []
+            if isinstance(item, dict)
+        }
+        replaced = owned.union(generated)
+
+        existing_hooks = settings_config.get("hooks")
+        if not isinstance(existing_hooks, dict):
+            existing_hooks = {}
+
+        merged: Dict[str, List[Any]] = {}
+        for event, entries in existing_hooks.items():
+            kept = []
+            for entry in entries if isinstance(entries, list) else []:
+                if not isinstance(entry, dict):
+                    kept.append(entry)
+                    continue
+                # Drop generated commands, keeping the user's hooks
+                hooks = [
+                    hook
+                    for hook in entry.get("hooks", [])
+                    if not isinstance(hook, dict)
+                    or (event, entry.get("matcher"), hook.get("command"))
+                    not in replaced
+                ]
+                if hooks:
+                    kept.append({**entry, "hooks": hooks})
+                elif not entry.get("hooks"):
+                    kept.append(entry)
+            if kept:
+                merged[event] = kept
+
+        for event, entries in hooks_by_event.items():
+            merged.setdefault(event, []).extend(entries)
+
+        settings_config["hooks"] = merged
+        if generated:
+            settings_config[self.GENERATED_HOOKS_KEY] = [
+                {"event": event, "matcher": matcher, "command": command}
+                for event, matcher, command in generated
+            ]
+        else:
+            # Nothing generated any more: leave no trace of promptrek
+            settings_config.pop(self.GENERATED_HOOKS_KEY, None)
+            if not merged:
+                settings_config.pop("hooks")
+        return json.dumps(settings_config, indent=2)
+
     def _build_command_content(self, command: Any, prompt: str) -> str:
         """Build markdown content for a slash command or workflow."""
         lines = []
@@ -7,8 +7,6 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import (
     UniversalPrompt,
@@ -16,9 +14,18 @@ from ..core.models import (
     UniversalPromptV3,
     UserConfig,
 )
+from ..utils.locking import atomic_write, file_lock
+from ..utils.outputs import (
+    confirm,
+    echo,
+    ensure_directory,
+    prompt_input,
+    remove_directory,
+    write_generated_file,
+)
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
-from .sync_mixin import MarkdownSyncMixin
+from .sync_mixin import MarkdownSyncMixin, is_unchanged_file
 
 
 class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
@@ -108,19 +115,19 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         Returns:
             Path provided by user, or None if skipped
         """
-        click.echo("\n❌ Could not find Cline MCP configuration file")
-        click.echo("\nTo find your Cline MCP configuration file:")
-        click.echo("  1. Open VS Code with Cline extension")
-        click.echo("  2. Open Cline chat window")
-        click.echo("  3. At the bottom, click the stacked servers icon (MCP)")
-        click.echo("  4. Click the settings cog icon")
-        click.echo('  5. Click "Configure MCP Servers"')
-        click.echo("  6. Right-click on the file tab at the top")
-        click.echo('  7. Click "Copy Path"')
-        click.echo("  8. Paste the path below")
-        click.echo("")
-
-        path_str = click.prompt(
+        echo("\n❌ Could not find Cline MCP configuration file")
+        echo("\nTo find your Cline MCP configuration file:")
+        echo("  1. Open VS Code with Cline extension")
+        echo("  2. Open Cline chat window")
+        echo("  3. At the bottom, click the stacked servers icon (MCP)")
+        echo("  4. Click the settings cog icon")
+        echo('  5. Click "Configure MCP Servers"')
+        echo("  6. Right-click on the file tab at the top")
+        echo('  7. Click "Copy Path"')
+        echo("  8. Paste the path below")
+        echo("")
+
+        path_str = prompt_input(
             "Enter path to cline_mcp_settings.json (or press Enter to skip)",
             default="",
             show_default=False,
@@ -131,8 +138,8 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
 
         path = Path(path_str).expanduser()
         if not path.exists():
-            click.echo(f"⚠️  Warning: File does not exist: {path}")
-            if not click.confirm("Use this path anyway?", default=False):
+            echo(f"⚠️  Warning: File does not exist: {path}")
+            if not confirm("Use this path anyway?", default=False):
                 return None
 
         return path
@@ -210,69 +217,61 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             True if write was successful, False otherwise
         """
         try:
-            # Read existing config or create new one
-            user_config = ClineAdapter._read_user_config(user_config_path)
-
-            if not user_config:
-                user_config = UserConfig(
-                    schema_version="1.0.0",
-                    editor_paths={"cline_mcp_path": str(mcp_config_path)},
-                )
-            else:
-                # Update existing config
-                if not user_config.editor_paths:
-                    user_config.editor_paths = {}
-                user_config.editor_paths["cline_mcp_path"] = str(mcp_config_path)
+            import yaml
 
-            # Write to file with warning comments
-            user_config_path.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(user_config_path.parent)
 
-            import yaml
+            # Lock so concurrent runs don't drop each other's paths
+            with file_lock(user_config_path):
+                # Read existing config or create new one
+                user_config = ClineAdapter._read_user_config(user_config_path)
 
-            with open(user_config_path, "w", encoding="utf-8") as f:
-                # Add YAML language server directive for schema validation
-                f.write(
+                if not user_config:
+                    user_config = UserConfig(
+                        schema_version="1.0.0",
+                        editor_paths={"cline_mcp_path": str(mcp_config_path)},
+                    )
+                else:
+                    # Update existing config
+                    if not user_config.editor_paths:
+                        user_config.editor_paths = {}
+                    user_config.editor_paths["cline_mcp_path"] = str(mcp_config_path)
+
+                # Write to file with warning comments
+                content = (
+                    # Add YAML language server directive for schema validation
                     "# yaml-language-server: $schema=https://promptrek.ai/schema/user-config/v1.0.0.json\n"
-                )
-                f.write("#\n")
-                # Add warning comments
-                f.write("# WARNING: This file contains user-specific configuration\n")
-                f.write(
+                    "#\n"
+                    # Add warning comments
+                    "# WARNING: This file contains user-specific configuration\n"
                     "# DO NOT commit this file to version control (it should be in .gitignore)\n"
-                )
-                f.write("#\n")
-                f.write(
+                    "#\n"
                     "# This file is automatically generated and contains paths specific to your machine.\n"
-                )
-                f.write(
                     "# Other developers will have different paths on their machines.\n"
+                    "\n"
                 )
-                f.write("\n")
-
                 # Write YAML data
-                yaml.safe_dump(
+                content += yaml.safe_dump(
                     user_config.model_dump(exclude_none=True),
-                    f,
                     default_flow_style=False,
                     sort_keys=False,
                 )
+                atomic_write(user_config_path, content)
 
             # Add .promptrek/ directory to .gitignore
             ClineAdapter._add_to_gitignore(
                 user_config_path.parent.parent, ".promptrek/"
             )
 
-            click.echo(
-                f"  💾 Saved Cline MCP path to: .promptrek/{user_config_path.name}"
-            )
+            echo(f"  💾 Saved Cline MCP path to: .promptrek/{user_config_path.name}")
             if verbose:
-                click.echo(f"     Path: {mcp_config_path}")
+                echo(f"     Path: {mcp_config_path}")
 
             return True
 
         except Exception as e:
             if verbose:
-                click.echo(f"  ⚠️  Could not update user config: {e}")
+                echo(f"  ⚠️  Could not update user config: {e}")
             return False
 
     @staticmethod
@@ -286,37 +285,40 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         """
         gitignore_path = project_dir / ".gitignore"
 
-        # Check if .gitignore exists
-        if gitignore_path.exists():
-            # Read existing content
-            try:
-                with open(gitignore_path, "r", encoding="utf-8") as f:
-                    content = f.read()
+        try:
+            with file_lock(gitignore_path):
+                # Read existing content
+                try:
+                    with open(gitignore_path, "r", encoding="utf-8") as f:
+                        content: Optional[str] = f.read()
+                except FileNotFoundError:
+                    content = None
+
+                if content is None:
+                    # Create new .gitignore with pattern
+                    atomic_write(
+                        gitignore_path,
+                        "# PrompTrek user-specific config (not committed)\n"
+                        f"{pattern}\n",
+                    )
+                    echo(f"  📝 Created .gitignore and added {pattern}")
+                    return
 
                 # Check if pattern already exists
                 if pattern in content:
                     return
 
-                # Add pattern to existing file
-                with open(gitignore_path, "a", encoding="utf-8") as f:
-                    # Ensure file ends with newline before adding
-                    if content and not content.endswith("\n"):
-                        f.write("\n")
-                    f.write("\n# PrompTrek user-specific config (not committed)\n")
-                    f.write(f"{pattern}\n")
-
-                click.echo(f"  📝 Added {pattern} to .gitignore")
-            except Exception as e:
-                click.echo(f"  ⚠️  Could not update .gitignore: {e}", err=True)
-        else:
-            # Create new .gitignore with pattern
-            try:
-                with open(gitignore_path, "w", encoding="utf-8") as f:
-                    f.write("# PrompTrek user-specific config (not committed)\n")
-                    f.write(f"{pattern}\n")
-                click.echo(f"  📝 Created .gitignore and added {pattern}")
-            except Exception as e:
-                click.echo(f"  ⚠️  Could not create .gitignore: {e}", err=True)
+                # Ensure file ends with newline before adding
+                if content and not content.endswith("\n"):
+                    content += "\n"
+                atomic_write(
+                    gitignore_path,
+                    content + "\n# PrompTrek user-specific config (not committed)\n"
+                    f"{pattern}\n",
+                )
+                echo(f"  📝 Added {pattern} to .gitignore")
+        except Exception as e:
+            echo(f"  ⚠️  Could not update .gitignore: {e}", err=True)
 
     def get_mcp_config_strategy(self) -> Dict[str, Any]:
         """Get MCP configuration strategy for Cline adapter."""
@@ -408,18 +410,17 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 output_file = clinerules_dir / filename
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
+                    echo(f"  📁 Would create: {output_file}")
                     if verbose:
                         preview = (
                             content[:200] + "..." if len(content) > 200 else content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(output_file)
                 else:
-                    clinerules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {output_file}")
+                    ensure_directory(clinerules_dir)
+                    write_generated_file(output_file, content)
+                    echo(f"✅ Generated: {output_file}")
                     created_files.append(output_file)
         else:
             # No documents, use main content as default-rules.md in .clinerules/ directory
@@ -432,16 +433,15 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             output_file = clinerules_dir / "default-rules.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
                     preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(output_file)
             else:
-                clinerules_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(clinerules_dir)
+                write_generated_file(output_file, content)
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
@@ -474,14 +474,10 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
             if prompt.plugins.commands:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("commands")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("commands"))
                 commands = prompt.plugins.commands
 
         # Generate MCP config if we have MCP servers
@@ -538,7 +534,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 user_config.editor_paths["cline_mcp_path"]
             ).expanduser()
             if verbose:
-                click.echo(f"  ℹ️  Using configured Cline MCP path: {mcp_config_path}")
+                echo(f"  ℹ️  Using configured Cline MCP path: {mcp_config_path}")
 
         # Try to find it automatically
         if not mcp_config_path:
@@ -546,19 +542,19 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             if mcp_config_path:
                 path_was_discovered = True
                 if verbose:
-                    click.echo(f"  ✅ Found Cline MCP config: {mcp_config_path}")
+                    echo(f"  ✅ Found Cline MCP config: {mcp_config_path}")
 
         # Prompt user if not found
         if not mcp_config_path and not dry_run:
             mcp_config_path = self.prompt_for_mcp_config_path()
             if not mcp_config_path:
-                click.echo("  ⏭️  Skipped Cline MCP configuration (no path provided)")
+                echo("  ⏭️  Skipped Cline MCP configuration (no path provided)")
                 return created_files
             path_was_discovered = True
 
         # If still no path (dry run mode), use a placeholder
         if not mcp_config_path:
-            click.echo("  ⏭️  Skipped Cline MCP configuration (no path available)")
+            echo("  ⏭️  Skipped Cline MCP configuration (no path available)")
             return created_files
 
         # Save discovered path to user-config.promptrek.yaml (if it was auto-detected or user-provided)
@@ -578,7 +574,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             server_count=len(new_servers),
             dry_run=dry_run,
         ):
-            click.echo("  ⏭️  Skipped Cline MCP configuration")
+            echo("  ⏭️  Skipped Cline MCP configuration")
             return created_files
 
         # Step 2: Read existing user-level config
@@ -590,7 +586,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
 
             if conflicts:
                 if verbose:
-                    click.echo(f"  ⚠️  Found {len(conflicts)} conflicting MCP server(s)")
+                    echo(f"  ⚠️  Found {len(conflicts)} conflicting MCP server(s)")
 
                 # Step 4: Prompt for each conflict
                 servers_to_skip = []
@@ -605,7 +601,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                     ):
                         servers_to_skip.append(server_name)
                         if verbose:
-                            click.echo(
+                            echo(
                                 f"  ⏭️  Skipping MCP server '{server_name}' (keeping existing)"
                             )
 
@@ -615,7 +611,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
 
             # Step 5: Merge with existing config (add/update only)
             if verbose:
-                click.echo("  ℹ️  Merging MCP servers with existing user-level config")
+                echo("  ℹ️  Merging MCP servers with existing user-level config")
 
             merged_config = existing_config.copy()
             if "mcpServers" not in merged_config:
@@ -632,11 +628,9 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             ):
                 created_files.append(mcp_config_path)
                 if not dry_run:
-                    click.echo(
-                        f"  ✅ Updated {len(new_servers)} MCP server(s) at user-level"
-                    )
+                    echo(f"  ✅ Updated {len(new_servers)} MCP server(s) at user-level")
         else:
-            click.echo("  ℹ️  No MCP servers to add (all skipped)")
+            echo("  ℹ️  No MCP servers to add (all skipped)")
 
         return created_files
 
@@ -661,7 +655,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         # Inform user about regular commands (not supported by Cline currently)
         if regular_commands:
             if verbose:
-                click.echo(
+                echo(
                     f"  ℹ️  Skipping {len(regular_commands)} regular command(s) "
                     "(Cline only supports workflows with steps/tool_calls in .clinerules/workflows/)"
                 )
@@ -731,22 +725,21 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 workflow_file = workflows_dir / filename
 
                 if dry_run:
-                    click.echo(f"  📁 Would create workflow: {workflow_file}")
+                    echo(f"  📁 Would create workflow: {workflow_file}")
                     if verbose:
                         preview = (
                             content[:200] + "..." if len(content) > 200 else content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(workflow_file)
                 else:
-                    workflows_dir.mkdir(parents=True, exist_ok=True)
-                    with open(workflow_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated workflow: {workflow_file}")
+                    ensure_directory(workflows_dir)
+                    write_generated_file(workflow_file, content)
+                    echo(f"✅ Generated workflow: {workflow_file}")
                     created_files.append(workflow_file)
 
             if not dry_run:
-                click.echo(f"  ✅ Generated {len(workflows)} workflow(s)")
+                echo(f"  ✅ Generated {len(workflows)} workflow(s)")
 
         return created_files
 
@@ -828,6 +821,8 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 # Skip workflow directory files
                 if "workflows" in md_file.parts:
                     continue
+                if md_file.stem != "default-rules" and is_unchanged_file(md_file):
+                    continue
 
                 try:
                     with open(md_file, "r", encoding="utf-8") as f:
@@ -850,7 +845,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                         )
 
                 except Exception as e:
-                    click.echo(f"Warning: Could not parse {md_file}: {e}")
+                    echo(f"Warning: Could not parse {md_file}: {e}")
 
             # Create metadata
             metadata = PromptMetadata(
@@ -895,6 +890,8 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         workflows = []
 
         for workflow_file in sorted(workflows_dir.glob("*.md")):
+            if is_unchanged_file(workflow_file):
+                continue
             try:
                 with open(workflow_file, "r", encoding="utf-8") as f:
                     content = f.read()
@@ -967,7 +964,7 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 workflows.append(workflow)
 
             except Exception as e:
-                click.echo(
+                echo(
                     f"⚠️  Warning: Could not parse workflow file {workflow_file}: {e}",
                     err=True,
                 )
@@ -1184,25 +1181,24 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         rule_files = self._generate_rule_files(prompt, conditional_content)
 
         if dry_run:
-            click.echo(f"  📁 Would create directory: {clinerules_dir}")
+            echo(f"  📁 Would create directory: {clinerules_dir}")
             for filename, content in rule_files.items():
                 output_file = clinerules_dir / filename
-                click.echo(f"  📄 Would create: {output_file}")
+                echo(f"  📄 Would create: {output_file}")
                 if verbose:
-                    click.echo("      Content preview:")
+                    echo("      Content preview:")
                     preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"      {preview}")
+                    echo(f"      {preview}")
                 created_files.append(output_file)
         else:
             # Create .clinerules directory if it doesn't exist
-            clinerules_dir.mkdir(parents=True, exist_ok=True)
+            ensure_directory(clinerules_dir)
 
             # Create rule files
             for filename, content in rule_files.items():
                 output_file = clinerules_dir / filename
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
+                write_generated_file(output_file, content)
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
@@ -1226,31 +1222,28 @@ class ClineAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             content = self._build_unified_content(prompt, conditional_content)
 
         if dry_run:
-            click.echo(f"  📄 Would create: {output_file}")
+            echo(f"  📄 Would create: {output_file}")
             if verbose:
-                click.echo("      Content preview:")
+                echo("      Content preview:")
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"      {preview}")
+                echo(f"      {preview}")
         else:
             # Check if .clinerules exists as a directory and remove it
             if output_file.exists() and output_file.is_dir():
-                import shutil
-
-                click.echo(
+                echo(
                     f"⚠️  Warning: {output_file} exists as a directory and will be removed"
                 )
-                if not click.confirm(
+                if not confirm(
                     "  Continue and replace directory with single file?", default=False
                 ):
-                    click.echo("  ⏭️  Skipped generation (user cancelled)")
+                    echo("  ⏭️  Skipped generation (user cancelled)")
                     return []
 
-                shutil.rmtree(output_file)
+                remove_directory(output_file)
                 if verbose:
-                    click.echo(f"  🗑️  Removed existing directory: {output_file}")
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file}")
+                    echo(f"  🗑️  Removed existing directory: {output_file}")
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file}")
 
         return [output_file]
 
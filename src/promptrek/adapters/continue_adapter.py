@@ -7,7 +7,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
 import yaml
 
 from ..core.exceptions import DeprecationWarnings, ValidationError
@@ -20,8 +19,16 @@ from ..core.models import (
     UniversalPromptV2,
     UniversalPromptV3,
 )
+from ..utils.markdown import (
+    extract_frontmatter,
+    parse_frontmatter,
+    split_frontmatter,
+    tokenize,
+)
+from ..utils.outputs import echo, ensure_directory, write_generated_file
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
+from .sync_mixin import is_unchanged_file
 
 
 class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
@@ -136,20 +143,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                 output_file = rules_dir / filename
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
+                    echo(f"  📁 Would create: {output_file}")
                     if verbose:
                         preview = (
                             doc_content[:200] + "..."
                             if len(doc_content) > 200
                             else doc_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(output_file)
                 else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(doc_content)
-                    click.echo(f"✅ Generated: {output_file}")
+                    ensure_directory(rules_dir)
+                    write_generated_file(output_file, doc_content)
+                    echo(f"✅ Generated: {output_file}")
                     created_files.append(output_file)
         else:
             # No documents, use main content as general rules
@@ -176,20 +182,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             output_file = rules_dir / "general.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
                     preview = (
                         main_content[:200] + "..."
                         if len(main_content) > 200
                         else main_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(output_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(main_content)
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(output_file, main_content)
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
@@ -223,14 +228,10 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
             if prompt.plugins.commands:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("commands")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("commands"))
                 commands = prompt.plugins.commands
 
         # Generate plugin config if we have any plugins
@@ -383,18 +384,18 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             yaml_file = mcp_dir / f"{safe_filename}.yaml"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {yaml_file}")
+                echo(f"  📁 Would create: {yaml_file}")
                 if verbose:
                     preview = yaml.dump(yaml_content, default_flow_style=False)[:300]
-                    click.echo(f"    {preview}...")
+                    echo(f"    {preview}...")
                 created_files.append(yaml_file)
             else:
-                mcp_dir.mkdir(parents=True, exist_ok=True)
-                with open(yaml_file, "w", encoding="utf-8") as f:
-                    yaml.dump(
-                        yaml_content, f, default_flow_style=False, sort_keys=False
-                    )
-                click.echo(f"✅ Generated: {yaml_file}")
+                ensure_directory(mcp_dir)
+                write_generated_file(
+                    yaml_file,
+                    yaml.dump(yaml_content, default_flow_style=False, sort_keys=False),
+                )
+                echo(f"✅ Generated: {yaml_file}")
                 created_files.append(yaml_file)
 
         return created_files
@@ -469,20 +470,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             md_file = prompts_dir / f"{safe_filename}.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {md_file}")
+                echo(f"  📁 Would create: {md_file}")
                 if verbose:
                     preview = (
                         md_content[:300] + "..."
                         if len(md_content) > 300
                         else md_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(md_file)
             else:
-                prompts_dir.mkdir(parents=True, exist_ok=True)
-                with open(md_file, "w", encoding="utf-8") as f:
-                    f.write(md_content)
-                click.echo(f"✅ Generated: {md_file}")
+                ensure_directory(prompts_dir)
+                write_generated_file(md_file, md_content)
+                echo(f"✅ Generated: {md_file}")
                 created_files.append(md_file)
 
         return created_files
@@ -517,15 +517,17 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             config["prompts"] = prompts_list
 
         if dry_run:
-            click.echo(f"  📁 Would create: {config_path}")
+            echo(f"  📁 Would create: {config_path}")
             if verbose:
                 preview = yaml.dump(config, default_flow_style=False)[:300]
-                click.echo(f"    {preview}...")
+                echo(f"    {preview}...")
         else:
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=False)
-            click.echo(f"✅ Generated: {config_path}")
+            ensure_directory(config_path.parent)
+            write_generated_file(
+                config_path,
+                yaml.dump(config, default_flow_style=False, sort_keys=False),
+            )
+            echo(f"✅ Generated: {config_path}")
 
         return config_path
 
@@ -561,20 +563,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {general_file}")
+                echo(f"  📁 Would create: {general_file}")
                 if verbose:
                     preview = (
                         general_content[:200] + "..."
                         if len(general_content) > 200
                         else general_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(general_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(general_file, "w", encoding="utf-8") as f:
-                    f.write(general_content)
-                click.echo(f"✅ Generated: {general_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(general_file, general_content)
+                echo(f"✅ Generated: {general_file}")
                 created_files.append(general_file)
 
         # Generate code style rules
@@ -585,20 +586,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {style_file}")
+                echo(f"  📁 Would create: {style_file}")
                 if verbose:
                     preview = (
                         style_content[:200] + "..."
                         if len(style_content) > 200
                         else style_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(style_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(style_file, "w", encoding="utf-8") as f:
-                    f.write(style_content)
-                click.echo(f"✅ Generated: {style_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(style_file, style_content)
+                echo(f"✅ Generated: {style_file}")
                 created_files.append(style_file)
 
         # Generate testing rules
@@ -609,20 +609,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {testing_file}")
+                echo(f"  📁 Would create: {testing_file}")
                 if verbose:
                     preview = (
                         testing_content[:200] + "..."
                         if len(testing_content) > 200
                         else testing_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(testing_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(testing_file, "w", encoding="utf-8") as f:
-                    f.write(testing_content)
-                click.echo(f"✅ Generated: {testing_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(testing_file, testing_content)
+                echo(f"✅ Generated: {testing_file}")
                 created_files.append(testing_file)
 
         # Generate technology-specific rules
@@ -632,20 +631,19 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                 tech_content = self._build_tech_rules_content(tech, prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
+                    echo(f"  📁 Would create: {tech_file}")
                     if verbose:
                         preview = (
                             tech_content[:200] + "..."
                             if len(tech_content) > 200
                             else tech_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(tech_file)
                 else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
+                    ensure_directory(rules_dir)
+                    write_generated_file(tech_file, tech_content)
+                    echo(f"✅ Generated: {tech_file}")
                     created_files.append(tech_file)
 
         return created_files
@@ -662,14 +660,13 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
         output_file = output_dir / ".continuerules"
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file} (legacy compatibility)")
+            echo(f"  📁 Would create: {output_file} (legacy compatibility)")
             if verbose:
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file} (legacy compatibility)")
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file} (legacy compatibility)")
             return [output_file]
 
         return []
@@ -917,6 +914,8 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
         main_content = None
 
         for md_file in sorted(rules_dir.glob("*.md")):
+            if md_file.stem != "general" and is_unchanged_file(md_file):
+                continue
             try:
                 with open(md_file, "r", encoding="utf-8") as f:
                     content = f.read()
@@ -928,23 +927,15 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                 doc_file_globs = None
                 actual_content = content.strip()
 
-                if content.startswith("---"):
-                    parts = content.split("---", 2)
-                    if len(parts) >= 3:
-                        try:
-                            frontmatter = yaml.safe_load(parts[1])
-                            actual_content = parts[2].strip()
-
-                            # Extract frontmatter fields
-                            if frontmatter:
-                                doc_name = frontmatter.get("name", doc_name)
-                                doc_description = frontmatter.get("description")
-                                doc_always_apply = frontmatter.get("alwaysApply")
-                                # Continue uses 'applyToFiles' for file globs
-                                doc_file_globs = frontmatter.get("applyToFiles")
-                        except Exception:
-                            # If frontmatter parsing fails, use full content
-                            pass
+                # If frontmatter parsing fails, the full content is used
+                frontmatter, body = extract_frontmatter(content)
+                if frontmatter is not None:
+                    actual_content = body.strip()
+                    doc_name = frontmatter.get("name", doc_name)
+                    doc_description = frontmatter.get("description")
+                    doc_always_apply = frontmatter.get("alwaysApply")
+                    # Continue uses 'applyToFiles' for file globs
+                    doc_file_globs = frontmatter.get("applyToFiles")
 
                 # Special handling: general.md becomes the main content field
                 # This is the default file generated by PrompTrek and should not be renamed
@@ -964,7 +955,7 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                     )
 
             except Exception as e:
-                click.echo(f"Warning: Could not parse {md_file}: {e}")
+                echo(f"Warning: Could not parse {md_file}: {e}")
 
         # Parse MCP servers from .continue/mcpServers/*.yaml
         mcp_servers = []
@@ -989,35 +980,36 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                                 )
                             )
                 except Exception as e:
-                    click.echo(f"Warning: Could not parse {yaml_file}: {e}")
+                    echo(f"Warning: Could not parse {yaml_file}: {e}")
 
         # Parse slash commands from .continue/prompts/*.md
         commands = []
         prompts_dir = source_dir / ".continue" / "prompts"
         if prompts_dir.exists():
             for md_file in sorted(prompts_dir.glob("*.md")):
+                if is_unchanged_file(md_file):
+                    continue
                 try:
                     with open(md_file, "r", encoding="utf-8") as f:
                         content = f.read()
 
                     # Parse frontmatter
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            frontmatter = yaml.safe_load(parts[1])
-                            prompt_content = parts[2].strip()
-
-                            from promptrek.core.models import Command
-
-                            commands.append(
-                                Command(
-                                    name=frontmatter.get("name", md_file.stem),
-                                    description=frontmatter.get("description", ""),
-                                    prompt=prompt_content,
-                                )
+                    frontmatter_text, body = split_frontmatter(content)
+                    if frontmatter_text is not None:
+                        frontmatter = parse_frontmatter(frontmatter_text)
+                        prompt_content = body.strip()
+
+                        from promptrek.core.models import Command
+
+                        commands.append(
+                            Command(
+                                name=frontmatter.get("name", md_file.stem),
+                                description=frontmatter.get("description", ""),
+                                prompt=prompt_content,
                             )
+                        )
                 except Exception as e:
-                    click.echo(f"Warning: Could not parse {md_file}: {e}")
+                    echo(f"Warning: Could not parse {md_file}: {e}")
 
         # Parse metadata from .continue/config.yaml if it exists
         config_yaml = source_dir / ".continue" / "config.yaml"
@@ -1037,7 +1029,7 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                     tags=["continue", "synced"],
                 )
             except Exception as e:
-                click.echo(f"Warning: Could not parse config.yaml: {e}")
+                echo(f"Warning: Could not parse config.yaml: {e}")
                 metadata = PromptMetadata(
                     title="Continue AI Assistant",
                     description="Configuration synced from Continue rules",
@@ -1120,7 +1112,7 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                         instructions.general = config["rules"]
 
             except Exception as e:
-                click.echo(f"Warning: Could not parse config.yaml: {e}")
+                echo(f"Warning: Could not parse config.yaml: {e}")
 
         # Parse markdown files from .continue/rules/
         rules_dir = source_dir / ".continue" / "rules"
@@ -1160,7 +1152,7 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
                         instructions_dict["general"].extend(instructions_from_file)
 
                 except Exception as e:
-                    click.echo(f"Warning: Could not parse {md_file}: {e}")
+                    echo(f"Warning: Could not parse {md_file}: {e}")
 
             # Merge config.yaml rules with markdown rules
             if instructions.general and "general" in instructions_dict:
@@ -1206,6 +1198,7 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             List of instructions extracted from the file
         """
         instructions = []
+        seen = set()
 
         with open(md_file, "r", encoding="utf-8") as f:
             content = f.read()
@@ -1218,17 +1211,16 @@ class ContinueAdapter(MCPGenerationMixin, EditorAdapter):
             "Consider performance and security implications",
         }
 
-        for line in content.split("\n"):
-            line = line.strip()
-            # Only process lines that start with "- " (not indented bullets)
-            if line.startswith("- ") and not line.startswith("  -"):
-                # Remove the bullet point marker and clean up
-                instruction = line[2:].strip()
-                if (
-                    instruction
-                    and instruction not in instructions
-                    and instruction not in generic_guidelines
-                ):
-                    instructions.append(instruction)
+        for token in tokenize(content):
+            if token.kind != "bullet" or token.marker != "-":
+                continue
+            instruction = token.text
+            if (
+                instruction
+                and instruction not in seen
+                and instruction not in generic_guidelines
+            ):
+                seen.add(instruction)
+                instructions.append(instruction)
 
         return instructions
@@ -5,9 +5,7 @@ GitHub Copilot adapter implementation.
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
-
-import click
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import (
@@ -19,6 +17,8 @@ from ..core.models import (
     UniversalPromptV2,
     UniversalPromptV3,
 )
+from ..utils.markdown import split_frontmatter, tokenize
+from ..utils.outputs import echo, ensure_directory, write_generated_file
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
 from .sync_mixin import SingleFileMarkdownSyncMixin
@@ -154,15 +154,14 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             content = "\n".join(lines)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file}")
+            echo(f"  📁 Would create: {output_file}")
             if verbose:
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
-            github_dir.mkdir(exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file}")
+            ensure_directory(github_dir)
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file}")
 
         return [output_file]
 
@@ -194,9 +193,7 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
                 # Use centralized deprecation warning
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
 
         # Generate MCP config if we have MCP servers
@@ -239,7 +236,7 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             if existing_config:
                 # Merge with existing config
                 if verbose:
-                    click.echo("  ℹ️  Merging MCP servers with existing Copilot config")
+                    echo("  ℹ️  Merging MCP servers with existing Copilot config")
                 merged_config = self.merge_mcp_config(
                     existing_config, mcp_config, format_style="standard"
                 )
@@ -276,16 +273,15 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             content = self._build_repository_content(prompt, conditional_content)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file}")
+            echo(f"  📁 Would create: {output_file}")
             if verbose:
-                click.echo("  📄 Repository instructions preview:")
+                echo("  📄 Repository instructions preview:")
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
-            github_dir.mkdir(exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file}")
+            ensure_directory(github_dir)
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file}")
             return [output_file]
 
         return []
@@ -315,19 +311,18 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {code_file}")
+                echo(f"  📁 Would create: {code_file}")
                 if verbose:
                     preview = (
                         code_content[:200] + "..."
                         if len(code_content) > 200
                         else code_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
             else:
-                instructions_dir.mkdir(parents=True, exist_ok=True)
-                with open(code_file, "w", encoding="utf-8") as f:
-                    f.write(code_content)
-                click.echo(f"✅ Generated: {code_file}")
+                ensure_directory(instructions_dir)
+                write_generated_file(code_file, code_content)
+                echo(f"✅ Generated: {code_file}")
                 created_files.append(code_file)
 
         # Generate testing instructions for test files
@@ -340,19 +335,18 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {test_file}")
+                echo(f"  📁 Would create: {test_file}")
                 if verbose:
                     preview = (
                         test_content[:200] + "..."
                         if len(test_content) > 200
                         else test_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
             else:
-                instructions_dir.mkdir(parents=True, exist_ok=True)
-                with open(test_file, "w", encoding="utf-8") as f:
-                    f.write(test_content)
-                click.echo(f"✅ Generated: {test_file}")
+                ensure_directory(instructions_dir)
+                write_generated_file(test_file, test_content)
+                echo(f"✅ Generated: {test_file}")
                 created_files.append(test_file)
 
         # Generate technology-specific instructions
@@ -362,19 +356,18 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
                 tech_content = self._build_tech_specific_content(tech, prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
+                    echo(f"  📁 Would create: {tech_file}")
                     if verbose:
                         preview = (
                             tech_content[:200] + "..."
                             if len(tech_content) > 200
                             else tech_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                 else:
-                    instructions_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
+                    ensure_directory(instructions_dir)
+                    write_generated_file(tech_file, tech_content)
+                    echo(f"✅ Generated: {tech_file}")
                     created_files.append(tech_file)
 
         return created_files
@@ -399,19 +392,18 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
         coding_prompt_content = self._build_coding_prompt_content(prompt)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {coding_prompt_file} (experimental)")
+            echo(f"  📁 Would create: {coding_prompt_file} (experimental)")
             if verbose:
                 preview = (
                     coding_prompt_content[:200] + "..."
                     if len(coding_prompt_content) > 200
                     else coding_prompt_content
                 )
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
-            prompts_dir.mkdir(parents=True, exist_ok=True)
-            with open(coding_prompt_file, "w", encoding="utf-8") as f:
-                f.write(coding_prompt_content)
-            click.echo(f"✅ Generated: {coding_prompt_file} (experimental)")
+            ensure_directory(prompts_dir)
+            write_generated_file(coding_prompt_file, coding_prompt_content)
+            echo(f"✅ Generated: {coding_prompt_file} (experimental)")
             created_files.append(coding_prompt_file)
 
         return created_files
@@ -449,20 +441,17 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
         output_file = github_dir / "copilot-instructions.md"
 
         if dry_run:
-            click.echo(f"  📁 Would create merged: {output_file}")
+            echo(f"  📁 Would create merged: {output_file}")
             if verbose:
-                click.echo("  📄 Merged content preview:")
+                echo("  📄 Merged content preview:")
                 preview = content[:300] + "..." if len(content) > 300 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
             # Create directory and file
-            github_dir.mkdir(exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            ensure_directory(github_dir)
+            write_generated_file(output_file, content)
             source_files = [str(pf[1]) for pf in prompt_files]
-            click.echo(
-                f"✅ Generated merged: {output_file} (from {len(prompt_files)} files)"
-            )
+            echo(f"✅ Generated merged: {output_file} (from {len(prompt_files)} files)")
 
         return [output_file]
 
@@ -656,72 +645,70 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
         # Skip headless instructions block if present
         content = self._strip_headless_instructions(content)
 
-        # Parse metadata from header
-        lines = content.split("\n")
+        # Title (first # heading), description (text between the title and
+        # the first ## heading) and sections are collected in a single pass
         title = None
         description = None
-
-        # Extract title (first # header)
-        for line in lines:
-            line = line.strip()
-            if line.startswith("# ") and not title:
-                title = line[2:].strip()
-                break
-
-        # Find description (text after title, before first ##)
+        desc_lines: List[str] = []
         in_description = False
-        desc_lines = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith("# ") and title:
-                in_description = True
-                continue
-            elif in_description:
-                if line.startswith("##"):
-                    break
-                elif line:
-                    desc_lines.append(line)
-
-        if desc_lines:
-            description = " ".join(desc_lines)
-
-        # Update metadata
-        if title or description:
-            result["metadata"] = PromptMetadata(
-                title=title or "GitHub Copilot Configuration",
-                description=description
-                or "Configuration parsed from GitHub Copilot files",
-            )
+        description_done = False
 
-        # Parse instructions by section
         instructions_dict: Dict[str, List[str]] = {}
-        current_section = None
+        current_section: Optional[str] = None
         current_items: List[str] = []
-
-        for line in lines:
-            line = line.strip()
+        seen_items: Set[str] = set()
+
+        for token in tokenize(content):
+            is_title = token.kind == "heading" and token.level == 1
+            if is_title and title is None:
+                title = token.text
+
+            if not description_done:
+                if is_title:
+                    in_description = True
+                    continue
+                if in_description:
+                    if token.raw.lstrip().startswith("##"):
+                        description_done = True
+                    elif token.kind != "blank":
+                        desc_lines.append(token.raw.strip())
 
             # Section headers
-            if line.startswith("## "):
+            if token.kind == "heading" and token.level == 2:
                 # Save previous section
                 if current_section and current_items:
                     instructions_dict[current_section] = current_items
 
                 # Start new section
-                section_name = line[3:].strip()
-                current_section = self._normalize_section_name(section_name)
+                current_section = self._normalize_section_name(token.text)
                 current_items = []
+                seen_items = set()
 
             # Bullet points
-            elif line.startswith("- ") and current_section is not None:
-                instruction = line[2:].strip()
-                if instruction and instruction not in current_items:
-                    current_items.append(instruction)
+            elif (
+                token.kind == "bullet"
+                and token.marker == "-"
+                and current_section is not None
+            ):
+                if token.text and token.text not in seen_items:
+                    seen_items.add(token.text)
+                    current_items.append(token.text)
 
         # Save final section
         if current_section and current_items:
             instructions_dict[current_section] = current_items
 
+        if desc_lines:
+            description = " ".join(desc_lines)
+
+        # Update metadata
+        if title or description:
+            result["metadata"] = PromptMetadata(
+                title=title or "GitHub Copilot Configuration",
+                description=description
+                or "Configuration parsed from GitHub Copilot files",
+            )
+
         # Create Instructions object
         if instructions_dict:
             # Valid instruction categories from the Instructions model
@@ -780,20 +767,13 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
             content = f.read()
 
         # Skip YAML frontmatter
-        if content.startswith("---"):
-            parts = content.split("---", 2)
-            if len(parts) >= 3:
-                content = parts[2].strip()
+        _, body = split_frontmatter(content)
 
-        instructions = []
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("- "):
-                instruction = line[2:].strip()
-                if instruction:
-                    instructions.append(instruction)
-
-        return instructions
+        return [
+            token.text
+            for token in tokenize(body)
+            if token.kind == "bullet" and token.marker == "-" and token.text
+        ]
 
     def _parse_prompt_file(self, file_path: Path) -> List[str]:
         """Parse individual .prompt.md file."""
@@ -803,20 +783,19 @@ class CopilotAdapter(MCPGenerationMixin, SingleFileMarkdownSyncMixin, EditorAdap
         instructions = []
         in_guidelines = False
 
-        for line in content.split("\n"):
-            line = line.strip()
+        for token in tokenize(content):
+            line_lower = token.raw.lower()
 
             # Look for guideline sections
-            if "guideline" in line.lower() or "instruction" in line.lower():
+            if "guideline" in line_lower or "instruction" in line_lower:
                 in_guidelines = True
                 continue
-            elif line.startswith("#"):
+            elif token.kind == "heading":
                 in_guidelines = False
 
-            if in_guidelines and line.startswith("- "):
-                instruction = line[2:].strip()
-                if instruction:
-                    instructions.append(instruction)
+            if in_guidelines and token.kind == "bullet" and token.marker == "-":
+                if token.text:
+                    instructions.append(token.text)
 
         return instructions
 
@@ -6,10 +6,10 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from ..utils.outputs import echo, ensure_directory, is_preview, write_generated_file
+from ..utils.repo_scan import ScanResult, scan_repository
 from .base import EditorAdapter
 from .sync_mixin import MarkdownSyncMixin
 
@@ -107,22 +107,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
 
         index_file = rules_dir / "index.mdc"
 
-        if dry_run:
-            click.echo(f"  📁 Would create: {index_file}")
-            if verbose:
-                preview = (
-                    main_content[:200] + "..."
-                    if len(main_content) > 200
-                    else main_content
-                )
-                click.echo(f"    {preview}")
-            created_files.append(index_file)
-        else:
-            rules_dir.mkdir(parents=True, exist_ok=True)
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(main_content)
-            click.echo(f"✅ Generated: {index_file}")
-            created_files.append(index_file)
+        created_files.extend(
+            self.write_rule_file(index_file, main_content, dry_run, verbose)
+        )
 
         # If documents field is present, generate separate rule files
         if prompt.documents:
@@ -154,22 +141,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 )
                 output_file = rules_dir / filename
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
-                    if verbose:
-                        preview = (
-                            doc_content[:200] + "..."
-                            if len(doc_content) > 200
-                            else doc_content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(output_file)
-                else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(doc_content)
-                    click.echo(f"✅ Generated: {output_file}")
-                    created_files.append(output_file)
+                created_files.extend(
+                    self.write_rule_file(output_file, doc_content, dry_run, verbose)
+                )
 
         # Generate plugin files for v2.1/v3.0
         if isinstance(prompt, (UniversalPromptV2, UniversalPromptV3)):
@@ -189,6 +163,11 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
             )
             created_files.extend(plugin_files)
 
+        # Generate ignore files when a repository scan is configured
+        created_files.extend(
+            self._generate_ignore_files(prompt, output_dir, dry_run, verbose)
+        )
+
         return created_files
 
     def _generate_plugins(
@@ -216,17 +195,13 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
             if prompt.plugins.agents:
-                click.echo(DeprecationWarnings.v3_nested_plugin_field_warning("agents"))
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("agents"))
                 agents = prompt.plugins.agents
             if prompt.plugins.commands:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("commands")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("commands"))
                 commands = prompt.plugins.commands
 
         # Generate MCP server configurations
@@ -257,14 +232,13 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
             mcp_config = {"mcpServers": mcp_servers_config}
 
             if dry_run:
-                click.echo(f"  📁 Would create: {mcp_file}")
+                echo(f"  📁 Would create: {mcp_file}")
                 if verbose:
-                    click.echo(f"    {json.dumps(mcp_config, indent=2)[:200]}...")
+                    echo(f"    {json.dumps(mcp_config, indent=2)[:200]}...")
             else:
-                cursor_dir.mkdir(parents=True, exist_ok=True)
-                with open(mcp_file, "w", encoding="utf-8") as f:
-                    json.dump(mcp_config, f, indent=2)
-                click.echo(f"✅ Generated: {mcp_file}")
+                ensure_directory(cursor_dir)
+                write_generated_file(mcp_file, json.dumps(mcp_config, indent=2))
+                echo(f"✅ Generated: {mcp_file}")
             created_files.append(mcp_file)
 
         # Generate agent schemas
@@ -292,15 +266,16 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 }
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {schema_file}")
+                    echo(f"  📁 Would create: {schema_file}")
                     if verbose:
                         preview = json.dumps(agent_schema, indent=2)[:200] + "..."
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                 else:
-                    schemas_dir.mkdir(parents=True, exist_ok=True)
-                    with open(schema_file, "w", encoding="utf-8") as f:
-                        json.dump(agent_schema, f, indent=2)
-                    click.echo(f"✅ Generated: {schema_file}")
+                    ensure_directory(schemas_dir)
+                    write_generated_file(
+                        schema_file, json.dumps(agent_schema, indent=2)
+                    )
+                    echo(f"✅ Generated: {schema_file}")
                 created_files.append(schema_file)
 
         # Generate agent functions (tools available to agents)
@@ -354,15 +329,16 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                     ]
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {function_file}")
+                    echo(f"  📁 Would create: {function_file}")
                     if verbose:
                         preview = json.dumps(function_schema, indent=2)[:200] + "..."
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                 else:
-                    functions_dir.mkdir(parents=True, exist_ok=True)
-                    with open(function_file, "w", encoding="utf-8") as f:
-                        json.dump(function_schema, f, indent=2)
-                    click.echo(f"✅ Generated: {function_file}")
+                    ensure_directory(functions_dir)
+                    write_generated_file(
+                        function_file, json.dumps(function_schema, indent=2)
+                    )
+                    echo(f"✅ Generated: {function_file}")
                 created_files.append(function_file)
 
         return created_files
@@ -392,22 +368,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 "Apply coding standards to all source files",
             )
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {coding_file}")
-                if verbose:
-                    preview = (
-                        coding_content[:200] + "..."
-                        if len(coding_content) > 200
-                        else coding_content
-                    )
-                    click.echo(f"    {preview}")
-                created_files.append(coding_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(coding_file, "w", encoding="utf-8") as f:
-                    f.write(coding_content)
-                click.echo(f"✅ Generated: {coding_file}")
-                created_files.append(coding_file)
+            created_files.extend(
+                self.write_rule_file(coding_file, coding_content, dry_run, verbose)
+            )
 
         # Create testing guidelines rule
         if prompt.instructions and prompt.instructions.testing:
@@ -419,22 +382,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 "Apply testing guidelines to test files",
             )
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {testing_file}")
-                if verbose:
-                    preview = (
-                        testing_content[:200] + "..."
-                        if len(testing_content) > 200
-                        else testing_content
-                    )
-                    click.echo(f"    {preview}")
-                created_files.append(testing_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(testing_file, "w", encoding="utf-8") as f:
-                    f.write(testing_content)
-                click.echo(f"✅ Generated: {testing_file}")
-                created_files.append(testing_file)
+            created_files.extend(
+                self.write_rule_file(testing_file, testing_content, dry_run, verbose)
+            )
 
         # Create technology-specific rules if context provided
         if prompt.context and prompt.context.technologies:
@@ -442,22 +392,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 tech_file = rules_dir / f"{tech.lower()}-guidelines.mdc"
                 tech_content = self._build_tech_mdc_content(tech, prompt)
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
-                    if verbose:
-                        preview = (
-                            tech_content[:200] + "..."
-                            if len(tech_content) > 200
-                            else tech_content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(tech_file)
-                else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
-                    created_files.append(tech_file)
+                created_files.extend(
+                    self.write_rule_file(tech_file, tech_content, dry_run, verbose)
+                )
 
         return created_files
 
@@ -480,20 +417,19 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         index_content = self._build_single_index_content(prompt)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {index_file}")
+            echo(f"  📁 Would create: {index_file}")
             if verbose:
                 preview = (
                     index_content[:200] + "..."
                     if len(index_content) > 200
                     else index_content
                 )
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
             return [index_file]
         else:
-            rules_dir.mkdir(parents=True, exist_ok=True)
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(index_content)
-            click.echo(f"✅ Generated: {index_file}")
+            ensure_directory(rules_dir)
+            write_generated_file(index_file, index_content)
+            echo(f"✅ Generated: {index_file}")
             return [index_file]
 
     def _generate_agents_file(
@@ -511,16 +447,15 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         content = self._build_agents_content(prompt)
 
         if dry_run:
-            click.echo(f"  📁 Would create: {agents_file}")
+            echo(f"  📁 Would create: {agents_file}")
             if verbose:
-                click.echo("  📄 AGENTS.md preview:")
+                echo("  📄 AGENTS.md preview:")
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
             return [agents_file]
         else:
-            with open(agents_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {agents_file}")
+            write_generated_file(agents_file, content)
+            echo(f"✅ Generated: {agents_file}")
             return [agents_file]
 
     def _generate_legacy_cursorrules(
@@ -538,15 +473,14 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         output_file = output_dir / ".cursorrules"
 
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file} (legacy compatibility)")
+            echo(f"  📁 Would create: {output_file} (legacy compatibility)")
             if verbose:
-                click.echo("  📄 Content preview:")
+                echo("  📄 Content preview:")
                 preview = content[:200] + "..." if len(content) > 200 else content
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
         else:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            click.echo(f"✅ Generated: {output_file} (legacy compatibility)")
+            write_generated_file(output_file, content)
+            echo(f"✅ Generated: {output_file} (legacy compatibility)")
             return [output_file]
 
         return []
@@ -571,21 +505,20 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         index_file = rules_dir / "index.mdc"
 
         if dry_run:
-            click.echo(f"  📁 Would create merged: {index_file}")
+            echo(f"  📁 Would create merged: {index_file}")
             if verbose:
-                click.echo("  📄 Merged project overview preview:")
+                echo("  📄 Merged project overview preview:")
                 preview = (
                     index_content[:300] + "..."
                     if len(index_content) > 300
                     else index_content
                 )
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
             created_files.append(index_file)
         else:
-            rules_dir.mkdir(parents=True, exist_ok=True)
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(index_content)
-            click.echo(
+            ensure_directory(rules_dir)
+            write_generated_file(index_file, index_content)
+            echo(
                 f"✅ Generated merged project overview: {index_file} (from {len(prompt_files)} files)"
             )
             created_files.append(index_file)
@@ -846,54 +779,83 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         verbose: bool,
     ) -> List[Path]:
         """Generate Cursor ignore files for better indexing control."""
-        # V2/V3 doesn't generate ignore files
-        if isinstance(prompt, (UniversalPromptV2, UniversalPromptV3)):
+        scan = self._scan_repository(prompt, output_dir, dry_run, verbose)
+
+        # V2/V3 only generate ignore files from a repository scan
+        if scan is None and isinstance(prompt, (UniversalPromptV2, UniversalPromptV3)):
             return []
         created_files = []
 
         # Generate .cursorignore for files to ignore completely
-        cursorignore_content = self._build_cursorignore_content(prompt)
+        cursorignore_content = self._build_cursorignore_content(prompt, scan)
         cursorignore_file = output_dir / ".cursorignore"
 
         if dry_run:
-            click.echo(f"  📁 Would create: {cursorignore_file}")
+            echo(f"  📁 Would create: {cursorignore_file}")
             if verbose:
                 preview = (
                     cursorignore_content[:200] + "..."
                     if len(cursorignore_content) > 200
                     else cursorignore_content
                 )
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
             created_files.append(cursorignore_file)
         else:
-            with open(cursorignore_file, "w", encoding="utf-8") as f:
-                f.write(cursorignore_content)
-            click.echo(f"✅ Generated: {cursorignore_file}")
+            write_generated_file(cursorignore_file, cursorignore_content)
+            echo(f"✅ Generated: {cursorignore_file}")
             created_files.append(cursorignore_file)
 
         # Generate .cursorindexingignore for indexing control
-        indexignore_content = self._build_indexing_ignore_content(prompt)
+        indexignore_content = self._build_indexing_ignore_content(prompt, scan)
         indexignore_file = output_dir / ".cursorindexingignore"
 
         if dry_run:
-            click.echo(f"  📁 Would create: {indexignore_file}")
+            echo(f"  📁 Would create: {indexignore_file}")
             if verbose:
                 preview = (
                     indexignore_content[:200] + "..."
                     if len(indexignore_content) > 200
                     else indexignore_content
                 )
-                click.echo(f"    {preview}")
+                echo(f"    {preview}")
             created_files.append(indexignore_file)
         else:
-            with open(indexignore_file, "w", encoding="utf-8") as f:
-                f.write(indexignore_content)
-            click.echo(f"✅ Generated: {indexignore_file}")
+            write_generated_file(indexignore_file, indexignore_content)
+            echo(f"✅ Generated: {indexignore_file}")
             created_files.append(indexignore_file)
 
         return created_files
 
-    def _build_cursorignore_content(self, prompt: UniversalPrompt) -> str:
+    def _scan_repository(
+        self,
+        prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+        output_dir: Path,
+        dry_run: bool,
+        verbose: bool,
+    ) -> Optional[ScanResult]:
+        """Scan the repository if the prompt opts in (repository_scan)."""
+        config = getattr(prompt, "repository_scan", None)
+        if config is None or not config.enabled:
+            return None
+
+        # Previews (dry runs, --diff) leave nothing on disk, the cache included
+        scan = scan_repository(
+            output_dir, config, write_cache=not dry_run and not is_preview()
+        )
+        if verbose:
+            ignored, indexing_ignored = scan.patterns()
+            echo(
+                f"  🔍 Scanned {scan.files} file(s) ({scan.sniffed} read): "
+                f"{len(ignored)} ignore and {len(indexing_ignored)} "
+                "indexing-ignore pattern(s)"
+            )
+        return scan
+
+    def _build_cursorignore_content(
+        self,
+        prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+        scan: Optional[ScanResult] = None,
+    ) -> str:
         """Build .cursorignore content for files to exclude from Cursor."""
         lines = []
 
@@ -933,9 +895,10 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         lines.append("")
 
         # Technology-specific ignore patterns (avoid duplicates)
-        if prompt.context and prompt.context.technologies:
+        context = getattr(prompt, "context", None)
+        if context and context.technologies:
             tech_categories = set()
-            tech_lower_list = [tech.lower() for tech in prompt.context.technologies]
+            tech_lower_list = [tech.lower() for tech in context.technologies]
 
             # Determine which tech categories are present
             if any(
@@ -969,9 +932,16 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 lines.append("*.jar")
                 lines.append("")
 
+        if scan is not None:
+            lines.extend(scan.format_sections(scan.ignore))
+
         return "\n".join(lines)
 
-    def _build_indexing_ignore_content(self, prompt: UniversalPrompt) -> str:
+    def _build_indexing_ignore_content(
+        self,
+        prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+        scan: Optional[ScanResult] = None,
+    ) -> str:
         """Build .cursorindexingignore content for indexing control."""
         lines = []
 
@@ -1006,6 +976,9 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
         lines.append("libs/")
         lines.append("")
 
+        if scan is not None:
+            lines.extend(scan.format_sections(scan.indexing_ignore))
+
         return "\n".join(lines)
 
     def _build_legacy_content(self, prompt: UniversalPrompt) -> str:
@@ -1258,19 +1231,18 @@ class CursorAdapter(MarkdownSyncMixin, EditorAdapter):
                 )
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {rule_file}")
+                    echo(f"  📁 Would create: {rule_file}")
                     if verbose:
                         preview = (
                             rule_content[:200] + "..."
                             if len(rule_content) > 200
                             else rule_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(rule_file)
                 else:
-                    with open(rule_file, "w", encoding="utf-8") as f:
-                        f.write(rule_content)
-                    click.echo(f"✅ Generated: {rule_file}")
+                    write_generated_file(rule_file, rule_content)
+                    echo(f"✅ Generated: {rule_file}")
                     created_files.append(rule_file)
 
         return created_files
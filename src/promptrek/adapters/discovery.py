@@ -0,0 +1,214 @@
+"""
+Adapter discovery through entry points, with a cached metadata index.
+
+Third-party packages provide adapters by declaring an entry point in the
+``promptrek.adapters`` group, for example in pyproject.toml::
+
+    [project.entry-points."promptrek.adapters"]
+    my-editor = "my_package.adapter:MyEditorAdapter"
+
+Importing every adapter just to list names and descriptions would slow down
+every CLI call, so the name, description, file patterns, capabilities and
+descriptor of each adapter are cached in an index file. The index is rebuilt
+only when installed distributions (or the built-in adapters) change; adapter
+code itself is imported on first use by the registry.
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from ..utils.locking import atomic_write
+from ..utils.outputs import echo
+from .base import EditorAdapter
+from .registry import AdapterCapability, AdapterDescriptor
+
+# Entry point group for third-party adapters
+ENTRY_POINT_GROUP = "promptrek.adapters"
+
+# Bumped whenever the layout of index entries changes
+INDEX_VERSION = 3
+
+
+def index_path() -> Path:
+    """
+    Get the adapter index file.
+
+    Uses $PROMPTREK_CACHE_DIR if set, otherwise promptrek/ in $XDG_CACHE_HOME
+    or ~/.cache.
+
+    Returns:
+        Path to the index file
+    """
+    cache_dir = os.environ.get("PROMPTREK_CACHE_DIR")
+    if not cache_dir:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        cache_dir = str(Path(cache_home) / "promptrek")
+    return Path(cache_dir) / "adapter-index.json"
+
+
+def load_adapter_index(
+    builtins: Dict[str, str], index_file: Optional[Path] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load adapter metadata, rebuilding the index if the environment changed.
+
+    Args:
+        builtins: Built-in adapter names mapped to 'module:Class' references
+        index_file: Index file to use (defaults to index_path())
+
+    Returns:
+        Adapter name mapped to its index entry ('reference', 'description',
+        'file_patterns', 'capabilities', 'descriptor')
+    """
+    index_file = index_file or index_path()
+    fingerprint = environment_fingerprint(builtins)
+
+    try:
+        with open(index_file, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if (
+            index.get("version") == INDEX_VERSION
+            and index.get("fingerprint") == fingerprint
+        ):
+            adapters: Dict[str, Dict[str, Any]] = index["adapters"]
+            return adapters
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing or unreadable index, rebuild it
+
+    adapters = build_adapter_index(builtins)
+    try:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(
+            index_file,
+            json.dumps(
+                {
+                    "version": INDEX_VERSION,
+                    "fingerprint": fingerprint,
+                    "adapters": adapters,
+                },
+                indent=2,
+            ),
+        )
+    except OSError:
+        pass  # Read-only cache, the index is rebuilt next time
+    return adapters
+
+
+def build_adapter_index(builtins: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Import the built-in and entry point adapters and collect their metadata.
+
+    Adapters that fail to load are skipped with a warning. Built-in names
+    cannot be taken over by entry points.
+
+    Args:
+        builtins: Built-in adapter names mapped to 'module:Class' references
+
+    Returns:
+        Adapter name mapped to its index entry
+    """
+    adapters: Dict[str, Dict[str, Any]] = {}
+    for name, reference in list(builtins.items()) + entry_point_references():
+        if name in adapters:
+            continue
+        try:
+            adapter_class = import_reference(reference)
+        except Exception as e:
+            echo(f"⚠️  Could not load adapter '{name}' ({reference}): {e}", err=True)
+            continue
+        if not (
+            isinstance(adapter_class, type) and issubclass(adapter_class, EditorAdapter)
+        ):
+            echo(
+                f"⚠️  Ignoring adapter '{name}': {reference} is not an EditorAdapter",
+                err=True,
+            )
+            continue
+        adapters[name] = _index_entry(reference, adapter_class)
+    return adapters
+
+
+def entry_point_references() -> List[Tuple[str, str]]:
+    """Get (name, 'module:Class') for every installed adapter entry point."""
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        selected = entry_points.select(group=ENTRY_POINT_GROUP)
+    else:  # pragma: no cover - Python 3.9
+        selected = entry_points.get(ENTRY_POINT_GROUP, [])  # type: ignore
+    return sorted((ep.name, ep.value) for ep in selected)
+
+
+def import_reference(reference: str) -> Any:
+    """
+    Import the object named by a 'module:attribute' reference.
+
+    Args:
+        reference: Module path and attribute, separated by a colon
+
+    Returns:
+        The referenced object
+    """
+    module_name, _, attribute = reference.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in filter(None, attribute.split(".")):
+        target = getattr(target, part)
+    return target
+
+
+def environment_fingerprint(builtins: Dict[str, str]) -> str:
+    """
+    Fingerprint the installed distributions and built-in adapters.
+
+    Installing, upgrading or removing a distribution changes the modification
+    time of its site directory, and editing a built-in adapter changes that of
+    its module, so either invalidates the index without reading any package
+    metadata.
+
+    Args:
+        builtins: Built-in adapter names mapped to 'module:Class' references
+
+    Returns:
+        Hex digest identifying the current environment
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{INDEX_VERSION}\0{sys.version}\0".encode("utf-8"))
+    for name, reference in sorted(builtins.items()):
+        digest.update(f"{name}={reference}\0".encode("utf-8"))
+
+    cwd = os.getcwd()
+    paths = [p for p in sys.path if p and os.path.abspath(p) != cwd]
+    paths.extend(str(p) for p in sorted(Path(__file__).parent.glob("*.py")))
+    for path in paths:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        digest.update(f"{path}\0{mtime}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _index_entry(reference: str, adapter_class: Type[EditorAdapter]) -> Dict[str, Any]:
+    """Collect the index entry of an adapter class."""
+    capabilities = list(
+        getattr(
+            adapter_class,
+            "_capabilities",
+            [AdapterCapability.GENERATES_PROJECT_FILES],
+        )
+    )
+    descriptor = getattr(
+        adapter_class, "_descriptor", None
+    ) or AdapterDescriptor.from_adapter_class(adapter_class, capabilities)
+    return {
+        "reference": reference,
+        "description": getattr(adapter_class, "_description", "No description"),
+        "file_patterns": list(getattr(adapter_class, "_file_patterns", [])),
+        "capabilities": [capability.value for capability in capabilities],
+        "descriptor": descriptor.to_dict(),
+    }
@@ -5,10 +5,9 @@ JetBrains AI adapter implementation.
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import ValidationError
 from ..core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from ..utils.outputs import echo, ensure_directory, write_generated_file
 from .base import EditorAdapter
 from .sync_mixin import MarkdownSyncMixin
 
@@ -86,18 +85,17 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
                 output_file = rules_dir / filename
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
+                    echo(f"  📁 Would create: {output_file}")
                     if verbose:
                         preview = (
                             content[:200] + "..." if len(content) > 200 else content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(output_file)
                 else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {output_file}")
+                    ensure_directory(rules_dir)
+                    write_generated_file(output_file, content)
+                    echo(f"✅ Generated: {output_file}")
                     created_files.append(output_file)
         else:
             # No documents, use main content as general.md
@@ -110,16 +108,15 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
             output_file = rules_dir / "general.md"
 
             if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
+                echo(f"  📁 Would create: {output_file}")
                 if verbose:
                     preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(output_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(output_file, content)
+                echo(f"✅ Generated: {output_file}")
                 created_files.append(output_file)
 
         return created_files
@@ -203,20 +200,19 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {general_file}")
+                echo(f"  📁 Would create: {general_file}")
                 if verbose:
                     preview = (
                         general_content[:200] + "..."
                         if len(general_content) > 200
                         else general_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(general_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(general_file, "w", encoding="utf-8") as f:
-                    f.write(general_content)
-                click.echo(f"✅ Generated: {general_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(general_file, general_content)
+                echo(f"✅ Generated: {general_file}")
                 created_files.append(general_file)
 
         # Generate code style rules
@@ -227,20 +223,19 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {style_file}")
+                echo(f"  📁 Would create: {style_file}")
                 if verbose:
                     preview = (
                         style_content[:200] + "..."
                         if len(style_content) > 200
                         else style_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(style_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(style_file, "w", encoding="utf-8") as f:
-                    f.write(style_content)
-                click.echo(f"✅ Generated: {style_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(style_file, style_content)
+                echo(f"✅ Generated: {style_file}")
                 created_files.append(style_file)
 
         # Generate testing rules
@@ -251,20 +246,19 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
             )
 
             if dry_run:
-                click.echo(f"  📁 Would create: {testing_file}")
+                echo(f"  📁 Would create: {testing_file}")
                 if verbose:
                     preview = (
                         testing_content[:200] + "..."
                         if len(testing_content) > 200
                         else testing_content
                     )
-                    click.echo(f"    {preview}")
+                    echo(f"    {preview}")
                 created_files.append(testing_file)
             else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(testing_file, "w", encoding="utf-8") as f:
-                    f.write(testing_content)
-                click.echo(f"✅ Generated: {testing_file}")
+                ensure_directory(rules_dir)
+                write_generated_file(testing_file, testing_content)
+                echo(f"✅ Generated: {testing_file}")
                 created_files.append(testing_file)
 
         # Generate technology-specific rules
@@ -274,20 +268,19 @@ class JetBrainsAdapter(MarkdownSyncMixin, EditorAdapter):
                 tech_content = self._build_tech_rules_content(tech, prompt)
 
                 if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
+                    echo(f"  📁 Would create: {tech_file}")
                     if verbose:
                         preview = (
                             tech_content[:200] + "..."
                             if len(tech_content) > 200
                             else tech_content
                         )
-                        click.echo(f"    {preview}")
+                        echo(f"    {preview}")
                     created_files.append(tech_file)
                 else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
+                    ensure_directory(rules_dir)
+                    write_generated_file(tech_file, tech_content)
+                    echo(f"✅ Generated: {tech_file}")
                     created_files.append(tech_file)
 
         return created_files
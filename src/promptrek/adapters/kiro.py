@@ -6,8 +6,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import (
     DocumentConfig,
@@ -16,9 +14,11 @@ from ..core.models import (
     UniversalPromptV2,
     UniversalPromptV3,
 )
+from ..utils.outputs import echo, ensure_directory, write_generated_file
+from ..utils.splitter import group_part_files
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
-from .sync_mixin import MarkdownSyncMixin
+from .sync_mixin import MarkdownSyncMixin, is_unchanged_file, read_rule_file
 
 
 class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
@@ -115,20 +115,9 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 )
                 output_file = steering_dir / filename
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
-                    if verbose:
-                        preview = (
-                            content[:200] + "..." if len(content) > 200 else content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(output_file)
-                else:
-                    steering_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {output_file}")
-                    created_files.append(output_file)
+                created_files.extend(
+                    self.write_rule_file(output_file, content, dry_run, verbose)
+                )
         else:
             # No documents, use main content as project steering
             content = prompt.content
@@ -139,18 +128,9 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
 
             output_file = steering_dir / "project.md"
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
-                if verbose:
-                    preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
-                created_files.append(output_file)
-            else:
-                steering_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
-                created_files.append(output_file)
+            created_files.extend(
+                self.write_rule_file(output_file, content, dry_run, verbose)
+            )
 
         return created_files
 
@@ -180,9 +160,7 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
 
         # Generate MCP config if we have MCP servers
@@ -225,7 +203,7 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             if existing_config:
                 # Merge with existing config
                 if verbose:
-                    click.echo("  ℹ️  Merging MCP servers with existing Kiro config")
+                    echo("  ℹ️  Merging MCP servers with existing Kiro config")
                 merged_config = self.merge_mcp_config(
                     existing_config, mcp_config, format_style="standard"
                 )
@@ -256,22 +234,9 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         main_file = steering_dir / "project.md"
         main_content = self._build_project_steering(prompt, conditional_content)
 
-        if dry_run:
-            click.echo(f"  📁 Would create: {main_file}")
-            if verbose:
-                preview = (
-                    main_content[:200] + "..."
-                    if len(main_content) > 200
-                    else main_content
-                )
-                click.echo(f"    {preview}")
-            created_files.append(main_file)
-        else:
-            steering_dir.mkdir(parents=True, exist_ok=True)
-            with open(main_file, "w", encoding="utf-8") as f:
-                f.write(main_content)
-            click.echo(f"✅ Generated: {main_file}")
-            created_files.append(main_file)
+        created_files.extend(
+            self.write_rule_file(main_file, main_content, dry_run, verbose)
+        )
 
         # Generate instruction category steering documents
         if prompt.instructions:
@@ -283,21 +248,11 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                         category, instructions, prompt
                     )
 
-                    if dry_run:
-                        click.echo(f"  📁 Would create: {category_file}")
-                        if verbose:
-                            preview = (
-                                category_content[:200] + "..."
-                                if len(category_content) > 200
-                                else category_content
-                            )
-                            click.echo(f"    {preview}")
-                        created_files.append(category_file)
-                    else:
-                        with open(category_file, "w", encoding="utf-8") as f:
-                            f.write(category_content)
-                        click.echo(f"✅ Generated: {category_file}")
-                        created_files.append(category_file)
+                    created_files.extend(
+                        self.write_rule_file(
+                            category_file, category_content, dry_run, verbose
+                        )
+                    )
 
         return created_files
 
@@ -431,12 +386,14 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         documents = []
         main_content = None
 
-        for md_file in sorted(steering_dir.glob("*.md")):
+        for doc_name, md_files in group_part_files(steering_dir.glob("*.md")):
+            if doc_name.lower() != "project" and all(
+                is_unchanged_file(md_file) for md_file in md_files
+            ):
+                continue
             try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                doc_name = md_file.stem  # Remove .md extension
+                # Parts of a split document are read back as one document
+                content = read_rule_file(md_files)
 
                 # Special handling: project.md becomes the main content field
                 # This is the default file generated by PrompTrek and should not be renamed
@@ -453,7 +410,7 @@ class KiroAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                     )
 
             except Exception as e:
-                click.echo(f"Warning: Could not parse {md_file}: {e}")
+                echo(f"Warning: Could not parse {md_files[0]}: {e}")
 
         # Create metadata
         metadata = PromptMetadata(
@@ -9,9 +9,14 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import click
-
 from ..core.models import MCPServer
+from ..utils.outputs import (
+    confirm,
+    echo,
+    ensure_directory,
+    prompt_input,
+    update_generated_file,
+)
 
 
 class MCPGenerationMixin:
@@ -53,19 +58,19 @@ class MCPGenerationMixin:
             True if user confirms (or dry_run), False otherwise
         """
         if dry_run:
-            click.echo(f"\n⚠️  Would update system-wide {editor_name} MCP configuration")
-            click.echo(f"   Location: {system_path}")
+            echo(f"\n⚠️  Would update system-wide {editor_name} MCP configuration")
+            echo(f"   Location: {system_path}")
             return True
 
-        click.echo(f"\n⚠️  {editor_name} MCP Configuration Warning")
-        click.echo(
+        echo(f"\n⚠️  {editor_name} MCP Configuration Warning")
+        echo(
             f"   {editor_name} does not support project-level MCP server configuration"
         )
-        click.echo("   This will update your system-wide configuration at:")
-        click.echo(f"   {system_path}")
-        click.echo("")
+        echo("   This will update your system-wide configuration at:")
+        echo(f"   {system_path}")
+        echo("")
 
-        return click.confirm(
+        return confirm(
             f"Update system-wide {editor_name} MCP configuration?", default=False
         )
 
@@ -169,22 +174,57 @@ class MCPGenerationMixin:
             True if successful (or dry_run), False otherwise
         """
         if dry_run:
-            click.echo(f"  📁 Would create: {output_file}")
+            echo(f"  📁 Would create: {output_file}")
             if verbose:
                 preview = json.dumps(config, indent=2)[:300]
-                click.echo(f"    {preview}...")
+                echo(f"    {preview}...")
             return True
 
         try:
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
-            click.echo(f"✅ Generated: {output_file}")
+            ensure_directory(output_file.parent)
+            # Merge into the file as it is now, under its lock, so servers
+            # another run added since it was read are kept
+            update_generated_file(
+                output_file,
+                lambda existing: json.dumps(
+                    self._merge_current_mcp_config(existing, config), indent=2
+                ),
+            )
+            echo(f"✅ Generated: {output_file}")
             return True
         except Exception as e:
-            click.echo(f"❌ Error writing {output_file}: {e}", err=True)
+            echo(f"❌ Error writing {output_file}: {e}", err=True)
             return False
 
+    def _merge_current_mcp_config(
+        self, existing: Optional[str], config: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Merge a configuration into the current content of its file.
+
+        Args:
+            existing: Current file content, or None if it does not exist
+            config: Configuration to write
+
+        Returns:
+            The configuration with servers only present on disk added
+        """
+        try:
+            current = json.loads(existing) if existing is not None else None
+        except ValueError:
+            return config
+        if not isinstance(current, dict) or not isinstance(
+            current.get("mcpServers"), dict
+        ):
+            return config
+
+        merged = {**current, **config}
+        merged["mcpServers"] = {
+            **current["mcpServers"],
+            **config.get("mcpServers", {}),
+        }
+        return merged
+
     def read_existing_mcp_config(self, config_file: Path) -> Optional[Dict[str, Any]]:
         """
         Read existing MCP configuration file.
@@ -203,7 +243,7 @@ class MCPGenerationMixin:
                 result: Dict[str, Any] = json.load(f)
                 return result
         except Exception as e:
-            click.echo(f"⚠️  Warning: Could not read {config_file}: {e}", err=True)
+            echo(f"⚠️  Warning: Could not read {config_file}: {e}", err=True)
             return None
 
     def prompt_merge_strategy(self, config_file: Path, editor_name: str) -> str:
@@ -217,14 +257,14 @@ class MCPGenerationMixin:
         Returns:
             Strategy choice: 'merge', 'replace', 'skip', or 'system'
         """
-        click.echo(f"\nℹ️  Existing {editor_name} config found at {config_file}")
-        click.echo("\nChoose action:")
-        click.echo("  1. Merge MCP servers with existing config (recommended)")
-        click.echo("  2. Replace entire config (⚠️  will overwrite existing)")
-        click.echo(f"  3. Skip {editor_name} MCP generation")
-        click.echo("  4. Use system-wide config instead")
+        echo(f"\nℹ️  Existing {editor_name} config found at {config_file}")
+        echo("\nChoose action:")
+        echo("  1. Merge MCP servers with existing config (recommended)")
+        echo("  2. Replace entire config (⚠️  will overwrite existing)")
+        echo(f"  3. Skip {editor_name} MCP generation")
+        echo("  4. Use system-wide config instead")
 
-        choice = click.prompt("Choice", type=int, default=1)
+        choice = prompt_input("Choice", type=int, default=1)
 
         strategy_map = {1: "merge", 2: "replace", 3: "skip", 4: "system"}
         return strategy_map.get(choice, "merge")
@@ -301,24 +341,22 @@ class MCPGenerationMixin:
             True if user confirms overwrite (or dry_run), False otherwise
         """
         if dry_run:
-            click.echo(
+            echo(
                 f"\n⚠️  Would overwrite existing MCP server '{server_name}' with different configuration"
             )
             return True
 
-        click.echo("\n⚠️  Conflicting MCP Server Configuration Detected")
-        click.echo(f"   Server name: {server_name}")
-        click.echo("")
-        click.echo("   Existing configuration:")
-        click.echo(f"   {json.dumps(existing_config, indent=2)}")
-        click.echo("")
-        click.echo("   New configuration:")
-        click.echo(f"   {json.dumps(new_config, indent=2)}")
-        click.echo("")
-
-        return click.confirm(
-            f"Overwrite existing '{server_name}' MCP server?", default=False
-        )
+        echo("\n⚠️  Conflicting MCP Server Configuration Detected")
+        echo(f"   Server name: {server_name}")
+        echo("")
+        echo("   Existing configuration:")
+        echo(f"   {json.dumps(existing_config, indent=2)}")
+        echo("")
+        echo("   New configuration:")
+        echo(f"   {json.dumps(new_config, indent=2)}")
+        echo("")
+
+        return confirm(f"Overwrite existing '{server_name}' MCP server?", default=False)
 
     def warn_user_level_operations(
         self,
@@ -340,24 +378,22 @@ class MCPGenerationMixin:
             True if user confirms to proceed (or dry_run), False otherwise
         """
         if dry_run:
-            click.echo(f"\n⚠️  Would update user-level {editor_name} MCP configuration")
-            click.echo(f"   Location: {config_path}")
-            click.echo(f"   Servers to add/update: {server_count}")
+            echo(f"\n⚠️  Would update user-level {editor_name} MCP configuration")
+            echo(f"   Location: {config_path}")
+            echo(f"   Servers to add/update: {server_count}")
             return True
 
-        click.echo(f"\n⚠️  {editor_name} User-Level MCP Configuration Warning")
-        click.echo(
+        echo(f"\n⚠️  {editor_name} User-Level MCP Configuration Warning")
+        echo(
             f"   {editor_name} does not support project-level MCP server configuration"
         )
-        click.echo("   This will update your user-level configuration at:")
-        click.echo(f"   {config_path}")
-        click.echo("")
-        click.echo(f"   MCP servers to add/update: {server_count}")
-        click.echo(
-            "   Note: Existing MCP servers will NOT be removed, only added/updated"
-        )
-        click.echo("")
-
-        return click.confirm(
+        echo("   This will update your user-level configuration at:")
+        echo(f"   {config_path}")
+        echo("")
+        echo(f"   MCP servers to add/update: {server_count}")
+        echo("   Note: Existing MCP servers will NOT be removed, only added/updated")
+        echo("")
+
+        return confirm(
             f"Proceed with user-level {editor_name} MCP configuration?", default=False
         )
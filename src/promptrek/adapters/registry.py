@@ -2,9 +2,11 @@
 Adapter registry for managing and discovering editor adapters.
 """
 
+import inspect
+import threading
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, Iterable, List, Optional, Set, Type
 
 from ..core.exceptions import AdapterNotFoundError
 from .base import EditorAdapter
@@ -21,6 +23,158 @@ class AdapterCapability(Enum):
     MULTIPLE_FILE_GENERATION = "multiple_file_generation"
 
 
+# Where an adapter writes MCP server configuration
+MCP_SCOPES = ("none", "project", "user")
+
+
+class AdapterDescriptor:
+    """
+    Declared features of an editor adapter.
+
+    Each adapter declares its descriptor when it is registered, so callers
+    can decide how to drive an adapter (which generation method to call and
+    with which arguments) from a lookup instead of inspecting the adapter.
+    """
+
+    __slots__ = (
+        "headless",
+        "merged",
+        "multiple",
+        "sync",
+        "plugins",
+        "mcp_scope",
+        "output_paths",
+        "context_paths",
+        "max_file_chars",
+        "max_file_lines",
+        "multi_file_strategy",
+    )
+
+    def __init__(
+        self,
+        *,
+        headless: bool = False,
+        merged: bool = False,
+        multiple: bool = False,
+        sync: bool = False,
+        plugins: bool = False,
+        mcp_scope: str = "none",
+        output_paths: Iterable[str] = (),
+        context_paths: Iterable[str] = (),
+        max_file_chars: Optional[int] = None,
+        max_file_lines: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a descriptor.
+
+        Args:
+            headless: Generation methods accept the 'headless' argument
+            merged: Implements generate_merged() for several prompt files
+            multiple: Implements generate_multiple() (one output per file)
+            sync: Implements parse_files() for syncing editor files back
+            plugins: Generates agents, commands, hooks or MCP servers
+            mcp_scope: Where MCP servers are configured ('none', 'project'
+                or 'user')
+            output_paths: Paths the adapter writes, relative to the output
+                directory; '{name}' stands for a document, command or agent
+                name
+            context_paths: Output paths the editor loads into the model's
+                context on every request (unless the file's frontmatter
+                limits it to matching files)
+            max_file_chars: Most characters the editor handles well in one
+                rule file; larger files are written as numbered parts
+            max_file_lines: Most lines the editor handles well in one rule
+                file
+        """
+        if mcp_scope not in MCP_SCOPES:
+            raise ValueError(
+                f"Invalid MCP scope '{mcp_scope}' (expected one of {MCP_SCOPES})"
+            )
+        self.headless = headless
+        self.merged = merged
+        self.multiple = multiple
+        self.sync = sync
+        self.plugins = plugins
+        self.mcp_scope = mcp_scope
+        self.output_paths = tuple(output_paths)
+        self.context_paths = tuple(context_paths)
+        self.max_file_chars = max_file_chars
+        self.max_file_lines = max_file_lines
+        # How several prompt files are generated: 'multiple', 'merged' or
+        # 'last' (only the last file is used)
+        self.multi_file_strategy = (
+            "multiple" if multiple else "merged" if merged else "last"
+        )
+
+    @classmethod
+    def from_adapter_class(
+        cls,
+        adapter_class: Type[EditorAdapter],
+        capabilities: Optional[Iterable[AdapterCapability]] = None,
+    ) -> "AdapterDescriptor":
+        """
+        Derive a descriptor for an adapter registered without one.
+
+        This inspects the class once, at registration, so adapters written
+        before descriptors existed keep working.
+
+        Args:
+            adapter_class: Adapter class
+            capabilities: Capabilities the adapter was registered with
+
+        Returns:
+            Descriptor matching the methods the class overrides
+        """
+
+        def overrides(method: str) -> bool:
+            return getattr(adapter_class, method, None) is not getattr(
+                EditorAdapter, method
+            )
+
+        try:
+            headless = (
+                "headless"
+                in inspect.signature(getattr(adapter_class, "generate")).parameters
+            )
+        except (AttributeError, TypeError, ValueError):
+            headless = False
+
+        return cls(
+            headless=headless,
+            merged=overrides("generate_merged"),
+            multiple=overrides("generate_multiple")
+            and AdapterCapability.MULTIPLE_FILE_GENERATION in set(capabilities or ()),
+            sync=overrides("parse_files"),
+            plugins=hasattr(adapter_class, "_generate_plugins"),
+            mcp_scope="none",
+            output_paths=getattr(adapter_class, "_file_patterns", ()),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AdapterDescriptor":
+        """Create a descriptor from the output of to_dict()."""
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the descriptor as a dictionary."""
+        return {
+            "headless": self.headless,
+            "merged": self.merged,
+            "multiple": self.multiple,
+            "sync": self.sync,
+            "plugins": self.plugins,
+            "mcp_scope": self.mcp_scope,
+            "output_paths": list(self.output_paths),
+            "context_paths": list(self.context_paths),
+            "max_file_chars": self.max_file_chars,
+            "max_file_lines": self.max_file_lines,
+        }
+
+    def __repr__(self) -> str:
+        features = [key for key, value in self.to_dict().items() if value is True]
+        return f"AdapterDescriptor({', '.join(features)}, mcp={self.mcp_scope!r})"
+
+
 class AdapterRegistry:
     """Registry for managing editor adapters."""
 
@@ -28,48 +182,142 @@ class AdapterRegistry:
         self._adapters: Dict[str, EditorAdapter] = {}
         self._adapter_classes: Dict[str, Type[EditorAdapter]] = {}
         self._capabilities: Dict[str, Set[AdapterCapability]] = {}
+        self._descriptors: Dict[str, AdapterDescriptor] = {}
+        # Lazily registered adapters ('module:Class') and their cached
+        # description and file patterns
+        self._references: Dict[str, str] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        # Guards lazy instantiation so concurrent callers share one instance
+        self._lock = threading.Lock()
+        # Entry point discovery deferred to first use (see discover_on_use)
+        self._discovery_pending = False
+        self._discovery_index: Optional[Path] = None
+        self._discovery_lock = threading.Lock()
 
     def register(
         self,
         adapter: EditorAdapter,
         capabilities: Optional[List[AdapterCapability]] = None,
+        descriptor: Optional[AdapterDescriptor] = None,
     ) -> None:
-        """Register an adapter instance with its capabilities."""
+        """Register an adapter instance with its capabilities and descriptor."""
         self._adapters[adapter.name] = adapter
         if capabilities:
             self._capabilities[adapter.name] = set(capabilities)
+        self._descriptors[adapter.name] = (
+            descriptor
+            or AdapterDescriptor.from_adapter_class(type(adapter), capabilities)
+        )
 
     def register_class(
         self,
         name: str,
         adapter_class: Type[EditorAdapter],
         capabilities: Optional[List[AdapterCapability]] = None,
+        descriptor: Optional[AdapterDescriptor] = None,
     ) -> None:
         """Register an adapter class that will be instantiated on demand."""
         self._adapter_classes[name] = adapter_class
         if capabilities:
             self._capabilities[name] = set(capabilities)
+        self._descriptors[name] = descriptor or AdapterDescriptor.from_adapter_class(
+            adapter_class, capabilities
+        )
+
+    def register_lazy(
+        self,
+        name: str,
+        reference: str,
+        capabilities: Optional[List[AdapterCapability]] = None,
+        descriptor: Optional[AdapterDescriptor] = None,
+    ) -> None:
+        """
+        Register an adapter by reference, importing it on first use.
+
+        Args:
+            name: Adapter name
+            reference: Adapter class as 'module:Class'
+            capabilities: Adapter capabilities
+            descriptor: Declared features (derived on import when omitted)
+        """
+        self._references[name] = reference
+        if capabilities:
+            self._capabilities[name] = set(capabilities)
+        if descriptor:
+            self._descriptors[name] = descriptor
+
+    def _is_registered(self, name: str) -> bool:
+        """Check whether an adapter is registered (without discovery)."""
+        return (
+            name in self._adapters
+            or name in self._adapter_classes
+            or name in self._references
+        )
+
+    def _discover_pending(self) -> None:
+        """Run entry point discovery deferred with discover_on_use()."""
+        if not self._discovery_pending:
+            return
+        with self._discovery_lock:
+            if self._discovery_pending:
+                self._discovery_pending = False
+                self.discover_adapters(self._discovery_index)
 
     def get(self, name: str) -> EditorAdapter:
         """Get an adapter by name."""
         if name in self._adapters:
             return self._adapters[name]
+        if not self._is_registered(name):
+            self._discover_pending()
 
-        if name in self._adapter_classes:
-            # Instantiate the adapter class
-            adapter_class = self._adapter_classes[name]
-            adapter = adapter_class()  # type: ignore[call-arg]
-            self._adapters[name] = adapter
-            return adapter
+        if name in self._adapter_classes or name in self._references:
+            with self._lock:
+                if name not in self._adapters:
+                    # Instantiate the adapter class
+                    adapter_class = self._load_class(name)
+                    self._adapters[name] = adapter_class()  # type: ignore[call-arg]
+                return self._adapters[name]
 
         raise AdapterNotFoundError(f"No adapter found for '{name}'")
 
+    def _load_class(self, name: str) -> Type[EditorAdapter]:
+        """Get an adapter class, importing it if it was registered lazily."""
+        if name not in self._adapter_classes:
+            from .discovery import import_reference
+
+            adapter_class = import_reference(self._references[name])
+            self._adapter_classes[name] = adapter_class
+            if name not in self._descriptors:
+                self._descriptors[name] = AdapterDescriptor.from_adapter_class(
+                    adapter_class, self._capabilities.get(name)
+                )
+        return self._adapter_classes[name]
+
+    def get_descriptor(self, name: str) -> AdapterDescriptor:
+        """Get the declared features of an adapter without instantiating it."""
+        if not self._is_registered(name):
+            self._discover_pending()
+        if name not in self._descriptors and name in self._references:
+            with self._lock:
+                self._load_class(name)
+        descriptor = self._descriptors.get(name)
+        if descriptor is None:
+            raise AdapterNotFoundError(f"No adapter found for '{name}'")
+        return descriptor
+
     def list_adapters(self) -> List[str]:
         """Get list of all registered adapter names."""
-        return list(set(self._adapters.keys()) | set(self._adapter_classes.keys()))
+        self._discover_pending()
+        return list(
+            set(self._adapters.keys())
+            | set(self._adapter_classes.keys())
+            | set(self._references.keys())
+        )
 
     def get_adapter_info(self, name: str) -> Dict[str, Any]:
         """Get information about an adapter without instantiating it."""
+        if not self._is_registered(name):
+            self._discover_pending()
         if name in self._adapters:
             adapter = self._adapters[name]
             capabilities = self._capabilities.get(name, set())
@@ -78,6 +326,7 @@ class AdapterRegistry:
                 "description": adapter.description,
                 "file_patterns": adapter.file_patterns,
                 "capabilities": [cap.value for cap in capabilities],
+                "features": self._descriptors[name].to_dict(),
                 "status": "available",
             }
 
@@ -90,6 +339,23 @@ class AdapterRegistry:
                 "description": getattr(adapter_class, "_description", "No description"),
                 "file_patterns": getattr(adapter_class, "_file_patterns", []),
                 "capabilities": [cap.value for cap in capabilities],
+                "features": self._descriptors[name].to_dict(),
+                "status": "available",
+            }
+
+        if name in self._references:
+            # Use the cached metadata so listing adapters imports nothing
+            if name not in self._metadata:
+                with self._lock:
+                    self._load_class(name)
+                return self.get_adapter_info(name)
+            capabilities = self._capabilities.get(name, set())
+            return {
+                "name": name,
+                "description": self._metadata[name]["description"],
+                "file_patterns": self._metadata[name]["file_patterns"],
+                "capabilities": [cap.value for cap in capabilities],
+                "features": self.get_descriptor(name).to_dict(),
                 "status": "available",
             }
 
@@ -97,10 +363,13 @@ class AdapterRegistry:
 
     def get_adapters_by_capability(self, capability: AdapterCapability) -> List[str]:
         """Get list of adapter names that have a specific capability."""
+        self._discover_pending()
         return [name for name, caps in self._capabilities.items() if capability in caps]
 
     def has_capability(self, adapter_name: str, capability: AdapterCapability) -> bool:
         """Check if an adapter has a specific capability."""
+        if not self._is_registered(adapter_name):
+            self._discover_pending()
         return capability in self._capabilities.get(adapter_name, set())
 
     def get_project_file_adapters(self) -> List[str]:
@@ -113,16 +382,53 @@ class AdapterRegistry:
         """Get adapters that only support global configuration."""
         return self.get_adapters_by_capability(AdapterCapability.GLOBAL_CONFIG_ONLY)
 
-    def discover_adapters(self, package_path: Path) -> None:
+    def discover_adapters(self, index_file: Optional[Path] = None) -> None:
         """
-        Discover and register adapters from a package directory.
+        Register adapters installed through entry points.
+
+        Adapter metadata comes from the cached adapter index (see
+        discovery.py), so no adapter code is imported unless the index is
+        stale. Adapters already registered keep their registration.
+
+        Args:
+            index_file: Index file to use (defaults to the user cache)
+        """
+        from .discovery import load_adapter_index
+
+        self._discovery_pending = False
+        entries = load_adapter_index(dict(self._references), index_file)
+        for name, entry in entries.items():
+            registered = self._is_registered(name)
+            try:
+                if not registered:
+                    self.register_lazy(
+                        name,
+                        entry["reference"],
+                        [AdapterCapability(value) for value in entry["capabilities"]],
+                        AdapterDescriptor.from_dict(entry["descriptor"]),
+                    )
+                if self._references.get(name) == entry["reference"]:
+                    self._metadata[name] = {
+                        "description": entry["description"],
+                        "file_patterns": entry["file_patterns"],
+                    }
+            except (KeyError, TypeError, ValueError):
+                continue  # Entry from an incompatible index, import on use
+
+    def discover_on_use(self, index_file: Optional[Path] = None) -> None:
+        """
+        Defer discover_adapters() until the registry is first queried.
+
+        Listing adapters, querying capabilities, or looking up a name that is
+        not registered runs the discovery; looking up a registered adapter
+        does not. Importing promptrek therefore neither reads nor writes the
+        adapter index.
 
         Args:
-            package_path: Path to the adapters package
+            index_file: Index file to use (defaults to the user cache)
         """
-        # This would scan for adapter modules and register them automatically
-        # For now, we'll implement manual registration
-        pass
+        self._discovery_index = index_file
+        self._discovery_pending = True
 
 
 # Global adapter registry instance
@@ -5,12 +5,11 @@ Provides common functionality for parsing markdown-based configuration files
 back into UniversalPrompt format.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-
-import click
-import yaml
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
 
 from ..core.models import (
     DocumentConfig,
@@ -21,6 +20,56 @@ from ..core.models import (
     UniversalPromptV2,
     UniversalPromptV3,
 )
+from ..utils.markdown import extract_frontmatter, split_frontmatter, tokenize
+from ..utils.outputs import echo
+from ..utils.splitter import group_part_files, join_parts
+
+# Editor files a change-aware sync may skip (unchanged since generation)
+_unchanged_files: ContextVar[FrozenSet[Path]] = ContextVar(
+    "promptrek_unchanged_sync_files", default=frozenset()
+)
+
+
+@contextmanager
+def skip_unchanged_files(paths: Iterable[Path]) -> Iterator[None]:
+    """
+    Let adapters skip files that still match their generated content.
+
+    Within this context, adapters do not parse per-item files (documents,
+    agents, commands, workflows) in paths; the sync merge keeps the existing
+    entries for them. Files that provide the main content are always read.
+
+    Args:
+        paths: Files whose content matches the last generation
+    """
+    token = _unchanged_files.set(frozenset(Path(p).resolve() for p in paths))
+    try:
+        yield
+    finally:
+        _unchanged_files.reset(token)
+
+
+def is_unchanged_file(path: Path) -> bool:
+    """Check whether a file can be skipped by the current sync."""
+    unchanged = _unchanged_files.get()
+    return bool(unchanged) and path.resolve() in unchanged
+
+
+def read_rule_file(paths: List[Path]) -> str:
+    """
+    Read a rule file, joining the numbered parts it was split into.
+
+    Args:
+        paths: The file, or its parts in order (see group_part_files())
+
+    Returns:
+        Content of the whole file
+    """
+    contents = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            contents.append(f.read())
+    return join_parts(contents)
 
 
 class MarkdownSyncMixin:
@@ -68,41 +117,38 @@ class MarkdownSyncMixin:
         rules_dir = source_dir / rules_subdir
         if rules_dir.exists():
             pattern = f"*.{file_extension}"
-            md_files = sorted(rules_dir.glob(pattern))
+            # Parts of a split file are read back as one document
+            groups = group_part_files(rules_dir.glob(pattern))
+
+            for stem, md_files in groups:
+                # Check if this is the main file (index, general, or first file)
+                is_main = (
+                    stem.lower() in ["index", "general", "main"]
+                    or len(groups) == 1
+                    or (not main_content and stem == groups[0][0])
+                )
+                if not (is_main and not main_content) and all(
+                    is_unchanged_file(md_file) for md_file in md_files
+                ):
+                    continue
 
-            for md_file in md_files:
                 try:
-                    with open(md_file, "r", encoding="utf-8") as f:
-                        content = f.read()
+                    content = read_rule_file(md_files)
 
                     # Parse frontmatter if exists
-                    doc_name = md_file.stem
+                    doc_name = stem
                     doc_description = None
                     doc_always_apply = None
                     doc_file_globs = None
                     actual_content = content.strip()
 
-                    if content.startswith("---"):
-                        parts = content.split("---", 2)
-                        if len(parts) >= 3:
-                            try:
-                                frontmatter = yaml.safe_load(parts[1])
-                                actual_content = parts[2].strip()
-
-                                if frontmatter:
-                                    doc_name = frontmatter.get("name", doc_name)
-                                    doc_description = frontmatter.get("description")
-                                    doc_always_apply = frontmatter.get("alwaysApply")
-                                    doc_file_globs = frontmatter.get("applyToFiles")
-                            except Exception:
-                                pass
-
-                    # Check if this is the main file (index, general, or first file)
-                    is_main = (
-                        md_file.stem.lower() in ["index", "general", "main"]
-                        or len(md_files) == 1
-                        or (not main_content and md_file == md_files[0])
-                    )
+                    frontmatter, body = extract_frontmatter(content)
+                    if frontmatter is not None:
+                        actual_content = body.strip()
+                        doc_name = frontmatter.get("name", doc_name)
+                        doc_description = frontmatter.get("description")
+                        doc_always_apply = frontmatter.get("alwaysApply")
+                        doc_file_globs = frontmatter.get("applyToFiles")
 
                     if is_main and not main_content:
                         # Use as main content
@@ -120,7 +166,7 @@ class MarkdownSyncMixin:
                         )
 
                 except Exception as e:
-                    click.echo(f"Warning: Could not parse {md_file}: {e}")
+                    echo(f"Warning: Could not parse {md_files[0]}: {e}")
 
         # If no main content, use a default message
         if not main_content:
@@ -149,23 +195,16 @@ class MarkdownSyncMixin:
             with open(md_file, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            # Parse frontmatter if exists (skip it)
-            if content.startswith("---"):
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    content = parts[2]
-
-            # Extract bullet points (lines starting with - or *)
-            for line in content.split("\n"):
-                line = line.strip()
-                if line.startswith("- ") or line.startswith("* "):
-                    instruction = line[2:].strip()
-                    # Skip empty lines and headings
-                    if instruction and not instruction.startswith("#"):
-                        instructions.append(instruction)
+            # Skip frontmatter and extract bullet points (- or *)
+            _, body = split_frontmatter(content)
+            for token in tokenize(body):
+                if token.kind == "bullet" and token.marker in "-*":
+                    # Skip empty items and headings
+                    if token.text and not token.text.startswith("#"):
+                        instructions.append(token.text)
 
         except Exception as e:
-            click.echo(f"Error parsing {md_file}: {e}")
+            echo(f"Error parsing {md_file}: {e}")
 
         return instructions
 
@@ -265,19 +304,16 @@ class SingleFileMarkdownSyncMixin:
                 with open(md_file, "r", encoding="utf-8") as f:
                     content = f.read()
 
-                # Parse sections
-                instructions_dict = self._parse_markdown_sections(content)
+                # Parse sections and project context in a single pass
+                instructions_dict, context = self._scan_markdown(content)
 
                 # Update instructions object
                 for category, instrs in instructions_dict.items():
                     if instrs:
                         setattr(instructions, category, instrs)
 
-                # Try to extract project context from content
-                context = self._extract_context_from_content(content)
-
             except Exception as e:
-                click.echo(f"Warning: Could not parse {md_file}: {e}")
+                echo(f"Warning: Could not parse {md_file}: {e}")
 
         target = editor_name.lower().replace(" ", "-")
 
@@ -435,26 +471,16 @@ class SingleFileMarkdownSyncMixin:
         Returns:
             Tuple of (frontmatter_dict, remaining_content)
         """
-        if not content.startswith("---"):
-            return None, content
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return None, content
-
-        try:
-            frontmatter = yaml.safe_load(parts[1])
-            remaining = parts[2].strip()
-            return frontmatter, remaining
-        except yaml.YAMLError:
+        frontmatter, body = extract_frontmatter(content)
+        if frontmatter is None:
             return None, content
+        return frontmatter, body.strip()
 
     def _extract_title_from_markdown(self, content: str) -> Optional[str]:
         """Extract title from first H1 heading in markdown."""
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("# "):
-                return line[2:].strip()
+        for token in tokenize(content):
+            if token.kind == "heading" and token.level == 1 and token.text:
+                return token.text
         return None
 
     def _parse_markdown_sections(self, content: str) -> Dict[str, List[str]]:
@@ -467,39 +493,7 @@ class SingleFileMarkdownSyncMixin:
         Returns:
             Dictionary mapping categories to instruction lists
         """
-        instructions_dict: Dict[str, List[str]] = {}
-        current_section: Optional[str] = None
-
-        lines = content.split("\n")
-        for line in lines:
-            line_stripped = line.strip()
-
-            # Detect section headers
-            if line_stripped.startswith("## "):
-                header = line_stripped[3:].lower()
-                if "general" in header or "guideline" in header:
-                    current_section = "general"
-                elif "code" in header and "style" in header:
-                    current_section = "code_style"
-                elif "test" in header:
-                    current_section = "testing"
-                elif "security" in header:
-                    current_section = "security"
-                elif "performance" in header:
-                    current_section = "performance"
-                elif "architecture" in header:
-                    current_section = "architecture"
-                else:
-                    current_section = "general"
-            # Extract bullet points
-            elif line_stripped.startswith("- ") or line_stripped.startswith("* "):
-                instruction = line_stripped[2:].strip()
-                if instruction and current_section:
-                    if current_section not in instructions_dict:
-                        instructions_dict[current_section] = []
-                    instructions_dict[current_section].append(instruction)
-
-        return instructions_dict
+        return self._scan_markdown(content)[0]
 
     def _extract_context_from_content(self, content: str) -> Optional[ProjectContext]:
         """
@@ -511,30 +505,69 @@ class SingleFileMarkdownSyncMixin:
         Returns:
             ProjectContext if found, None otherwise
         """
-        # Simple extraction - look for common patterns
-        technologies = []
-        project_type = None
+        return self._scan_markdown(content)[1]
+
+    def _scan_markdown(
+        self, content: str
+    ) -> tuple[Dict[str, List[str]], Optional[ProjectContext]]:
+        """
+        Extract sectioned instructions and project context in one pass.
+
+        Args:
+            content: Markdown file content
 
-        for line in content.split("\n"):
-            line_lower = line.lower()
+        Returns:
+            Tuple of (category -> instructions, project context or None)
+        """
+        instructions_dict: Dict[str, List[str]] = {}
+        current_section: Optional[str] = None
+        technologies: List[str] = []
+
+        for token in tokenize(content):
+            if token.kind == "blank":
+                continue
+
+            # Detect section headers
+            if token.kind == "heading" and token.level == 2:
+                current_section = _section_category(token.text.lower())
+            # Extract bullet points
+            elif token.kind == "bullet" and token.marker in "-*":
+                if token.text and current_section:
+                    instructions_dict.setdefault(current_section, []).append(token.text)
+
+            # Look for technology lists ("Technologies: a, b")
+            line_lower = token.raw.lower()
             if "technologies:" in line_lower or "tech stack:" in line_lower:
-                # Try to extract tech list
-                parts = line.split(":", 1)
-                if len(parts) > 1:
-                    tech_str = parts[1].strip()
-                    # Split by common delimiters
-                    for delimiter in [",", "|", "•"]:
-                        if delimiter in tech_str:
-                            technologies = [
-                                t.strip() for t in tech_str.split(delimiter)
-                            ]
-                            break
+                tech_str = token.raw.split(":", 1)[1].strip()
+                # Split by common delimiters
+                for delimiter in [",", "|", "•"]:
+                    if delimiter in tech_str:
+                        technologies = [t.strip() for t in tech_str.split(delimiter)]
+                        break
 
+        context = None
         if technologies:
-            return ProjectContext(
-                project_type=project_type or "application",
+            context = ProjectContext(
+                project_type="application",
                 technologies=technologies,
                 description=f"Project using {', '.join(technologies)}",
             )
 
-        return None
+        return instructions_dict, context
+
+
+def _section_category(header: str) -> str:
+    """Map a lowercase level-2 heading to an instruction category."""
+    if "general" in header or "guideline" in header:
+        return "general"
+    elif "code" in header and "style" in header:
+        return "code_style"
+    elif "test" in header:
+        return "testing"
+    elif "security" in header:
+        return "security"
+    elif "performance" in header:
+        return "performance"
+    elif "architecture" in header:
+        return "architecture"
+    return "general"
@@ -6,8 +6,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
-import click
-
 from ..core.exceptions import DeprecationWarnings, ValidationError
 from ..core.models import (
     DocumentConfig,
@@ -16,9 +14,11 @@ from ..core.models import (
     UniversalPromptV2,
     UniversalPromptV3,
 )
+from ..utils.outputs import echo, ensure_directory, write_generated_file
+from ..utils.splitter import group_part_files
 from .base import EditorAdapter
 from .mcp_mixin import MCPGenerationMixin
-from .sync_mixin import MarkdownSyncMixin
+from .sync_mixin import MarkdownSyncMixin, is_unchanged_file, read_rule_file
 
 
 class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
@@ -114,20 +114,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 )
                 output_file = rules_dir / filename
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {output_file}")
-                    if verbose:
-                        preview = (
-                            content[:200] + "..." if len(content) > 200 else content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(output_file)
-                else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(output_file, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    click.echo(f"✅ Generated: {output_file}")
-                    created_files.append(output_file)
+                created_files.extend(
+                    self.write_rule_file(output_file, content, dry_run, verbose)
+                )
         else:
             # No documents, use main content as general rules
             content = prompt.content
@@ -138,18 +127,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
 
             output_file = rules_dir / "general.md"
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {output_file}")
-                if verbose:
-                    preview = content[:200] + "..." if len(content) > 200 else content
-                    click.echo(f"    {preview}")
-                created_files.append(output_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(content)
-                click.echo(f"✅ Generated: {output_file}")
-                created_files.append(output_file)
+            created_files.extend(
+                self.write_rule_file(output_file, content, dry_run, verbose)
+            )
 
         return created_files
 
@@ -179,9 +159,7 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         elif isinstance(prompt, UniversalPromptV2) and prompt.plugins:
             # V2.1: Use nested plugins structure (deprecated)
             if prompt.plugins.mcp_servers:
-                click.echo(
-                    DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers")
-                )
+                echo(DeprecationWarnings.v3_nested_plugin_field_warning("mcp_servers"))
                 mcp_servers = prompt.plugins.mcp_servers
 
         # Generate MCP config if we have MCP servers
@@ -218,7 +196,7 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 "Windsurf", system_path, dry_run
             ):
                 if verbose:
-                    click.echo("  ⏭️  Skipping Windsurf MCP configuration")
+                    echo("  ⏭️  Skipping Windsurf MCP configuration")
                 return created_files
 
             # Build MCP servers config (uses standard MCP format)
@@ -232,7 +210,7 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
             if existing_config:
                 # Merge with existing config
                 if verbose:
-                    click.echo("  ℹ️  Merging MCP servers with existing Windsurf config")
+                    echo("  ℹ️  Merging MCP servers with existing Windsurf config")
                 merged_config = self.merge_mcp_config(
                     existing_config, mcp_config, format_style="standard"
                 )
@@ -306,12 +284,14 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
         documents = []
         main_content = None
 
-        for md_file in sorted(rules_dir.glob("*.md")):
+        for doc_name, md_files in group_part_files(rules_dir.glob("*.md")):
+            if doc_name != "general" and all(
+                is_unchanged_file(md_file) for md_file in md_files
+            ):
+                continue
             try:
-                with open(md_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                doc_name = md_file.stem  # Remove .md extension
+                # Parts of a split document are read back as one document
+                content = read_rule_file(md_files)
 
                 # Special handling: general.md becomes the main content field
                 if doc_name == "general":
@@ -326,7 +306,7 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                     )
 
             except Exception as e:
-                click.echo(f"Warning: Could not parse {md_file}: {e}")
+                echo(f"Warning: Could not parse {md_files[0]}: {e}")
 
         # Create metadata
         metadata = PromptMetadata(
@@ -384,22 +364,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 "General Rules", all_instructions
             )
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {general_file}")
-                if verbose:
-                    preview = (
-                        general_content[:200] + "..."
-                        if len(general_content) > 200
-                        else general_content
-                    )
-                    click.echo(f"    {preview}")
-                created_files.append(general_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(general_file, "w", encoding="utf-8") as f:
-                    f.write(general_content)
-                click.echo(f"✅ Generated: {general_file}")
-                created_files.append(general_file)
+            created_files.extend(
+                self.write_rule_file(general_file, general_content, dry_run, verbose)
+            )
 
         # Generate code style rules
         if (
@@ -412,22 +379,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 "Code Style Rules", prompt.instructions.code_style
             )
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {style_file}")
-                if verbose:
-                    preview = (
-                        style_content[:200] + "..."
-                        if len(style_content) > 200
-                        else style_content
-                    )
-                    click.echo(f"    {preview}")
-                created_files.append(style_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(style_file, "w", encoding="utf-8") as f:
-                    f.write(style_content)
-                click.echo(f"✅ Generated: {style_file}")
-                created_files.append(style_file)
+            created_files.extend(
+                self.write_rule_file(style_file, style_content, dry_run, verbose)
+            )
 
         # Generate testing rules
         if (
@@ -440,22 +394,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 "Testing Rules", prompt.instructions.testing
             )
 
-            if dry_run:
-                click.echo(f"  📁 Would create: {testing_file}")
-                if verbose:
-                    preview = (
-                        testing_content[:200] + "..."
-                        if len(testing_content) > 200
-                        else testing_content
-                    )
-                    click.echo(f"    {preview}")
-                created_files.append(testing_file)
-            else:
-                rules_dir.mkdir(parents=True, exist_ok=True)
-                with open(testing_file, "w", encoding="utf-8") as f:
-                    f.write(testing_content)
-                click.echo(f"✅ Generated: {testing_file}")
-                created_files.append(testing_file)
+            created_files.extend(
+                self.write_rule_file(testing_file, testing_content, dry_run, verbose)
+            )
 
         # Generate technology-specific rules
         if (
@@ -467,22 +408,9 @@ class WindsurfAdapter(MCPGenerationMixin, MarkdownSyncMixin, EditorAdapter):
                 tech_file = rules_dir / f"{tech.lower()}-rules.md"
                 tech_content = self._build_tech_rules_content(tech, prompt)
 
-                if dry_run:
-                    click.echo(f"  📁 Would create: {tech_file}")
-                    if verbose:
-                        preview = (
-                            tech_content[:200] + "..."
-                            if len(tech_content) > 200
-                            else tech_content
-                        )
-                        click.echo(f"    {preview}")
-                    created_files.append(tech_file)
-                else:
-                    rules_dir.mkdir(parents=True, exist_ok=True)
-                    with open(tech_file, "w", encoding="utf-8") as f:
-                        f.write(tech_content)
-                    click.echo(f"✅ Generated: {tech_file}")
-                    created_files.append(tech_file)
+                created_files.extend(
+                    self.write_rule_file(tech_file, tech_content, dry_run, verbose)
+                )
 
         return created_files
 
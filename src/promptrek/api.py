@@ -0,0 +1,130 @@
+"""
+Programmatic API for PrompTrek.
+
+Renders editor files entirely in memory so PrompTrek can be embedded in other
+Python services without spawning the CLI or touching the filesystem:
+
+    from promptrek import generate
+
+    files = generate("project.promptrek.yaml", ["claude", "cursor"])
+    for path, content in files.items():
+        ...
+
+Adapters are shared between calls and render into a per-call virtual output,
+so the functions here are safe to call concurrently from multiple threads.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+from .adapters import registry
+from .core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from .core.parser import UPFParser
+from .utils.outputs import VirtualOutput, echo, virtual_output
+
+PromptType = Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]
+PromptSource = Union[PromptType, Dict[str, Any], str, Path]
+
+
+def load_prompt(source: PromptSource) -> PromptType:
+    """
+    Load a prompt from a model, a dictionary or a .promptrek.yaml file.
+
+    Args:
+        source: Prompt model, parsed YAML dictionary or path to a UPF file
+
+    Returns:
+        Parsed prompt model
+
+    Raises:
+        UPFParsingError: If the prompt cannot be parsed
+    """
+    if isinstance(source, (UniversalPrompt, UniversalPromptV2, UniversalPromptV3)):
+        return source
+    parser = UPFParser()
+    if isinstance(source, dict):
+        return parser.parse_dict(source)
+    return parser.parse_file(Path(source))
+
+
+def render(
+    prompt: PromptSource,
+    editors: Union[str, Sequence[str]],
+    variables: Optional[Dict[str, Any]] = None,
+    output_dir: Union[str, Path] = ".",
+    headless: bool = False,
+    dry_run: bool = False,
+) -> VirtualOutput:
+    """
+    Render editor files for a prompt into memory.
+
+    Args:
+        prompt: Prompt model, parsed YAML dictionary or path to a UPF file
+        editors: Editor name or names to render for
+        variables: Variable overrides (take precedence over prompt variables)
+        output_dir: Directory the generated paths are relative to
+        headless: Whether to render headless agent instructions
+        dry_run: Run adapters in dry-run mode (reports without rendering files)
+
+    Returns:
+        VirtualOutput with the rendered files and the events emitted
+
+    Raises:
+        AdapterNotFoundError: If an editor is not registered
+        UPFParsingError: If the prompt cannot be parsed
+    """
+    prompt_model = load_prompt(prompt)
+    editor_names = [editors] if isinstance(editors, str) else list(editors)
+
+    merged_variables: Dict[str, Any] = dict(prompt_model.variables or {})
+    if variables:
+        merged_variables.update(variables)
+
+    with virtual_output(preview=True) as output:
+        for editor in editor_names:
+            adapter = registry.get(editor)
+            kwargs: Dict[str, Any] = {}
+            if headless:
+                if registry.get_descriptor(editor).headless:
+                    kwargs["headless"] = True
+                else:
+                    echo(
+                        f"Warning: {editor} adapter does not support headless mode",
+                        err=True,
+                    )
+            adapter.generate(
+                prompt_model,
+                Path(output_dir),
+                dry_run=dry_run,
+                verbose=False,
+                variables=merged_variables,
+                **kwargs,
+            )
+    return output
+
+
+def generate(
+    prompt: PromptSource,
+    editors: Union[str, Sequence[str]],
+    variables: Optional[Dict[str, Any]] = None,
+    output_dir: Union[str, Path] = ".",
+    headless: bool = False,
+) -> Dict[Path, bytes]:
+    """
+    Generate editor files for a prompt without writing them to disk.
+
+    Args:
+        prompt: Prompt model, parsed YAML dictionary or path to a UPF file
+        editors: Editor name or names to generate for
+        variables: Variable overrides (take precedence over prompt variables)
+        output_dir: Directory the generated paths are relative to
+        headless: Whether to generate headless agent instructions
+
+    Returns:
+        Dictionary mapping generated file paths to their content
+
+    Raises:
+        AdapterNotFoundError: If an editor is not registered
+        UPFParsingError: If the prompt cannot be parsed
+    """
+    return render(prompt, editors, variables, output_dir, headless).files
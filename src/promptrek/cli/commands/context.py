@@ -0,0 +1,187 @@
+"""
+Context-size report and budget for generation (`promptrek generate
+--context-report` / `--max-context-tokens`).
+
+Instruction files are loaded into the model's context: some on every request
+(CLAUDE.md, Cursor rules with alwaysApply, Copilot's instructions), others
+only when they apply (rules attached to file globs, agents, commands). Each
+adapter declares which of its outputs are loaded on every request in its
+descriptor (context_paths); a file's frontmatter can still limit it to
+matching files (alwaysApply: false, a Windsurf trigger or a Kiro inclusion
+other than always).
+
+Token counts are local estimates (see utils.tokens). A budget applies to the
+total of each editor's always-loaded files and to every other file on its
+own, since that is what one request can load.
+"""
+
+import re
+from pathlib import Path, PurePosixPath
+from typing import Dict, List
+
+import click
+
+from ...adapters import registry
+from ...core.exceptions import CLIError
+from ...utils.markdown import extract_frontmatter
+from ...utils.tokens import estimate_tokens
+
+WARN = "warn"
+FAIL = "fail"
+
+# Suffixes of instruction files loaded on demand
+CONTEXT_SUFFIXES = frozenset({".md", ".mdc", ".txt"})
+
+
+class ContextFile:
+    """Estimated size of a generated instruction file."""
+
+    __slots__ = ("editor", "path", "tokens", "always_loaded")
+
+    def __init__(
+        self, editor: str, path: str, tokens: int, always_loaded: bool
+    ) -> None:
+        """
+        Initialize a context file.
+
+        Args:
+            editor: Editor the file was generated for
+            path: Path relative to the output directory
+            tokens: Estimated token count
+            always_loaded: Whether the file is loaded on every request
+        """
+        self.editor = editor
+        self.path = path
+        self.tokens = tokens
+        self.always_loaded = always_loaded
+
+    def __repr__(self) -> str:
+        return f"ContextFile({self.editor!r}, {self.path!r}, {self.tokens})"
+
+
+def measure_context(
+    outputs_by_editor: Dict[str, Dict[Path, str]], output_dir: Path
+) -> List[ContextFile]:
+    """
+    Estimate the context size of generated instruction files.
+
+    Args:
+        outputs_by_editor: Generated files for each editor (path -> content)
+        output_dir: Output directory the files were generated in
+
+    Returns:
+        Instruction files, by editor and path
+    """
+    files: List[ContextFile] = []
+    for editor, outputs in sorted(outputs_by_editor.items()):
+        patterns = _context_patterns(editor)
+        for path, content in sorted(outputs.items()):
+            name = _relative_name(path, output_dir)
+            declared = any(pattern.fullmatch(name) for pattern in patterns)
+            if not declared and PurePosixPath(name).suffix not in CONTEXT_SUFFIXES:
+                continue  # Settings, MCP configurations, ignore files
+            files.append(
+                ContextFile(
+                    editor,
+                    name,
+                    estimate_tokens(content),
+                    declared and not _limited_by_frontmatter(content),
+                )
+            )
+    return files
+
+
+def show_context_report(files: List[ContextFile]) -> None:
+    """
+    Print estimated context tokens per editor and per file.
+
+    Args:
+        files: Measured instruction files
+    """
+    if not files:
+        return
+    click.echo("📏 Estimated context tokens (● loaded on every request):")
+    for editor in sorted({f.editor for f in files}):
+        editor_files = [f for f in files if f.editor == editor]
+        always = sum(f.tokens for f in editor_files if f.always_loaded)
+        total = sum(f.tokens for f in editor_files)
+        click.echo(f"  {editor}: ~{always:,} always loaded, ~{total:,} in total")
+        for f in sorted(
+            editor_files, key=lambda f: (not f.always_loaded, -f.tokens, f.path)
+        ):
+            marker = "●" if f.always_loaded else " "
+            click.echo(f"    {marker} {f.path}: ~{f.tokens:,}")
+
+
+def check_context_budget(
+    files: List[ContextFile], max_tokens: int, action: str = WARN
+) -> List[str]:
+    """
+    Check generated instruction files against a token budget.
+
+    Args:
+        files: Measured instruction files
+        max_tokens: Budget per request
+        action: 'warn' to print violations, 'fail' to raise on them
+
+    Returns:
+        Violation messages (empty if the files fit the budget)
+
+    Raises:
+        CLIError: If action is 'fail' and the budget is exceeded
+    """
+    violations: List[str] = []
+    for editor in sorted({f.editor for f in files}):
+        always = [f for f in files if f.editor == editor and f.always_loaded]
+        total = sum(f.tokens for f in always)
+        if total > max_tokens:
+            largest = max(always, key=lambda f: f.tokens)
+            violations.append(
+                f"{editor}: files loaded on every request total ~{total:,} "
+                f"tokens (largest: {largest.path}, ~{largest.tokens:,})"
+            )
+        for f in files:
+            if f.editor == editor and not f.always_loaded and f.tokens > max_tokens:
+                violations.append(f"{editor}: {f.path} is ~{f.tokens:,} tokens")
+
+    if violations:
+        details = "\n".join(f"  - {violation}" for violation in violations)
+        message = (
+            f"Generated context exceeds the budget of {max_tokens:,} tokens:\n"
+            f"{details}"
+        )
+        if action == FAIL:
+            raise CLIError(f"{message}\nNothing was written.")
+        click.echo(f"⚠️  {message}", err=True)
+    return violations
+
+
+def _context_patterns(editor: str) -> List["re.Pattern[str]"]:
+    """Compile an editor's declared context paths ('{name}' is one segment)."""
+    return [
+        re.compile(re.escape(path).replace(re.escape("{name}"), "[^/]+"))
+        for path in registry.get_descriptor(editor).context_paths
+    ]
+
+
+def _limited_by_frontmatter(content: str) -> bool:
+    """Check whether frontmatter limits a file to some requests."""
+    frontmatter, _ = extract_frontmatter(content)
+    if not frontmatter:
+        return False
+    return (
+        frontmatter.get("alwaysApply") is False
+        or frontmatter.get("trigger", "always_on") != "always_on"
+        or frontmatter.get("inclusion", "always") != "always"
+    )
+
+
+def _relative_name(path: Path, output_dir: Path) -> str:
+    """Get a file's POSIX path relative to the output directory."""
+    try:
+        return path.relative_to(output_dir).as_posix()
+    except ValueError:
+        try:
+            return path.resolve().relative_to(output_dir.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
@@ -0,0 +1,158 @@
+"""
+Diff preview for generation (`promptrek generate --diff`).
+
+Shows which generated files would change, as a unified diff against the
+current tree, without writing anything. Each planned file is compared to the
+file on disk by size, then by SHA-256 digest, and a diff is only computed for
+files that really changed, so previews of large trees stay fast. Stale files
+that pruning would delete are shown as removed.
+"""
+
+import difflib
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import click
+
+from ...utils.output_plan import DEFAULT_JOBS, REPLACE, OutputPlan, PlannedWrite
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+UNCHANGED = "unchanged"
+
+
+def compare_output(planned: PlannedWrite) -> Tuple[str, List[str]]:
+    """
+    Compare a planned file with the file on disk.
+
+    Args:
+        planned: Planned write
+
+    Returns:
+        Status ('added', 'changed' or 'unchanged') and the unified diff lines
+        (empty for unchanged files)
+    """
+    path = planned.path
+    name = _display_path(path)
+    try:
+        size = os.stat(path).st_size
+    except (FileNotFoundError, NotADirectoryError):
+        content = planned.render(None)
+        if content is None:
+            return UNCHANGED, []
+        return ADDED, _unified_diff("", content, "/dev/null", f"b/{name}")
+
+    new: Optional[bytes] = None
+    if planned.policy == REPLACE and not planned.updates:
+        new = planned.content.encode("utf-8")
+        if size == len(new):
+            # Same size: only a digest mismatch needs a diff
+            with open(path, "rb") as f:
+                if hashlib.sha256(f.read()).digest() == hashlib.sha256(new).digest():
+                    return UNCHANGED, []
+
+    with open(path, "rb") as f:
+        current = f.read()
+    try:
+        existing = current.decode("utf-8")
+    except UnicodeDecodeError:
+        return CHANGED, [f"Binary file {name} differs\n"]
+
+    if new is None:
+        content = planned.render(existing)
+        if content is None or content == existing:
+            return UNCHANGED, []
+    else:
+        content = planned.content
+    return CHANGED, _unified_diff(existing, content, f"a/{name}", f"b/{name}")
+
+
+def compare_removed(path: Path) -> Tuple[str, List[str]]:
+    """
+    Diff a file that would be removed against its current content.
+
+    Args:
+        path: File that would be removed
+
+    Returns:
+        Status 'removed' and the unified diff lines
+    """
+    name = _display_path(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            existing = f.read()
+    except (OSError, UnicodeDecodeError):
+        return REMOVED, [f"Deleted file {name}\n"]
+    return REMOVED, _unified_diff(existing, "", f"a/{name}", "/dev/null")
+
+
+def show_output_diff(
+    plan: OutputPlan, jobs: Optional[int] = None, removed: Iterable[Path] = ()
+) -> None:
+    """
+    Print a unified diff of the planned files against the current tree.
+
+    Args:
+        plan: Checked output plan
+        jobs: Number of files compared concurrently
+        removed: Stale files the run would remove
+    """
+    writes = sorted(plan.writes.values(), key=lambda planned: str(planned.path))
+    if writes:
+        with ThreadPoolExecutor(
+            max_workers=min(jobs or DEFAULT_JOBS, len(writes))
+        ) as pool:
+            results = list(pool.map(compare_output, writes))
+    else:
+        results = []
+    results.extend(compare_removed(path) for path in sorted(removed))
+
+    counts = {ADDED: 0, CHANGED: 0, REMOVED: 0, UNCHANGED: 0}
+    for status, lines in results:
+        counts[status] += 1
+        for line in lines:
+            click.echo(_style(line), nl=False)
+
+    removed_count = f"{counts[REMOVED]} removed, " if counts[REMOVED] else ""
+    click.echo(
+        f"📊 {counts[ADDED]} added, {counts[CHANGED]} changed, "
+        f"{removed_count}{counts[UNCHANGED]} unchanged"
+    )
+
+
+def _unified_diff(old: str, new: str, old_name: str, new_name: str) -> List[str]:
+    """Compute a unified diff whose lines all end with a newline."""
+    lines = list(
+        difflib.unified_diff(
+            old.splitlines(keepends=True),
+            new.splitlines(keepends=True),
+            fromfile=old_name,
+            tofile=new_name,
+        )
+    )
+    return [line if line.endswith("\n") else line + "\n" for line in lines]
+
+
+def _display_path(path: Path) -> str:
+    """Get a path relative to the current directory when it is below it."""
+    try:
+        return str(path.resolve().relative_to(Path.cwd().resolve()))
+    except ValueError:
+        return str(path)
+
+
+def _style(line: str) -> str:
+    """Colour a diff line (colours are dropped when not writing to a terminal)."""
+    if line.startswith(("+++", "---")):
+        return click.style(line, bold=True)
+    if line.startswith("+"):
+        return click.style(line, fg="green")
+    if line.startswith("-"):
+        return click.style(line, fg="red")
+    if line.startswith("@@"):
+        return click.style(line, fg="cyan")
+    return line
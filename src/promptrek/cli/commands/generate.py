@@ -4,52 +4,65 @@ Generate command implementation.
 Handles generation of editor-specific prompts from universal prompt files.
 """
 
-import inspect
+import re
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import click
 import yaml
 
 from ...adapters import registry
-from ...adapters.registry import AdapterCapability
-from ...core.exceptions import AdapterNotFoundError, CLIError, UPFParsingError
+from ...adapters.registry import AdapterCapability, AdapterDescriptor
+from ...core.exceptions import (
+    AdapterNotFoundError,
+    CLIError,
+    FileLockError,
+    UPFParsingError,
+)
 from ...core.models import (
     DynamicVariableConfig,
     GenerationMetadata,
+    OutputRecord,
     UniversalPrompt,
     UniversalPromptV2,
     UniversalPromptV3,
 )
 from ...core.parser import UPFParser
 from ...core.validator import UPFValidator
+from ...utils.locking import atomic_write, file_lock
+from ...utils.object_store import ObjectStore
+from ...utils.output_plan import MERGE, OutputPlan
+from ...utils.outputs import (
+    VirtualOutput,
+    content_digest,
+    echo,
+    record_outputs,
+    virtual_output,
+)
 from ...utils.variables import BuiltInVariables, VariableSubstitution
+from .context import (
+    WARN,
+    ContextFile,
+    check_context_budget,
+    measure_context,
+    show_context_report,
+)
+from .diff import show_output_diff
+from .prune import (
+    collect_unused_objects,
+    load_previous_generation,
+    prunable_outputs,
+    prune_stale_outputs,
+    stale_outputs,
+    unfinished_outputs,
+)
 
-
-def _adapter_supports_headless(adapter: object, method_name: str) -> bool:
-    """
-    Check if an adapter method supports the 'headless' parameter.
-
-    Uses inspect.signature() for reliable parameter detection.
-
-    Args:
-        adapter: The adapter instance
-        method_name: Name of the method to check ('generate' or 'generate_merged')
-
-    Returns:
-        bool: True if the method supports headless parameter
-    """
-    try:
-        if not hasattr(adapter, method_name):
-            return False
-
-        method = getattr(adapter, method_name)
-        sig = inspect.signature(method)
-        return "headless" in sig.parameters
-    except (ValueError, TypeError):
-        # Fallback to False if signature inspection fails
-        return False
+# (prompt, source file) pairs generated together for one editor
+_PromptFiles = List[
+    Tuple[Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3], Path]
+]
 
 
 def generate_command(
@@ -63,7 +76,18 @@ def generate_command(
     all_editors: bool,
     variables: Optional[dict] = None,
     headless: bool = False,
-) -> None:
+    base_variables: Optional[dict] = None,
+    merge_metadata: bool = False,
+    stable_builtins: Optional[str] = None,
+    diff: bool = False,
+    prune: bool = True,
+    context_report: bool = False,
+    max_context_tokens: Optional[int] = None,
+    context_budget: str = WARN,
+    object_store: Optional[ObjectStore] = None,
+    interactive: bool = True,
+    collect_objects: bool = True,
+) -> Dict[str, Dict[Path, str]]:
     """
     Generate editor-specific prompts from universal prompt files.
 
@@ -77,6 +101,29 @@ def generate_command(
         dry_run: Whether to show what would be generated without creating files
         all_editors: Whether to generate for all target editors
         variables: Variable overrides
+        headless: Whether to generate headless agent instructions
+        base_variables: Pre-evaluated built-in + local variables (skips loading)
+        merge_metadata: Merge saved metadata with the previous run instead of
+            replacing it (used by refresh when regenerating a subset of editors)
+        stable_builtins: Stable build granularity for time-based built-in
+            variables (overrides the prompt's stable_builtins setting)
+        diff: Show a unified diff against the current files instead of
+            writing them
+        prune: Remove files generated by the previous run that are no longer
+            generated (with diff, show them as removed)
+        context_report: Print estimated context tokens per editor and file
+        max_context_tokens: Token budget for the generated context
+        context_budget: 'warn' or 'fail' when the budget is exceeded
+        object_store: Store to materialize generated files from (see
+            utils.object_store)
+        interactive: Ask adapter prompts; when False they are answered with
+            their defaults (used for runs nobody watches, e.g. workspaces)
+        collect_objects: Remove objects no current output needs from the
+            object store afterwards (off when the store is shared with
+            concurrent runs, which the caller collects for once they finish)
+
+    Returns:
+        Files written (or rendered, with diff) for each editor (path -> content)
     """
     verbose = ctx.obj.get("verbose", False)
 
@@ -128,6 +175,8 @@ def generate_command(
         first_prompt = _parse_and_validate_file(ctx, unique_files[0])
         if isinstance(first_prompt, UniversalPromptV3):
             allow_commands = first_prompt.allow_commands or False
+            if stable_builtins is None:
+                stable_builtins = first_prompt.stable_builtins
     except (UPFParsingError, CLIError):
         # If parsing fails, it will be caught again in the main loop
         pass
@@ -139,13 +188,15 @@ def generate_command(
 
     # Load and evaluate variables (including built-in and dynamic variables)
     # These are: built-in + local file variables (without CLI overrides yet)
-    var_sub = VariableSubstitution()
-    base_variables = var_sub.load_and_evaluate_variables(
-        allow_commands=allow_commands,
-        include_builtins=True,
-        verbose=verbose,
-        clear_cache=False,
-    )
+    if base_variables is None:
+        var_sub = VariableSubstitution()
+        base_variables = var_sub.load_and_evaluate_variables(
+            allow_commands=allow_commands,
+            include_builtins=True,
+            verbose=verbose,
+            clear_cache=False,
+            stable_builtins=stable_builtins,
+        )
 
     # Keep CLI overrides separate for now to ensure correct precedence
     # Precedence: built-in < local < prompt.variables < CLI
@@ -161,7 +212,8 @@ def generate_command(
         output = Path.cwd()
 
     # Ensure output directory exists
-    output.mkdir(parents=True, exist_ok=True)
+    if not diff:
+        output.mkdir(parents=True, exist_ok=True)
 
     if dry_run:
         click.echo("🔍 Dry run mode - showing what would be generated:")
@@ -239,30 +291,113 @@ def generate_command(
         first_error_file, first_error_msg = processing_errors[0]
         raise CLIError(f"Failed to process {first_error_file}: {first_error_msg}")
 
-    # Generate for each editor with all collected prompts
+    # Plan: render each editor in memory, so conflicting writes between
+    # editors are found before anything is written (dry runs write nothing)
+    plan = None if dry_run else OutputPlan()
+    stale: Dict[str, OutputRecord] = {}
+    unfinished: Dict[str, OutputRecord] = {}
+    # Adapter messages are left out of diffs, which only show file changes
+    show_messages = not diff or verbose
+    planned_outputs: List[VirtualOutput] = []
     generation_errors = []
+    outputs_by_editor: Dict[str, Dict[Path, str]] = {}
     for target_editor, prompt_files in prompts_by_editor.items():
+        planned: Optional[VirtualOutput] = None
         try:
-            _generate_for_editor_multiple(
-                prompt_files,
-                target_editor,
-                output,
-                dry_run,
-                verbose,
-                variables=None,  # Deprecated param
-                headless=headless,
-                base_variables=base_variables,
-                cli_overrides=cli_overrides,
-            )
+            with ExitStack() as stack:
+                recorded = stack.enter_context(record_outputs())
+                if plan is not None:
+                    planned = stack.enter_context(
+                        virtual_output(
+                            interactive=interactive and not diff, preview=diff
+                        )
+                    )
+                elif not interactive:
+                    # Non-interactive dry run: render in memory, answering
+                    # prompts with their defaults, and list the planned files
+                    planned = stack.enter_context(virtual_output(preview=True))
+                _generate_for_editor_multiple(
+                    prompt_files,
+                    target_editor,
+                    output,
+                    dry_run and planned is None,
+                    verbose,
+                    variables=None,  # Deprecated param
+                    headless=headless,
+                    base_variables=base_variables,
+                    cli_overrides=cli_overrides,
+                )
+            if plan is not None and planned is not None:
+                plan.add(target_editor, planned)
+                planned_outputs.append(planned)
+            elif planned is not None:
+                for path in planned.files:
+                    click.echo(f"  📁 Would create: {path}")
+            outputs_by_editor[target_editor] = recorded
         except AdapterNotFoundError:
             click.echo(f"⚠️ Editor '{target_editor}' not yet implemented - skipping")
         except Exception as e:
+            if planned is not None and show_messages:
+                planned.flush_messages()
             generation_errors.append((target_editor, str(e)))
             if verbose:
                 raise
             click.echo(f"❌ Failed to generate for {target_editor}: {e}", err=True)
             # Continue with other editors
 
+    # Measure the generated context before anything is written, so a budget
+    # set to fail leaves the tree untouched
+    context_files: List[ContextFile] = []
+    if plan is not None and (context_report or max_context_tokens):
+        context_files = measure_context(outputs_by_editor, output)
+        if max_context_tokens:
+            check_context_budget(context_files, max_context_tokens, context_budget)
+
+    if plan is not None and diff:
+        plan.check()
+        if show_messages:
+            for planned in planned_outputs:
+                planned.flush_messages()
+        removed: List[Path] = []
+        if prune:
+            removed, _ = prunable_outputs(
+                stale_outputs(
+                    load_previous_generation(
+                        Path.cwd() / ".promptrek" / "last-generation.yaml"
+                    ),
+                    outputs_by_editor,
+                    output,
+                    unique_files,
+                )
+            )
+        show_output_diff(plan, removed=removed)
+    elif plan is not None:
+        # Execute: write the planned files, then report what each editor did
+        plan.execute(store=object_store)
+        for planned in planned_outputs:
+            planned.flush_messages()
+        if object_store is not None and verbose:
+            _report_materialized(object_store)
+        # Merged files were re-read from disk when written
+        for recorded in outputs_by_editor.values():
+            for path in recorded:
+                if path in plan.writes:
+                    recorded[path] = plan.writes[path].content
+
+        # Files no longer generated are removed, or with --no-prune kept in
+        # the records so a later run can still remove them
+        previous = load_previous_generation(
+            Path.cwd() / ".promptrek" / "last-generation.yaml"
+        )
+        stale = stale_outputs(previous, outputs_by_editor, output, unique_files)
+        unfinished = unfinished_outputs(previous, outputs_by_editor, output)
+        if prune:
+            _report_pruned(*prune_stale_outputs(stale, output), verbose=verbose)
+            stale = {}
+
+    if context_report:
+        show_context_report(context_files)
+
     # If we had generation errors but no successful generations, report error
     if generation_errors and not any(prompts_by_editor.values()):
         first_error_editor, first_error_msg = generation_errors[0]
@@ -271,10 +406,10 @@ def generate_command(
         )
 
     # Save generation metadata for refresh command (skip in dry-run mode)
-    if not dry_run and prompts_by_editor:
+    if not dry_run and not diff and prompts_by_editor:
         try:
             # Merge base + CLI for metadata (not including prompt.variables)
-            metadata_vars = {}
+            metadata_vars: Dict[str, Any] = {}
             if base_variables:
                 metadata_vars.update(base_variables)
             if cli_overrides:
@@ -287,12 +422,146 @@ def generate_command(
                 variables=metadata_vars,
                 allow_commands=allow_commands,
                 verbose=verbose,
+                stable_builtins=stable_builtins,
+                outputs={
+                    **unfinished,
+                    **stale,
+                    **_build_output_records(
+                        outputs_by_editor,
+                        prompts_by_editor,
+                        metadata_vars,
+                        merged_paths={
+                            path
+                            for path, planned in (plan.writes if plan else {}).items()
+                            if planned.policy == MERGE or planned.updates
+                        },
+                    ),
+                },
+                merge=merge_metadata,
             )
         except Exception as e:
             if verbose:
                 click.echo(f"⚠️ Failed to save generation metadata: {e}", err=True)
             # Don't fail the whole generation if metadata saving fails
 
+    if object_store is not None and collect_objects and plan is not None and not diff:
+        _report_collected(collect_unused_objects(object_store, [Path.cwd()]), verbose)
+
+    return outputs_by_editor
+
+
+def _output_dependencies(
+    source_text: str, content: str, variables: Dict[str, Any]
+) -> List[str]:
+    """
+    Determine which variables a generated output depends on.
+
+    A variable referenced through a {{{ NAME }}} placeholder is a dependency
+    when its value appears in the generated content. A variable referenced by
+    bare name (e.g. in a condition) can change any output of the source, so it
+    is always a dependency. Placeholders that were not defined at generation
+    time are dependencies too, so defining them later triggers a refresh.
+
+    Args:
+        source_text: Raw text of the source file(s) the output came from
+        content: Generated file content
+        variables: Variables in effect for the generation
+
+    Returns:
+        Sorted list of variable names
+    """
+    pattern = VariableSubstitution().variable_pattern
+    placeholders = set(pattern.findall(source_text))
+    bare_text = pattern.sub("", source_text)
+
+    dependencies = {name for name in placeholders if name not in variables}
+    for name, value in variables.items():
+        if name in placeholders:
+            value_text = str(value)
+            if not value_text or value_text in content:
+                dependencies.add(name)
+        elif re.search(rf"\b{re.escape(name)}\b", bare_text):
+            dependencies.add(name)
+
+    return sorted(dependencies)
+
+
+def _build_output_records(
+    outputs_by_editor: Dict[str, Dict[Path, str]],
+    prompts_by_editor: Dict[str, List[Any]],
+    variables: Dict[str, Any],
+    merged_paths: Optional[Set[Path]] = None,
+) -> Dict[str, OutputRecord]:
+    """Build output records (content hash + variable dependencies) per file."""
+    source_texts: Dict[Path, str] = {}
+    records: Dict[str, OutputRecord] = {}
+
+    for editor, outputs in outputs_by_editor.items():
+        texts = []
+        for _, source_file in prompts_by_editor.get(editor, []):
+            if source_file not in source_texts:
+                try:
+                    source_texts[source_file] = Path(source_file).read_text(
+                        encoding="utf-8"
+                    )
+                except OSError:
+                    source_texts[source_file] = ""
+            texts.append(source_texts[source_file])
+        source_text = "\n".join(texts)
+
+        for path, content in outputs.items():
+            records[str(path)] = OutputRecord(
+                editor=editor,
+                variables=_output_dependencies(source_text, content, variables),
+                hash=content_digest(content),
+                merged=path in (merged_paths or ()),
+            )
+
+    return records
+
+
+def _report_materialized(store: ObjectStore) -> None:
+    """Report how files were materialized from the object store."""
+    if store.counts:
+        methods = ", ".join(
+            f"{method}: {count}" for method, count in sorted(store.counts.items())
+        )
+        click.echo(f"🔗 Materialized from {store.root} ({methods})")
+
+
+def _report_collected(removed: int, verbose: bool) -> None:
+    """Report the objects removed from the object store."""
+    if removed and verbose:
+        click.echo(f"🧹 Removed {removed} unused object(s) from the object store")
+
+
+def _report_pruned(removed: List[Path], kept: List[Path], verbose: bool) -> None:
+    """Report the stale outputs that were removed or kept."""
+    for path in kept:
+        click.echo(
+            f"⚠️  Kept {path}: it is no longer generated but was edited by hand "
+            "(delete it if it is not needed)",
+            err=True,
+        )
+    if removed:
+        click.echo(f"🧹 Removed {len(removed)} stale generated file(s)")
+        if verbose:
+            for path in removed:
+                click.echo(f"  🗑️  {path}")
+
+
+def _source_hashes(source_files: List[Path]) -> Dict[str, str]:
+    """Compute content digests for source files."""
+    hashes = {}
+    for source_file in source_files:
+        try:
+            hashes[str(source_file)] = content_digest(
+                Path(source_file).read_text(encoding="utf-8")
+            )
+        except OSError:
+            continue
+    return hashes
+
 
 def _save_generation_metadata(
     source_files: list[Path],
@@ -301,6 +570,9 @@ def _save_generation_metadata(
     variables: dict[str, str],
     allow_commands: bool,
     verbose: bool = False,
+    stable_builtins: Optional[str] = None,
+    outputs: Optional[Dict[str, OutputRecord]] = None,
+    merge: bool = False,
 ) -> None:
     """Save generation metadata for refresh command."""
     # Create .promptrek directory if it doesn't exist
@@ -349,31 +621,58 @@ def _save_generation_metadata(
         if key not in builtin_var_names and key not in dynamic_vars:
             static_vars[key] = value
 
-    # Create metadata
-    metadata = GenerationMetadata(
-        timestamp=datetime.now().isoformat(),
-        source_file=str(source_files[0]) if source_files else "",
-        editors=editors,
-        output_dir=str(output_dir),
-        variables=static_vars,
-        dynamic_variables=dynamic_vars,
-        builtin_variables_enabled=True,
-        allow_commands=allow_commands,
-    )
+    outputs = dict(outputs or {})
 
-    # Save to file
     try:
-        with open(metadata_file, "w", encoding="utf-8") as f:
-            yaml.dump(
-                metadata.model_dump(by_alias=True),
-                f,
-                default_flow_style=False,
-                sort_keys=False,
+        # Hold the metadata lock while merging so concurrent runs don't drop
+        # each other's records
+        with file_lock(metadata_file):
+            # When refreshing a subset of editors, keep the records of the others
+            if merge and metadata_file.exists():
+                try:
+                    with open(metadata_file, "r", encoding="utf-8") as f:
+                        previous = GenerationMetadata.model_validate(yaml.safe_load(f))
+                    if previous.output_dir == str(output_dir):
+                        for path, record in previous.outputs.items():
+                            if record.editor not in editors:
+                                outputs.setdefault(path, record)
+                        editors = previous.editors + [
+                            e for e in editors if e not in previous.editors
+                        ]
+                except Exception:
+                    pass  # Fall back to replacing the metadata
+
+            # Create metadata
+            metadata = GenerationMetadata(
+                timestamp=datetime.now().isoformat(),
+                source_file=str(source_files[0]) if source_files else "",
+                editors=editors,
+                output_dir=str(output_dir),
+                variables=static_vars,
+                dynamic_variables=dynamic_vars,
+                builtin_variables_enabled=True,
+                allow_commands=allow_commands,
+                stable_builtins=stable_builtins,
+                source_hashes=_source_hashes(source_files),
+                variable_digests={
+                    key: content_digest(str(value)) for key, value in variables.items()
+                },
+                outputs=outputs,
+            )
+
+            # Save to file, replacing it atomically
+            atomic_write(
+                metadata_file,
+                yaml.dump(
+                    metadata.model_dump(by_alias=True),
+                    default_flow_style=False,
+                    sort_keys=False,
+                ),
             )
 
         if verbose:
             click.echo(f"💾 Saved generation metadata to {metadata_file}")
-    except (OSError, PermissionError) as e:
+    except (OSError, FileLockError) as e:
         click.echo(
             f"⚠️  Warning: Failed to save generation metadata to {metadata_file}: {e}",
             err=True,
@@ -443,161 +742,136 @@ def _generate_for_editor_multiple(
 
     try:
         adapter = registry.get(editor)
-
-        if len(prompt_files) == 1:
-            # Single file - merge variables with correct precedence
-            prompt, source_file = prompt_files[0]
-
-            # Merge variables: base < prompt.variables < CLI
-            merged_vars = {}
-            if base_variables:
-                merged_vars.update(base_variables)
-            if hasattr(prompt, "variables") and prompt.variables:
-                merged_vars.update(prompt.variables)
-            if cli_overrides:
-                merged_vars.update(cli_overrides)
-            # Fallback to old 'variables' param for backward compatibility
-            if variables and not (base_variables or cli_overrides):
-                merged_vars = variables
-
-            # Check if adapter supports headless parameter
-            if _adapter_supports_headless(adapter, "generate"):
-                adapter.generate(
-                    prompt, output_dir, dry_run, verbose, merged_vars, headless=headless
-                )
-            else:
-                if headless:
-                    click.echo(
-                        f"Warning: {editor} adapter does not support headless mode, ignoring --headless flag"
-                    )
-                adapter.generate(prompt, output_dir, dry_run, verbose, merged_vars)
-            if verbose:
-                click.echo(f"✅ Generated {editor} files from {source_file}")
-        else:
-            # Multiple files - for merged generation, we'll use the last prompt's variables
-            # TODO: In future, support merging variables from multiple prompts
-            last_prompt = prompt_files[-1][0]
-            merged_vars = {}
-            if base_variables:
-                merged_vars.update(base_variables)
-            if hasattr(last_prompt, "variables") and last_prompt.variables:
-                merged_vars.update(last_prompt.variables)
-            if cli_overrides:
-                merged_vars.update(cli_overrides)
-            if variables and not (base_variables or cli_overrides):
-                merged_vars = variables
-
-            # Multiple files - check adapter capabilities
-            if hasattr(adapter, "generate_multiple") and registry.has_capability(
-                editor, AdapterCapability.MULTIPLE_FILE_GENERATION
-            ):
-                # Adapter supports generating separate files for each prompt
-                adapter.generate_multiple(
-                    prompt_files, output_dir, dry_run, verbose, merged_vars
-                )
-                click.echo(f"Generated separate {editor} files")
-            elif hasattr(adapter, "generate_merged"):
-                # Other adapters use merged files - try to use generate_merged
-                try:
-                    # Check if adapter supports headless parameter in generate_merged
-                    if _adapter_supports_headless(adapter, "generate_merged"):
-                        adapter.generate_merged(
-                            prompt_files,
-                            output_dir,
-                            dry_run,
-                            verbose,
-                            merged_vars,
-                            headless=headless,
-                        )
-                    else:
-                        if headless:
-                            click.echo(
-                                f"Warning: {editor} adapter does not support headless mode in merged generation, ignoring --headless flag"
-                            )
-                        adapter.generate_merged(
-                            prompt_files, output_dir, dry_run, verbose, merged_vars
-                        )
-                    if verbose:
-                        source_files = [str(pf[1]) for pf in prompt_files]
-                        click.echo(
-                            f"✅ Generated merged {editor} files from: {', '.join(source_files)}"
-                        )
-                except NotImplementedError:
-                    # Adapter doesn't actually support merging - fall back to single file generation
-                    prompt, source_file = prompt_files[-1]
-                    # Re-merge variables for this specific prompt
-                    fallback_vars = {}
-                    if base_variables:
-                        fallback_vars.update(base_variables)
-                    if hasattr(prompt, "variables") and prompt.variables:
-                        fallback_vars.update(prompt.variables)
-                    if cli_overrides:
-                        fallback_vars.update(cli_overrides)
-                    if variables and not (base_variables or cli_overrides):
-                        fallback_vars = variables
-
-                    # Check if adapter supports headless parameter
-                    if _adapter_supports_headless(adapter, "generate"):
-                        adapter.generate(
-                            prompt,
-                            output_dir,
-                            dry_run,
-                            verbose,
-                            fallback_vars,
-                            headless=headless,
-                        )
-                    else:
-                        if headless:
-                            click.echo(
-                                f"Warning: {editor} adapter does not support headless mode, ignoring --headless flag"
-                            )
-                        adapter.generate(
-                            prompt, output_dir, dry_run, verbose, fallback_vars
-                        )
-                    source_files = [str(pf[1]) for pf in prompt_files]
-                    click.echo(
-                        f"⚠️ {editor} adapter doesn't support merging. Generated from {source_file}, other files ignored: {', '.join(source_files[:-1])}"
-                    )
-            else:
-                # Fallback: generate from last file with warning
-                prompt, source_file = prompt_files[-1]
-                fallback_vars = {}
-                if base_variables:
-                    fallback_vars.update(base_variables)
-                if hasattr(prompt, "variables") and prompt.variables:
-                    fallback_vars.update(prompt.variables)
-                if cli_overrides:
-                    fallback_vars.update(cli_overrides)
-                if variables and not (base_variables or cli_overrides):
-                    fallback_vars = variables
-
-                # Check if adapter supports headless parameter
-                if _adapter_supports_headless(adapter, "generate"):
-                    adapter.generate(
-                        prompt,
-                        output_dir,
-                        dry_run,
-                        verbose,
-                        fallback_vars,
-                        headless=headless,
-                    )
-                else:
-                    if headless:
-                        click.echo(
-                            f"Warning: {editor} adapter does not support headless mode, ignoring --headless flag"
-                        )
-                    adapter.generate(
-                        prompt, output_dir, dry_run, verbose, fallback_vars
-                    )
-                source_files = [str(pf[1]) for pf in prompt_files]
-                click.echo(
-                    f"⚠️ {editor} adapter doesn't support merging. Generated from {source_file}, other files ignored: {', '.join(source_files[:-1])}"
-                )
+        descriptor = registry.get_descriptor(editor)
+
+        # Merge variables: base < prompt.variables < CLI. With several files
+        # the last prompt's variables are used
+        # TODO: In future, support merging variables from multiple prompts
+        prompt = prompt_files[-1][0]
+        merged_vars = {}
+        if base_variables:
+            merged_vars.update(base_variables)
+        if hasattr(prompt, "variables") and prompt.variables:
+            merged_vars.update(prompt.variables)
+        if cli_overrides:
+            merged_vars.update(cli_overrides)
+        # Fallback to old 'variables' param for backward compatibility
+        if variables and not (base_variables or cli_overrides):
+            merged_vars = variables
+
+        strategy = (
+            "single" if len(prompt_files) == 1 else descriptor.multi_file_strategy
+        )
+        _MULTI_FILE_GENERATORS[strategy](
+            adapter,
+            editor,
+            prompt_files,
+            output_dir,
+            dry_run,
+            verbose,
+            merged_vars,
+            _headless_kwargs(editor, descriptor, headless),
+        )
 
     except AdapterNotFoundError:
         raise AdapterNotFoundError(f"Editor '{editor}' adapter not implemented yet")
 
 
+def _headless_kwargs(
+    editor: str, descriptor: AdapterDescriptor, headless: bool
+) -> Dict[str, Any]:
+    """Get the headless argument for an adapter's generation methods."""
+    if descriptor.headless:
+        return {"headless": headless}
+    if headless:
+        echo(
+            f"Warning: {editor} adapter does not support headless mode, ignoring --headless flag"
+        )
+    return {}
+
+
+def _generate_single(
+    adapter: Any,
+    editor: str,
+    prompt_files: _PromptFiles,
+    output_dir: Path,
+    dry_run: bool,
+    verbose: bool,
+    variables: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> None:
+    """Generate from a single prompt file."""
+    prompt, source_file = prompt_files[0]
+    adapter.generate(prompt, output_dir, dry_run, verbose, variables, **extra)
+    if verbose:
+        echo(f"✅ Generated {editor} files from {source_file}")
+
+
+def _generate_separate(
+    adapter: Any,
+    editor: str,
+    prompt_files: _PromptFiles,
+    output_dir: Path,
+    dry_run: bool,
+    verbose: bool,
+    variables: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> None:
+    """Generate separate files for each prompt file."""
+    adapter.generate_multiple(
+        prompt_files, output_dir, dry_run, verbose, variables, **extra
+    )
+    echo(f"Generated separate {editor} files")
+
+
+def _generate_merged(
+    adapter: Any,
+    editor: str,
+    prompt_files: _PromptFiles,
+    output_dir: Path,
+    dry_run: bool,
+    verbose: bool,
+    variables: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> None:
+    """Merge all prompt files into one configuration."""
+    adapter.generate_merged(
+        prompt_files, output_dir, dry_run, verbose, variables, **extra
+    )
+    if verbose:
+        source_files = [str(pf[1]) for pf in prompt_files]
+        echo(f"✅ Generated merged {editor} files from: {', '.join(source_files)}")
+
+
+def _generate_from_last(
+    adapter: Any,
+    editor: str,
+    prompt_files: _PromptFiles,
+    output_dir: Path,
+    dry_run: bool,
+    verbose: bool,
+    variables: Dict[str, Any],
+    extra: Dict[str, Any],
+) -> None:
+    """Generate from the last prompt file for adapters that cannot merge."""
+    prompt, source_file = prompt_files[-1]
+    adapter.generate(prompt, output_dir, dry_run, verbose, variables, **extra)
+    source_files = [str(pf[1]) for pf in prompt_files]
+    echo(
+        f"⚠️ {editor} adapter doesn't support merging. Generated from {source_file}, other files ignored: {', '.join(source_files[:-1])}"
+    )
+
+
+# Generation function for each AdapterDescriptor.multi_file_strategy (and
+# 'single' for one prompt file)
+_MULTI_FILE_GENERATORS = {
+    "single": _generate_single,
+    "multiple": _generate_separate,
+    "merged": _generate_merged,
+    "last": _generate_from_last,
+}
+
+
 def _process_single_file(
     ctx: click.Context,
     file_path: Path,
@@ -719,17 +993,14 @@ def _generate_for_editor(
 
     try:
         adapter = registry.get(editor)
-        # Check if adapter supports headless parameter
-        if _adapter_supports_headless(adapter, "generate"):
-            adapter.generate(
-                prompt, output_dir, dry_run, verbose, variables, headless=headless
-            )
-        else:
-            if headless:
-                click.echo(
-                    f"Warning: {editor} adapter does not support headless mode, ignoring --headless flag"
-                )
-            adapter.generate(prompt, output_dir, dry_run, verbose, variables)
+        adapter.generate(
+            prompt,
+            output_dir,
+            dry_run,
+            verbose,
+            variables,
+            **_headless_kwargs(editor, registry.get_descriptor(editor), headless),
+        )
 
         if verbose and source_file:
             click.echo(f"✅ Generated {editor} files from {source_file}")
@@ -0,0 +1,296 @@
+"""
+Matrix generation (`promptrek generate --matrix`).
+
+Renders one UPF file for several variable sets (teams, environments, ...) in
+a single run. The prompt is parsed, validated and its base variables are
+evaluated once; each variant is rendered in memory in parallel into an
+OutputPlan, which is then checked and executed for the variant's output
+directory (so merged files, locking and atomic writes behave as in a regular
+run).
+
+All variants render the same prompt object, so the placeholder index of a
+v1 prompt (see VariableSubstitution.substitute_prompt()) is built once and
+shared by every variant. v2/v3 content is substituted with plain string
+replacement, which has nothing to precompile; only the substitution itself
+is repeated per variant.
+
+Matrix file format::
+
+    variants:
+      - name: team-a
+        output: build/team-a
+        variables:
+          TEAM: a
+          ENVIRONMENT: production
+      - name: team-b
+        output: build/team-b
+        variables:
+          TEAM: b
+
+Relative output directories are resolved against the matrix file's
+directory. Variant variables take precedence over -V overrides, which take
+precedence over prompt, local and built-in variables.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import click
+import yaml
+
+from ...adapters import registry
+from ...core.exceptions import AdapterNotFoundError, CLIError, OutputConflictError
+from ...core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
+from ...core.parser import UPFParser
+from ...utils.object_store import STORE_DIR, ObjectStore
+from ...utils.output_plan import OutputPlan
+from ...utils.outputs import virtual_output
+from ...utils.variables import VariableSubstitution
+from .generate import _generate_for_editor_multiple, _parse_and_validate_file
+from .prune import collect_unused_objects
+
+
+class MatrixVariant:
+    """A single entry of a generation matrix."""
+
+    def __init__(self, name: str, output: Path, variables: Dict[str, str]) -> None:
+        """
+        Initialize a matrix variant.
+
+        Args:
+            name: Variant name used in reports
+            output: Output directory for the variant
+            variables: Variable overrides for the variant
+        """
+        self.name = name
+        self.output = output
+        self.variables = variables
+
+
+def load_matrix(matrix_file: Path) -> List[MatrixVariant]:
+    """
+    Load and validate a matrix file.
+
+    Args:
+        matrix_file: Path to the matrix YAML file
+
+    Returns:
+        List of variants
+
+    Raises:
+        CLIError: If the file cannot be read or is invalid
+    """
+    try:
+        with open(matrix_file, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+    except (OSError, yaml.YAMLError) as e:
+        raise CLIError(f"Failed to read matrix file {matrix_file}: {e}")
+
+    entries = data.get("variants") if isinstance(data, dict) else data
+    if not isinstance(entries, list) or not entries:
+        raise CLIError(f"Matrix file {matrix_file} must define a list of 'variants'")
+
+    base_dir = matrix_file.resolve().parent
+    variants: List[MatrixVariant] = []
+    seen_outputs: Dict[Path, str] = {}
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("output"):
+            raise CLIError(f"Matrix variant #{index} must define an 'output' directory")
+
+        name = str(entry.get("name") or f"variant-{index}")
+        variables = entry.get("variables") or {}
+        if not isinstance(variables, dict):
+            raise CLIError(f"Matrix variant '{name}': 'variables' must be a mapping")
+
+        output = (base_dir / str(entry["output"])).resolve()
+        if output in seen_outputs:
+            raise CLIError(
+                f"Matrix variants '{seen_outputs[output]}' and '{name}' "
+                f"share the output directory {output}"
+            )
+        seen_outputs[output] = name
+
+        variants.append(
+            MatrixVariant(name, output, {str(k): str(v) for k, v in variables.items()})
+        )
+    return variants
+
+
+def _target_editors(
+    prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    editor: Optional[str],
+    all_editors: bool,
+) -> List[str]:
+    """Determine the editors to render for a prompt."""
+    if isinstance(prompt, UniversalPrompt):
+        targets = prompt.targets or []
+        if all_editors:
+            return list(targets)
+        if editor and prompt.targets is not None and editor not in targets:
+            raise CLIError(f"Editor '{editor}' not in targets: {', '.join(targets)}")
+    elif all_editors:
+        return registry.get_project_file_adapters()
+    if not editor:
+        raise CLIError("Must specify either --editor or --all")
+    return [editor]
+
+
+def _render_variant(
+    variant: MatrixVariant,
+    prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    source_file: Path,
+    editors: List[str],
+    base_variables: Dict[str, str],
+    cli_overrides: Dict[str, str],
+    headless: bool,
+    preview: bool = False,
+) -> Tuple[OutputPlan, List[str], List[str]]:
+    """Render all editors for one variant into an output plan."""
+    overrides = dict(cli_overrides)
+    overrides.update(variant.variables)
+    plan = OutputPlan()
+    messages: List[str] = []
+    errors = []
+
+    for editor in editors:
+        with virtual_output(preview=preview) as output:
+            try:
+                _generate_for_editor_multiple(
+                    [(prompt, source_file)],
+                    editor,
+                    variant.output,
+                    dry_run=False,
+                    verbose=False,
+                    headless=headless,
+                    base_variables=base_variables,
+                    cli_overrides=overrides,
+                )
+            except AdapterNotFoundError:
+                errors.append(f"editor '{editor}' not implemented")
+            except Exception as e:
+                errors.append(f"{editor}: {e}")
+            else:
+                plan.add(editor, output)
+        messages.extend(output.messages())
+    return plan, messages, errors
+
+
+def matrix_generate_command(
+    ctx: click.Context,
+    matrix_file: Path,
+    files: Tuple[Path, ...],
+    editor: Optional[str],
+    dry_run: bool,
+    all_editors: bool,
+    variables: Optional[dict] = None,
+    headless: bool = False,
+    stable_builtins: Optional[str] = None,
+    jobs: Optional[int] = None,
+    object_store: Optional[str] = None,
+) -> None:
+    """
+    Generate one UPF file for every variant of a matrix.
+
+    Args:
+        ctx: Click context
+        matrix_file: Path to the matrix YAML file
+        files: UPF file to render (defaults to the one in the current directory)
+        editor: Target editor name
+        dry_run: Whether to show what would be generated without creating files
+        all_editors: Whether to generate for all editors
+        variables: Variable overrides applied to every variant
+        headless: Whether to generate headless agent instructions
+        stable_builtins: Stable build granularity for time-based built-ins
+        jobs: Number of variants rendered concurrently
+        object_store: Link mode of an object store shared by all variants
+
+    Raises:
+        CLIError: If the matrix or prompt is invalid, or a variant fails
+    """
+    verbose = ctx.obj.get("verbose", False)
+    variants = load_matrix(matrix_file)
+
+    source_files = list(files) or UPFParser().find_upf_files(Path.cwd())
+    if len(source_files) != 1:
+        raise CLIError(
+            "Matrix generation renders exactly one UPF file; "
+            f"found {len(source_files)}. Pass the file explicitly."
+        )
+    source_file = source_files[0]
+
+    # Parse, validate and resolve base variables once for all variants
+    prompt = _parse_and_validate_file(ctx, source_file)
+    editors = _target_editors(prompt, editor, all_editors)
+
+    allow_commands = False
+    if isinstance(prompt, UniversalPromptV3):
+        allow_commands = prompt.allow_commands or False
+        if stable_builtins is None:
+            stable_builtins = prompt.stable_builtins
+    base_variables = VariableSubstitution().load_and_evaluate_variables(
+        allow_commands=allow_commands,
+        include_builtins=True,
+        verbose=verbose,
+        stable_builtins=stable_builtins,
+    )
+
+    click.echo(
+        f"🧮 Rendering {source_file} for {len(variants)} variant(s): "
+        f"{', '.join(editors)}"
+    )
+    if dry_run:
+        click.echo("🔍 Dry run mode - showing what would be generated:")
+
+    with ThreadPoolExecutor(max_workers=jobs or min(len(variants), 8)) as pool:
+        rendered = list(
+            pool.map(
+                lambda variant: _render_variant(
+                    variant,
+                    prompt,
+                    source_file,
+                    editors,
+                    base_variables,
+                    variables or {},
+                    headless,
+                    dry_run,
+                ),
+                variants,
+            )
+        )
+
+    # Variants share most of their files, which the store keeps once
+    store = ObjectStore(Path.cwd() / STORE_DIR, object_store) if object_store else None
+    failed = 0
+    for variant, (plan, messages, errors) in zip(variants, rendered):
+        if verbose:
+            for message in messages:
+                click.echo(f"  [{variant.name}] {message}")
+
+        try:
+            if dry_run:
+                plan.check()
+                click.echo(f"  📁 {variant.name} → {variant.output}")
+                for path in plan.writes:
+                    click.echo(f"    📄 {path}")
+            else:
+                written = plan.execute(store=store)
+                unchanged = len(plan.writes) - written
+                click.echo(
+                    f"  ✅ {variant.name} → {variant.output}: "
+                    f"{written} file(s) written, {unchanged} unchanged"
+                )
+        except OutputConflictError as e:
+            errors.append(str(e))
+
+        for error in errors:
+            click.echo(f"  ❌ {variant.name}: {error}", err=True)
+        failed += bool(errors)
+
+    if store is not None and not dry_run:
+        removed = collect_unused_objects(store, [Path.cwd()])
+        if removed and verbose:
+            click.echo(f"🧹 Removed {removed} unused object(s) from the object store")
+
+    if failed:
+        raise CLIError(f"{failed} of {len(variants)} matrix variant(s) failed")
@@ -14,6 +14,7 @@ from ...core.exceptions import AdapterNotFoundError, CLIError
 from ...core.models import UniversalPrompt
 from ...core.parser import UPFParser
 from ...core.validator import UPFValidator
+from ...utils.outputs import virtual_output
 
 
 def preview_command(
@@ -72,28 +73,16 @@ def preview_command(
     click.echo("=" * 80)
     click.echo()
 
-    # Generate with dry_run mode
+    # Generate with dry_run mode, capturing adapter messages in memory
     try:
-        import sys
-        from io import StringIO
-
-        # Capture output
-        old_stdout = sys.stdout
-        captured_output = StringIO()
-        try:
-            sys.stdout = captured_output
-
-            # Run generation in dry-run mode
-            output_dir = Path.cwd()
+        with virtual_output(preview=True) as output:
             files = adapter.generate(
-                prompt, output_dir, dry_run=True, verbose=True, variables=variables
+                prompt, Path.cwd(), dry_run=True, verbose=True, variables=variables
             )
-        finally:
-            sys.stdout = old_stdout
         # Show captured output
-        output_text = captured_output.getvalue()
-        if output_text:
-            click.echo(output_text)
+        for event in output.events:
+            if event.kind == "message":
+                click.echo(event.message, err=event.err)
 
         # Show file list
         if files:
@@ -0,0 +1,236 @@
+"""
+Pruning of stale generated outputs.
+
+When a document, agent or command is renamed or removed from a prompt, the
+file generated for it earlier is no longer produced but stays on disk, where
+editors keep loading and indexing it. After a generation run, files that the
+previous run (recorded in .promptrek/last-generation.yaml) generated for the
+same editors and output directory, and that were not generated again, are
+removed. A stale file is kept when:
+
+- it was edited since it was generated (its digest no longer matches),
+- it is a merged file that also holds user content (MCP configurations,
+  settings files), or
+- it is protected (PrompTrek's own files, git files and prompt files).
+
+With --object-store, objects that no current output needs are collected
+from the store the same way once a run is complete.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from ...core.models import GenerationMetadata, OutputRecord
+from ...utils.object_store import ObjectStore
+from ...utils.outputs import content_digest
+
+# Directories whose files are never pruned
+PROTECTED_DIRECTORIES = frozenset({".promptrek", ".git"})
+
+# File names never pruned
+PROTECTED_NAMES = frozenset({".gitignore"})
+
+
+def load_previous_generation(metadata_file: Path) -> Optional[GenerationMetadata]:
+    """
+    Load the metadata of the previous generation run.
+
+    Args:
+        metadata_file: Path to last-generation.yaml
+
+    Returns:
+        The metadata, or None if there is none or it cannot be read
+    """
+    try:
+        with open(metadata_file, "r", encoding="utf-8") as f:
+            return GenerationMetadata.model_validate(yaml.safe_load(f))
+    except Exception:
+        return None
+
+
+def is_protected(path: Path, source_files: Iterable[Path] = ()) -> bool:
+    """
+    Check whether a file must never be pruned.
+
+    Args:
+        path: File to check
+        source_files: Prompt files of the current run
+
+    Returns:
+        True if the file is protected
+    """
+    if path.name in PROTECTED_NAMES or path.name.endswith(".promptrek.yaml"):
+        return True
+    if PROTECTED_DIRECTORIES.intersection(path.parts):
+        return True
+    resolved = path.resolve()
+    return any(resolved == Path(source).resolve() for source in source_files)
+
+
+def stale_outputs(
+    previous: Optional[GenerationMetadata],
+    outputs_by_editor: Dict[str, Dict[Path, str]],
+    output_dir: Path,
+    source_files: Iterable[Path] = (),
+) -> Dict[str, OutputRecord]:
+    """
+    Find files the previous run generated that this run did not.
+
+    Only editors generated (successfully) in this run are considered, so
+    generating a single editor never touches another editor's files. An
+    editor that produced no files did not finish generating (for example the
+    user declined to replace a directory), so its files are not stale either
+    (see unfinished_outputs()). Merged and protected files are never stale.
+
+    Args:
+        previous: Metadata of the previous run
+        outputs_by_editor: Files generated in this run for each editor
+        output_dir: Output directory of this run
+        source_files: Prompt files of this run
+
+    Returns:
+        Records of the stale files, keyed by path
+    """
+    if previous is None or previous.output_dir != str(output_dir):
+        return {}
+
+    generated = {str(path) for files in outputs_by_editor.values() for path in files}
+    sources = list(source_files)
+    return {
+        name: record
+        for name, record in sorted(previous.outputs.items())
+        if outputs_by_editor.get(record.editor)
+        and name not in generated
+        and not record.merged
+        and not is_protected(Path(name), sources)
+    }
+
+
+def unfinished_outputs(
+    previous: Optional[GenerationMetadata],
+    outputs_by_editor: Dict[str, Dict[Path, str]],
+    output_dir: Path,
+) -> Dict[str, OutputRecord]:
+    """
+    Find the previous records of editors that produced no files in this run.
+
+    Their files are left as they are, and the records are carried forward so
+    a later run that finishes can still prune them.
+
+    Args:
+        previous: Metadata of the previous run
+        outputs_by_editor: Files generated in this run for each editor
+        output_dir: Output directory of this run
+
+    Returns:
+        Records of the unfinished editors' files, keyed by path
+    """
+    if previous is None or previous.output_dir != str(output_dir):
+        return {}
+
+    return {
+        name: record
+        for name, record in sorted(previous.outputs.items())
+        if record.editor in outputs_by_editor and not outputs_by_editor[record.editor]
+    }
+
+
+def prunable_outputs(
+    stale: Dict[str, OutputRecord],
+) -> Tuple[List[Path], List[Path]]:
+    """
+    Split stale files into those pruning would remove and those it keeps.
+
+    Args:
+        stale: Records of the stale files (see stale_outputs())
+
+    Returns:
+        Tuple of (files not edited since they were generated, files kept
+        because they were edited or cannot be read); files already gone are
+        left out
+    """
+    prunable: List[Path] = []
+    kept: List[Path] = []
+
+    for name, record in stale.items():
+        path = Path(name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except FileNotFoundError:
+            continue  # Already removed
+        except (OSError, UnicodeDecodeError):
+            kept.append(path)
+            continue
+
+        if content_digest(content) != record.hash:
+            kept.append(path)  # Edited by hand since it was generated
+        else:
+            prunable.append(path)
+
+    return prunable, kept
+
+
+def prune_stale_outputs(
+    stale: Dict[str, OutputRecord], output_dir: Path
+) -> Tuple[List[Path], List[Path]]:
+    """
+    Remove stale files that were not edited since they were generated.
+
+    Args:
+        stale: Records of the stale files (see stale_outputs())
+        output_dir: Output directory (empty directories are removed up to it)
+
+    Returns:
+        Tuple of (removed files, files kept because they were edited or could
+        not be removed)
+    """
+    removed: List[Path] = []
+    prunable, kept = prunable_outputs(stale)
+
+    for path in prunable:
+        try:
+            path.unlink()
+        except OSError:
+            kept.append(path)
+            continue
+        _remove_empty_directories(path.parent, output_dir)
+        removed.append(path)
+
+    return removed, kept
+
+
+def collect_unused_objects(store: ObjectStore, projects: Iterable[Path]) -> int:
+    """
+    Remove store objects that no project's current outputs need.
+
+    Args:
+        store: Object store the projects were generated with
+        projects: Directories whose .promptrek/last-generation.yaml records
+            reference objects to keep
+
+    Returns:
+        Number of objects removed
+    """
+    keep: Set[str] = set()
+    for project in projects:
+        previous = load_previous_generation(
+            project / ".promptrek" / "last-generation.yaml"
+        )
+        if previous is not None:
+            keep.update(record.hash for record in previous.outputs.values())
+    return store.collect(keep)
+
+
+def _remove_empty_directories(directory: Path, output_dir: Path) -> None:
+    """Remove directories left empty by pruning, up to the output directory."""
+    root = output_dir.resolve()
+    current = directory.resolve()
+    while current != root and root in current.parents:
+        try:
+            current.rmdir()
+        except OSError:
+            return  # Not empty
+        current = current.parent
@@ -5,14 +5,70 @@ Regenerates editor files using last generation settings with updated dynamic var
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
 import click
 import yaml
 
 from ...core.exceptions import CLIError
 from ...core.models import GenerationMetadata
-from ...core.parser import UPFParser
+from ...utils.outputs import content_digest
+from ...utils.variables import VariableSubstitution
+
+
+def _changed_variables(
+    metadata: GenerationMetadata, current: Dict[str, str]
+) -> Set[str]:
+    """
+    Find variables whose values differ from the last generation.
+
+    Args:
+        metadata: Metadata of the last generation run
+        current: Freshly evaluated variables
+
+    Returns:
+        Names of variables that were added, removed or changed
+    """
+    current_digests = {
+        key: content_digest(str(value)) for key, value in current.items()
+    }
+    names = set(current_digests) | set(metadata.variable_digests)
+    return {
+        name
+        for name in names
+        if current_digests.get(name) != metadata.variable_digests.get(name)
+    }
+
+
+def _sources_changed(metadata: GenerationMetadata) -> bool:
+    """Check whether any source file changed since the last generation."""
+    if not metadata.source_hashes:
+        return True
+    for source, digest in metadata.source_hashes.items():
+        try:
+            text = Path(source).read_text(encoding="utf-8")
+        except OSError:
+            return True
+        if content_digest(text) != digest:
+            return True
+    return False
+
+
+def _affected_editors(
+    metadata: GenerationMetadata, editors: List[str], changed: Set[str]
+) -> List[str]:
+    """
+    Select editors with at least one output affected by the changed variables.
+
+    Outputs that are missing on disk also mark their editor as affected.
+    """
+    affected = set()
+    for path, record in metadata.outputs.items():
+        if record.editor in affected or record.editor not in editors:
+            continue
+        if changed.intersection(record.variables) or not Path(path).exists():
+            affected.add(record.editor)
+    return [e for e in editors if e in affected]
 
 
 def refresh_command(
@@ -99,6 +155,35 @@ def refresh_command(
     if dry_run:
         click.echo("🔍 Dry run mode - showing what would be refreshed:")
 
+    # Selective refresh: evaluate variables once and regenerate only editors
+    # whose outputs reference a changed value. Older metadata without output
+    # records (or an explicit --editor) falls back to regenerating everything.
+    base_variables = None
+    if metadata.outputs and not editor:
+        base_variables = VariableSubstitution().load_and_evaluate_variables(
+            allow_commands=metadata.allow_commands,
+            include_builtins=metadata.builtin_variables_enabled,
+            verbose=verbose,
+            clear_cache=clear_cache,
+            stable_builtins=metadata.stable_builtins,
+        )
+        current = dict(base_variables)
+        current.update(variables_dict)
+
+        if _sources_changed(metadata):
+            if verbose:
+                click.echo("📝 Source changed since last generation")
+        else:
+            changed = _changed_variables(metadata, current)
+            if verbose and changed:
+                click.echo(f"🔁 Changed variables: {', '.join(sorted(changed))}")
+
+            affected = _affected_editors(metadata, target_editors, changed)
+            for target_editor in target_editors:
+                if target_editor not in affected:
+                    click.echo(f"✓ {target_editor} is up to date")
+            target_editors = affected
+
     # Call generate command for each target editor
     for target_editor in target_editors:
         try:
@@ -117,6 +202,9 @@ def refresh_command(
                 all_editors=False,
                 variables=variables_dict or None,
                 headless=False,
+                base_variables=base_variables,
+                merge_metadata=base_variables is not None,
+                stable_builtins=metadata.stable_builtins,
             )
 
             if verbose and not dry_run:
@@ -0,0 +1,43 @@
+"""
+Serve command implementation.
+
+Runs the PrompTrek daemon that answers client requests over a Unix socket.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from ...client import default_socket_path
+from ..daemon import DaemonServer
+
+
+def serve_command(
+    ctx: click.Context, socket_path: Optional[Path], verbose_requests: bool = False
+) -> None:
+    """
+    Run the PrompTrek daemon in the foreground.
+
+    Args:
+        ctx: Click context
+        socket_path: Unix socket path (defaults to the per-user socket)
+        verbose_requests: Log each request and its duration to stderr
+    """
+    verbose = ctx.obj.get("verbose", False)
+    path = socket_path or default_socket_path()
+
+    server = DaemonServer(path, verbose=verbose or verbose_requests)
+    click.echo(f"🚀 PrompTrek daemon listening on {path}")
+    click.echo(
+        "   Use 'promptrek-client <command> ...' to send requests (Ctrl+C to stop)"
+    )
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+    click.echo(
+        f"👋 PrompTrek daemon stopped ({server.requests_served} request(s) served)"
+    )
@@ -5,13 +5,15 @@ Handles reading editor-specific markdown files and updating/creating
 PrompTrek configuration from them.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import click
 
 from ...adapters import registry
+from ...adapters.sync_mixin import skip_unchanged_files
 from ...core.exceptions import PrompTrekError, UPFParsingError
 from ...core.models import (
     Instructions,
@@ -23,8 +25,10 @@ from ...core.models import (
 )
 from ...core.parser import UPFParser
 from ...utils.gitignore import configure_gitignore
+from ...utils.outputs import content_digest
 from ...utils.variables import VariableSubstitution
 from ..yaml_writer import write_promptrek_yaml
+from .prune import load_previous_generation
 
 
 def sync_command(
@@ -34,10 +38,15 @@ def sync_command(
     output_file: Optional[Path],
     dry_run: bool,
     force: bool,
+    full: bool = False,
 ) -> None:
     """
     Sync editor-specific files to PrompTrek configuration.
 
+    Editor files whose content still matches the hash recorded by the last
+    generation are not parsed: if none of the editor's files changed the
+    sync is skipped, otherwise only the edited files are merged back.
+
     Args:
         ctx: Click context
         source_dir: Directory containing editor files to read
@@ -45,9 +54,11 @@ def sync_command(
         output_file: Output PrompTrek file (defaults to project.promptrek.yaml)
         dry_run: Show what would be done without making changes
         force: Overwrite existing files without confirmation
+        full: Parse every editor file, ignoring generation hashes
     """
     if output_file is None:
         output_file = Path("project.promptrek.yaml")
+    verbose = ctx.obj.get("verbose", False) if ctx.obj else False
 
     # Get the adapter for the specified editor
     try:
@@ -59,25 +70,30 @@ def sync_command(
     if not adapter.supports_bidirectional_sync():
         raise PrompTrekError(f"Editor '{editor}' does not support syncing from files")
 
+    # Only an existing configuration can supply entries for skipped files
+    changes = None
+    if not full and output_file.exists():
+        changes = _editor_changes(
+            source_dir, adapter, _load_generation_records(source_dir).get(editor)
+        )
+    if changes is not None and not changes[0]:
+        click.echo(f"✅ No {editor} files changed since the last generation")
+        return
+    unchanged = changes[1] if changes else []
+    if verbose and changes:
+        click.echo(f"🔍 {len(changes[0])} changed, {len(unchanged)} unchanged file(s)")
+
     # Parse files from the source directory
     try:
-        parsed_prompt = adapter.parse_files(source_dir)
+        with skip_unchanged_files(unchanged):
+            parsed_prompt = adapter.parse_files(source_dir)
     except Exception as e:
         raise PrompTrekError(f"Failed to parse {editor} files: {e}")
 
     # Handle existing PrompTrek file
-    existing_prompt = None
-    if output_file.exists():
-        if not force and not dry_run:
-            if not click.confirm(f"File {output_file} exists. Update it?"):
-                click.echo("Sync cancelled.")
-                return
-
-        try:
-            parser = UPFParser()
-            existing_prompt = parser.parse_file(output_file)
-        except Exception as e:
-            click.echo(f"Warning: Could not parse existing file {output_file}: {e}")
+    proceed, existing_prompt = _load_existing_prompt(output_file, dry_run, force)
+    if not proceed:
+        return
 
     # Merge with existing configuration if present
     if existing_prompt:
@@ -86,19 +102,357 @@ def sync_command(
             existing=existing_prompt,
             parsed=parsed_prompt,
             source_dir=source_dir,
-            verbose=ctx.obj.get("verbose", False) if ctx.obj else False,
+            verbose=verbose,
+            variables=_load_restore_variables(existing_prompt, source_dir),
+        )
+        merged_prompt = _merge_prompts(
+            existing_prompt, parsed_prompt, editor, partial=bool(unchanged)
         )
-        merged_prompt = _merge_prompts(existing_prompt, parsed_prompt, editor)
     else:
         merged_prompt = parsed_prompt
 
-    # Write the result
+    _finish_sync(merged_prompt, output_file, dry_run, editor)
+
+
+def sync_all_command(
+    ctx: click.Context,
+    source_dir: Path,
+    output_file: Optional[Path],
+    dry_run: bool,
+    force: bool,
+    full: bool = False,
+) -> None:
+    """
+    Sync every editor with files in the source directory in a single pass.
+
+    Editor files are parsed concurrently, variables are restored once and all
+    results are merged in memory before the output file is written once.
+    Editors are merged in alphabetical order, so for fields that are replaced
+    rather than combined (v2/v3 content and documents) the last editor wins.
+    Editors whose parsed content matches the existing file are skipped so
+    they cannot revert another editor's changes, and as with a single-editor
+    sync, files unchanged since the last generation are not parsed.
+
+    Args:
+        ctx: Click context
+        source_dir: Directory containing editor files to read
+        output_file: Output PrompTrek file (defaults to project.promptrek.yaml)
+        dry_run: Show what would be done without making changes
+        force: Overwrite existing files without confirmation
+        full: Parse every editor file, ignoring generation hashes
+    """
+    if output_file is None:
+        output_file = Path("project.promptrek.yaml")
+    verbose = ctx.obj.get("verbose", False) if ctx.obj else False
+
+    editors = _detect_sync_editors(source_dir)
+    if not editors:
+        raise PrompTrekError(f"No editor files found in {source_dir} to sync from")
+
+    # Skip editors whose files all match the last generation
+    unchanged_by_editor: Dict[str, List[Path]] = {}
+    if not full and output_file.exists():
+        records = _load_generation_records(source_dir)
+        for editor in list(editors):
+            changes = _editor_changes(
+                source_dir, registry.get(editor), records.get(editor)
+            )
+            if changes is None:
+                continue
+            if not changes[0]:
+                editors.remove(editor)
+                if verbose:
+                    click.echo(f"  {editor}: unchanged since the last generation")
+            else:
+                unchanged_by_editor[editor] = changes[1]
+        if not editors:
+            click.echo("✅ No editor files changed since the last generation")
+            return
+
+    def parse(editor: str) -> Any:
+        with skip_unchanged_files(unchanged_by_editor.get(editor, [])):
+            return registry.get(editor).parse_files(source_dir)
+
+    # Parse every editor's files concurrently
+    parsed_by_editor: Dict[
+        str, Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]
+    ] = {}
+    with ThreadPoolExecutor(max_workers=len(editors)) as pool:
+        futures = {editor: pool.submit(parse, editor) for editor in editors}
+        for editor in editors:
+            try:
+                parsed_by_editor[editor] = futures[editor].result()
+            except Exception as e:
+                click.echo(
+                    f"⚠️  Skipping {editor}: failed to parse files: {e}", err=True
+                )
+
+    if not parsed_by_editor:
+        raise PrompTrekError("Failed to parse files for any editor")
+
+    proceed, existing_prompt = _load_existing_prompt(output_file, dry_run, force)
+    if not proceed:
+        return
+
+    merged_prompt = existing_prompt
+    if existing_prompt:
+        variables = _load_restore_variables(existing_prompt, source_dir)
+        baseline = _sync_form(existing_prompt)
+    synced = []
+
+    for editor in sorted(parsed_by_editor):
+        parsed_prompt = parsed_by_editor[editor]
+        if merged_prompt is None:
+            merged_prompt = parsed_prompt
+            synced.append(editor)
+            continue
+
+        partial = bool(unchanged_by_editor.get(editor))
+        if existing_prompt:
+            parsed_prompt = _restore_variables_in_parsed(
+                existing=existing_prompt,
+                parsed=parsed_prompt,
+                source_dir=source_dir,
+                verbose=verbose,
+                variables=variables,
+            )
+            if _is_unchanged(baseline, existing_prompt, parsed_prompt, editor, partial):
+                if verbose:
+                    click.echo(f"  {editor}: no changes")
+                continue
+
+        merged_prompt = _merge_prompts(
+            merged_prompt, parsed_prompt, editor, partial=partial
+        )
+        synced.append(editor)
+
+    assert merged_prompt is not None
+    _finish_sync(merged_prompt, output_file, dry_run, ", ".join(synced) or "no")
+
+
+def _detect_sync_editors(source_dir: Path) -> List[str]:
+    """
+    Find bidirectional editors whose files exist in a directory.
+
+    Args:
+        source_dir: Directory containing editor files
+
+    Returns:
+        Sorted list of editor names
+    """
+    editors = []
+    for name in sorted(registry.list_adapters()):
+        try:
+            adapter = registry.get(name)
+        except Exception:
+            continue
+        if not adapter.supports_bidirectional_sync():
+            continue
+        if any(any(source_dir.glob(pattern)) for pattern in adapter.file_patterns):
+            editors.append(name)
+    return editors
+
+
+def _load_generation_records(source_dir: Path) -> Dict[str, Dict[Path, str]]:
+    """
+    Load the output hashes recorded by the last generation.
+
+    Generate saves its metadata in the directory it ran in, which is not the
+    source directory when it wrote to another output directory (-o). The
+    current directory is looked in first, then the source directory; the
+    metadata counts only if it was generated into the source directory.
+
+    Args:
+        source_dir: Directory the generated files are synced from
+
+    Returns:
+        Mapping of editor name to {generated file: content digest}
+    """
+    source_dir = source_dir.resolve()
+    for project in dict.fromkeys([Path.cwd().resolve(), source_dir]):
+        metadata = load_previous_generation(
+            project / ".promptrek" / "last-generation.yaml"
+        )
+        # Relative paths are relative to the directory generate ran in
+        if metadata is None or (project / metadata.output_dir).resolve() != source_dir:
+            continue
+
+        records: Dict[str, Dict[Path, str]] = {}
+        for path, record in metadata.outputs.items():
+            records.setdefault(record.editor, {})[
+                (project / path).resolve()
+            ] = record.hash
+        return records
+    return {}
+
+
+def _editor_changes(
+    source_dir: Path, adapter: Any, records: Optional[Dict[Path, str]]
+) -> Optional[Tuple[List[Path], List[Path]]]:
+    """
+    Compare an editor's files with the hashes recorded at generation time.
+
+    Files matching the adapter's patterns, or sitting next to a generated
+    file with the same suffix, that were not generated count as changed.
+
+    Args:
+        source_dir: Directory containing editor files
+        adapter: Editor adapter
+        records: Recorded {generated file: content digest} for the editor
+
+    Returns:
+        Tuple of (changed files, unchanged files), or None if every file has
+        to be parsed (no records, or a generated file was deleted)
+    """
+    if not records:
+        return None
+
+    root = source_dir.resolve()
+    candidates = set(records)
+    for pattern in adapter.file_patterns:
+        candidates.update(path.resolve() for path in root.glob(pattern))
+    for directory, suffix in {(p.parent, p.suffix) for p in records}:
+        if directory != root and directory.is_dir():
+            candidates.update(p.resolve() for p in directory.glob(f"*{suffix}"))
+
+    changed: List[Path] = []
+    unchanged: List[Path] = []
+    for path in sorted(candidates):
+        try:
+            digest = content_digest(path.read_text(encoding="utf-8"))
+        except OSError:
+            # Deleted outputs need a full parse to drop their entries
+            return None
+        (unchanged if records.get(path) == digest else changed).append(path)
+    return changed, unchanged
+
+
+def _sync_form(
+    prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+) -> Dict[str, Any]:
+    """
+    Dump a prompt for comparison, ignoring what editor files cannot preserve.
+
+    Trailing whitespace of the content and documents differs between editors,
+    and the update date is set by every sync.
+    """
+    data = prompt.model_dump(mode="json", exclude_none=True)
+    data.get("metadata", {}).pop("updated", None)
+    if "content" in data:
+        data["content"] = data["content"].rstrip()
+    for document in data.get("documents") or []:
+        document["content"] = document["content"].rstrip()
+    return data
+
+
+def _is_unchanged(
+    baseline: Dict[str, Any],
+    existing: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    parsed: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    editor: str,
+    partial: bool,
+) -> bool:
+    """
+    Check whether syncing parsed v2/v3 data would leave a configuration as is.
+
+    Args:
+        baseline: _sync_form() of the existing configuration
+        existing: Existing configuration
+        parsed: Data parsed from an editor's files
+        editor: Editor the data was parsed from
+        partial: Whether only the editor's changed files were parsed
+
+    Returns:
+        True if merging the parsed data changes nothing
+    """
+    if not isinstance(parsed, (UniversalPromptV2, UniversalPromptV3)):
+        return False
+    if type(parsed) is not type(existing):
+        return False  # Merging would replace the schema
+    merged = _merge_prompts(existing, parsed, editor, partial=partial)
+    return _sync_form(merged) == baseline
+
+
+def _load_existing_prompt(
+    output_file: Path, dry_run: bool, force: bool
+) -> Tuple[
+    bool, Optional[Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]]
+]:
+    """
+    Confirm updating and parse the existing PrompTrek file, if any.
+
+    Args:
+        output_file: Output PrompTrek file
+        dry_run: Whether this is a dry run
+        force: Whether to overwrite without confirmation
+
+    Returns:
+        Tuple of (whether to proceed, existing prompt or None)
+    """
+    if not output_file.exists():
+        return True, None
+
+    if not force and not dry_run:
+        if not click.confirm(f"File {output_file} exists. Update it?"):
+            click.echo("Sync cancelled.")
+            return False, None
+
+    try:
+        parser = UPFParser()
+        return True, parser.parse_file(output_file)
+    except Exception as e:
+        click.echo(f"Warning: Could not parse existing file {output_file}: {e}")
+        return True, None
+
+
+def _load_restore_variables(
+    existing: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    source_dir: Path,
+) -> Optional[Dict[str, str]]:
+    """
+    Evaluate variables for restoration once per sync.
+
+    Includes the existing prompt's own variables, which take precedence over
+    built-in and local variables as they do during generation.
+
+    Args:
+        existing: Existing PrompTrek configuration
+        source_dir: Source directory for loading variables
+
+    Returns:
+        Evaluated variables, or None if they could not be loaded (each field
+        then falls back to loading them itself)
+    """
+    var_sub = VariableSubstitution()
+    if not var_sub.extract_variables(str(existing.model_dump(exclude_none=True))):
+        return {}
+    try:
+        variables = var_sub.load_and_evaluate_variables(
+            search_dir=source_dir,
+            allow_commands=True,
+            include_builtins=True,
+            verbose=False,
+            clear_cache=False,
+        )
+    except Exception:
+        return None
+    variables.update(getattr(existing, "variables", None) or {})
+    return variables
+
+
+def _finish_sync(
+    merged_prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
+    output_file: Path,
+    dry_run: bool,
+    editors: str,
+) -> None:
+    """Preview or write the merged configuration."""
     if dry_run:
         click.echo(f"🔍 Dry run mode - would write to: {output_file}")
         _preview_prompt(merged_prompt)
     else:
         _write_prompt_file(merged_prompt, output_file)
-        click.echo(f"✅ Synced {editor} configuration to: {output_file}")
+        click.echo(f"✅ Synced {editors} configuration to: {output_file}")
 
         # Check and apply ignore_editor_files configuration
         _apply_gitignore_config(merged_prompt, output_file.parent)
@@ -233,6 +587,7 @@ def _restore_variables_in_parsed(
     parsed: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
     source_dir: Path,
     verbose: bool = False,
+    variables: Optional[Dict[str, str]] = None,
 ) -> Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]:
     """
     Restore variable references in parsed prompt by comparing with existing.
@@ -246,6 +601,7 @@ def _restore_variables_in_parsed(
         parsed: Newly parsed data from editor files (with values)
         source_dir: Source directory for loading variables
         verbose: Whether to print restoration details
+        variables: Pre-evaluated variables (loaded per field when omitted)
 
     Returns:
         Parsed prompt with variables restored
@@ -264,6 +620,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.title,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.description and parsed.metadata.description:
                 parsed.metadata.description = var_sub.restore_variables_in_content(
@@ -271,6 +628,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.description,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.author and parsed.metadata.author:
                 parsed.metadata.author = var_sub.restore_variables_in_content(
@@ -278,6 +636,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.author,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
 
         # Restore variables in main content
@@ -289,6 +648,7 @@ def _restore_variables_in_parsed(
                 parsed_content=parsed.content,
                 source_dir=source_dir,
                 verbose=verbose,
+                variables=variables,
             )
 
         # Restore variables in documents
@@ -309,6 +669,7 @@ def _restore_variables_in_parsed(
                             parsed_content=parsed_doc.content,
                             source_dir=source_dir,
                             verbose=verbose,
+                            variables=variables,
                         )
 
     # V2 schema - restore in content and documents
@@ -323,6 +684,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.title,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.description and parsed.metadata.description:
                 parsed.metadata.description = var_sub.restore_variables_in_content(
@@ -330,6 +692,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.description,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.author and parsed.metadata.author:
                 parsed.metadata.author = var_sub.restore_variables_in_content(
@@ -337,6 +700,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.author,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
 
         # Restore variables in main content
@@ -348,6 +712,7 @@ def _restore_variables_in_parsed(
                 parsed_content=parsed.content,
                 source_dir=source_dir,
                 verbose=verbose,
+                variables=variables,
             )
 
         # Restore variables in documents
@@ -368,6 +733,7 @@ def _restore_variables_in_parsed(
                             parsed_content=parsed_doc.content,
                             source_dir=source_dir,
                             verbose=verbose,
+                            variables=variables,
                         )
 
     # V1 schema - restore in instructions
@@ -380,6 +746,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.title,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.description and parsed.metadata.description:
                 parsed.metadata.description = var_sub.restore_variables_in_content(
@@ -387,6 +754,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.description,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
             if existing.metadata.author and parsed.metadata.author:
                 parsed.metadata.author = var_sub.restore_variables_in_content(
@@ -394,6 +762,7 @@ def _restore_variables_in_parsed(
                     parsed_content=parsed.metadata.author,
                     source_dir=source_dir,
                     verbose=False,
+                    variables=variables,
                 )
 
         if parsed.instructions and existing.instructions:
@@ -422,6 +791,7 @@ def _restore_variables_in_parsed(
                         parsed_content=parsed_content,
                         source_dir=source_dir,
                         verbose=verbose,
+                        variables=variables,
                     )
 
                     # Split back into list
@@ -437,6 +807,7 @@ def _merge_prompts(
     existing: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
     parsed: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
     editor: str,
+    partial: bool = False,
 ) -> Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]:
     """
     Merge parsed prompt data with existing PrompTrek configuration.
@@ -453,6 +824,9 @@ def _merge_prompts(
         existing: Existing PrompTrek configuration
         parsed: Newly parsed data from editor files
         editor: Editor name being synced
+        partial: Whether unchanged files were skipped while parsing, in which
+            case parsed documents, agents and commands are merged into the
+            existing ones by name instead of replacing them
 
     Returns:
         Merged UniversalPrompt, UniversalPromptV2, or UniversalPromptV3
@@ -474,19 +848,19 @@ def _merge_prompts(
 
             # Update documents if present
             if parsed.documents:
-                merged_data["documents"] = [
-                    doc.model_dump(exclude_none=True) for doc in parsed.documents
-                ]
+                merged_data["documents"] = _merge_named(
+                    merged_data.get("documents"), parsed.documents, partial
+                )
 
             # Update plugin fields if present in parsed
             if parsed.agents:
-                merged_data["agents"] = [
-                    agent.model_dump(exclude_none=True) for agent in parsed.agents
-                ]
+                merged_data["agents"] = _merge_named(
+                    merged_data.get("agents"), parsed.agents, partial
+                )
             if parsed.commands:
-                merged_data["commands"] = [
-                    cmd.model_dump(exclude_none=True) for cmd in parsed.commands
-                ]
+                merged_data["commands"] = _merge_named(
+                    merged_data.get("commands"), parsed.commands, partial
+                )
             if parsed.hooks:
                 merged_data["hooks"] = [
                     hook.model_dump(exclude_none=True) for hook in parsed.hooks
@@ -530,9 +904,9 @@ def _merge_prompts(
 
             # Update documents if present
             if parsed.documents:
-                merged_data["documents"] = [
-                    doc.model_dump(exclude_none=True) for doc in parsed.documents
-                ]
+                merged_data["documents"] = _merge_named(
+                    merged_data.get("documents"), parsed.documents, partial
+                )
 
             # Update plugins if present in parsed (V2.1 nested structure)
             if parsed.plugins:
@@ -587,6 +961,25 @@ def _merge_prompts(
     )
 
 
+def _merge_named(
+    existing: Optional[List[Dict[str, Any]]], parsed: List[Any], partial: bool
+) -> List[Dict[str, Any]]:
+    """
+    Merge parsed named entries (documents, agents, commands).
+
+    A full sync replaces the existing entries. A partial sync only parsed the
+    edited files, so their entries replace existing ones with the same name
+    and all other existing entries are kept.
+    """
+    parsed_data = [item.model_dump(exclude_none=True) for item in parsed]
+    if not partial:
+        return parsed_data
+
+    by_name = {item.get("name"): item for item in parsed_data}
+    merged = [by_name.pop(item.get("name"), item) for item in existing or []]
+    return merged + list(by_name.values())
+
+
 def _preview_prompt(
     prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3],
 ) -> None:
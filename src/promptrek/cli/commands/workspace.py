@@ -0,0 +1,365 @@
+"""
+Workspace generation (`promptrek generate --workspace`).
+
+Generates every project root below a workspace directory (for example each
+package of a monorepo) from a single invocation. Built-in and git variables
+are computed once, local variable files are evaluated once per directory and
+inherited by nested projects, and the projects are generated in a process
+pool that inherits the parent's parse cache.
+"""
+
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from ...core.exceptions import CLIError
+from ...core.models import UniversalPromptV3
+from ...core.parser import UPFParser
+from ...utils.object_store import STORE_DIR, ObjectStore
+from ...utils.variables import BuiltInVariables, VariableSubstitution
+from .prune import collect_unused_objects
+
+# Directories never searched for project roots
+_SKIPPED_DIRECTORIES = {"node_modules", "venv", "__pycache__", "dist", "build"}
+
+# Legacy location of the local variables file (also matches *.promptrek.yaml)
+_LEGACY_VARIABLES_FILE = "variables.promptrek.yaml"
+
+
+def find_project_roots(workspace: Path) -> List[Tuple[Path, List[Path]]]:
+    """
+    Find all project roots in a workspace.
+
+    A project root is a directory that directly contains at least one UPF
+    file. Hidden directories and common dependency/build directories are
+    skipped.
+
+    Args:
+        workspace: Workspace root directory
+
+    Returns:
+        Sorted list of (project directory, UPF files) tuples
+    """
+    roots = []
+    for dirpath, dirnames, filenames in os.walk(workspace):
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if not d.startswith(".") and d not in _SKIPPED_DIRECTORIES
+        )
+        upf_files = sorted(
+            Path(dirpath) / name
+            for name in filenames
+            if (name.endswith(".promptrek.yaml") or name.endswith(".promptrek.yml"))
+            and not name.startswith("variables.promptrek.")
+        )
+        if upf_files:
+            roots.append((Path(dirpath), upf_files))
+    return roots
+
+
+def _variable_layer_directories(workspace: Path, project_dir: Path) -> List[Path]:
+    """Get the directories whose variable files apply, outermost first."""
+    relative = project_dir.relative_to(workspace)
+    directories = [workspace]
+    current = workspace
+    for part in relative.parts:
+        current = current / part
+        directories.append(current)
+    return directories
+
+
+def resolve_project_variables(
+    workspace: Path,
+    project_dir: Path,
+    builtins: Dict[str, str],
+    allow_commands: bool,
+    layer_cache: Dict[Tuple[str, bool], Dict[str, str]],
+    verbose: bool = False,
+) -> Dict[str, str]:
+    """
+    Resolve the base variables (built-in + local) for a workspace project.
+
+    Local variable files are layered from the workspace root (including the
+    nearest file above it) down to the project, so nested projects inherit
+    shared variables and override them. Each file is evaluated once and
+    cached in layer_cache.
+
+    Args:
+        workspace: Workspace root directory
+        project_dir: Project root directory
+        builtins: Built-in variables computed for the workspace
+        allow_commands: Whether command-based variables may be executed
+        layer_cache: Cache of evaluated variable files per directory
+        verbose: Whether to show verbose output
+
+    Returns:
+        Dictionary of base variables for the project
+    """
+    variables = dict(builtins)
+    variables["PROJECT_ROOT"] = str(project_dir)
+    # Without a git remote the project name falls back to the directory name
+    if builtins.get("PROJECT_NAME") == workspace.name:
+        variables["PROJECT_NAME"] = project_dir.name
+
+    for directory in _variable_layer_directories(workspace, project_dir):
+        has_file = (directory / VariableSubstitution.LOCAL_VARIABLES_FILE).exists()
+        has_legacy_file = (directory / _LEGACY_VARIABLES_FILE).exists()
+        if directory != workspace and not (has_file or has_legacy_file):
+            continue
+
+        cache_key = (str(directory), allow_commands)
+        if cache_key not in layer_cache:
+            layer_cache[cache_key] = VariableSubstitution().load_and_evaluate_variables(
+                search_dir=directory,
+                allow_commands=allow_commands,
+                include_builtins=False,
+                verbose=verbose,
+            )
+        variables.update(layer_cache[cache_key])
+
+    return variables
+
+
+def _build_tasks(
+    workspace: Path,
+    roots: List[Tuple[Path, List[Path]]],
+    editor: Optional[str],
+    dry_run: bool,
+    all_editors: bool,
+    variables: Dict[str, str],
+    headless: bool,
+    stable_builtins: Optional[str],
+    verbose: bool,
+) -> List[Dict[str, Any]]:
+    """Resolve each project's variables and build its generation task."""
+    parser = UPFParser()
+    # Git and date variables are computed once for the whole workspace
+    builtins_by_mode: Dict[Optional[str], Dict[str, str]] = {}
+    layer_cache: Dict[Tuple[str, bool], Dict[str, str]] = {}
+    previous_cwd = Path.cwd()
+    tasks = []
+    try:
+        os.chdir(workspace)
+        for project_dir, files in roots:
+            allow_commands = False
+            project_stable = stable_builtins
+            try:
+                first_prompt = parser.parse_file(files[0])
+                if isinstance(first_prompt, UniversalPromptV3):
+                    allow_commands = first_prompt.allow_commands or False
+                    if project_stable is None:
+                        project_stable = first_prompt.stable_builtins
+            except Exception:
+                # Reported by the project's own generation
+                pass
+
+            if project_stable not in builtins_by_mode:
+                builtins_by_mode[project_stable] = BuiltInVariables.get_all(
+                    verbose=verbose, stable=project_stable
+                )
+
+            tasks.append(
+                {
+                    "project": str(project_dir),
+                    "files": [str(f) for f in files],
+                    "editor": editor,
+                    "all_editors": all_editors,
+                    "dry_run": dry_run,
+                    "variables": variables,
+                    "headless": headless,
+                    "stable_builtins": project_stable,
+                    "verbose": verbose,
+                    "base_variables": resolve_project_variables(
+                        workspace,
+                        project_dir,
+                        builtins_by_mode[project_stable],
+                        allow_commands,
+                        layer_cache,
+                        verbose,
+                    ),
+                }
+            )
+    finally:
+        os.chdir(previous_cwd)
+    return tasks
+
+
+def _generate_project(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate a single workspace project (runs in a worker process).
+
+    Args:
+        task: Project directory and generate options
+
+    Returns:
+        Result with status, captured output and generated editors/files
+    """
+    from .generate import generate_command
+
+    result: Dict[str, Any] = {"project": task["project"], "ok": True, "error": None}
+    stdout, stderr = io.StringIO(), io.StringIO()
+    previous_cwd = os.getcwd()
+    ctx = click.Context(click.Command("generate"), obj={"verbose": task["verbose"]})
+
+    previous_stdin = sys.stdin
+    try:
+        os.chdir(task["project"])
+        # Nobody can answer prompts: adapters use their defaults, and
+        # anything still reading stdin sees end of input
+        sys.stdin = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            outputs = generate_command(
+                ctx,
+                tuple(Path(f) for f in task["files"]),
+                None,
+                False,
+                task["editor"],
+                None,
+                task["dry_run"],
+                task["all_editors"],
+                task["variables"],
+                task["headless"],
+                base_variables=task["base_variables"],
+                stable_builtins=task["stable_builtins"],
+                object_store=(
+                    ObjectStore(Path(task["store_root"]), task["object_store"])
+                    if task.get("object_store")
+                    else None
+                ),
+                interactive=False,
+                collect_objects=False,
+            )
+        result["editors"] = sorted(outputs)
+        result["files"] = sum(len(files) for files in outputs.values())
+    except Exception as e:
+        result.update(ok=False, error=str(e), editors=[], files=0)
+    finally:
+        sys.stdin = previous_stdin
+        os.chdir(previous_cwd)
+
+    result["output"] = stdout.getvalue()
+    result["errors"] = stderr.getvalue()
+    return result
+
+
+def workspace_generate_command(
+    ctx: click.Context,
+    workspace: Path,
+    editor: Optional[str],
+    dry_run: bool,
+    all_editors: bool,
+    variables: Optional[dict] = None,
+    headless: bool = False,
+    stable_builtins: Optional[str] = None,
+    jobs: Optional[int] = None,
+    object_store: Optional[str] = None,
+) -> None:
+    """
+    Generate editor files for every project root in a workspace.
+
+    Args:
+        ctx: Click context
+        workspace: Workspace root directory
+        editor: Target editor name
+        dry_run: Whether to show what would be generated without creating files
+        all_editors: Whether to generate for all editors
+        variables: Variable overrides applied to every project
+        headless: Whether to generate headless agent instructions
+        stable_builtins: Stable build granularity for time-based built-ins
+        jobs: Number of worker processes (defaults to the CPU count)
+        object_store: Link mode of an object store shared by all projects
+            (in the workspace's .promptrek/objects/)
+
+    Raises:
+        CLIError: If no projects are found or any project fails
+    """
+    verbose = ctx.obj.get("verbose", False)
+    if not editor and not all_editors:
+        raise CLIError("Must specify either --editor or --all")
+
+    workspace = workspace.resolve()
+    roots = find_project_roots(workspace)
+    if not roots:
+        raise CLIError(f"No UPF files found in workspace {workspace}")
+
+    click.echo(f"📦 Workspace {workspace}: {len(roots)} project(s)")
+
+    # Parsed prompts are reused by serial runs and by forked workers
+    cache_was_enabled = UPFParser.is_cache_enabled()
+    if not cache_was_enabled:
+        UPFParser.enable_cache()
+    try:
+        tasks = _build_tasks(
+            workspace,
+            roots,
+            editor,
+            dry_run,
+            all_editors,
+            variables or {},
+            headless,
+            stable_builtins,
+            verbose,
+        )
+        for task in tasks:
+            task["object_store"] = object_store
+            task["store_root"] = str(workspace / STORE_DIR)
+        workers = min(jobs or os.cpu_count() or 1, len(tasks))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_generate_project, tasks))
+        else:
+            results = [_generate_project(task) for task in tasks]
+    finally:
+        if not cache_was_enabled:
+            UPFParser.enable_cache(False)
+
+    _print_summary(workspace, results, verbose, dry_run)
+
+    # Projects share the store, so it is collected once they are all done
+    if object_store and not dry_run:
+        removed = collect_unused_objects(
+            ObjectStore(workspace / STORE_DIR, object_store),
+            (root for root, _ in roots),
+        )
+        if removed and verbose:
+            click.echo(f"🧹 Removed {removed} unused object(s) from the object store")
+
+    failed = [r for r in results if not r["ok"]]
+    if failed:
+        raise CLIError(f"{len(failed)} of {len(results)} workspace project(s) failed")
+
+
+def _print_summary(
+    workspace: Path, results: List[Dict[str, Any]], verbose: bool, dry_run: bool
+) -> None:
+    """Print the aggregated result of a workspace generation."""
+    total_files = 0
+    for result in results:
+        project = Path(result["project"])
+        name = str(project.relative_to(workspace)) if project != workspace else "."
+
+        if verbose and (result["output"] or result["errors"]):
+            click.echo(f"\n── {name} ──")
+            click.echo(result["output"].rstrip())
+            if result["errors"]:
+                click.echo(result["errors"].rstrip(), err=True)
+
+        if result["ok"]:
+            total_files += result["files"]
+            editors = ", ".join(result["editors"]) or "no editors"
+            click.echo(f"  ✅ {name}: {editors} ({result['files']} file(s))")
+        else:
+            click.echo(f"  ❌ {name}: {result['error']}", err=True)
+
+    succeeded = sum(1 for r in results if r["ok"])
+    verb = "Would generate" if dry_run else "Generated"
+    click.echo(
+        f"{verb} {total_files} file(s) for {succeeded}/{len(results)} project(s)"
+    )
@@ -0,0 +1,221 @@
+"""
+PrompTrek daemon (`promptrek serve`).
+
+Keeps the CLI, adapter registry, parsed prompts and built-in variables warm in
+a long-lived process and executes commands sent by clients over a local Unix
+socket using a JSON-lines protocol (see promptrek.client).
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from .. import __version__
+from ..client import CONTROL_COMMANDS, DAEMON_COMMANDS
+from ..core.exceptions import CLIError
+from ..core.parser import UPFParser
+from ..utils.variables import BuiltInVariables
+
+
+def run_cli_command(args: List[str]) -> int:
+    """
+    Run a PrompTrek CLI command in the current process.
+
+    Args:
+        args: Command-line arguments, starting with the command name
+
+    Returns:
+        Exit code
+    """
+    from .main import cli
+
+    try:
+        result = cli.main(args=args, prog_name="promptrek", standalone_mode=False)
+        return result if isinstance(result, int) else 0
+    except click.exceptions.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+
+
+class DaemonServer:
+    """Executes PrompTrek commands for clients connected over a Unix socket."""
+
+    def __init__(self, socket_path: Path, verbose: bool = False) -> None:
+        """
+        Initialize the daemon.
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+            verbose: Whether to log requests
+        """
+        self.socket_path = socket_path
+        self.verbose = verbose
+        # Commands change the working directory and redirect stdout, which
+        # are process-wide, so they run one at a time.
+        self._execution_lock = threading.Lock()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self.requests_served = 0
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a single protocol request.
+
+        Args:
+            request: Request with 'command', optional 'args', 'cwd' and 'id'
+
+        Returns:
+            Response dictionary
+        """
+        started = time.perf_counter()
+        command = request.get("command")
+        response: Dict[str, Any] = {"id": request.get("id")}
+
+        if command == "ping":
+            response.update(ok=True, exit_code=0, pid=os.getpid())
+            response["version"] = __version__
+        elif command == "shutdown":
+            response.update(ok=True, exit_code=0)
+            if self._server is not None:
+                threading.Thread(target=self._server.shutdown, daemon=True).start()
+        elif command in DAEMON_COMMANDS:
+            args = request.get("args") or []
+            if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+                response.update(ok=False, exit_code=2, error="'args' must be strings")
+            else:
+                exit_code, stdout, stderr = self._execute(
+                    [command, *args], request.get("cwd")
+                )
+                response.update(
+                    ok=exit_code == 0, exit_code=exit_code, stdout=stdout, stderr=stderr
+                )
+        else:
+            supported = ", ".join(DAEMON_COMMANDS + CONTROL_COMMANDS)
+            response.update(
+                ok=False,
+                exit_code=2,
+                error=f"Unknown command '{command}'. Supported: {supported}",
+            )
+
+        self.requests_served += 1
+        response["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return response
+
+    def _execute(self, args: List[str], cwd: Optional[str]) -> Tuple[int, str, str]:
+        """Run a CLI command with captured output in the requested directory."""
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        with self._execution_lock:
+            previous_cwd = os.getcwd()
+            previous_stdin = sys.stdin
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                # Interactive prompts cannot be answered over the socket
+                sys.stdin = io.StringIO()
+                with redirect_stdout(stdout), redirect_stderr(stderr):
+                    try:
+                        exit_code = run_cli_command(args)
+                    except Exception as e:
+                        click.echo(f"Unexpected error: {e}", err=True)
+                        exit_code = 1
+            except OSError as e:
+                stderr.write(f"Error: cannot change directory to {cwd}: {e}\n")
+                exit_code = 1
+            finally:
+                sys.stdin = previous_stdin
+                os.chdir(previous_cwd)
+
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def serve_forever(self) -> None:
+        """
+        Listen on the socket and serve requests until shut down.
+
+        Raises:
+            CLIError: If Unix sockets are unavailable or a daemon is running
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise CLIError("'promptrek serve' requires Unix domain sockets")
+
+        self._prepare_socket_path()
+
+        # Keep parsed prompts and git-derived variables warm between requests
+        UPFParser.enable_cache()
+        BuiltInVariables.enable_cache()
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line.decode("utf-8"))
+                        if not isinstance(request, dict):
+                            raise ValueError("request must be a JSON object")
+                        response = daemon.handle_request(request)
+                    except ValueError as e:
+                        response = {"ok": False, "exit_code": 2, "error": str(e)}
+                    if daemon.verbose:
+                        click.echo(
+                            f"{response.get('exit_code')} {line.decode().strip()} "
+                            f"({response.get('duration_ms', 0)} ms)",
+                            err=True,
+                        )
+                    self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+                    self.wfile.flush()
+
+        # Create the socket owner-only: chmod after bind() would leave a
+        # window in which other users could connect
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(
+                str(self.socket_path), Handler
+            )
+        finally:
+            os.umask(previous_umask)
+        self._server.daemon_threads = True
+
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._server = None
+            UPFParser.enable_cache(False)
+            BuiltInVariables.enable_cache(False)
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+    def _prepare_socket_path(self) -> None:
+        """Remove a stale socket file, refusing if a daemon is listening."""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink()
+        else:
+            raise CLIError(
+                f"A PrompTrek daemon is already listening on {self.socket_path}"
+            )
+        finally:
+            probe.close()
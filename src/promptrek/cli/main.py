@@ -10,12 +10,15 @@ from typing import Optional
 import click
 
 from .. import __version__
-from ..core.exceptions import PrompTrekError
+from ..core.exceptions import CLIError, PrompTrekError
+from ..core.models import STABLE_BUILTIN_GRANULARITIES
+from ..utils.object_store import LINK_MODES, STORE_DIR, ObjectStore
 from .commands.agents import agents_command
 from .commands.config_ignores import config_ignores_command
 from .commands.generate import generate_command
 from .commands.hooks import check_generated_command, install_hooks_command
 from .commands.init import init_command
+from .commands.matrix import matrix_generate_command
 from .commands.migrate import migrate_command
 from .commands.plugins import (
     generate_plugins_command,
@@ -24,8 +27,10 @@ from .commands.plugins import (
 )
 from .commands.preview import preview_command
 from .commands.refresh import refresh_command
-from .commands.sync import sync_command
+from .commands.serve import serve_command
+from .commands.sync import sync_all_command, sync_command
 from .commands.validate import validate_command
+from .commands.workspace import workspace_generate_command
 from .interactive import run_interactive_mode
 
 
@@ -245,9 +250,14 @@ def preview(
     "--editor",
     "-e",
     type=str,
-    required=True,
     help="Editor type to sync from (e.g., continue)",
 )
+@click.option(
+    "--all",
+    "all_editors",
+    is_flag=True,
+    help="Sync from every editor with files in the source directory",
+)
 @click.option(
     "--output",
     "-o",
@@ -265,18 +275,32 @@ def preview(
     is_flag=True,
     help="Overwrite existing files without confirmation",
 )
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Parse every editor file, even those unchanged since the last generation",
+)
 @click.pass_context
 def sync(
     ctx: click.Context,
     source_dir: Path,
-    editor: str,
+    editor: Optional[str],
+    all_editors: bool,
     output: Path,
     dry_run: bool,
     force: bool,
+    full: bool,
 ) -> None:
     """Sync editor-specific files to PrompTrek configuration."""
     try:
-        sync_command(ctx, source_dir, editor, output, dry_run, force)
+        if all_editors:
+            if editor:
+                raise CLIError("Use either --editor or --all, not both")
+            sync_all_command(ctx, source_dir, output, dry_run, force, full)
+        elif editor:
+            sync_command(ctx, source_dir, editor, output, dry_run, force, full)
+        else:
+            raise CLIError("Must specify either --editor or --all")
     except PrompTrekError as e:
         click.echo(f"Error: {e}", err=True)
         ctx.exit(1)
@@ -309,6 +333,45 @@ def sync(
     is_flag=True,
     help="Show what would be generated without creating files",
 )
+@click.option(
+    "--diff",
+    is_flag=True,
+    help="Show a unified diff of the generated files against the current ones "
+    "without writing anything",
+)
+@click.option(
+    "--prune/--no-prune",
+    default=True,
+    show_default=True,
+    help="Delete files generated by the previous run that are no longer "
+    "generated (on by default; files edited since are kept, and --diff shows "
+    "them as removed). Use --no-prune to keep them",
+)
+@click.option(
+    "--context-report",
+    is_flag=True,
+    help="Show estimated context tokens per editor and per generated file",
+)
+@click.option(
+    "--max-context-tokens",
+    type=click.IntRange(min=1),
+    help="Token budget for the files loaded on every request (per editor) "
+    "and for each other instruction file",
+)
+@click.option(
+    "--context-budget",
+    type=click.Choice(["warn", "fail"]),
+    default="warn",
+    show_default=True,
+    help="Whether exceeding --max-context-tokens warns or fails without "
+    "writing anything",
+)
+@click.option(
+    "--object-store",
+    type=click.Choice(list(LINK_MODES)),
+    help="Store generated files once in .promptrek/objects/ and reflink or "
+    "hard link them into place (falls back to copying)",
+)
 @click.option(
     "--all", "all_editors", is_flag=True, help="Generate for all target editors"
 )
@@ -324,6 +387,30 @@ def sync(
     is_flag=True,
     help="Generate with headless agent instructions for autonomous operation",
 )
+@click.option(
+    "--stable-builtins",
+    type=click.Choice(list(STABLE_BUILTIN_GRANULARITIES)),
+    help="Pin time-based built-in variables for reproducible output "
+    "(SOURCE_DATE_EPOCH takes precedence when set)",
+)
+@click.option(
+    "--workspace",
+    "-w",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Generate every project root found below this directory",
+)
+@click.option(
+    "--matrix",
+    "matrix_file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Render the prompt once per variant defined in this matrix file",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Parallel workers for --workspace or --matrix (default: CPU count)",
+)
 @click.pass_context
 def generate(
     ctx: click.Context,
@@ -333,9 +420,19 @@ def generate(
     editor: str,
     output: Path,
     dry_run: bool,
+    diff: bool,
+    prune: bool,
+    context_report: bool,
+    max_context_tokens: Optional[int],
+    context_budget: str,
+    object_store: Optional[str],
     all_editors: bool,
     variables: tuple,
     headless: bool,
+    stable_builtins: Optional[str],
+    workspace: Optional[Path],
+    matrix_file: Optional[Path],
+    jobs: Optional[int],
 ) -> None:
     """Generate editor-specific prompts from universal prompt files."""
     try:
@@ -349,6 +446,63 @@ def generate(
             key, value = var.split("=", 1)
             var_dict[key.strip()] = value.strip()
 
+        if workspace and matrix_file:
+            raise CLIError("--workspace and --matrix cannot be used together")
+
+        if diff and (dry_run or workspace or matrix_file):
+            raise CLIError(
+                "--diff cannot be combined with --dry-run, --workspace or --matrix"
+            )
+
+        if (context_report or max_context_tokens) and (
+            dry_run or workspace or matrix_file
+        ):
+            raise CLIError(
+                "--context-report and --max-context-tokens cannot be combined "
+                "with --dry-run, --workspace or --matrix (use --diff to measure "
+                "without writing)"
+            )
+
+        if matrix_file:
+            if directory or output:
+                raise CLIError(
+                    "--matrix cannot be combined with --directory or --output; "
+                    "set 'output' for each variant in the matrix file"
+                )
+            matrix_generate_command(
+                ctx,
+                matrix_file,
+                files,
+                editor,
+                dry_run,
+                all_editors,
+                var_dict,
+                headless,
+                stable_builtins=stable_builtins,
+                jobs=jobs,
+                object_store=object_store,
+            )
+            return
+
+        if workspace:
+            if files or directory or output:
+                raise CLIError(
+                    "--workspace cannot be combined with files, --directory or --output"
+                )
+            workspace_generate_command(
+                ctx,
+                workspace,
+                editor,
+                dry_run,
+                all_editors,
+                var_dict,
+                headless,
+                stable_builtins=stable_builtins,
+                jobs=jobs,
+                object_store=object_store,
+            )
+            return
+
         generate_command(
             ctx,
             files,
@@ -360,6 +514,17 @@ def generate(
             all_editors,
             var_dict,
             headless,
+            stable_builtins=stable_builtins,
+            diff=diff,
+            prune=prune,
+            context_report=context_report,
+            max_context_tokens=max_context_tokens,
+            context_budget=context_budget,
+            object_store=(
+                ObjectStore(Path.cwd() / STORE_DIR, object_store)
+                if object_store
+                else None
+            ),
         )
     except PrompTrekError as e:
         click.echo(f"Error: {e}", err=True)
@@ -689,6 +854,46 @@ def check_generated(ctx: click.Context, files: tuple[str, ...]) -> None:
         ctx.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket path (default: $PROMPTREK_SOCKET or a per-user socket)",
+)
+@click.option(
+    "--log-requests",
+    is_flag=True,
+    help="Log each request and its duration to stderr",
+)
+@click.pass_context
+def serve(ctx: click.Context, socket_path: Optional[Path], log_requests: bool) -> None:
+    """Run a warm PrompTrek daemon for editor and hook clients.
+
+    The daemon keeps adapters, parsed prompts and built-in variables loaded
+    and executes generate, validate, preview, check-generated and sync
+    requests sent over a Unix socket (JSON lines).
+
+    Examples:
+        # Start the daemon
+        promptrek serve
+
+        # Send requests with the thin client
+        promptrek-client generate -e claude
+        promptrek-client check-generated CLAUDE.md
+    """
+    try:
+        serve_command(ctx, socket_path, log_requests)
+    except PrompTrekError as e:
+        click.echo(f"Error: {e}", err=True)
+        ctx.exit(1)
+    except Exception as e:
+        if ctx.obj.get("verbose"):
+            raise
+        click.echo(f"Unexpected error: {e}", err=True)
+        ctx.exit(1)
+
+
 @cli.group()
 @click.pass_context
 def plugins(ctx: click.Context) -> None:
@@ -0,0 +1,181 @@
+"""
+Thin client for the PrompTrek daemon (`promptrek serve`).
+
+Sends a command to a running daemon over its Unix socket and prints the
+result, so editor extensions and git hooks avoid paying the CLI start-up cost
+on every call. Falls back to running the command in-process when no daemon
+is listening.
+
+Only the standard library is imported here to keep start-up fast.
+
+Usage:
+    promptrek-client generate -e claude
+    promptrek-client check-generated CLAUDE.md
+
+Protocol (JSON lines, one request and one response per line):
+    -> {"id": 1, "command": "generate", "args": ["-e", "claude"], "cwd": "/repo"}
+    <- {"id": 1, "ok": true, "exit_code": 0, "stdout": "...", "stderr": "",
+        "duration_ms": 4.2}
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+SOCKET_ENV = "PROMPTREK_SOCKET"
+
+# Commands the daemon executes on behalf of clients
+DAEMON_COMMANDS = ("generate", "validate", "preview", "check-generated", "sync")
+
+# Control requests handled by the daemon itself
+CONTROL_COMMANDS = ("ping", "shutdown")
+
+
+class DaemonUnavailableError(ConnectionError):
+    """Raised when no daemon is listening on the socket."""
+
+
+class DaemonError(RuntimeError):
+    """Raised when a request was sent but no valid response came back."""
+
+
+def default_socket_path() -> Path:
+    """
+    Get the default daemon socket path.
+
+    Uses $PROMPTREK_SOCKET if set, otherwise a per-user socket in
+    $XDG_RUNTIME_DIR or the system temporary directory.
+
+    Returns:
+        Path to the Unix socket
+    """
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return Path(configured)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "promptrek.sock"
+
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"promptrek-{uid}.sock"
+
+
+def request(
+    command: str,
+    args: Optional[List[str]] = None,
+    cwd: Optional[str] = None,
+    socket_path: Optional[Path] = None,
+    timeout: Optional[float] = 60.0,
+) -> Dict[str, Any]:
+    """
+    Send a single request to the daemon and wait for the response.
+
+    Args:
+        command: Command name (e.g. 'generate', 'ping')
+        args: Command-line arguments for the command
+        cwd: Working directory to run the command in (defaults to current)
+        socket_path: Daemon socket path (defaults to default_socket_path())
+        timeout: Socket timeout in seconds
+
+    Returns:
+        Response dictionary
+
+    Raises:
+        DaemonUnavailableError: If the daemon cannot be reached (nothing was
+            sent, so the command can safely run elsewhere)
+        DaemonError: If the request was sent but timed out or got an invalid
+            response (the daemon may have run the command)
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailableError("Unix sockets are not supported here")
+
+    path = socket_path or default_socket_path()
+    payload = {
+        "id": 1,
+        "command": command,
+        "args": list(args or []),
+        "cwd": cwd or os.getcwd(),
+    }
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except PermissionError as e:
+            raise DaemonUnavailableError(f"Cannot connect to {path}: {e}") from e
+        except OSError as e:
+            raise DaemonUnavailableError(f"No daemon listening on {path}") from e
+
+        try:
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+        except socket.timeout as e:
+            raise DaemonError(
+                f"No response from the daemon at {path} within {timeout:g}s"
+            ) from e
+        except OSError as e:
+            raise DaemonError(f"Connection to the daemon at {path} failed: {e}") from e
+
+    if not line.endswith(b"\n"):
+        raise DaemonError(f"Daemon at {path} closed the connection")
+    try:
+        response = json.loads(line.decode("utf-8"))
+    except ValueError as e:
+        raise DaemonError(f"Invalid response from the daemon at {path}") from e
+    if not isinstance(response, dict):
+        raise DaemonError(f"Invalid response from the daemon at {path}")
+    return response
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run a command through the daemon, falling back to the in-process CLI.
+
+    Args:
+        argv: Arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print((__doc__ or "").strip())
+        return 0
+
+    command, args = argv[0], argv[1:]
+    if command not in DAEMON_COMMANDS + CONTROL_COMMANDS:
+        print(f"Unsupported command: {command}", file=sys.stderr)
+        return 2
+
+    try:
+        response = request(command, args)
+    except DaemonUnavailableError:
+        if command in CONTROL_COMMANDS:
+            print("PrompTrek daemon is not running", file=sys.stderr)
+            return 1
+        # No daemon: run the regular CLI in this process
+        from .cli.daemon import run_cli_command
+
+        return run_cli_command([command, *args])
+    except DaemonError as e:
+        # The daemon may have run the command: never run it a second time
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if response.get("stdout"):
+        sys.stdout.write(response["stdout"])
+    if response.get("stderr"):
+        sys.stderr.write(response["stderr"])
+    if command == "ping" and response.get("ok"):
+        print(f"PrompTrek daemon {response.get('version')} (pid {response.get('pid')})")
+    return int(response.get("exit_code", 0 if response.get("ok") else 1))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
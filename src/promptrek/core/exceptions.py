@@ -36,6 +36,12 @@ class UPFValidationError(UPFError):
     pass
 
 
+class ConditionSyntaxError(UPFError):
+    """Raised when a condition expression cannot be parsed."""
+
+    pass
+
+
 class ValidationError(PrompTrekError):
     """Represents a validation error with field and message information."""
 
@@ -102,6 +108,18 @@ class CLIError(PrompTrekError):
     pass
 
 
+class FileLockError(PrompTrekError):
+    """Raised when a file lock cannot be acquired within the timeout."""
+
+    pass
+
+
+class OutputConflictError(PrompTrekError):
+    """Raised when editors generated in one run write the same file differently."""
+
+    pass
+
+
 class DeprecationWarnings:
     """Centralized deprecation warning messages for PrompTrek."""
 
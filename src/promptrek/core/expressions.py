@@ -0,0 +1,380 @@
+"""
+Condition expression compiler for PrompTrek.
+
+Compiles v1 ``conditions`` expressions into a small AST once, so evaluation is
+a cheap tree walk against the variable table.
+
+Grammar::
+
+    expr       := or_expr
+    or_expr    := and_expr ("or" and_expr)*
+    and_expr   := not_expr ("and" not_expr)*
+    not_expr   := "not" not_expr | comparison
+    comparison := primary [op value]
+    op         := "==" | "!=" | "<" | "<=" | ">" | ">=" | "in" | "not in"
+    primary    := NAME | "(" expr ")" | "true" | "false"
+    value      := STRING | NUMBER | NAME | list
+    list       := "[" [value ("," value)*] "]"
+
+The left side of a comparison is a variable name (missing variables compare as
+an empty string). Bare words on the right side are literals, matching the
+original ``EDITOR == claude`` syntax. ``==``/``!=`` compare numerically only
+when both sides are numbers; ordering operators always compare numerically.
+
+An expression that does not parse but has the original ``NAME == raw text``
+form (e.g. ``project_type == web app``) compares against the raw text, as the
+original string-split evaluator did. Such comparisons are flagged as
+``unquoted`` so the validator can suggest quoting the value.
+
+Breaking change: an unquoted value followed by ``and``/``or`` used to be part
+of one multi-word value (``TEAM == research and development`` compared TEAM
+with "research and development"); it is now a boolean expression
+(``(TEAM == research) and development``). Such comparisons record the
+keyword in ``continued_by`` so the validator can warn about them.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .exceptions import ConditionSyntaxError
+
+Literal = Union[str, float]
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"[^"]*"|'[^']*')
+      | (?P<number>-?\d+(?:\.\d+)?(?![\w.-]))
+      | (?P<op>==|!=|<=|>=|<|>)
+      | (?P<punct>[()\[\],])
+      | (?P<name>\w[\w.\-/]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_KEYWORDS = {"and", "or", "not", "in", "true", "false"}
+
+_UNQUOTED_COMPARISON = re.compile(
+    r"^\s*(\w[\w.\-/]*)\s+(==|!=)\s+([^\s\"'()\[\]!=<>][^\"'()\[\]!=<>]*?)\s*$"
+)
+
+
+class Number(float):
+    """A numeric literal that remembers how it was written."""
+
+    text: str
+
+    def __new__(cls, text: str) -> "Number":
+        number = super().__new__(cls, text)
+        number.text = text
+        return number
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Convert a value to a float if it looks numeric."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Node:
+    """Base class for compiled expression nodes."""
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        """Evaluate the node against a variable table."""
+        raise NotImplementedError
+
+    def names(self) -> List[str]:
+        """Variable names referenced by the node."""
+        return []
+
+    def comparisons(self) -> List["Compare"]:
+        """Comparisons in the node, in source order."""
+        return []
+
+
+class Constant(Node):
+    """A literal true/false."""
+
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        return self.value
+
+
+class Truthy(Node):
+    """A bare variable reference, true when defined and truthy."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        return bool(variables.get(self.name, False))
+
+    def names(self) -> List[str]:
+        return [self.name]
+
+
+class Not(Node):
+    """Logical negation."""
+
+    def __init__(self, operand: Node) -> None:
+        self.operand = operand
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        return not self.operand.evaluate(variables)
+
+    def names(self) -> List[str]:
+        return self.operand.names()
+
+    def comparisons(self) -> List["Compare"]:
+        return self.operand.comparisons()
+
+
+class BoolOp(Node):
+    """Short-circuiting ``and`` / ``or`` over two or more operands."""
+
+    def __init__(self, op: str, operands: List[Node]) -> None:
+        self.op = op
+        self.operands = operands
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        if self.op == "and":
+            return all(operand.evaluate(variables) for operand in self.operands)
+        return any(operand.evaluate(variables) for operand in self.operands)
+
+    def names(self) -> List[str]:
+        return [name for operand in self.operands for name in operand.names()]
+
+    def comparisons(self) -> List["Compare"]:
+        return [c for operand in self.operands for c in operand.comparisons()]
+
+
+class Compare(Node):
+    """Comparison of a variable against a literal or list of literals."""
+
+    def __init__(
+        self,
+        name: str,
+        op: str,
+        value: Union[Literal, Tuple[Literal, ...]],
+        unquoted: bool = False,
+    ) -> None:
+        self.name = name
+        self.op = op
+        self.value = value
+        self.unquoted = unquoted
+        # 'and'/'or' right after an unquoted value (see the module docstring)
+        self.continued_by: Optional[str] = None
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        actual = variables.get(self.name, "")
+
+        if self.op in ("in", "not in"):
+            assert isinstance(self.value, tuple)
+            found = any(_equals(actual, item) for item in self.value)
+            return found if self.op == "in" else not found
+
+        if self.op == "==":
+            return _equals(actual, self.value)
+        if self.op == "!=":
+            return not _equals(actual, self.value)
+
+        left = _to_number(actual)
+        right = _to_number(self.value)
+        if left is None or right is None:
+            return False
+        if self.op == "<":
+            return left < right
+        if self.op == "<=":
+            return left <= right
+        if self.op == ">":
+            return left > right
+        return left >= right
+
+    def names(self) -> List[str]:
+        return [self.name]
+
+    def comparisons(self) -> List["Compare"]:
+        return [self]
+
+
+def _equals(actual: Any, expected: Any) -> bool:
+    """
+    Compare values, numerically only when both sides are numbers.
+
+    Variables holding strings (e.g. versions) are compared as text against the
+    literal as written, so ``1.10`` does not match ``"1.1"``.
+    """
+    if isinstance(expected, Number) and isinstance(actual, (int, float)):
+        if not isinstance(actual, bool):
+            return float(actual) == expected
+    return str(actual) == str(expected)
+
+
+class _Parser:
+    """Recursive-descent parser producing a Node tree."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.tokens = self._tokenize(source)
+        self.pos = 0
+
+    def _tokenize(self, source: str) -> List[Tuple[str, str]]:
+        tokens: List[Tuple[str, str]] = []
+        pos = 0
+        end = len(source.rstrip())
+        while pos < end:
+            match = _TOKEN_PATTERN.match(source, pos)
+            if not match or match.end() == pos:
+                raise ConditionSyntaxError(
+                    f"Unexpected character at position {pos} in condition: {source!r}"
+                )
+            kind = match.lastgroup or ""
+            text = match.group(kind)
+            if kind == "name" and text in _KEYWORDS:
+                kind = text
+            tokens.append((kind, text))
+            pos = match.end()
+        return tokens
+
+    def _peek(self) -> Tuple[str, str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return ("end", "")
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self.pos += 1
+        return token
+
+    def _expect(self, text: str) -> None:
+        kind, value = self._next()
+        if value != text:
+            raise self._error(f"expected '{text}'", value)
+
+    def _error(self, message: str, found: str) -> ConditionSyntaxError:
+        found = found or "end of expression"
+        return ConditionSyntaxError(
+            f"Invalid condition {self.source!r}: {message}, found '{found}'"
+        )
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ConditionSyntaxError("Condition expression is empty")
+        node = self._or()
+        kind, value = self._peek()
+        if kind != "end":
+            raise self._error("unexpected token", value)
+        return node
+
+    def _or(self) -> Node:
+        operands = [self._and()]
+        while self._peek()[0] == "or":
+            self._next()
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else BoolOp("or", operands)
+
+    def _and(self) -> Node:
+        operands = [self._not()]
+        while self._peek()[0] == "and":
+            self._next()
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else BoolOp("and", operands)
+
+    def _not(self) -> Node:
+        if self._peek()[0] == "not":
+            self._next()
+            return Not(self._not())
+        return self._comparison()
+
+    def _comparison(self) -> Node:
+        kind, value = self._next()
+
+        if value == "(":
+            node = self._or()
+            self._expect(")")
+            return node
+        if kind in ("true", "false"):
+            return Constant(kind == "true")
+        if kind != "name":
+            raise self._error("expected a variable name", value)
+
+        name = value
+        op_kind, op_value = self._peek()
+        if op_kind == "op":
+            self._next()
+            literal_kind = self._peek()[0]
+            node = Compare(name, op_value, self._literal())
+            next_kind = self._peek()[0]
+            if (
+                op_value in ("==", "!=")
+                and literal_kind in ("name", "number")
+                and next_kind in ("and", "or")
+            ):
+                node.continued_by = next_kind
+            return node
+        if op_kind == "in":
+            self._next()
+            return Compare(name, "in", self._list())
+        if op_kind == "not" and self._lookahead_kind(1) == "in":
+            self.pos += 2
+            return Compare(name, "not in", self._list())
+        return Truthy(name)
+
+    def _lookahead_kind(self, offset: int) -> str:
+        index = self.pos + offset
+        return self.tokens[index][0] if index < len(self.tokens) else "end"
+
+    def _literal(self) -> Literal:
+        kind, value = self._next()
+        if kind == "string":
+            return value[1:-1]
+        if kind == "number":
+            return Number(value)
+        if kind in ("name", "true", "false"):
+            return value
+        raise self._error("expected a value", value)
+
+    def _list(self) -> Tuple[Literal, ...]:
+        self._expect("[")
+        items: List[Literal] = []
+        if self._peek()[1] != "]":
+            items.append(self._literal())
+            while self._peek()[1] == ",":
+                self._next()
+                items.append(self._literal())
+        self._expect("]")
+        return tuple(items)
+
+
+def compile_condition(source: str) -> Node:
+    """
+    Compile a condition expression into an evaluable AST.
+
+    Args:
+        source: Condition expression (e.g. ``EDITOR == "claude" and DEBUG``)
+
+    Returns:
+        Root node of the compiled expression
+
+    Raises:
+        ConditionSyntaxError: If the expression cannot be parsed
+    """
+    try:
+        return _Parser(source).parse()
+    except ConditionSyntaxError:
+        # Keep the original "NAME == raw text" form working
+        match = _UNQUOTED_COMPARISON.match(source)
+        if not match:
+            raise
+        name, op, value = match.groups()
+        return Compare(name, op, value, unquoted=True)
@@ -8,7 +8,20 @@ validation and serialization capabilities.
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from .exceptions import ConditionSyntaxError
+from .expressions import Node, compile_condition
+
+# Granularities for pinning time-based built-in variables (stable builds)
+STABLE_BUILTIN_GRANULARITIES = ("day", "hour", "minute", "commit")
 
 
 class PromptMetadata(BaseModel):
@@ -117,6 +130,47 @@ class Condition(BaseModel):
         default=None, alias="else", description="Instructions if false"
     )
 
+    # Compiled form of if_condition, built once when the model is loaded
+    _compiled: Optional[Node] = PrivateAttr(default=None)
+    _compiled_source: Optional[str] = PrivateAttr(default=None)
+    _compile_error: Optional[str] = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compile the condition expression."""
+        self._compile()
+
+    def _compile(self) -> None:
+        self._compiled_source = self.if_condition
+        try:
+            self._compiled = compile_condition(self.if_condition)
+            self._compile_error = None
+        except ConditionSyntaxError as e:
+            self._compiled = None
+            self._compile_error = str(e)
+
+    @property
+    def compiled(self) -> Optional[Node]:
+        """Compiled expression, or None if the expression is invalid."""
+        if self._compiled_source != self.if_condition:
+            self._compile()
+        return self._compiled
+
+    @property
+    def compile_error(self) -> Optional[str]:
+        """Syntax error message for an invalid expression."""
+        if self._compiled_source != self.if_condition:
+            self._compile()
+        return self._compile_error
+
+    def evaluate(self, variables: Dict[str, Any]) -> bool:
+        """
+        Evaluate the condition against a variable table.
+
+        Invalid expressions evaluate to False.
+        """
+        compiled = self.compiled
+        return compiled.evaluate(variables) if compiled is not None else False
+
 
 class ImportConfig(BaseModel):
     """Import configuration from other UPF files."""
@@ -148,6 +202,27 @@ class DocumentConfig(BaseModel):
     )
 
 
+class RepositoryScanConfig(BaseModel):
+    """Thresholds for the repository scan behind Cursor ignore files."""
+
+    enabled: bool = Field(default=True, description="Whether to scan the repository")
+    max_file_size: int = Field(
+        default=1_048_576,
+        ge=1,
+        description="Files larger than this many bytes are excluded from Cursor",
+    )
+    max_directory_files: int = Field(
+        default=500,
+        ge=1,
+        description="Directories directly holding more files than this are excluded from indexing",
+    )
+    binary_files: bool = Field(
+        default=True, description="Whether to exclude binary files from indexing"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
 # V2.1 Models - Plugin support (v2.1.0+)
 
 
@@ -286,6 +361,18 @@ class Agent(BaseModel):
     trust_metadata: Optional[TrustMetadata] = Field(
         default=None, description="Trust and security metadata"
     )
+    resources: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Rule documents the agent loads into its context, by name or glob "
+            "pattern; all rules when omitted"
+        ),
+    )
+    max_resource_tokens: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Estimated token budget for the agent's resources",
+    )
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -458,6 +545,30 @@ class UniversalPromptV3(BaseModel):
         description="Allow dynamic variables to execute shell commands (security control)",
     )
 
+    stable_builtins: Optional[str] = Field(
+        default=None,
+        description=(
+            "Pin time-based built-in variables for reproducible output "
+            "('day', 'hour', 'minute' or 'commit')"
+        ),
+    )
+
+    repository_scan: Optional[RepositoryScanConfig] = Field(
+        default=None,
+        description="Scan the repository for large, binary, generated and vendored paths to exclude from Cursor (opt-in)",
+    )
+
+    @field_validator("stable_builtins")
+    @classmethod
+    def validate_stable_builtins(cls, v: Optional[str]) -> Optional[str]:
+        """Validate stable build granularity."""
+        if v is not None and v not in STABLE_BUILTIN_GRANULARITIES:
+            raise ValueError(
+                "stable_builtins must be one of: "
+                + ", ".join(STABLE_BUILTIN_GRANULARITIES)
+            )
+        return v
+
     @field_validator("schema_version")
     @classmethod
     def validate_schema_version(cls, v: str) -> str:
@@ -516,6 +627,10 @@ class UniversalPrompt(BaseModel):
         default=None,
         description="Automatically add editor-specific files to .gitignore (default: True)",
     )
+    repository_scan: Optional[RepositoryScanConfig] = Field(
+        default=None,
+        description="Scan the repository for large, binary, generated and vendored paths to exclude from Cursor (opt-in)",
+    )
 
     @field_validator("schema_version")
     @classmethod
@@ -601,6 +716,24 @@ class DynamicVariableConfig(BaseModel):
 # Generation Metadata (for refresh command)
 
 
+class OutputRecord(BaseModel):
+    """A generated output file and the variables its content depends on."""
+
+    editor: str = Field(..., description="Editor that produced the file")
+    variables: List[str] = Field(
+        default_factory=list,
+        description="Variables whose values affect this file's content",
+    )
+    hash: str = Field(..., description="SHA-256 digest of the generated content")
+    merged: bool = Field(
+        default=False,
+        description="Whether the file was merged with existing content "
+        "(such files are never pruned)",
+    )
+
+    model_config = ConfigDict(validate_assignment=True, extra="forbid")
+
+
 class GenerationMetadata(BaseModel):
     """
     Metadata about a generation run, saved to .promptrek/last-generation.yaml.
@@ -624,6 +757,20 @@ class GenerationMetadata(BaseModel):
     allow_commands: bool = Field(
         default=False, description="Whether command execution was allowed"
     )
+    stable_builtins: Optional[str] = Field(
+        default=None, description="Stable build granularity for built-in variables"
+    )
+    source_hashes: Dict[str, str] = Field(
+        default_factory=dict, description="SHA-256 digests of the source files"
+    )
+    variable_digests: Dict[str, str] = Field(
+        default_factory=dict,
+        description="SHA-256 digests of every variable value used (values are not stored)",
+    )
+    outputs: Dict[str, OutputRecord] = Field(
+        default_factory=dict,
+        description="Generated files keyed by path, with their variable dependencies",
+    )
 
     @field_validator("timestamp")
     @classmethod
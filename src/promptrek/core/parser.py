@@ -5,7 +5,7 @@ Handles loading and parsing .promptrek.yaml files into UniversalPrompt objects.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import yaml
 from pydantic import ValidationError
@@ -13,6 +13,10 @@ from pydantic import ValidationError
 from .exceptions import DeprecationWarnings, UPFFileNotFoundError, UPFParsingError
 from .models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
 
+# Parsed-file cache for long-running processes (e.g. `promptrek serve`).
+# Maps resolved path -> ((mtime_ns, size), prompt). Disabled (None) by default.
+_parse_cache: Optional[Dict[str, Tuple[Tuple[int, int], Any]]] = None
+
 
 class UPFParser:
     """Parser for Universal Prompt Format files."""
@@ -21,6 +25,25 @@ class UPFParser:
         """Initialize the UPF parser."""
         pass
 
+    @staticmethod
+    def enable_cache(enabled: bool = True) -> None:
+        """
+        Enable or disable the parsed-file cache.
+
+        When enabled, parse_file() returns a copy of the previous result for
+        files whose modification time and size are unchanged.
+
+        Args:
+            enabled: Whether caching should be enabled
+        """
+        global _parse_cache
+        _parse_cache = {} if enabled else None
+
+    @staticmethod
+    def is_cache_enabled() -> bool:
+        """Check whether the parsed-file cache is enabled."""
+        return _parse_cache is not None
+
     def parse_file(
         self, file_path: Union[str, Path]
     ) -> Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]:
@@ -47,6 +70,19 @@ class UPFParser:
                 f"File must have .yaml or .yml extension: {file_path}"
             )
 
+        cache = _parse_cache
+        cache_key = None
+        signature = (0, 0)
+        if cache is not None:
+            stat = file_path.stat()
+            cache_key = str(file_path.resolve())
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = cache.get(cache_key)
+            if cached is not None and cached[0] == signature:
+                prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]
+                prompt = cached[1].model_copy(deep=True)
+                return prompt
+
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f)
@@ -63,6 +99,11 @@ class UPFParser:
 
             import_processor = ImportProcessor()
             prompt = import_processor.process_imports(prompt, file_path.parent)
+            # Imported files are not tracked, so don't cache the result
+            cache_key = None
+
+        if cache is not None and cache_key is not None:
+            cache[cache_key] = (signature, prompt.model_copy(deep=True))
 
         return prompt
 
@@ -259,6 +300,9 @@ class UPFParser:
         """
         Parse multiple UPF files and merge them into a single UniversalPrompt.
 
+        Files are merged in order in a single pass (see _PromptMerger), so the
+        cost is linear in their total size.
+
         Args:
             file_paths: List of paths to .promptrek.yaml files
 
@@ -271,15 +315,10 @@ class UPFParser:
         if not file_paths:
             raise UPFParsingError("No files provided for parsing")
 
-        # Parse the first file as the base
-        base_prompt = self.parse_file(file_paths[0])
-
-        # Merge additional files
-        for file_path in file_paths[1:]:
-            additional_prompt = self.parse_file(file_path)
-            base_prompt = self._merge_prompts(base_prompt, additional_prompt)
-
-        return base_prompt
+        merger = _PromptMerger()
+        for file_path in file_paths:
+            merger.add(self.parse_file(file_path))
+        return merger.result()
 
     def parse_directory(
         self, directory: Union[str, Path], recursive: bool = True
@@ -322,96 +361,143 @@ class UPFParser:
         Returns:
             Merged UniversalPrompt object
         """
-        # V2/V3 merging: simple content concatenation
-        if isinstance(base, (UniversalPromptV2, UniversalPromptV3)) or isinstance(
-            additional, (UniversalPromptV2, UniversalPromptV3)
-        ):
-            # For v2/v3, we can't meaningfully merge - just return the additional
-            # This is a limitation of the simplified v2/v3 format
-            return additional
+        merger = _PromptMerger()
+        merger.add(base)
+        merger.add(additional)
+        return merger.result()
 
-        # Convert to dicts for easier merging (v1 only)
-        base_dict = base.model_dump()
-        additional_dict = additional.model_dump()
 
-        # Merge metadata - additional takes precedence for most fields
-        if additional_dict.get("metadata"):
-            if "metadata" not in base_dict or base_dict["metadata"] is None:
-                base_dict["metadata"] = {}
-            base_dict["metadata"].update(additional_dict["metadata"])
+# Instruction categories concatenated across merged files
+_MERGED_INSTRUCTIONS = ("general", "code_style", "testing")
 
-        # Merge context - combine lists, additional takes precedence for simple fields
-        if additional_dict.get("context"):
-            if "context" not in base_dict or base_dict["context"] is None:
-                base_dict["context"] = {}
 
-            context = base_dict["context"]
-            add_context = additional_dict["context"]
+class _PromptMerger:
+    """
+    Single-pass (k-way) merge of parsed prompts, later prompts taking
+    precedence.
 
-            # Simple fields - additional takes precedence
-            for field in ["project_type", "description"]:
-                if add_context.get(field):
-                    context[field] = add_context[field]
-
-            # List fields - combine and deduplicate
-            if add_context.get("technologies"):
-                existing = context.get("technologies", [])
-                combined = existing + add_context["technologies"]
-                context["technologies"] = list(
-                    dict.fromkeys(combined)
-                )  # Remove duplicates
-
-        # Merge instructions - combine lists
-        if additional_dict.get("instructions"):
-            if "instructions" not in base_dict or base_dict["instructions"] is None:
-                base_dict["instructions"] = {}
-
-            instructions = base_dict["instructions"]
-            add_instructions = additional_dict["instructions"]
-
-            for inst_type in ["general", "code_style", "testing"]:
-                if add_instructions.get(inst_type):
-                    existing = instructions.get(inst_type, []) or []
-                    instructions[inst_type] = existing + add_instructions[inst_type]
-
-        # Merge examples - additional takes precedence for conflicts
-        if additional_dict.get("examples"):
-            if "examples" not in base_dict or base_dict["examples"] is None:
-                base_dict["examples"] = {}
-            base_dict["examples"].update(additional_dict["examples"])
-
-        # Merge variables - additional takes precedence for conflicts
-        if additional_dict.get("variables"):
-            if "variables" not in base_dict or base_dict["variables"] is None:
-                base_dict["variables"] = {}
-            base_dict["variables"].update(additional_dict["variables"])
-
-        # Merge conditions - combine lists
-        if additional_dict.get("conditions"):
-            existing_conditions = base_dict.get("conditions", []) or []
-            base_dict["conditions"] = (
-                existing_conditions + additional_dict["conditions"]
-            )
+    Lists and dicts are accumulated in place and the merged v1 prompt is
+    validated once at the end, instead of dumping and revalidating the
+    growing result for every file.
+    """
+
+    __slots__ = ("_first", "_data", "_technologies", "_targets")
+
+    def __init__(self) -> None:
+        """Initialize an empty merge."""
+        self._first: Optional[
+            Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]
+        ] = None
+        # Merged v1 fields, once a second v1 prompt is added
+        self._data: Optional[Dict[str, Any]] = None
+        # Deduplicated (ordered) technologies and targets, once extended
+        self._technologies: Optional[Dict[str, None]] = None
+        self._targets: Optional[Dict[str, None]] = None
+
+    def add(
+        self, prompt: Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]
+    ) -> None:
+        """Merge the next prompt."""
+        if (
+            self._first is None
+            or not isinstance(self._first, UniversalPrompt)
+            or not isinstance(prompt, UniversalPrompt)
+        ):
+            # v2/v3 prompts can't be meaningfully merged (a limitation of the
+            # simplified format): the later prompt replaces the result
+            self._first = prompt
+            self._data = None
+            self._technologies = None
+            self._targets = None
+            return
+
+        if self._data is None:
+            self._data = self._start(self._first)
+        self._merge(self._data, prompt)
+
+    def result(self) -> Union[UniversalPrompt, UniversalPromptV2, UniversalPromptV3]:
+        """
+        Get the merged prompt.
 
-        # Merge targets - combine and deduplicate
-        if additional_dict.get("targets"):
-            existing_targets = base_dict.get("targets", []) or []
-            combined_targets = existing_targets + additional_dict["targets"]
-            base_dict["targets"] = list(dict.fromkeys(combined_targets))
-
-        # Merge editor_specific - additional takes precedence for conflicts
-        if additional_dict.get("editor_specific"):
-            if (
-                "editor_specific" not in base_dict
-                or base_dict["editor_specific"] is None
-            ):
-                base_dict["editor_specific"] = {}
-            base_dict["editor_specific"].update(additional_dict["editor_specific"])
-
-        # Merge imports - combine lists
-        if additional_dict.get("imports"):
-            existing_imports = base_dict.get("imports", []) or []
-            base_dict["imports"] = existing_imports + additional_dict["imports"]
-
-        # Create new merged prompt
-        return UniversalPrompt(**base_dict)
+        Raises:
+            UPFParsingError: If no prompts were added
+        """
+        if self._first is None:
+            raise UPFParsingError("No files provided for parsing")
+        if self._data is None:
+            return self._first
+
+        data = self._data
+        if self._technologies is not None:
+            data["context"]["technologies"] = list(self._technologies)
+        if self._targets is not None:
+            data["targets"] = list(self._targets)
+        return UniversalPrompt(**data)
+
+    @staticmethod
+    def _start(base: UniversalPrompt) -> Dict[str, Any]:
+        """Get the mutable fields of the first prompt."""
+        data = {name: getattr(base, name) for name in UniversalPrompt.model_fields}
+        for name in ("context", "instructions"):
+            if data[name] is not None:
+                data[name] = data[name].model_dump()
+        for name in ("examples", "variables", "editor_specific"):
+            if data[name] is not None:
+                data[name] = dict(data[name])
+        for name in ("conditions", "imports"):
+            if data[name] is not None:
+                data[name] = list(data[name])
+        return data
+
+    def _merge(self, data: Dict[str, Any], additional: UniversalPrompt) -> None:
+        """Merge a prompt into the accumulated fields."""
+        # Metadata - additional takes precedence
+        data["metadata"] = additional.metadata
+
+        # Context - additional takes precedence for simple fields,
+        # technologies are combined and deduplicated
+        add_context = additional.context
+        if add_context is not None:
+            context = data["context"] = data["context"] or {}
+            for field in ["project_type", "description"]:
+                value = getattr(add_context, field)
+                if value:
+                    context[field] = value
+            if add_context.technologies:
+                if self._technologies is None:
+                    self._technologies = dict.fromkeys(
+                        context.get("technologies") or []
+                    )
+                self._technologies.update(dict.fromkeys(add_context.technologies))
+
+        # Instructions - combine lists
+        add_instructions = additional.instructions
+        if add_instructions is not None:
+            instructions = data["instructions"] = data["instructions"] or {}
+            for inst_type in _MERGED_INSTRUCTIONS:
+                items = getattr(add_instructions, inst_type)
+                if items:
+                    existing = instructions.get(inst_type) or []
+                    existing.extend(items)
+                    instructions[inst_type] = existing
+
+        # Examples, variables and editor_specific - additional takes
+        # precedence for conflicts
+        for name in ("examples", "variables", "editor_specific"):
+            values = getattr(additional, name)
+            if values:
+                data[name] = data[name] or {}
+                data[name].update(values)
+
+        # Conditions and imports - combine lists
+        for name in ("conditions", "imports"):
+            items = getattr(additional, name)
+            if items:
+                data[name] = data[name] or []
+                data[name].extend(items)
+
+        # Targets - combine and deduplicate
+        if additional.targets:
+            if self._targets is None:
+                self._targets = dict.fromkeys(data["targets"] or [])
+            self._targets.update(dict.fromkeys(additional.targets))
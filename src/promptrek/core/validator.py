@@ -7,6 +7,7 @@ beyond basic schema validation.
 
 from typing import Any, Dict, List, Union, cast
 
+from .expressions import Compare
 from .models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
 
 
@@ -318,10 +319,31 @@ class UPFValidator:
         if not prompt.conditions:
             return
 
-        # For now, just check basic structure
         for i, condition in enumerate(prompt.conditions):
             if not condition.if_condition.strip():
                 result.add_error(f"Condition {i+1} has empty 'if' clause")
+            elif condition.compile_error:
+                result.add_warning(
+                    f"Condition {i+1} will never match: {condition.compile_error}"
+                )
+            elif (
+                isinstance(condition.compiled, Compare) and condition.compiled.unquoted
+            ):
+                result.add_warning(
+                    f"Condition {i+1} compares against unquoted text "
+                    f"{condition.compiled.value!r}; quote the value: "
+                    f"{condition.if_condition!r}"
+                )
+            elif condition.compiled is not None:
+                for compare in condition.compiled.comparisons():
+                    if compare.continued_by:
+                        result.add_warning(
+                            f"Condition {i+1} {condition.if_condition!r} compares "
+                            f"{compare.name} with {str(compare.value)!r} and then "
+                            f"applies '{compare.continued_by}'; unquoted words "
+                            f"after '{compare.op}' are no longer one value. "
+                            "Quote the value to make the meaning explicit"
+                        )
 
     def _validate_imports(
         self, prompt: UniversalPrompt, result: ValidationResult
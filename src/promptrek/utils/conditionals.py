@@ -5,10 +5,17 @@ Handles conditional instructions and template logic in UPF content.
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
+from ..core.exceptions import ConditionSyntaxError
+from ..core.expressions import compile_condition
 from ..core.models import UniversalPrompt
 
+# Compiled expressions for conditions evaluated by string; bounded, as a
+# daemon evaluates conditions for as long as it runs
+_compile_cached = lru_cache(maxsize=256)(compile_condition)
+
 
 class ConditionalProcessor:
     """Processes conditional instructions in UPF prompts."""
@@ -41,7 +48,7 @@ class ConditionalProcessor:
         # Process each condition
         additional_content: Dict[str, Any] = {}
         for condition in prompt.conditions:
-            if self._evaluate_condition(condition.if_condition, all_variables):
+            if condition.evaluate(all_variables):
                 if condition.then:
                     self._merge_content(additional_content, condition.then)
             elif condition.else_clause:
@@ -53,53 +60,28 @@ class ConditionalProcessor:
         """
         Evaluate a condition expression.
 
-        Supports basic expressions like:
-        - VARIABLE == "value"
-        - VARIABLE != "value"
-        - VARIABLE in ["value1", "value2"]
-        - EDITOR == "claude"
+        Supports comparisons, boolean combinators and grouping, e.g.:
+        - VARIABLE == "value" / VARIABLE != "value"
+        - VARIABLE in ["value1", "value2"] / VARIABLE not in [...]
+        - COUNT >= 3 (numeric comparison)
+        - EDITOR == "claude" and (DEBUG or not STRICT)
+
+        Compiled expressions are cached, so each distinct expression is
+        parsed only once.
 
         Args:
             condition: The condition expression
             variables: Available variables
 
         Returns:
-            True if condition is met, False otherwise
+            True if condition is met, False otherwise (including invalid
+            expressions)
         """
-        # Simple condition parsing - can be extended for more complex logic
-        condition = condition.strip()
-
-        # Handle equality checks
-        if " == " in condition:
-            left, right = condition.split(" == ", 1)
-            left = left.strip()
-            right = right.strip().strip("\"'")
-            return str(variables.get(left, "")) == right
-
-        # Handle inequality checks
-        if " != " in condition:
-            left, right = condition.split(" != ", 1)
-            left = left.strip()
-            right = right.strip().strip("\"'")
-            return str(variables.get(left, "")) != right
-
-        # Handle 'in' checks
-        if " in " in condition:
-            left, right = condition.split(" in ", 1)
-            left = left.strip()
-            # Parse list like ["value1", "value2"]
-            if right.strip().startswith("[") and right.strip().endswith("]"):
-                values = [
-                    v.strip().strip("\"'") for v in right.strip()[1:-1].split(",")
-                ]
-                return str(variables.get(left, "")) in values
-
-        # Handle boolean variables
-        if condition in variables:
-            return bool(variables[condition])
-
-        # Default to False for unrecognized expressions
-        return False
+        try:
+            compiled = _compile_cached(condition)
+        except ConditionSyntaxError:
+            return False
+        return compiled.evaluate(variables)
 
     def _merge_content(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """
@@ -1,8 +1,9 @@
 """
 Utility functions for managing .gitignore file.
 
-Provides functionality to add editor-specific file patterns to .gitignore
-and to run git commands to untrack previously committed files.
+Provides functionality to add editor-specific file patterns to .gitignore,
+to run git commands to untrack previously committed files, and to keep
+PrompTrek's own local state (caches) out of version control.
 """
 
 import subprocess
@@ -11,6 +12,8 @@ from typing import List, Optional, Set
 
 import click
 
+from .locking import atomic_write, file_lock
+
 
 def get_editor_file_patterns() -> List[str]:
     """
@@ -100,43 +103,39 @@ def add_patterns_to_gitignore(
     Returns:
         Number of patterns added
     """
-    existing_patterns = read_gitignore(gitignore_path)
+    try:
+        # Lock so concurrent runs don't add (or drop) each other's patterns
+        with file_lock(gitignore_path):
+            existing_patterns = read_gitignore(gitignore_path)
 
-    # Filter out patterns that already exist
-    new_patterns = [p for p in patterns if p not in existing_patterns]
+            # Filter out patterns that already exist
+            new_patterns = [p for p in patterns if p not in existing_patterns]
 
-    if not new_patterns:
-        return 0
+            if not new_patterns:
+                return 0
 
-    # Prepare content to add
-    lines_to_add = []
+            try:
+                with open(gitignore_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+            except FileNotFoundError:
+                content = None
 
-    # Add comment if provided
-    if comment:
-        lines_to_add.append(f"\n# {comment}\n")
-    elif not gitignore_path.exists():
-        lines_to_add.append("")
+            # Ensure existing file ends with newline
+            if content and not content.endswith("\n"):
+                content += "\n"
 
-    # Add new patterns
-    for pattern in new_patterns:
-        lines_to_add.append(f"{pattern}\n")
+            # Prepare content to add
+            lines_to_add = []
 
-    # Write to file
-    try:
-        mode = "a" if gitignore_path.exists() else "w"
-        with open(gitignore_path, mode, encoding="utf-8") as f:
-            # Ensure existing file ends with newline
-            if mode == "a" and gitignore_path.stat().st_size > 0:
-                # Read last char to check if we need a newline
-                with open(gitignore_path, "rb") as check_f:
-                    check_f.seek(-1, 2)
-                    last_char = check_f.read(1)
-                    if last_char != b"\n":
-                        f.write("\n")
-
-            # Write new content
-            for line in lines_to_add:
-                f.write(line)
+            # Add comment if provided
+            if comment:
+                lines_to_add.append(f"\n# {comment}\n")
+
+            # Add new patterns
+            for pattern in new_patterns:
+                lines_to_add.append(f"{pattern}\n")
+
+            atomic_write(gitignore_path, (content or "") + "".join(lines_to_add))
 
         return len(new_patterns)
     except Exception as e:
@@ -255,3 +254,24 @@ def configure_gitignore(
             )
 
     return results
+
+
+def create_ignored_directory(path: Path) -> Path:
+    """
+    Create a directory for local state that must never be committed.
+
+    The directory gets its own .gitignore ignoring everything in it, so
+    caches stay out of `git status` without touching the project's
+    .gitignore.
+
+    Args:
+        path: Directory to create (parents included)
+
+    Returns:
+        The directory path
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    ignore_file = path / ".gitignore"
+    if not ignore_file.exists():
+        atomic_write(ignore_file, "*\n")
+    return path
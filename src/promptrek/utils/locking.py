@@ -0,0 +1,215 @@
+"""
+File locking and atomic replace for PrompTrek.
+
+Several promptrek processes (for example parallel CI jobs running
+`generate` and `refresh` on the same checkout) may update the same files:
+generation metadata, merged editor settings, .gitignore and user-level MCP
+configurations. Every read-modify-write of such a file holds an exclusive
+advisory lock for that file, and every write replaces the file atomically so
+readers never see partial content.
+
+Lock files live outside the project (in a per-user directory under the
+system temp directory, or in PROMPTREK_LOCK_DIR when set, e.g. to share
+locks between containers that mount the same checkout), so they never show
+up in the working tree. A lock file is removed when its lock is released.
+"""
+
+import hashlib
+import os
+import secrets
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from ..core.exceptions import FileLockError
+
+if sys.platform == "win32":  # pragma: no cover - Windows
+    import msvcrt
+else:
+    import fcntl
+
+# Seconds to wait for a lock (overridable with PROMPTREK_LOCK_TIMEOUT)
+DEFAULT_LOCK_TIMEOUT = 30.0
+
+_POLL_INTERVAL = 0.05
+
+# Locks held by the current thread (lock key -> nesting depth)
+_held = threading.local()
+
+
+def lock_timeout() -> float:
+    """Get the configured lock timeout in seconds."""
+    try:
+        return float(os.environ.get("PROMPTREK_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT))
+    except ValueError:
+        return DEFAULT_LOCK_TIMEOUT
+
+
+def _lock_dir() -> Path:
+    """Get the directory holding lock files, creating it if needed."""
+    configured = os.environ.get("PROMPTREK_LOCK_DIR")
+    if configured:
+        lock_dir = Path(configured)
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        return lock_dir
+
+    # Per-user directory, like the daemon socket
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    lock_dir = Path(tempfile.gettempdir()) / f"promptrek-locks-{uid}"
+    try:
+        lock_dir.mkdir(mode=0o700)
+    except FileExistsError:
+        if hasattr(os, "getuid") and lock_dir.stat().st_uid != uid:
+            raise FileLockError(
+                f"Lock directory {lock_dir} is owned by another user "
+                "(set PROMPTREK_LOCK_DIR to use another directory)"
+            )
+    return lock_dir
+
+
+def _lock_path(path: Path) -> Path:
+    """Get the lock file used for a target file."""
+    key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()[:32]
+    return _lock_dir() / f"{key}.lock"
+
+
+def _try_lock(fd: int) -> bool:
+    """Try to take an exclusive lock on a file descriptor without blocking."""
+    try:
+        if sys.platform == "win32":  # pragma: no cover - Windows
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(fd: int) -> None:
+    """Release a lock taken with _try_lock()."""
+    if sys.platform == "win32":  # pragma: no cover - Windows
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _is_current(fd: int, lock_file: Path) -> bool:
+    """Check that a locked descriptor is still the lock file on disk."""
+    if sys.platform == "win32":  # pragma: no cover - open files can't be removed
+        return True
+    try:
+        info = lock_file.stat()
+    except FileNotFoundError:
+        return False
+    fd_info = os.fstat(fd)
+    return (info.st_dev, info.st_ino) == (fd_info.st_dev, fd_info.st_ino)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: Optional[float] = None) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock for a file.
+
+    The lock is shared between processes and threads, and is re-entrant
+    within a thread.
+
+    Args:
+        path: File to lock (does not need to exist)
+        timeout: Seconds to wait (defaults to lock_timeout())
+
+    Raises:
+        FileLockError: If the lock is not acquired within the timeout
+    """
+    lock_file = _lock_path(path)
+    held: Dict[str, int] = _held.__dict__.setdefault("locks", {})
+    key = str(lock_file)
+    if held.get(key):
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    wait = lock_timeout() if timeout is None else timeout
+    deadline = time.monotonic() + wait
+    while True:
+        fd = os.open(lock_file, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            while not _try_lock(fd):
+                if time.monotonic() >= deadline:
+                    raise FileLockError(
+                        f"Timed out after {wait:g}s waiting for a lock on {path}"
+                    )
+                time.sleep(_POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+        if _is_current(fd, lock_file):
+            break
+        # The previous holder removed the file: lock the new one instead
+        _unlock(fd)
+        os.close(fd)
+
+    held[key] = 1
+    try:
+        yield
+    finally:
+        held.pop(key, None)
+        if sys.platform != "win32":
+            # Remove the lock file while still holding it; waiters on this
+            # file notice it is gone and retry (see _is_current)
+            try:
+                lock_file.unlink()
+            except OSError:
+                pass
+        _unlock(fd)
+        os.close(fd)
+
+
+def atomic_write(path: Path, content: str) -> None:
+    """
+    Replace a file's content atomically.
+
+    The content is written to a temporary file in the same directory and
+    renamed over the target, keeping the target's permissions. Read-only
+    targets are refused like a normal write would be. A symlinked target is
+    written through the link: the file it points to is replaced.
+
+    Args:
+        path: File to write
+        content: Text content
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    # Replace the real file, not the link (which would become a regular file)
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    else:
+        # Replacing would otherwise succeed even for read-only files
+        if not os.access(path, os.W_OK):
+            raise PermissionError(f"Permission denied: '{path}'")
+
+    temp_name = str(path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp"))
+    # New files get the default mode (0666 less the process umask)
+    fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(temp_name, mode)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,342 @@
+"""
+Markdown and frontmatter tokenizer shared by the adapters' sync parsers.
+
+Editor files are parsed back into prompts by splitting off an optional YAML
+frontmatter block and scanning the markdown body for headings and bullets.
+tokenize() does the scanning in a single streaming pass (one token per line,
+with fenced code blocks recognised so their contents are never mistaken for
+headings or bullets), and parse_frontmatter() reads flat `key: value`
+headers without going through the YAML parser.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+from yaml.resolver import Resolver
+
+# Tags the YAML resolver assigns to plain scalars
+_STR_TAG = "tag:yaml.org,2002:str"
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_NULL_TAG = "tag:yaml.org,2002:null"
+_INT_TAG = "tag:yaml.org,2002:int"
+
+_RESOLVER = Resolver()
+
+# A flat frontmatter line: simple key, then an optional plain value
+_FLAT_LINE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*?))?\s*$")
+
+# Characters that give a value YAML syntax beyond a plain scalar
+_YAML_INDICATORS = set("-?:,[]{}#&*!|>'\"%@`")
+_YAML_SPECIAL = (": ", " #", "\t")
+
+_DECIMAL_INT = re.compile(r"^[-+]?(?:0|[1-9][0-9]*)$")
+
+_HEADING = re.compile(r"^(#{1,6})(?:\s+(.*))?$")
+
+
+class Token:
+    """A single line of a markdown document."""
+
+    __slots__ = ("kind", "text", "level", "marker", "raw", "lineno")
+
+    def __init__(
+        self,
+        kind: str,
+        text: str,
+        raw: str,
+        lineno: int,
+        level: int = 0,
+        marker: str = "",
+    ) -> None:
+        """
+        Initialize a token.
+
+        Args:
+            kind: 'heading', 'bullet', 'fence', 'code', 'text' or 'blank'
+            text: Heading title, bullet item or stripped line
+            raw: The original line
+            lineno: Line number within the scanned text (1-based)
+            level: Heading level or bullet indentation
+            marker: Bullet marker ('-', '*' or '+')
+        """
+        self.kind = kind
+        self.text = text
+        self.raw = raw
+        self.lineno = lineno
+        self.level = level
+        self.marker = marker
+
+    def __repr__(self) -> str:
+        return f"Token({self.kind!r}, {self.text!r}, level={self.level})"
+
+
+class MarkdownDocument:
+    """A markdown file split into frontmatter, body and tokens."""
+
+    def __init__(self, frontmatter: Optional[Dict[str, Any]], body: str) -> None:
+        """
+        Initialize a document.
+
+        Args:
+            frontmatter: Parsed frontmatter, or None if absent or invalid
+            body: Markdown content after the frontmatter
+        """
+        self.frontmatter = frontmatter
+        self.body = body
+        self.tokens: List[Token] = list(tokenize(body))
+
+    @property
+    def title(self) -> Optional[str]:
+        """Get the text of the first level-1 heading."""
+        for token in self.tokens:
+            if token.kind == "heading" and token.level == 1:
+                return token.text
+        return None
+
+    def bullets(self, markers: str = "-*") -> List[str]:
+        """Get all bullet items using one of the given markers."""
+        return [
+            token.text
+            for token in self.tokens
+            if token.kind == "bullet" and token.marker in markers
+        ]
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """
+    Split a leading `---` delimited frontmatter block from markdown content.
+
+    Args:
+        content: Markdown file content
+
+    Returns:
+        Tuple of (frontmatter text or None, remaining content)
+    """
+    if not content.startswith("---"):
+        return None, content
+
+    first_end = content.find("\n")
+    if first_end == -1 or content[:first_end].strip() != "---":
+        return None, content
+
+    start = first_end + 1
+    position = start
+    while position <= len(content):
+        line_end = content.find("\n", position)
+        if line_end == -1:
+            line_end = len(content)
+        if content[position:line_end].strip() == "---":
+            return content[start:position], content[line_end + 1 :]
+        position = line_end + 1
+
+    return None, content
+
+
+def parse_frontmatter(text: str, lenient: bool = False) -> Any:
+    """
+    Parse frontmatter text.
+
+    Flat `key: value` headers whose values are plain strings, booleans,
+    nulls or integers are read directly; anything else (nesting, lists,
+    quoting, comments, floats, dates) is handed to the YAML parser, so the
+    result is always what yaml.safe_load() would return.
+
+    Args:
+        text: Frontmatter text without the `---` delimiters
+        lenient: Fall back to line-based parsing for frontmatter that is not
+            valid YAML (e.g. unquoted descriptions containing colons)
+
+    Returns:
+        Parsed frontmatter (usually a dictionary), or None if empty
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML and lenient is False
+    """
+    flat = _parse_flat_frontmatter(text)
+    if flat is not None:
+        return flat or None
+
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError:
+        if not lenient:
+            raise
+        return _parse_frontmatter_lines(text)
+
+
+def extract_frontmatter(
+    content: str, lenient: bool = False
+) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Split and parse the frontmatter of markdown content.
+
+    Args:
+        content: Markdown file content
+        lenient: Accept frontmatter that is not valid YAML
+
+    Returns:
+        Tuple of (frontmatter dictionary or None, remaining content). An
+        empty frontmatter block gives an empty dictionary; if there is no
+        frontmatter or it is not a valid mapping, the content is returned
+        unchanged.
+    """
+    text, body = split_frontmatter(content)
+    if text is None:
+        return None, content
+
+    try:
+        frontmatter = parse_frontmatter(text, lenient=lenient)
+    except yaml.YAMLError:
+        return None, content
+
+    if frontmatter is None:
+        return {}, body
+    if not isinstance(frontmatter, dict):
+        return None, content
+    return frontmatter, body
+
+
+def parse_markdown(content: str, lenient: bool = False) -> MarkdownDocument:
+    """
+    Parse markdown content into a document.
+
+    Args:
+        content: Markdown file content
+        lenient: Accept frontmatter that is not valid YAML
+
+    Returns:
+        Parsed markdown document
+    """
+    frontmatter, body = extract_frontmatter(content, lenient=lenient)
+    return MarkdownDocument(frontmatter, body)
+
+
+def tokenize(content: str) -> Iterator[Token]:
+    """
+    Tokenize markdown content line by line.
+
+    Args:
+        content: Markdown content (without frontmatter)
+
+    Yields:
+        One token per line
+    """
+    fence: Optional[str] = None
+
+    for lineno, raw in enumerate(content.split("\n"), 1):
+        stripped = raw.strip()
+
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+                yield Token("fence", stripped, raw, lineno)
+            else:
+                yield Token("code", raw, raw, lineno)
+            continue
+
+        if not stripped:
+            yield Token("blank", "", raw, lineno)
+        elif stripped.startswith("```") or stripped.startswith("~~~"):
+            fence = stripped[:3]
+            yield Token("fence", stripped, raw, lineno)
+        elif stripped[0] == "#" and (heading := _HEADING.match(stripped)):
+            yield Token(
+                "heading",
+                (heading.group(2) or "").strip(),
+                raw,
+                lineno,
+                level=len(heading.group(1)),
+            )
+        elif stripped[0] in "-*+" and stripped[1:2] == " ":
+            yield Token(
+                "bullet",
+                stripped[2:].strip(),
+                raw,
+                lineno,
+                level=len(raw) - len(raw.lstrip()),
+                marker=stripped[0],
+            )
+        else:
+            yield Token("text", stripped, raw, lineno)
+
+
+def _parse_flat_frontmatter(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse frontmatter made only of flat `key: value` lines.
+
+    Returns:
+        The parsed dictionary, or None if the text needs the YAML parser
+    """
+    result: Dict[str, Any] = {}
+    for line in text.split("\n"):
+        if not line.strip():
+            continue
+        match = _FLAT_LINE.match(line)
+        if not match or _resolve(match.group(1)) != _STR_TAG:
+            return None
+
+        value = match.group(2)
+        if not value:
+            result[match.group(1)] = None
+            continue
+        if (
+            value[0] in _YAML_INDICATORS
+            or value.endswith(":")
+            or any(s in value for s in _YAML_SPECIAL)
+        ):
+            return None
+
+        tag = _resolve(value)
+        if tag == _STR_TAG:
+            result[match.group(1)] = value
+        elif tag == _BOOL_TAG:
+            result[match.group(1)] = value.lower() in ("yes", "true", "on")
+        elif tag == _NULL_TAG:
+            result[match.group(1)] = None
+        elif tag == _INT_TAG and _DECIMAL_INT.match(value):
+            result[match.group(1)] = int(value)
+        else:
+            return None
+    return result
+
+
+def _resolve(scalar: str) -> str:
+    """Get the tag YAML would assign to an unquoted scalar."""
+    tag: str = _RESOLVER.resolve(yaml.ScalarNode, scalar, (True, False))
+    return tag
+
+
+def _parse_frontmatter_lines(text: str) -> Dict[str, Any]:
+    """
+    Parse frontmatter that is not valid YAML line by line.
+
+    Each unindented `key: value` line starts a new field and indented lines
+    continue it. Values are loaded as YAML where possible (lists, mappings)
+    and otherwise kept as strings.
+    """
+    frontmatter: Dict[str, Any] = {}
+    current_key: Optional[str] = None
+    current_value_lines: List[str] = []
+
+    def store() -> None:
+        value = "\n".join(current_value_lines).strip()
+        try:
+            frontmatter[current_key] = yaml.safe_load(value)  # type: ignore[index]
+        except (yaml.YAMLError, ValueError, TypeError):
+            frontmatter[current_key] = value  # type: ignore[index]
+
+    for line in text.split("\n"):
+        if ": " in line and line.lstrip() == line:
+            if current_key:
+                store()
+            key, value = line.split(": ", 1)
+            current_key = key.strip()
+            current_value_lines = [value]
+        elif current_key:
+            current_value_lines.append(line)
+
+    if current_key:
+        store()
+
+    return frontmatter
@@ -0,0 +1,254 @@
+"""
+Content-addressed store for generated files (`promptrek generate
+--object-store`).
+
+Workspaces and matrix variants often generate identical files (shared rules,
+agents, commands) into many output directories. With the store, each
+distinct content is written once under .promptrek/objects/, named after its
+SHA-256 digest, and output files are materialized from it:
+
+- reflink: a copy-on-write clone sharing the object's blocks (Btrfs, XFS and
+  other filesystems with FICLONE support); outputs stay independent files;
+- hardlink: the output is the object itself, so an unchanged file is found by
+  comparing inodes instead of contents. Objects are read-only, so a hard
+  linked output cannot be edited in place by accident; regenerating replaces
+  the link instead of writing through it.
+
+Either mode falls back to a plain copy where the filesystem does not support
+it (for example when the store and the output are on different devices).
+The store is a cache: deleting .promptrek/objects/ is always safe. It carries
+its own .gitignore, and after each run objects that no output links to and
+no generation record references are collected (see collect()).
+"""
+
+import errno
+import hashlib
+import os
+import secrets
+import shutil
+import stat
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from .gitignore import create_ignored_directory
+
+# Store location, relative to the project (or workspace) root
+STORE_DIR = Path(".promptrek") / "objects"
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+COPY = "copy"
+LINK_MODES = (REFLINK, HARDLINK)
+
+# ioctl request cloning a whole file on Linux (FICLONE)
+_FICLONE = 0x40049409
+
+# Errors meaning a link mode is unsupported here (fall back to copying)
+_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EINVAL, errno.ENOTTY}
+    | {
+        getattr(errno, name)
+        for name in ("EOPNOTSUPP", "ENOTSUP")
+        if hasattr(errno, name)
+    }
+)
+
+
+class ObjectStore:
+    """Content-addressed objects materialized into output directories."""
+
+    __slots__ = ("root", "mode", "counts", "_used", "_created", "_lock")
+
+    def __init__(self, root: Path, mode: str = REFLINK) -> None:
+        """
+        Initialize a store.
+
+        Args:
+            root: Store directory (usually <project>/.promptrek/objects)
+            mode: 'reflink' or 'hardlink'; both fall back to copying
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in LINK_MODES:
+            raise ValueError(
+                f"Invalid link mode '{mode}' (expected one of {LINK_MODES})"
+            )
+        self.root = root
+        self.mode = mode
+        # Files materialized per method ('reflink', 'hardlink' or 'copy')
+        self.counts: Dict[str, int] = {}
+        # Digests of the objects stored or reused by this run
+        self._used: Set[str] = set()
+        self._created = False
+        self._lock = threading.Lock()
+
+    def object_path(self, digest: str) -> Path:
+        """Get the path of the object with the given SHA-256 digest."""
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, data: bytes) -> Path:
+        """
+        Store content, unless an object with the same digest exists.
+
+        Args:
+            data: Content to store
+
+        Returns:
+            Path of the object
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest)
+        with self._lock:
+            self._used.add(digest)
+            created, self._created = self._created, True
+        if not created:
+            create_ignored_directory(self.root)
+        try:
+            if path.stat().st_size == len(data):
+                return path
+        except FileNotFoundError:
+            pass
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(temp_name, 0o444)
+            # Concurrent writers of the same object write the same bytes
+            os.replace(temp_name, path)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        return path
+
+    def collect(self, keep: Iterable[str] = ()) -> int:
+        """
+        Remove objects that are no longer needed.
+
+        An object is kept while an output is hard linked to it, while this
+        run used it, or while its digest is in keep (the digests recorded for
+        the current outputs, whose reflinked or copied files no longer share
+        an inode with it). Temporary files of concurrent writers are left
+        alone.
+
+        Args:
+            keep: Digests of objects to keep
+
+        Returns:
+            Number of objects removed
+        """
+        keep = self._used.union(keep)
+        removed = 0
+        try:
+            directories = [d for d in self.root.iterdir() if d.is_dir()]
+        except OSError:
+            return 0  # No store yet
+
+        for directory in directories:
+            for path in directory.iterdir():
+                if path.suffix == ".tmp" or directory.name + path.name in keep:
+                    continue
+                try:
+                    if path.lstat().st_nlink > 1:
+                        continue  # Still linked from an output
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    continue
+            try:
+                directory.rmdir()
+            except OSError:
+                pass  # Not empty
+        return removed
+
+    def materialize(self, path: Path, content: str) -> bool:
+        """
+        Write a file from the store, skipping it if it is unchanged.
+
+        Args:
+            path: Destination file
+            content: Text content
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        # A symlinked destination keeps its link; the file it points to is set
+        path = Path(os.path.realpath(path))
+        data = content.encode("utf-8")
+        source = self.put(data)
+        if self._unchanged(path, source, data):
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+        try:
+            method = self._link(source, temp)
+            # Replacing breaks an older link instead of writing through it
+            os.replace(temp, path)
+        except BaseException:
+            try:
+                temp.unlink()
+            except OSError:
+                pass
+            raise
+        with self._lock:
+            self.counts[method] = self.counts.get(method, 0) + 1
+        return True
+
+    def _unchanged(self, path: Path, source: Path, data: bytes) -> bool:
+        """Check whether a file already holds the content."""
+        try:
+            info = path.stat()
+        except FileNotFoundError:
+            return False
+        if not stat.S_ISREG(info.st_mode):
+            return False
+        source_info = source.stat()
+        if (info.st_dev, info.st_ino) == (source_info.st_dev, source_info.st_ino):
+            return True  # Hard link to the object
+        if info.st_size != len(data):
+            return False
+        if self.mode == HARDLINK and info.st_dev == source_info.st_dev:
+            # Link copies, so later runs only compare inodes
+            return False
+        try:
+            with open(path, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def _link(self, source: Path, target: Path) -> str:
+        """Materialize an object as a new file at target."""
+        link = _reflink if self.mode == REFLINK else os.link
+        try:
+            link(source, target)
+            return self.mode
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+        shutil.copyfile(source, target)
+        return COPY
+
+
+def _reflink(source: Path, target: Path) -> None:
+    """Create target as a copy-on-write clone of source."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "Reflinks are not supported")
+    with open(source, "rb") as src, open(target, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            os.unlink(target)
+            raise
@@ -0,0 +1,218 @@
+"""
+Output plans for generation runs.
+
+Adapters write their files as they go, so two editors generated in one run
+could silently overwrite each other's files (for example AGENTS.md or a
+shared MCP configuration). A run is therefore split in two phases: each
+editor is first rendered in memory with virtual_output(), and its files are
+added to an OutputPlan. The plan detects conflicting writes before anything
+touches the disk, writes identical files once, creates each directory once
+and then writes the files in parallel.
+
+Files an adapter writes in full are planned with the 'replace' policy. Files
+it updates with update_generated_file() (merged settings, MCP configurations)
+are planned with the 'merge' policy: their updates are replayed against the
+file on disk, so several editors can merge into the same file.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.exceptions import OutputConflictError
+from .object_store import ObjectStore
+from .outputs import (
+    VirtualOutput,
+    ensure_directory,
+    remove_directory,
+    update_generated_file,
+    write_generated_file,
+)
+
+REPLACE = "replace"
+MERGE = "merge"
+
+# Maximum number of files written concurrently
+DEFAULT_JOBS = 8
+
+_Update = Callable[[Optional[str]], Optional[str]]
+
+
+class PlannedWrite:
+    """A file a generation run intends to write."""
+
+    __slots__ = ("path", "content", "policy", "updates", "editors", "written")
+
+    def __init__(
+        self,
+        path: Path,
+        content: str,
+        policy: str,
+        updates: List[_Update],
+        editor: str,
+    ) -> None:
+        """
+        Initialize a planned write.
+
+        Args:
+            path: File to write
+            content: Rendered content (for 'merge', as rendered against the
+                file when it was planned)
+            policy: 'replace' or 'merge'
+            updates: Read-modify-write updates applied on top of the content
+                ('replace') or of the file on disk ('merge')
+            editor: Editor the write was planned for
+        """
+        self.path = path
+        self.content = content
+        self.policy = policy
+        self.updates = updates
+        self.editors = [editor]
+        # Whether the file changed on disk, once the plan is executed
+        self.written: Optional[bool] = None
+
+    def render(self, existing: Optional[str]) -> Optional[str]:
+        """
+        Get the content to write over the file's current content.
+
+        Args:
+            existing: Current file content, or None if it does not exist
+
+        Returns:
+            New content, or None to leave the file as it is
+        """
+        content = self.content if self.policy == REPLACE else existing
+        for update in self.updates:
+            updated = update(content)
+            if updated is not None:
+                content = updated
+        return content
+
+    def __repr__(self) -> str:
+        return f"PlannedWrite({self.path!r}, {self.policy!r}, editors={self.editors!r})"
+
+
+class OutputPlan:
+    """Files planned by a generation run, checked for conflicts."""
+
+    def __init__(self) -> None:
+        """Initialize an empty plan."""
+        self.writes: Dict[Path, PlannedWrite] = {}
+        # Conflicting writes as (path, editors)
+        self.conflicts: List[Tuple[Path, List[str]]] = []
+        # Directories replaced by planned files, removed before writing
+        self.removals: List[Path] = []
+
+    def add(self, editor: str, output: VirtualOutput) -> None:
+        """
+        Add the files an editor rendered into memory.
+
+        Args:
+            editor: Editor name
+            output: Virtual output the editor was rendered into
+        """
+        for directory in output.removals:
+            if directory not in self.removals:
+                self.removals.append(directory)
+        for path, data in output.files.items():
+            content = data.decode("utf-8")
+            updates = output.merges.get(path)
+            planned = self.writes.get(path)
+
+            if planned is None:
+                self.writes[path] = PlannedWrite(
+                    path,
+                    content,
+                    REPLACE if updates is None else MERGE,
+                    list(updates or []),
+                    editor,
+                )
+            elif updates is not None:
+                # Merges compose with whatever was planned before them
+                planned.updates.extend(updates)
+                planned.editors.append(editor)
+            elif (
+                planned.policy == REPLACE
+                and not planned.updates
+                and planned.content == content
+            ):
+                # Identical write, done once
+                planned.editors.append(editor)
+            else:
+                self.conflicts.append((path, planned.editors + [editor]))
+
+    def check(self) -> None:
+        """
+        Check the plan for conflicting writes.
+
+        Raises:
+            OutputConflictError: If editors planned different content for the
+                same file
+        """
+        if self.conflicts:
+            details = "\n".join(
+                f"  - {path}: {', '.join(editors)}" for path, editors in self.conflicts
+            )
+            raise OutputConflictError(
+                "Several editors would write different content to the same "
+                f"file; nothing was written:\n{details}"
+            )
+
+    def execute(
+        self, jobs: Optional[int] = None, store: Optional[ObjectStore] = None
+    ) -> int:
+        """
+        Write all planned files.
+
+        Args:
+            jobs: Number of files written concurrently
+            store: Object store to materialize replaced files from (merged
+                files are always written in place)
+
+        Returns:
+            Number of files that changed on disk
+
+        Raises:
+            OutputConflictError: If editors planned different content for the
+                same file (nothing is written)
+        """
+        self.check()
+        for directory in self.removals:
+            if directory.is_dir():
+                remove_directory(directory)
+        if not self.writes:
+            return 0
+
+        for directory in sorted({path.parent for path in self.writes}):
+            ensure_directory(directory)
+
+        with ThreadPoolExecutor(
+            max_workers=min(jobs or DEFAULT_JOBS, len(self.writes))
+        ) as pool:
+            # Each write runs in a copy of this context, so it sees the same
+            # virtual output or recorder as a sequential write would
+            futures = [
+                pool.submit(copy_context().run, self._write, planned, store)
+                for planned in self.writes.values()
+            ]
+            for future in futures:
+                future.result()
+        return sum(1 for planned in self.writes.values() if planned.written)
+
+    @staticmethod
+    def _write(planned: PlannedWrite, store: Optional[ObjectStore] = None) -> None:
+        """Write a planned file, recording its final content."""
+        if planned.policy == REPLACE and not planned.updates:
+            planned.written = write_generated_file(
+                planned.path, planned.content, store=store
+            )
+            return
+
+        def apply(existing: Optional[str]) -> Optional[str]:
+            content = planned.render(existing)
+            if content is not None:
+                planned.content = content
+            return content
+
+        planned.written = update_generated_file(planned.path, apply)
@@ -0,0 +1,379 @@
+"""
+Generated output utilities for PrompTrek.
+
+All adapters write their generated files through write_generated_file() and
+report progress through echo() so that a generation run can be observed
+(which files were produced and what they contain), files whose content did
+not change are left untouched on disk, and a run can be rendered entirely in
+memory with virtual_output().
+"""
+
+import hashlib
+import shutil
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+import click
+
+from .locking import atomic_write, file_lock
+
+if TYPE_CHECKING:
+    from .object_store import ObjectStore
+
+# Recorder for the generation run currently in progress (path -> content)
+_active_recorder: ContextVar[Optional[Dict[Path, str]]] = ContextVar(
+    "promptrek_output_recorder", default=None
+)
+
+
+class OutputEvent:
+    """A structured event emitted while generating in memory."""
+
+    def __init__(
+        self,
+        kind: str,
+        message: str = "",
+        path: Optional[Path] = None,
+        err: bool = False,
+    ) -> None:
+        """
+        Initialize an output event.
+
+        Args:
+            kind: Event kind ('message', 'write' or 'prompt')
+            message: Human-readable message
+            path: File path for 'write' events
+            err: Whether the message was meant for stderr
+        """
+        self.kind = kind
+        self.message = message
+        self.path = path
+        self.err = err
+
+    def __repr__(self) -> str:
+        return f"OutputEvent({self.kind!r}, {self.message!r}, path={self.path!r})"
+
+
+class VirtualOutput:
+    """In-memory file tree and event log for a generation run."""
+
+    def __init__(self, interactive: bool = False, preview: bool = False) -> None:
+        """
+        Initialize an empty virtual output.
+
+        Args:
+            interactive: Ask prompts instead of answering with the defaults
+            preview: The files will never be written (dry runs and diffs)
+        """
+        self.files: Dict[Path, bytes] = {}
+        self.events: List[OutputEvent] = []
+        # Read-modify-write updates of files that were not written in full,
+        # to replay against the file on disk (see update_generated_file())
+        self.merges: Dict[Path, List[Callable[[Optional[str]], Optional[str]]]] = {}
+        # Directories to remove before the files are written
+        self.removals: List[Path] = []
+        self.interactive = interactive
+        self.preview = preview
+        # Number of events already shown on the console
+        self._shown = 0
+
+    def messages(self) -> List[str]:
+        """Get all console messages in order."""
+        return [e.message for e in self.events if e.kind == "message"]
+
+    def flush_messages(self) -> None:
+        """Print the console messages recorded since the last flush."""
+        for event in self.events[self._shown :]:
+            if event.kind == "message":
+                click.echo(event.message, err=event.err)
+        self._shown = len(self.events)
+
+
+# Virtual output for the current context; when set nothing touches the disk
+_active_virtual: ContextVar[Optional[VirtualOutput]] = ContextVar(
+    "promptrek_virtual_output", default=None
+)
+
+
+@contextmanager
+def virtual_output(
+    interactive: bool = False, preview: bool = False
+) -> Iterator[VirtualOutput]:
+    """
+    Render generated files into memory instead of writing them to disk.
+
+    Console messages and interactive prompts are recorded as events; prompts
+    resolve to their default answers. The context is per thread (and per
+    asyncio task), so concurrent renders don't interfere.
+
+    Args:
+        interactive: Still ask prompts, showing the messages recorded so far
+            first (used to plan writes of a normal run). Ignored when nested
+            in another virtual output.
+        preview: The rendered files will never be written, so adapters must
+            not leave anything else on disk either (caches included).
+            Inherited by nested virtual outputs.
+
+    Yields:
+        VirtualOutput collecting files and events
+    """
+    output = VirtualOutput(
+        interactive=interactive and not is_virtual(),
+        preview=preview or is_preview(),
+    )
+    token = _active_virtual.set(output)
+    try:
+        yield output
+    finally:
+        _active_virtual.reset(token)
+
+
+def is_virtual() -> bool:
+    """Check whether output is currently being rendered in memory."""
+    return _active_virtual.get() is not None
+
+
+def is_preview() -> bool:
+    """Check whether output is being rendered for a preview that writes nothing."""
+    virtual = _active_virtual.get()
+    return virtual is not None and virtual.preview
+
+
+def echo(message: Any = "", err: bool = False) -> None:
+    """
+    Report a console message, or record it as an event in virtual mode.
+
+    Args:
+        message: Message to print
+        err: Whether to print to stderr
+    """
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        virtual.events.append(OutputEvent("message", str(message), err=err))
+        return
+    click.echo(message, err=err)
+
+
+def confirm(text: str, default: bool = False) -> bool:
+    """
+    Ask for confirmation, answering with the default in virtual mode.
+
+    Args:
+        text: Question to ask
+        default: Default answer
+
+    Returns:
+        The user's answer
+    """
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        virtual.events.append(OutputEvent("prompt", text))
+        if not virtual.interactive:
+            return default
+        virtual.flush_messages()
+    return click.confirm(text, default=default)
+
+
+def prompt_input(text: str, **kwargs: Any) -> Any:
+    """
+    Prompt for a value, answering with the default in virtual mode.
+
+    Args:
+        text: Prompt text
+        **kwargs: Options passed to click.prompt (e.g. default, type)
+
+    Returns:
+        The entered value
+    """
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        virtual.events.append(OutputEvent("prompt", text))
+        if not virtual.interactive:
+            return kwargs.get("default")
+        virtual.flush_messages()
+    return click.prompt(text, **kwargs)
+
+
+def ensure_directory(path: Path) -> None:
+    """
+    Create an output directory (no-op in virtual mode).
+
+    Args:
+        path: Directory to create, including parents
+    """
+    if _active_virtual.get() is None:
+        path.mkdir(parents=True, exist_ok=True)
+
+
+def remove_directory(path: Path) -> None:
+    """
+    Remove a directory tree that a generated file replaces.
+
+    In virtual mode the removal is only recorded, so it happens when the
+    planned files are written (see OutputPlan.execute()).
+
+    Args:
+        path: Directory to remove
+    """
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        virtual.removals.append(path)
+        virtual.events.append(OutputEvent("remove", str(path), path=path))
+        return
+    shutil.rmtree(path)
+
+
+def content_digest(content: str) -> str:
+    """
+    Compute a stable digest for generated content.
+
+    Args:
+        content: Text content
+
+    Returns:
+        Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def write_generated_file(
+    path: Path,
+    content: str,
+    atomic: bool = False,
+    store: Optional["ObjectStore"] = None,
+) -> bool:
+    """
+    Write a generated file, skipping the write if content is unchanged.
+
+    Leaving unchanged files alone keeps their modification time stable, so
+    editors do not re-index them and file watchers are not triggered.
+
+    Args:
+        path: Destination file path
+        content: Text content to write
+        atomic: Replace the file atomically (for files other runs also read)
+        store: Object store to materialize the file from (see object_store)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    recorder = _active_recorder.get()
+    if recorder is not None:
+        recorder[path] = content
+
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        virtual.files[path] = content.encode("utf-8")
+        virtual.merges.pop(path, None)
+        virtual.events.append(OutputEvent("write", str(path), path=path))
+        return True
+
+    if store is not None:
+        return store.materialize(path, content)
+
+    if path.is_file():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    return False
+        except (OSError, UnicodeDecodeError):
+            pass
+        _unlink_stored(path)
+
+    try:
+        _write(path, content, atomic)
+    except FileNotFoundError:
+        # Parent directory is missing; create it only when actually needed
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write(path, content, atomic)
+    return True
+
+
+def _unlink_stored(path: Path) -> None:
+    """Remove a file hard linked to a read-only store object before writing."""
+    try:
+        info = path.stat()
+        if info.st_nlink > 1 and not info.st_mode & 0o222:
+            path.unlink()
+    except OSError:
+        pass
+
+
+def _write(path: Path, content: str, atomic: bool) -> None:
+    """Write a file in place, or atomically through a temporary file."""
+    if atomic:
+        atomic_write(path, content)
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+def update_generated_file(
+    path: Path, update: Callable[[Optional[str]], Optional[str]]
+) -> bool:
+    """
+    Read, modify and write a file that other processes may update too.
+
+    The file is locked for the whole read-modify-write and replaced
+    atomically, so concurrent promptrek runs never lose each other's
+    changes. In virtual mode the current content comes from the virtual
+    output (falling back to the file on disk), nothing is written, and the
+    update is kept so it can be replayed against the file later.
+
+    Args:
+        path: File to update
+        update: Function from the current content (None if the file does not
+            exist) to the new content (None to leave the file as it is)
+
+    Returns:
+        True if the file was written, False if it was left unchanged
+
+    Raises:
+        FileLockError: If the file lock cannot be acquired
+    """
+    virtual = _active_virtual.get()
+    if virtual is not None:
+        # Updates on top of a file written in full need no replay
+        pending = virtual.merges.get(path, [])
+        replay = path not in virtual.files or path in virtual.merges
+        content = update(_read_current(path))
+        if content is None:
+            return False
+        write_generated_file(path, content)
+        if replay:
+            virtual.merges[path] = pending + [update]
+        return True
+
+    with file_lock(path):
+        content = update(_read_current(path))
+        return content is not None and write_generated_file(path, content, atomic=True)
+
+
+def _read_current(path: Path) -> Optional[str]:
+    """Read a file's current content, including pending virtual writes."""
+    virtual = _active_virtual.get()
+    if virtual is not None and path in virtual.files:
+        return virtual.files[path].decode("utf-8")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def record_outputs() -> Iterator[Dict[Path, str]]:
+    """
+    Record every file written through write_generated_file() in this context.
+
+    Yields:
+        Dictionary mapping written paths to their content
+    """
+    recorded: Dict[Path, str] = {}
+    token = _active_recorder.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _active_recorder.reset(token)
@@ -0,0 +1,384 @@
+"""
+Repository scan for Cursor ignore files.
+
+Cursor indexes every file it is not told to skip, so vendored dependencies,
+build artifacts, data fixtures and binaries slow its indexer down and crowd
+its context. The scan walks the files git would track (tracked and untracked
+files not excluded by .gitignore) and classifies paths:
+
+- vendored and generated paths, and files over the size threshold, are
+  excluded from Cursor completely (.cursorignore);
+- binary files and directories holding many files are excluded from
+  indexing only (.cursorindexingignore).
+
+Whether a file is binary is sniffed from its first bytes unless its extension
+tells. Sniffing results are cached in .promptrek/cache/repo-scan.json (a
+directory git ignores), keyed by file size and modification time, so later
+scans only read new or changed files.
+"""
+
+import fnmatch
+import json
+import os
+import stat
+import subprocess
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import RepositoryScanConfig
+from .gitignore import create_ignored_directory, read_gitignore
+from .locking import atomic_write
+
+# Directories holding third-party code
+VENDORED_DIRECTORIES = frozenset(
+    {
+        "vendor",
+        "vendors",
+        "third_party",
+        "third-party",
+        "thirdparty",
+        "external",
+        "node_modules",
+        "bower_components",
+        "site-packages",
+        ".venv",
+        "venv",
+    }
+)
+
+# Directories holding build artifacts and other generated files
+GENERATED_DIRECTORIES = frozenset(
+    {
+        "dist",
+        "build",
+        "out",
+        "target",
+        "coverage",
+        "htmlcov",
+        "__pycache__",
+        ".next",
+        ".nuxt",
+        ".gradle",
+        ".tox",
+        ".nox",
+    }
+)
+
+# File name patterns of generated files
+GENERATED_FILE_PATTERNS = (
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*_pb2.py",
+    "*_pb2_grpc.py",
+    "*.pb.go",
+    "*.generated.*",
+    "*.g.dart",
+)
+
+# Extensions of files that are binary without looking at their content
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".webp",
+        ".pdf",
+        ".zip",
+        ".gz",
+        ".tgz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".rar",
+        ".jar",
+        ".war",
+        ".class",
+        ".so",
+        ".dylib",
+        ".dll",
+        ".exe",
+        ".o",
+        ".a",
+        ".pyc",
+        ".whl",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".mp3",
+        ".mp4",
+        ".mov",
+        ".wav",
+        ".sqlite",
+        ".db",
+        ".parquet",
+        ".npy",
+        ".pkl",
+    }
+)
+
+# Directories never scanned
+SKIPPED_DIRECTORIES = frozenset({".git", ".promptrek"})
+
+# Scan cache, relative to the repository root
+CACHE_FILE = Path(".promptrek") / "cache" / "repo-scan.json"
+
+# Bumped whenever the layout of the cache changes
+CACHE_VERSION = 1
+
+# Number of leading bytes read to tell whether a file is binary
+SNIFF_SIZE = 8192
+
+# (size, mtime_ns, binary)
+_FileRecord = Tuple[int, int, bool]
+
+
+class ScanResult:
+    """Paths a repository scan excludes from Cursor, as gitignore patterns."""
+
+    def __init__(self) -> None:
+        """Initialize an empty result."""
+        # Section title mapped to patterns, in the order they were found
+        self.ignore: Dict[str, List[str]] = {}
+        self.indexing_ignore: Dict[str, List[str]] = {}
+        # Number of files scanned, and of files whose content was read
+        self.files = 0
+        self.sniffed = 0
+
+    def patterns(self) -> Tuple[List[str], List[str]]:
+        """Get all .cursorignore and .cursorindexingignore patterns."""
+        return (
+            [p for section in self.ignore.values() for p in section],
+            [p for section in self.indexing_ignore.values() for p in section],
+        )
+
+    @staticmethod
+    def format_sections(sections: Dict[str, List[str]]) -> List[str]:
+        """
+        Format sections as ignore file lines.
+
+        Args:
+            sections: Section title mapped to patterns
+
+        Returns:
+            Lines with a comment heading each non-empty section
+        """
+        lines: List[str] = []
+        for title, patterns in sections.items():
+            if patterns:
+                lines.append(f"# {title} (repository scan)")
+                lines.extend(patterns)
+                lines.append("")
+        return lines
+
+
+def scan_repository(
+    root: Path,
+    config: Optional[RepositoryScanConfig] = None,
+    write_cache: bool = True,
+) -> ScanResult:
+    """
+    Scan a repository for paths to exclude from Cursor.
+
+    Args:
+        root: Repository root
+        config: Scan thresholds (defaults apply when omitted)
+        write_cache: Whether to update the scan cache
+
+    Returns:
+        Scan result
+    """
+    config = config or RepositoryScanConfig()
+    root = root.resolve()
+    cache = _load_cache(root)
+    records: Dict[str, _FileRecord] = {}
+    result = ScanResult()
+
+    for name in list_repository_files(root):
+        try:
+            info = os.stat(root / name)
+        except OSError:
+            continue  # Deleted, or a broken link
+        if not stat.S_ISREG(info.st_mode):
+            continue  # Submodule
+        cached = cache.get(name)
+        if cached is not None and cached[:2] == (info.st_size, info.st_mtime_ns):
+            binary = cached[2]
+        else:
+            binary = _is_binary(root / name)
+            if PurePosixPath(name).suffix.lower() not in BINARY_EXTENSIONS:
+                result.sniffed += 1
+        records[name] = (info.st_size, info.st_mtime_ns, binary)
+
+    result.files = len(records)
+    _classify(records, config, result)
+
+    if write_cache and records != cache:
+        try:
+            create_ignored_directory((root / CACHE_FILE).parent)
+            atomic_write(
+                root / CACHE_FILE,
+                json.dumps(
+                    {"version": CACHE_VERSION, "files": records}, sort_keys=True
+                ),
+            )
+        except OSError:
+            pass  # Read-only tree, the files are sniffed again next time
+    return result
+
+
+def list_repository_files(root: Path) -> List[str]:
+    """
+    List the files of a repository that .gitignore does not exclude.
+
+    Uses git when the root is inside a work tree; otherwise walks the tree
+    and applies the root .gitignore.
+
+    Args:
+        root: Repository root
+
+    Returns:
+        POSIX paths relative to the root
+    """
+    try:
+        completed = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            timeout=60,
+        )
+        if completed.returncode == 0:
+            names = completed.stdout.decode("utf-8", "surrogateescape").split("\0")
+            return sorted(
+                name
+                for name in set(names)
+                if name and not SKIPPED_DIRECTORIES.intersection(name.split("/")[:-1])
+            )
+    except (OSError, subprocess.SubprocessError):
+        pass  # No git, walk the tree
+
+    patterns = sorted(read_gitignore(root / ".gitignore"))
+    files: List[str] = []
+    for directory, dirnames, filenames in os.walk(root):
+        relative = Path(directory).relative_to(root).as_posix()
+        prefix = "" if relative == "." else relative + "/"
+        dirnames[:] = sorted(
+            d
+            for d in dirnames
+            if d not in SKIPPED_DIRECTORIES
+            and not _gitignored(prefix + d, patterns, directory=True)
+        )
+        files.extend(
+            prefix + f
+            for f in sorted(filenames)
+            if not _gitignored(prefix + f, patterns, directory=False)
+        )
+    return files
+
+
+def _gitignored(name: str, patterns: Iterable[str], directory: bool) -> bool:
+    """Match a path against root .gitignore patterns (negations unsupported)."""
+    basename = name.rsplit("/", 1)[-1]
+    for pattern in patterns:
+        if pattern.startswith("!"):
+            continue
+        if pattern.endswith("/"):
+            if not directory:
+                continue
+            pattern = pattern.rstrip("/")
+        if "/" in pattern:
+            if fnmatch.fnmatch(name, pattern.lstrip("/")):
+                return True
+        elif fnmatch.fnmatch(basename, pattern):
+            return True
+    return False
+
+
+def _is_binary(path: Path) -> bool:
+    """Tell whether a file is binary, by extension or by a NUL in its head."""
+    if path.suffix.lower() in BINARY_EXTENSIONS:
+        return True
+    try:
+        with open(path, "rb") as f:
+            return b"\0" in f.read(SNIFF_SIZE)
+    except OSError:
+        return False
+
+
+def _classify(
+    records: Dict[str, _FileRecord], config: RepositoryScanConfig, result: ScanResult
+) -> None:
+    """Sort scanned files into the sections of a scan result."""
+    vendored: List[str] = []
+    generated: List[str] = []
+    large: List[str] = []
+    binary: List[str] = []
+    crowded: List[str] = []
+    excluded: Set[str] = set()  # Directory patterns already emitted
+    binary_extensions: Set[str] = set()
+    directory_files: Dict[str, int] = {}
+
+    for name, (size, _mtime, is_binary) in sorted(records.items()):
+        parts = name.split("/")
+        covered = False
+        for depth, part in enumerate(parts[:-1]):
+            pattern = "/" + "/".join(parts[: depth + 1]) + "/"
+            if pattern in excluded:
+                covered = True
+                break
+            if part in VENDORED_DIRECTORIES or part in GENERATED_DIRECTORIES:
+                excluded.add(pattern)
+                (vendored if part in VENDORED_DIRECTORIES else generated).append(
+                    pattern
+                )
+                covered = True
+                break
+        if covered:
+            continue
+
+        directory_files[name.rpartition("/")[0]] = (
+            directory_files.get(name.rpartition("/")[0], 0) + 1
+        )
+        if any(fnmatch.fnmatch(parts[-1], p) for p in GENERATED_FILE_PATTERNS):
+            generated.append("/" + name)
+        elif size > config.max_file_size:
+            large.append("/" + name)
+        elif is_binary and config.binary_files:
+            suffix = PurePosixPath(name).suffix.lower()
+            if suffix in BINARY_EXTENSIONS:
+                binary_extensions.add(suffix)
+            else:
+                binary.append("/" + name)
+
+    for directory, count in sorted(directory_files.items()):
+        if directory and count > config.max_directory_files:
+            crowded.append(f"/{directory}/")
+
+    result.ignore = {
+        "Vendored code": vendored,
+        "Generated files": generated,
+        "Files over the size limit": large,
+    }
+    result.indexing_ignore = {
+        "Binary files": sorted(f"*{suffix}" for suffix in binary_extensions) + binary,
+        "Directories with many files": crowded,
+    }
+
+
+def _load_cache(root: Path) -> Dict[str, _FileRecord]:
+    """Load cached file records, or nothing if the cache is missing or stale."""
+    try:
+        with open(root / CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return {
+            name: (int(size), int(mtime), bool(binary))
+            for name, (size, mtime, binary) in data["files"].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
@@ -0,0 +1,223 @@
+"""
+Splitting of oversized rule files into numbered parts.
+
+Some editors limit the size of a rule file (Windsurf ignores rules over 6,000
+characters) or handle long ones poorly. Adapters declare these limits in
+their descriptor, and a file that exceeds them is written as numbered parts
+(``testing-part-1.md``, ``testing-part-2.md``, ...), each carrying the
+original frontmatter so descriptions, globs and alwaysApply stay the same.
+
+Content is split where it reads naturally: before the shallowest headings
+first, then deeper headings, then between paragraphs, and only then between
+lines. Code blocks are never split unless a single block is over the limit.
+Sync maps the parts back to one document with group_part_files() and
+join_parts().
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .markdown import split_frontmatter, tokenize
+
+# Stem of a numbered part: '<name>-part-<n>'
+PART_PATTERN = re.compile(r"^(?P<name>.+)-part-(?P<number>[1-9][0-9]*)$")
+
+# Break priorities; headings use their level (1-6)
+_PARAGRAPH = 7
+_LINE = 8
+_CODE = 9
+
+
+def split_content(
+    content: str,
+    max_chars: Optional[int] = None,
+    max_lines: Optional[int] = None,
+) -> List[str]:
+    """
+    Split file content into parts within the given limits.
+
+    A leading frontmatter block is repeated in every part and counts towards
+    each part's size.
+
+    Args:
+        content: File content
+        max_chars: Maximum characters per part
+        max_lines: Maximum lines per part
+
+    Returns:
+        The parts, or the unchanged content if it fits
+    """
+    if _fits(content, max_chars, max_lines):
+        return [content]
+
+    frontmatter, body = split_frontmatter(content)
+    header = f"---\n{frontmatter}---\n" if frontmatter is not None else ""
+    trailing = "\n" if body.endswith("\n") else ""
+    # The header and trailing newline are added to every part
+    if max_chars is not None:
+        max_chars = max(max_chars - len(header) - len(trailing), 1)
+    if max_lines is not None:
+        max_lines = max(max_lines - header.count("\n") - len(trailing), 1)
+
+    return [
+        header + part + trailing
+        for part in split_markdown(body.strip("\n"), max_chars, max_lines)
+    ]
+
+
+def split_markdown(
+    body: str,
+    max_chars: Optional[int] = None,
+    max_lines: Optional[int] = None,
+) -> List[str]:
+    """
+    Split markdown into parts within the given limits.
+
+    Args:
+        body: Markdown content (without frontmatter)
+        max_chars: Maximum characters per part
+        max_lines: Maximum lines per part
+
+    Returns:
+        Parts, without leading or trailing blank lines; joined with a blank
+        line they give back the content
+    """
+    lines = body.split("\n")
+    priorities = _break_priorities(lines)
+    parts = _split(lines, 0, len(lines), priorities, max_chars, max_lines)
+    return [part for part in ("\n".join(p).strip("\n") for p in parts) if part]
+
+
+def part_path(path: Path, number: int) -> Path:
+    """
+    Get the path of a numbered part of a file.
+
+    Args:
+        path: Path of the whole file
+        number: Part number (1-based)
+
+    Returns:
+        Path of the part, e.g. rules/testing-part-2.md
+    """
+    return path.with_name(f"{path.stem}-part-{number}{path.suffix}")
+
+
+def group_part_files(files: Iterable[Path]) -> List[Tuple[str, List[Path]]]:
+    """
+    Group the numbered parts of split files.
+
+    Parts are grouped only when they are numbered 1 to n without gaps, so a
+    file that merely ends in '-part-<n>' is left alone.
+
+    Args:
+        files: Files of one directory
+
+    Returns:
+        (document stem, files in part order), sorted by stem
+    """
+    groups: Dict[str, List[Path]] = {}
+    parts: Dict[str, Dict[int, Path]] = {}
+    for path in files:
+        match = PART_PATTERN.match(path.stem)
+        if match:
+            parts.setdefault(match.group("name"), {})[int(match.group("number"))] = path
+        else:
+            groups[path.stem] = [path]
+
+    for name, numbered in parts.items():
+        if name not in groups and sorted(numbered) == list(range(1, len(numbered) + 1)):
+            groups[name] = [numbered[number] for number in sorted(numbered)]
+        else:
+            for path in numbered.values():
+                groups[path.stem] = [path]
+
+    return sorted(groups.items())
+
+
+def join_parts(contents: List[str]) -> str:
+    """
+    Join the contents of a file's parts back into one document.
+
+    Args:
+        contents: Content of each part, in order
+
+    Returns:
+        The first part's frontmatter followed by every part's body
+    """
+    if len(contents) == 1:
+        return contents[0]
+    frontmatter, _ = split_frontmatter(contents[0])
+    header = f"---\n{frontmatter}---\n" if frontmatter is not None else ""
+    bodies = [split_frontmatter(content)[1].strip("\n") for content in contents]
+    return header + "\n\n".join(body for body in bodies if body) + "\n"
+
+
+def _fits(text: str, max_chars: Optional[int], max_lines: Optional[int]) -> bool:
+    """Check whether text is within the limits."""
+    if max_chars is not None and len(text) > max_chars:
+        return False
+    return max_lines is None or text.count("\n") + 1 <= max_lines
+
+
+def _break_priorities(lines: List[str]) -> List[int]:
+    """Get how good a break before each line is (lower is better)."""
+    priorities = []
+    previous = "blank"
+    after_heading = False
+    for token in tokenize("\n".join(lines)):
+        if token.kind == "code" or (token.kind == "fence" and previous == "code"):
+            priority = _CODE
+        elif token.kind == "heading":
+            priority = token.level
+        elif after_heading:
+            priority = _CODE  # Keep a heading with what follows it
+        elif previous == "blank" and token.kind != "blank":
+            priority = _PARAGRAPH
+        else:
+            priority = _LINE
+        priorities.append(priority)
+        previous = token.kind
+        if token.kind != "blank":
+            after_heading = token.kind == "heading"
+    return priorities
+
+
+def _split(
+    lines: List[str],
+    start: int,
+    end: int,
+    priorities: List[int],
+    max_chars: Optional[int],
+    max_lines: Optional[int],
+) -> List[List[str]]:
+    """Split lines[start:end] at its best breaks, packing segments greedily."""
+    chunk = lines[start:end]
+    if end - start <= 1 or _fits("\n".join(chunk).strip("\n"), max_chars, max_lines):
+        return [chunk]
+
+    best = min(priorities[start + 1 : end])
+    breaks = [i for i in range(start + 1, end) if priorities[i] == best]
+    bounds = [start] + breaks + [end]
+
+    parts: List[List[str]] = []
+    current: List[str] = []
+    for segment_start, segment_end in zip(bounds, bounds[1:]):
+        segment = lines[segment_start:segment_end]
+        if _fits("\n".join(current + segment).strip("\n"), max_chars, max_lines):
+            current += segment
+            continue
+        if current:
+            parts.append(current)
+            current = []
+        if _fits("\n".join(segment).strip("\n"), max_chars, max_lines):
+            current = segment
+        else:
+            parts.extend(
+                _split(
+                    lines, segment_start, segment_end, priorities, max_chars, max_lines
+                )
+            )
+    if current:
+        parts.append(current)
+    return parts
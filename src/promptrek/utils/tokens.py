@@ -0,0 +1,70 @@
+"""
+Local token estimates for generated files.
+
+Instruction files are loaded into a model's context, so their size in tokens
+is what costs latency and money. Exact counts depend on each model's
+tokenizer and would need a network call or a large dependency; instead, text
+is split the way byte-pair tokenizers tend to split it:
+
+- a word costs one token per started 6 letters (common words are one token,
+  long identifiers are several), and leading spaces merge into it;
+- numbers cost one token per started 3 digits;
+- punctuation costs one token per started 4 repeated characters (so a
+  Markdown rule or heading marker is one token);
+- line breaks and indentation cost one token per run;
+- words in other scripts cost one token per 2 letters, and any other
+  character (emoji, symbols) one token.
+
+The estimate is approximate: it is meant to compare files and to enforce
+budgets, not to predict a model's exact count.
+"""
+
+import re
+
+_PIECES = re.compile(
+    r"(?P<word>[^\W\d_]+)"
+    r"|(?P<number>\d+)"
+    r"|(?P<space>[ \t]+)"
+    r"|(?P<newline>\s+)"
+    r"|(?P<punct>([!-/:-@\[-`{-~])\6*)"
+    r"|(?P<other>.)",
+    re.DOTALL,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens of a text.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated token count
+    """
+    tokens = 0
+    previous = None
+    for match in _PIECES.finditer(text):
+        kind = match.lastgroup
+        length = match.end() - match.start()
+        if kind == "word":
+            # ASCII words merge into few tokens; other scripts split more
+            if match.group().isascii():
+                tokens += (length + 5) // 6
+            else:
+                tokens += (length + 1) // 2
+        elif kind == "number":
+            tokens += (length + 2) // 3
+        elif kind == "punct":
+            tokens += (length + 3) // 4
+        elif kind == "space":
+            # A single space merges into the following word; indentation
+            # after a line break is a token of its own
+            if length > 1 or previous == "newline":
+                tokens += 1
+        elif kind == "newline":
+            tokens += 1
+        else:
+            tokens += 1
+        previous = kind
+    return tokens
@@ -7,23 +7,162 @@ Supports both static and dynamic (command-based) variables.
 
 import os
 import re
+import selectors
+import shlex
+import signal
 import subprocess
 import sys
-from datetime import date, datetime
+import time
+import uuid
+import weakref
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Match, Optional
+from typing import Any, ClassVar, Dict, List, Match, Optional, Tuple
 
 import yaml
+from pydantic import BaseModel
 
 from ..core.exceptions import TemplateError
-from ..core.models import UniversalPrompt
+from ..core.models import STABLE_BUILTIN_GRANULARITIES, UniversalPrompt
+
+
+class ShellSession:
+    """
+    A persistent shell coprocess that runs commands one after another.
+
+    Starting a shell for every command dominates the cost of short commands
+    such as ``git rev-parse``. A session starts /bin/sh once and feeds it each
+    command to ``eval`` in a subshell, so commands cannot change each other's
+    working directory or variables, and a syntax error only fails its own
+    command. After a command, the shell prints a delimiter
+    unique to that command with its exit status on stdout, and the delimiter
+    alone on stderr, which tells where the command's output ends.
+    """
+
+    SHELL = "/bin/sh"
+
+    def __init__(self) -> None:
+        """Initialize a session (the shell is started on first use)."""
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether persistent sessions are supported on this platform."""
+        return os.name == "posix"
+
+    def run(self, command: str, timeout: float) -> "subprocess.CompletedProcess[str]":
+        """
+        Run a command in the session.
+
+        Args:
+            command: Shell command to run
+            timeout: Maximum execution time in seconds
+
+        Returns:
+            Completed process with the command's exit status and output
+
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time
+                (the session is restarted for the next command)
+            OSError: If the shell exited unexpectedly or cannot be started
+        """
+        process = self._start()
+        assert process.stdin is not None
+        assert process.stdout is not None
+        assert process.stderr is not None
+
+        marker = f"__promptrek_{uuid.uuid4().hex}__".encode("ascii")
+        script = (
+            b"(eval " + shlex.quote(command).encode("utf-8") + b") </dev/null\n"
+            b"printf '\\n%s %d\\n' " + marker + b" $?\n"
+            b"printf '\\n%s\\n' " + marker + b" >&2\n"
+        )
+        try:
+            process.stdin.write(script)
+            process.stdin.flush()
+        except OSError as e:
+            self.close()
+            raise OSError(f"Shell session exited unexpectedly: {e}") from e
+
+        streams = {process.stdout.fileno(): b"", process.stderr.fileno(): b""}
+        ends = {
+            process.stdout.fileno(): re.compile(
+                b"\n" + re.escape(marker) + b" (\\d+)\n$"
+            ),
+            process.stderr.fileno(): re.compile(b"\n" + re.escape(marker) + b"\n$"),
+        }
+        deadline = time.monotonic() + timeout
+        pending = set(streams)
+
+        with selectors.DefaultSelector() as selector:
+            for fd in pending:
+                selector.register(fd, selectors.EVENT_READ)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.close()
+                    raise subprocess.TimeoutExpired(command, timeout)
+                for key, _ in selector.select(remaining):
+                    fd = key.fd
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        self.close()
+                        raise OSError("Shell session exited unexpectedly")
+                    streams[fd] += chunk
+                    if ends[fd].search(streams[fd]):
+                        selector.unregister(fd)
+                        pending.discard(fd)
+
+        stdout = streams[process.stdout.fileno()]
+        stderr = streams[process.stderr.fileno()]
+        match = ends[process.stdout.fileno()].search(stdout)
+        assert match is not None
+        return subprocess.CompletedProcess(
+            command,
+            int(match.group(1)),
+            stdout[: match.start()].decode("utf-8", "replace"),
+            stderr[: stderr.rindex(b"\n" + marker)].decode("utf-8", "replace"),
+        )
+
+    def close(self) -> None:
+        """Stop the shell and any command still running in it."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            # The shell leads its own process group, which includes commands
+            # still running after a timeout
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        process.wait()
+        for stream in (process.stdin, process.stdout, process.stderr):
+            if stream is not None:
+                stream.close()
+
+    def _start(self) -> "subprocess.Popen[bytes]":
+        """Start the shell if it is not running."""
+        if self._process is None or self._process.poll() is not None:
+            self.close()
+            self._process = subprocess.Popen(
+                [self.SHELL],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                start_new_session=True,
+            )
+        return self._process
 
 
 class CommandExecutor:
     """Executes shell commands with security controls for dynamic variables."""
 
     def __init__(
-        self, allow_commands: bool = False, timeout: int = 5, verbose: bool = False
+        self,
+        allow_commands: bool = False,
+        timeout: int = 5,
+        verbose: bool = False,
+        persistent: bool = False,
     ) -> None:
         """
         Initialize command executor.
@@ -32,11 +171,28 @@ class CommandExecutor:
             allow_commands: Whether to allow command execution (security control)
             timeout: Maximum command execution time in seconds
             verbose: Whether to show verbose output
+            persistent: Whether to run all commands in one shell session
+                (ignored where sessions are not supported); call close(), or
+                use the executor as a context manager, to stop the shell
         """
         self.allow_commands = allow_commands
         self.timeout = timeout
         self.verbose = verbose
         self._warned = False
+        self._session: Optional[ShellSession] = (
+            ShellSession() if persistent and ShellSession.is_supported() else None
+        )
+
+    def __enter__(self) -> "CommandExecutor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the shell session, if any."""
+        if self._session is not None:
+            self._session.close()
 
     def execute(self, command: str) -> str:
         """
@@ -70,14 +226,18 @@ class CommandExecutor:
             if self.verbose:
                 print(f"  🔧 Executing: {command}")
 
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-                check=True,
-            )
+            if self._session is not None:
+                result = self._session.run(command, self.timeout)
+                result.check_returncode()
+            else:
+                result = subprocess.run(
+                    command,
+                    shell=True,
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout,
+                    check=True,
+                )
 
             output = result.stdout.strip()
 
@@ -175,18 +335,47 @@ class DynamicVariable:
 class BuiltInVariables:
     """Provides standard built-in dynamic variables."""
 
+    # Granularities accepted for stable (reproducible) builds
+    STABLE_GRANULARITIES = STABLE_BUILTIN_GRANULARITIES
+
+    # Reproducible-builds convention: fixed build time as a Unix timestamp
+    SOURCE_DATE_EPOCH_ENV = "SOURCE_DATE_EPOCH"
+
+    # Git files whose modification times identify the repository state
+    _GIT_STATE_FILES = ("HEAD", "logs/HEAD", "config", "packed-refs")
+
+    # Project/git variable cache for long-running processes, keyed by
+    # (working directory, git state). Disabled (None) by default.
+    _project_cache: Optional[Dict[Any, Dict[str, str]]] = None
+
     @staticmethod
-    def get_all(verbose: bool = False) -> Dict[str, str]:
+    def enable_cache(enabled: bool = True) -> None:
+        """
+        Enable or disable caching of project and git variables.
+
+        Cached values are reused until the repository state changes (checkout,
+        commit, remote change), so git is not probed on every call.
+
+        Args:
+            enabled: Whether caching should be enabled
+        """
+        BuiltInVariables._project_cache = {} if enabled else None
+
+    @staticmethod
+    def get_all(verbose: bool = False, stable: Optional[str] = None) -> Dict[str, str]:
         """
         Get all built-in variables with their current values.
 
         Args:
             verbose: Whether to show verbose output
+            stable: Stable build granularity ('day', 'hour', 'minute' or
+                'commit'). When set, time values are pinned so repeated runs
+                produce identical output.
 
         Returns:
             Dictionary of built-in variable names and values
         """
-        now = datetime.now()
+        now = BuiltInVariables._get_reference_time(stable, verbose)
 
         variables = {
             # Date/Time variables
@@ -196,17 +385,155 @@ class BuiltInVariables:
             "CURRENT_YEAR": now.strftime("%Y"),
             "CURRENT_MONTH": now.strftime("%m"),
             "CURRENT_DAY": now.strftime("%d"),
-            # Project context variables
+        }
+
+        # Project context and git variables (git only if in git repo)
+        variables.update(BuiltInVariables._get_project_variables(verbose))
+
+        return variables
+
+    @staticmethod
+    def _get_project_variables(verbose: bool = False) -> Dict[str, str]:
+        """
+        Get project context and git variables, using the cache when enabled.
+
+        Args:
+            verbose: Whether to show verbose output
+
+        Returns:
+            Dictionary with PROJECT_NAME, PROJECT_ROOT and git variables
+        """
+        cache = BuiltInVariables._project_cache
+        cache_key = None
+        if cache is not None:
+            cwd = Path.cwd().resolve()
+            state = BuiltInVariables._get_git_state(cwd)
+            if state is not None:
+                cache_key = (str(cwd), state)
+                if cache_key in cache:
+                    return dict(cache[cache_key])
+
+        variables = {
             "PROJECT_NAME": BuiltInVariables._get_project_name(verbose),
             "PROJECT_ROOT": str(Path.cwd().resolve()),
         }
+        variables.update(BuiltInVariables._get_git_variables(verbose))
 
-        # Git variables (only if in git repo)
-        git_vars = BuiltInVariables._get_git_variables(verbose)
-        variables.update(git_vars)
-
+        if cache is not None and cache_key is not None:
+            cache[cache_key] = dict(variables)
         return variables
 
+    @staticmethod
+    def _get_git_state(start: Path) -> Optional[Any]:
+        """
+        Identify the repository state for cache keys.
+
+        Args:
+            start: Directory to search upwards from
+
+        Returns:
+            Tuple of git directory and file modification times, an empty tuple
+            outside a repository, or None if the state cannot be determined
+            (e.g. worktrees, where .git is a file)
+        """
+        for directory in [start, *start.parents]:
+            git_path = directory / ".git"
+            if git_path.is_dir():
+                mtimes = []
+                for name in BuiltInVariables._GIT_STATE_FILES:
+                    try:
+                        mtimes.append((git_path / name).stat().st_mtime_ns)
+                    except OSError:
+                        mtimes.append(0)
+                return (str(git_path), tuple(mtimes))
+            if git_path.exists():
+                return None
+        return ()
+
+    @staticmethod
+    def _get_reference_time(
+        stable: Optional[str] = None, verbose: bool = False
+    ) -> datetime:
+        """
+        Get the time used for date/time built-in variables.
+
+        SOURCE_DATE_EPOCH always takes precedence when set, following the
+        reproducible builds convention. Otherwise, stable mode truncates the
+        current time to the requested granularity, or uses the timestamp of
+        the HEAD commit for 'commit'. Pinned times are always in UTC, so a
+        pinned build gives the same values in every timezone.
+
+        Args:
+            stable: Stable build granularity, or None for the current time
+            verbose: Whether to show verbose output
+
+        Returns:
+            Reference time: timezone-aware UTC when pinned (epoch or stable
+            mode), naive local time otherwise
+
+        Raises:
+            ValueError: If the granularity is not recognized
+        """
+        if stable is not None and stable not in BuiltInVariables.STABLE_GRANULARITIES:
+            raise ValueError(
+                f"Invalid stable build granularity '{stable}'. "
+                f"Expected one of: {', '.join(BuiltInVariables.STABLE_GRANULARITIES)}"
+            )
+
+        epoch = os.environ.get(BuiltInVariables.SOURCE_DATE_EPOCH_ENV)
+        if epoch:
+            try:
+                pinned = datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+                if verbose:
+                    print(f"  📌 Using SOURCE_DATE_EPOCH={epoch}")
+                return pinned
+            except (ValueError, OverflowError, OSError):
+                if verbose:
+                    print(f"  ⚠️  Ignoring invalid SOURCE_DATE_EPOCH: {epoch}")
+
+        if stable is None:
+            return datetime.now()
+
+        now = datetime.now(timezone.utc)
+        if stable == "commit":
+            commit_time = BuiltInVariables._get_commit_time()
+            if commit_time is not None:
+                return commit_time
+            if verbose:
+                print("  ℹ️  No commit timestamp available, pinning to the day")
+            stable = "day"
+
+        if stable == "day":
+            return now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if stable == "hour":
+            return now.replace(minute=0, second=0, microsecond=0)
+        return now.replace(second=0, microsecond=0)
+
+    @staticmethod
+    def _get_commit_time() -> Optional[datetime]:
+        """
+        Get the committer timestamp of HEAD.
+
+        Returns:
+            Commit time (UTC), or None if unavailable
+        """
+        try:
+            result = subprocess.run(
+                ["git", "log", "-1", "--format=%ct"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+                check=True,
+            )
+            return datetime.fromtimestamp(int(result.stdout.strip()), tz=timezone.utc)
+        except (
+            subprocess.CalledProcessError,
+            subprocess.TimeoutExpired,
+            FileNotFoundError,
+            ValueError,
+        ):
+            return None
+
     @staticmethod
     def _get_project_name(verbose: bool = False) -> str:
         """
@@ -331,11 +658,19 @@ class BuiltInVariables:
         return variables
 
 
+# Leaf of a placeholder index: a string containing placeholders
+_PLACEHOLDER = object()
+
+
 class VariableSubstitution:
     """Handles variable substitution in templates and content."""
 
     LOCAL_VARIABLES_FILE = ".promptrek/variables.promptrek.yaml"
 
+    # Placeholder index per prompt (shared by all instances, so every adapter
+    # in a generate run reuses it): id(prompt) -> (weak reference, index)
+    _placeholder_indexes: ClassVar[Dict[int, Tuple[Any, Any]]] = {}
+
     def __init__(self) -> None:
         """Initialize variable substitution system."""
         self.variable_pattern = re.compile(r"\{\{\{\s*(\w+)\s*\}\}\}")
@@ -392,22 +727,26 @@ class VariableSubstitution:
 
         Returns:
             New UniversalPrompt with variables substituted
+
+        Only the strings listed in the prompt's placeholder index are visited.
+        Models, lists and dicts on the way to a changed string are copied
+        (without revalidation); everything else is shared with the original
+        prompt, which is returned as-is if nothing changes. Prompts are treated
+        as immutable once parsed: the index is built on first use.
         """
         # Combine variables from prompt and additional variables
         variables = prompt.variables.copy() if prompt.variables else {}
         if additional_variables:
             variables.update(additional_variables)
 
-        # Create a copy of the prompt data using aliases for proper reconstruction
-        prompt_dict = prompt.model_dump(by_alias=True)
+        index = self._placeholder_index(prompt)
+        if index is None:
+            return prompt
 
-        # Substitute variables in all string fields recursively
-        prompt_dict = self._substitute_dict_recursive(
-            prompt_dict, variables, env_variables, strict
+        result: UniversalPrompt = self._substitute_indexed(
+            prompt, index, variables, env_variables, strict
         )
-
-        # Create a new prompt instance with substituted values
-        return UniversalPrompt.model_validate(prompt_dict)
+        return result
 
     def get_undefined_variables(
         self, content: str, variables: Dict[str, Any]
@@ -460,6 +799,7 @@ class VariableSubstitution:
         parsed_content: str,
         source_dir: Optional[Path] = None,
         verbose: bool = False,
+        variables: Optional[Dict[str, str]] = None,
     ) -> str:
         """
         Restore variable references in parsed content by comparing with original.
@@ -479,6 +819,8 @@ class VariableSubstitution:
             parsed_content: Parsed content with evaluated variable values
             source_dir: Source directory for loading variables (defaults to cwd)
             verbose: Whether to print restoration details
+            variables: Pre-evaluated variables (skips loading them again when
+                restoring many fields)
 
         Returns:
             Content with variables restored
@@ -493,17 +835,20 @@ class VariableSubstitution:
             return parsed_content
 
         # Load and evaluate variables
-        try:
-            all_variables = self.load_and_evaluate_variables(
-                search_dir=source_dir,
-                allow_commands=True,
-                include_builtins=True,
-                verbose=False,
-                clear_cache=False,
-            )
-        except Exception:
-            # If we can't load variables, return parsed content as-is
-            return parsed_content
+        if variables is not None:
+            all_variables = variables
+        else:
+            try:
+                all_variables = self.load_and_evaluate_variables(
+                    search_dir=source_dir,
+                    allow_commands=True,
+                    include_builtins=True,
+                    verbose=False,
+                    clear_cache=False,
+                )
+            except Exception:
+                # If we can't load variables, return parsed content as-is
+                return parsed_content
 
         # Build replacement list: (value, placeholder, var_name)
         replacements = []
@@ -622,6 +967,84 @@ class VariableSubstitution:
         else:
             return data
 
+    def _placeholder_index(self, prompt: BaseModel) -> Any:
+        """Get the (cached) placeholder index of a prompt."""
+        key = id(prompt)
+        cached = self._placeholder_indexes.get(key)
+        if cached is not None and cached[0]() is prompt:
+            return cached[1]
+
+        index = self._build_placeholder_index(prompt)
+        indexes = self._placeholder_indexes
+        reference = weakref.ref(prompt, lambda _: indexes.pop(key, None))
+        indexes[key] = (reference, index)
+        return index
+
+    def _build_placeholder_index(self, data: Any) -> Any:
+        """
+        Index the strings containing placeholders in a model/dict/list tree.
+
+        Returns:
+            None if there are none, _PLACEHOLDER for such a string, otherwise
+            a dict mapping field names, keys or list positions (in dump order)
+            to the index of each child containing placeholders
+        """
+        if isinstance(data, str):
+            if self.variable_pattern.search(data) or self.env_pattern.search(data):
+                return _PLACEHOLDER
+            return None
+
+        items: List[Tuple[Any, Any]]
+        if isinstance(data, BaseModel):
+            names = list(type(data).model_fields)
+            names.extend(data.__pydantic_extra__ or ())
+            items = [(name, getattr(data, name)) for name in names]
+        elif isinstance(data, dict):
+            items = list(data.items())
+        elif isinstance(data, list):
+            items = list(enumerate(data))
+        else:
+            return None
+
+        index: Dict[Any, Any] = {}
+        for key, value in items:
+            child = self._build_placeholder_index(value)
+            if child is not None:
+                index[key] = child
+        return index or None
+
+    def _substitute_indexed(
+        self,
+        data: Any,
+        index: Any,
+        variables: Dict[str, Any],
+        env_variables: bool,
+        strict: bool,
+    ) -> Any:
+        """Substitute the indexed strings, copying only the changed path."""
+        if index is _PLACEHOLDER:
+            result = self.substitute(data, variables, env_variables, strict)
+            return data if result == data else result
+
+        is_model = isinstance(data, BaseModel)
+        changes: Dict[Any, Any] = {}
+        for key, child in index.items():
+            value = getattr(data, key) if is_model else data[key]
+            new_value = self._substitute_indexed(
+                value, child, variables, env_variables, strict
+            )
+            if new_value is not value:
+                changes[key] = new_value
+
+        if not changes:
+            return data
+        if is_model:
+            return data.model_copy(update=changes)
+        copy = data.copy()
+        for key, new_value in changes.items():
+            copy[key] = new_value
+        return copy
+
     def load_local_variables(self, search_dir: Optional[Path] = None) -> Dict[str, Any]:
         """
         Load variables from local .promptrek/variables.promptrek.yaml file.
@@ -687,6 +1110,7 @@ class VariableSubstitution:
         include_builtins: bool = True,
         verbose: bool = False,
         clear_cache: bool = False,
+        stable_builtins: Optional[str] = None,
     ) -> Dict[str, str]:
         """
         Load and evaluate all variables (static, dynamic, and built-in).
@@ -697,6 +1121,7 @@ class VariableSubstitution:
             include_builtins: Whether to include built-in dynamic variables
             verbose: Whether to show verbose output
             clear_cache: Whether to clear cached dynamic variables before evaluation
+            stable_builtins: Stable build granularity for time-based built-ins
 
         Returns:
             Dictionary of all evaluated variables
@@ -711,7 +1136,9 @@ class VariableSubstitution:
         if include_builtins:
             if verbose:
                 print("📅 Loading built-in dynamic variables...")
-            builtin_vars = BuiltInVariables.get_all(verbose=verbose)
+            builtin_vars = BuiltInVariables.get_all(
+                verbose=verbose, stable=stable_builtins
+            )
             variables.update(builtin_vars)
             if verbose:
                 print(f"  ✅ Loaded {len(builtin_vars)} built-in variable(s)")
@@ -756,41 +1183,47 @@ class VariableSubstitution:
             if verbose:
                 print(f"📋 Loading variables from {var_file}...")
 
-            # Create command executor if needed
+            # Create command executor if needed; all commands share one shell
             executor = CommandExecutor(
-                allow_commands=allow_commands, timeout=5, verbose=verbose
+                allow_commands=allow_commands,
+                timeout=5,
+                verbose=verbose,
+                persistent=True,
             )
 
             # 4. Process each variable
             static_count = 0
             dynamic_count = 0
 
-            for key, value in data.items():
-                # Static variable (string value, number, bool, or YAML date)
-                if self._is_static_variable_value(value):
-                    variables[key] = str(value)
-                    static_count += 1
-
-                # Dynamic variable (dict with type: command)
-                elif isinstance(value, dict) and value.get("type") == "command":
-                    command = value.get("value", "")
-                    cache = value.get("cache", False)
-
-                    dynamic_var = DynamicVariable(
-                        name=key, command=command, cache=cache
-                    )
-
-                    if clear_cache:
-                        dynamic_var.clear_cache()
-
-                    try:
-                        evaluated_value = dynamic_var.evaluate(executor)
-                        variables[key] = evaluated_value
-                        dynamic_count += 1
-                    except TemplateError as e:
-                        # Always report evaluation failures (not just in verbose mode)
-                        print(f"  ⚠️  Failed to evaluate dynamic variable '{key}': {e}")
-                        # Continue with other variables
+            with executor:
+                for key, value in data.items():
+                    # Static variable (string value, number, bool, or YAML date)
+                    if self._is_static_variable_value(value):
+                        variables[key] = str(value)
+                        static_count += 1
+
+                    # Dynamic variable (dict with type: command)
+                    elif isinstance(value, dict) and value.get("type") == "command":
+                        command = value.get("value", "")
+                        cache = value.get("cache", False)
+
+                        dynamic_var = DynamicVariable(
+                            name=key, command=command, cache=cache
+                        )
+
+                        if clear_cache:
+                            dynamic_var.clear_cache()
+
+                        try:
+                            evaluated_value = dynamic_var.evaluate(executor)
+                            variables[key] = evaluated_value
+                            dynamic_count += 1
+                        except TemplateError as e:
+                            # Always report evaluation failures (not just in verbose mode)
+                            print(
+                                f"  ⚠️  Failed to evaluate dynamic variable '{key}': {e}"
+                            )
+                            # Continue with other variables
 
             if verbose:
                 print(
@@ -38,6 +38,27 @@ def setup_test_project_dir() -> Generator[Path, None, None]:
     #     shutil.rmtree(test_project_dir)
 
 
+@pytest.fixture(scope="session")
+def lock_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a lock directory shared by all tests."""
+    return tmp_path_factory.mktemp("locks")
+
+
+@pytest.fixture(scope="session")
+def cache_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a cache directory (adapter index) shared by all tests."""
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(autouse=True)
+def use_temp_user_dirs(
+    lock_dir: Path, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep lock files and caches out of the system temp and home directories."""
+    monkeypatch.setenv("PROMPTREK_LOCK_DIR", str(lock_dir))
+    monkeypatch.setenv("PROMPTREK_CACHE_DIR", str(cache_dir))
+
+
 @pytest.fixture(autouse=True)
 def use_test_project_dir(
     setup_test_project_dir: Path,
@@ -11,6 +11,7 @@ from promptrek.adapters.amazon_q import AmazonQAdapter
 from promptrek.core.models import (
     Agent,
     Command,
+    DocumentConfig,
     Hook,
     Instructions,
     PromptMetadata,
@@ -449,6 +450,61 @@ class TestAmazonQAdapterV3:
         # Rules are at: .amazonq/rules/*.md
         # So ../rules/**/*.md from agent location resolves to .amazonq/rules/**/*.md ✓
 
+    def test_agent_scoped_resources(self, adapter, tmp_path, capsys):
+        """Test that agents load only the documents they list."""
+        prompt = UniversalPromptV3(
+            schema_version="3.1.0",
+            metadata=PromptMetadata(
+                title="Scoped Resources", description="Test", version="1.0.0"
+            ),
+            content="# Test\n\nContent",
+            documents=[
+                DocumentConfig(name="security", content="# Security\n\nValidate."),
+                DocumentConfig(name="api-style", content="# API\n\nUse REST."),
+                DocumentConfig(name="api-errors", content="# Errors\n\nUse codes."),
+            ],
+            agents=[
+                Agent(
+                    name="reviewer",
+                    system_prompt="Review code",
+                    resources=["security.md", "api-*", "missing"],
+                ),
+            ],
+        )
+
+        adapter.generate(prompt, tmp_path)
+
+        agent_file = tmp_path / ".amazonq" / "cli-agents" / "reviewer.json"
+        assert json.loads(agent_file.read_text())["resources"] == [
+            "file://../rules/security.md",
+            "file://../rules/api-style.md",
+            "file://../rules/api-errors.md",
+        ]
+        assert "resource 'missing', which matches no rule" in capsys.readouterr().err
+
+    def test_agent_resource_budget_warning(self, adapter, tmp_path, capsys):
+        """Test that generation warns when an agent's resources exceed its budget."""
+        prompt = UniversalPromptV3(
+            schema_version="3.1.0",
+            metadata=PromptMetadata(
+                title="Resource Budget", description="Test", version="1.0.0"
+            ),
+            content="# Test\n\n" + "- Follow the project conventions\n" * 200,
+            agents=[
+                Agent(name="small", system_prompt="Help", resources=[]),
+                Agent(name="large", system_prompt="Help", max_resource_tokens=500),
+            ],
+        )
+
+        adapter.generate(prompt, tmp_path)
+
+        err = capsys.readouterr().err
+        assert "Agent 'large' loads ~" in err
+        assert "(budget: 500)" in err
+        assert "'small'" not in err
+        small = tmp_path / ".amazonq" / "cli-agents" / "small.json"
+        assert json.loads(small.read_text())["resources"] == []
+
     def test_mixed_scoped_and_global_hooks(self, adapter, tmp_path):
         """Test mixing scoped and global hooks correctly."""
         prompt = UniversalPromptV3(
@@ -505,6 +505,81 @@ This is the command prompt."""
         assert len(settings_data["hooks"]["PreToolUse"]) == 1
         assert settings_data["hooks"]["PreToolUse"][0]["matcher"] == "Bash"
 
+    def test_generate_hooks_matcher_idempotent(self, adapter, tmp_path):
+        """Test that regenerating replaces generated hooks and keeps user hooks."""
+
+        def hooks_prompt(*commands):
+            return UniversalPromptV3(
+                schema_version="3.0.0",
+                metadata=PromptMetadata(title="Test", description="Test"),
+                content="# Test content",
+                hooks=[
+                    Hook(
+                        name=f"hook-{i}",
+                        event="PreToolUse",
+                        command=command,
+                        conditions={"matcher": "Bash"},
+                    )
+                    for i, command in enumerate(commands)
+                ],
+            )
+
+        settings_file = tmp_path / ".claude" / "settings.local.json"
+        settings_file.parent.mkdir()
+        user_entry = {
+            "matcher": "Bash",
+            "hooks": [{"type": "command", "command": "./my-check.sh"}],
+        }
+        settings_file.write_text(
+            json.dumps({"model": "opus", "hooks": {"PreToolUse": [user_entry]}})
+        )
+
+        adapter.generate(hooks_prompt("make lint", "make test"), tmp_path)
+        first = settings_file.read_text()
+        adapter.generate(hooks_prompt("make lint", "make test"), tmp_path)
+
+        assert settings_file.read_text() == first
+        settings_data = json.loads(first)
+        assert settings_data["model"] == "opus"
+        assert [
+            entry["hooks"][0]["command"]
+            for entry in settings_data["hooks"]["PreToolUse"]
+        ] == ["./my-check.sh", "make lint", "make test"]
+
+        # Hooks removed from the prompt are dropped from the file
+        adapter.generate(hooks_prompt("make lint"), tmp_path)
+
+        settings_data = json.loads(settings_file.read_text())
+        assert [
+            entry["hooks"][0]["command"]
+            for entry in settings_data["hooks"]["PreToolUse"]
+        ] == ["./my-check.sh", "make lint"]
+
+    def test_generate_drops_last_matcher_hook(self, adapter, tmp_path):
+        """Test that removing every matcher hook cleans up settings.local.json."""
+        hook = Hook(
+            name="lint",
+            event="PreToolUse",
+            command="make lint",
+            conditions={"matcher": "Bash"},
+        )
+        prompt = UniversalPromptV3(
+            schema_version="3.0.0",
+            metadata=PromptMetadata(title="Test", description="Test"),
+            content="# Test content",
+            hooks=[hook],
+        )
+        settings_file = tmp_path / ".claude" / "settings.local.json"
+        settings_file.parent.mkdir()
+        settings_file.write_text(json.dumps({"model": "opus"}))
+
+        adapter.generate(prompt, tmp_path)
+        assert "make lint" in settings_file.read_text()
+
+        adapter.generate(prompt.model_copy(update={"hooks": None}), tmp_path)
+
+        assert json.loads(settings_file.read_text()) == {"model": "opus"}
+
     def test_generate_with_hooks_no_matcher(self, adapter, tmp_path):
         """Test generating hooks without matcher to hooks.yaml."""
         prompt = UniversalPromptV3(
@@ -347,7 +347,7 @@ class TestClineUserLevelMCPConfiguration:
         assert strategy["config_format"] == "json"
 
     @patch("promptrek.adapters.cline.ClineAdapter.find_mcp_config_file")
-    @patch("promptrek.adapters.cline.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
     def test_generate_mcp_config_user_accepts(
@@ -385,7 +385,7 @@ class TestClineUserLevelMCPConfiguration:
         mock_write.assert_called_once()
 
     @patch("promptrek.adapters.cline.ClineAdapter.find_mcp_config_file")
-    @patch("promptrek.adapters.cline.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
     def test_generate_mcp_config_user_declines(
@@ -421,7 +421,7 @@ class TestClineUserLevelMCPConfiguration:
         mock_write.assert_not_called()
 
     @patch("promptrek.adapters.cline.ClineAdapter.find_mcp_config_file")
-    @patch("promptrek.adapters.cline.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
     def test_generate_mcp_config_merge_with_existing(
@@ -469,7 +469,7 @@ class TestClineUserLevelMCPConfiguration:
         assert "github" in written_config["mcpServers"]
 
     @patch("promptrek.adapters.cline.ClineAdapter.find_mcp_config_file")
-    @patch("promptrek.adapters.cline.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
     def test_generate_mcp_config_conflict_detection(
@@ -542,7 +542,7 @@ class TestClineUserLevelMCPConfiguration:
         assert len(created_files) == 0
 
     @patch("promptrek.adapters.cline.ClineAdapter._read_user_config")
-    @patch("promptrek.adapters.cline.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
     @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
     def test_generate_mcp_config_with_user_config(
@@ -738,7 +738,7 @@ def test_add_to_gitignore_already_exists(tmp_path):
 @patch("promptrek.adapters.cline.ClineAdapter._write_user_config")
 @patch("promptrek.adapters.cline.ClineAdapter._read_user_config")
 @patch("promptrek.adapters.cline.ClineAdapter._find_user_config")
-@patch("promptrek.adapters.cline.click.confirm")
+@patch("promptrek.utils.outputs.click.confirm")
 @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.read_existing_mcp_config")
 @patch("promptrek.adapters.mcp_mixin.MCPGenerationMixin.write_mcp_config_file")
 @patch("promptrek.adapters.cline.ClineAdapter.find_mcp_config_file")
@@ -434,3 +434,30 @@ class TestCursorAdapter(TestAdapterBase):
                 content="   ",  # Whitespace only
             )
         assert "content" in str(exc_info.value).lower()
+
+    def test_generate_v3_with_repository_scan(self, adapter, tmp_path):
+        """Test that a v3 repository scan generates Cursor ignore files."""
+        from promptrek.core.models import (
+            PromptMetadata,
+            RepositoryScanConfig,
+            UniversalPromptV3,
+        )
+
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "lib.py").write_text("code")
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+
+        prompt = UniversalPromptV3(
+            schema_version="3.0.0",
+            metadata=PromptMetadata(title="Test", description="Test description"),
+            content="# Guidelines",
+        )
+        files = adapter.generate(prompt, tmp_path)
+        assert tmp_path / ".cursorignore" not in files
+
+        prompt.repository_scan = RepositoryScanConfig()
+        files = adapter.generate(prompt, tmp_path)
+
+        assert tmp_path / ".cursorignore" in files
+        assert "/vendor/" in (tmp_path / ".cursorignore").read_text()
+        assert "*.png" in (tmp_path / ".cursorindexingignore").read_text()
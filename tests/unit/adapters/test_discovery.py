@@ -0,0 +1,149 @@
+"""Tests for entry point adapter discovery and the adapter index."""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from promptrek.adapters import discovery
+from promptrek.adapters.registry import AdapterCapability, AdapterRegistry
+
+EXTERNAL_ADAPTER = """
+from promptrek.adapters.base import EditorAdapter
+from promptrek.adapters.registry import AdapterCapability
+
+
+class ExternalAdapter(EditorAdapter):
+    _description = "External editor"
+    _file_patterns = [".external/rules.md"]
+    _capabilities = [
+        AdapterCapability.GENERATES_PROJECT_FILES,
+        AdapterCapability.SUPPORTS_VARIABLES,
+    ]
+
+    def __init__(self):
+        super().__init__("external", self._description, self._file_patterns)
+
+    def generate(self, prompt, output_dir, dry_run=False, verbose=False,
+                 variables=None, headless=False):
+        return []
+
+    def validate(self, prompt):
+        return []
+"""
+
+
+@pytest.fixture
+def external_adapter(tmp_path, monkeypatch):
+    """Install an adapter module and an entry point that references it."""
+    module_dir = tmp_path / "site"
+    module_dir.mkdir()
+    (module_dir / "external_adapter.py").write_text(textwrap.dedent(EXTERNAL_ADAPTER))
+    monkeypatch.syspath_prepend(str(module_dir))
+    monkeypatch.setattr(
+        discovery,
+        "entry_point_references",
+        lambda: [
+            ("external", "external_adapter:ExternalAdapter"),
+            ("broken", "missing_module:Adapter"),
+        ],
+    )
+    yield tmp_path / "cache" / "adapter-index.json"
+    sys.modules.pop("external_adapter", None)
+
+
+class TestDiscoverAdapters:
+    """Tests for AdapterRegistry.discover_adapters()."""
+
+    def test_registers_entry_point_adapters(self, external_adapter, capsys):
+        """Test that entry point adapters are registered and broken ones skipped."""
+        registry = AdapterRegistry()
+        registry.discover_adapters(external_adapter)
+
+        assert registry.list_adapters() == ["external"]
+        assert registry.has_capability("external", AdapterCapability.SUPPORTS_VARIABLES)
+        assert registry.get_descriptor("external").headless is True
+        assert "missing_module" in capsys.readouterr().err
+        assert registry.get("external").name == "external"
+
+    def test_cached_index_imports_nothing(self, external_adapter):
+        """Test that a fresh index lists adapters without importing them."""
+        AdapterRegistry().discover_adapters(external_adapter)
+        sys.modules.pop("external_adapter")
+
+        registry = AdapterRegistry()
+        registry.discover_adapters(external_adapter)
+        info = registry.get_adapter_info("external")
+
+        assert info["description"] == "External editor"
+        assert info["file_patterns"] == [".external/rules.md"]
+        assert "external_adapter" not in sys.modules
+
+        registry.get("external")
+        assert "external_adapter" in sys.modules
+
+    def test_index_rebuilt_when_environment_changes(
+        self, external_adapter, monkeypatch
+    ):
+        """Test that a changed fingerprint invalidates the index."""
+        AdapterRegistry().discover_adapters(external_adapter)
+        index = json.loads(external_adapter.read_text())
+        index["adapters"]["external"]["description"] = "Stale"
+        external_adapter.write_text(json.dumps(index))
+
+        registry = AdapterRegistry()
+        registry.discover_adapters(external_adapter)
+        assert registry.get_adapter_info("external")["description"] == "Stale"
+
+        monkeypatch.setattr(discovery, "environment_fingerprint", lambda b: "new")
+        registry = AdapterRegistry()
+        registry.discover_adapters(external_adapter)
+        assert registry.get_adapter_info("external")["description"] == (
+            "External editor"
+        )
+
+    def test_builtin_names_take_precedence(self, external_adapter):
+        """Test that entry points cannot replace a registered adapter."""
+        registry = AdapterRegistry()
+        registry.register_lazy("external", "promptrek.adapters.kiro:KiroAdapter")
+        registry.discover_adapters(external_adapter)
+
+        assert type(registry.get("external")).__name__ == "KiroAdapter"
+
+    def test_discovery_deferred_to_first_use(self, external_adapter):
+        """Test that discover_on_use() only reads the index when queried."""
+        registry = AdapterRegistry()
+        registry.register_lazy("kiro", "promptrek.adapters.kiro:KiroAdapter")
+        registry.discover_on_use(external_adapter)
+
+        assert registry.get("kiro").name == "kiro"
+        assert not external_adapter.exists()
+
+        assert registry.get("external").name == "external"
+        assert external_adapter.exists()
+        assert sorted(registry.list_adapters()) == ["external", "kiro"]
+
+
+def test_import_does_not_touch_index(tmp_path):
+    """Test that importing promptrek neither reads nor writes the index."""
+    env = dict(os.environ, PROMPTREK_CACHE_DIR=str(tmp_path))
+    code = (
+        "import promptrek.adapters, pathlib, sys;"
+        "index = pathlib.Path(sys.argv[1]) / 'adapter-index.json';"
+        "assert not index.exists();"
+        "promptrek.adapters.registry.list_adapters();"
+        "assert index.exists()"
+    )
+
+    subprocess.run([sys.executable, "-c", code, str(tmp_path)], env=env, check=True)
+
+
+def test_builtin_adapters_load_lazily():
+    """Test that the built-in adapters are registered by reference."""
+    from promptrek.adapters import registry
+
+    assert registry.get_adapter_info("kiro")["file_patterns"]
+    assert registry.get("kiro").name == "kiro"
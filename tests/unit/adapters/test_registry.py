@@ -6,7 +6,11 @@ from typing import Dict, List, Optional, Union
 import pytest
 
 from promptrek.adapters.base import EditorAdapter
-from promptrek.adapters.registry import AdapterCapability, AdapterRegistry
+from promptrek.adapters.registry import (
+    AdapterCapability,
+    AdapterDescriptor,
+    AdapterRegistry,
+)
 from promptrek.core.exceptions import AdapterNotFoundError, ValidationError
 from promptrek.core.models import UniversalPrompt, UniversalPromptV2, UniversalPromptV3
 
@@ -137,8 +141,79 @@ class TestAdapterRegistry:
         assert "global" in global_adapters
         assert "project" not in global_adapters
 
-    def test_discover_adapters(self):
-        """Test discover_adapters method (currently a pass)."""
+    def test_register_lazy(self):
+        """Test that lazily registered adapters are imported on first use."""
         registry = AdapterRegistry()
-        # discover_adapters currently does nothing, just test it doesn't error
-        registry.discover_adapters(Path("/fake/path"))
+        registry.register_lazy(
+            "kiro",
+            "promptrek.adapters.kiro:KiroAdapter",
+            [AdapterCapability.GENERATES_PROJECT_FILES],
+        )
+
+        assert registry.list_adapters() == ["kiro"]
+        assert "kiro" in registry.get_project_file_adapters()
+        assert registry.get("kiro") is registry.get("kiro")
+        assert registry.get_descriptor("kiro").sync is True
+
+
+class TestAdapterDescriptor:
+    """Tests for AdapterDescriptor."""
+
+    def test_declared_descriptor(self):
+        """Test that a declared descriptor is returned as registered."""
+        registry = AdapterRegistry()
+        descriptor = AdapterDescriptor(headless=True, merged=True, mcp_scope="user")
+
+        registry.register_class("mock", MockAdapter, descriptor=descriptor)
+
+        assert registry.get_descriptor("mock") is descriptor
+        assert registry.get_adapter_info("mock")["features"]["mcp_scope"] == "user"
+
+    @pytest.mark.parametrize(
+        "kwargs, strategy",
+        [
+            ({}, "last"),
+            ({"merged": True}, "merged"),
+            ({"merged": True, "multiple": True}, "multiple"),
+        ],
+    )
+    def test_multi_file_strategy(self, kwargs, strategy):
+        """Test the precomputed strategy for several prompt files."""
+        assert AdapterDescriptor(**kwargs).multi_file_strategy == strategy
+
+    def test_derived_from_class(self):
+        """Test the descriptor of an adapter registered without one."""
+
+        class MergingAdapter(MockAdapter):
+            def generate_merged(self, *args, **kwargs):
+                return []
+
+        registry = AdapterRegistry()
+        registry.register(MergingAdapter())
+
+        descriptor = registry.get_descriptor("mock")
+        assert descriptor.headless is True
+        assert descriptor.merged is True
+        assert descriptor.multiple is False
+        assert descriptor.output_paths == ()
+
+    def test_invalid_mcp_scope(self):
+        """Test that unknown MCP scopes are rejected."""
+        with pytest.raises(ValueError, match="Invalid MCP scope"):
+            AdapterDescriptor(mcp_scope="global")
+
+    def test_unknown_adapter(self):
+        """Test that unknown adapters have no descriptor."""
+        with pytest.raises(AdapterNotFoundError):
+            AdapterRegistry().get_descriptor("missing")
+
+    def test_builtin_adapters_declare_descriptors(self):
+        """Test the descriptors declared for the built-in adapters."""
+        from promptrek.adapters import registry
+
+        assert registry.get_descriptor("claude").multi_file_strategy == "multiple"
+        assert registry.get_descriptor("cursor").multi_file_strategy == "merged"
+        assert registry.get_descriptor("cline").mcp_scope == "user"
+        assert all(
+            registry.get_descriptor(name).headless for name in registry.list_adapters()
+        )
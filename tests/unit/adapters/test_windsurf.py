@@ -8,7 +8,12 @@ from unittest.mock import mock_open, patch
 import pytest
 
 from promptrek.adapters.windsurf import WindsurfAdapter
-from promptrek.core.models import PromptMetadata, UniversalPrompt
+from promptrek.core.models import (
+    DocumentConfig,
+    PromptMetadata,
+    UniversalPrompt,
+    UniversalPromptV3,
+)
 
 from .base_test import TestAdapterBase
 
@@ -88,3 +93,35 @@ class TestWindsurfAdapter(TestAdapterBase):
         file_names = [f.name for f in files]
         assert "general.md" in file_names
         assert "code-style.md" in file_names
+
+    def test_large_document_split_and_synced(self, adapter, tmp_path):
+        """Test that a document over 6,000 characters is split and synced back."""
+        sections = [
+            f"## Section {n}\n\n" + f"- Guideline {n} for this project\n" * 40
+            for n in range(8)
+        ]
+        content = "# Testing\n\n" + "\n".join(sections).strip("\n")
+        prompt = UniversalPromptV3(
+            schema_version="3.1.0",
+            metadata=PromptMetadata(
+                title="Large", description="Large rules", version="1.0.0"
+            ),
+            content="# General\n\nShort rules",
+            documents=[DocumentConfig(name="testing", content=content)],
+        )
+
+        files = adapter.generate(prompt, tmp_path)
+
+        rules_dir = tmp_path / ".windsurf" / "rules"
+        parts = sorted(rules_dir.glob("testing-part-*.md"))
+        assert len(parts) > 1
+        assert not (rules_dir / "testing.md").exists()
+        assert set(parts) <= set(files)
+        for part in parts:
+            text = part.read_text()
+            assert len(text) <= 6000
+            assert text.startswith("## Section") or text.startswith("# Testing")
+
+        synced = adapter.parse_files(tmp_path)
+        assert [doc.name for doc in synced.documents] == ["testing"]
+        assert synced.documents[0].content == content
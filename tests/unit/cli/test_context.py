@@ -0,0 +1,136 @@
+"""Tests for the context-size report and budget."""
+
+import pytest
+from click.testing import CliRunner
+
+from promptrek.cli.commands.context import (
+    FAIL,
+    ContextFile,
+    _limited_by_frontmatter,
+    check_context_budget,
+    measure_context,
+)
+from promptrek.cli.main import cli
+from promptrek.core.exceptions import CLIError
+
+UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Context
+  description: Context project
+content: |
+  # Guidelines
+
+  Keep functions small and document every public module.
+documents:
+  - name: testing
+    content: Write a test for every bug fix.
+    file_globs: "**/*_test.py"
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with a UPF file."""
+    (tmp_path / "project.promptrek.yaml").write_text(UPF_CONTENT)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestMeasureContext:
+    """Test which generated files are counted and how."""
+
+    def test_always_loaded_files(self, tmp_path):
+        """Test declared context paths, frontmatter and non-context files."""
+        rules = tmp_path / ".cursor" / "rules"
+        files = measure_context(
+            {
+                "cursor": {
+                    rules / "index.mdc": "---\nalwaysApply: true\n---\nMain rules",
+                    rules / "tests.mdc": "---\nalwaysApply: false\n---\nTest rules",
+                    tmp_path / ".cursor" / "mcp-servers.json": "{}",
+                },
+                "claude": {
+                    tmp_path / ".claude" / "CLAUDE.md": "Main",
+                    tmp_path / ".claude" / "agents" / "a.md": "Agent",
+                },
+            },
+            tmp_path,
+        )
+
+        assert [(f.editor, f.path, f.always_loaded) for f in files] == [
+            ("claude", ".claude/CLAUDE.md", True),
+            ("claude", ".claude/agents/a.md", False),
+            ("cursor", ".cursor/rules/index.mdc", True),
+            ("cursor", ".cursor/rules/tests.mdc", False),
+        ]
+
+    @pytest.mark.parametrize(
+        "content,limited",
+        [
+            ("---\r\ntrigger: manual\r\n---\r\nRules", True),
+            ("---\nalwaysApply: false\n---", True),
+            ("---\ninclusion: fileMatch\n---\n", True),
+            ("---\n---\nRules", False),
+            ("---\nalwaysApply: true\n---\nRules", False),
+            ("No frontmatter", False),
+        ],
+    )
+    def test_frontmatter_forms(self, content, limited):
+        """Test that frontmatter is read by the shared markdown parser."""
+        assert _limited_by_frontmatter(content) is limited
+
+    def test_budget(self, capsys):
+        """Test that always-loaded files add up and others count alone."""
+        files = [
+            ContextFile("claude", "CLAUDE.md", 60, True),
+            ContextFile("claude", "rules.md", 50, True),
+            ContextFile("claude", "agent.md", 80, False),
+        ]
+
+        assert check_context_budget(files, 200) == []
+        assert len(check_context_budget(files, 100)) == 1
+        assert "~110 tokens" in capsys.readouterr().err
+        with pytest.raises(CLIError, match="agent.md is ~80 tokens"):
+            check_context_budget(files, 70, FAIL)
+
+
+class TestGenerateContextOptions:
+    """Test the generate --context-report and --max-context-tokens options."""
+
+    def test_report(self, project):
+        """Test the per-editor and per-file report."""
+        result = CliRunner().invoke(
+            cli, ["generate", "-e", "cursor", "--context-report"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "cursor: ~" in result.output
+        assert "● .cursor/rules/index.mdc: ~" in result.output
+        assert "  .cursor/rules/testing.mdc: ~" in result.output
+
+    def test_failing_budget_writes_nothing(self, project):
+        """Test that a failing budget leaves the tree untouched."""
+        result = CliRunner().invoke(
+            cli,
+            [
+                "generate",
+                "-e",
+                "cursor",
+                "--max-context-tokens",
+                "5",
+                "--context-budget",
+                "fail",
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "exceeds the budget of 5 tokens" in result.output
+        assert not (project / ".cursor").exists()
+
+    def test_rejects_dry_run(self, project):
+        """Test that the options need generated content."""
+        result = CliRunner().invoke(
+            cli, ["generate", "-e", "cursor", "--dry-run", "--context-report"]
+        )
+        assert result.exit_code == 1
+        assert "cannot be combined" in result.output
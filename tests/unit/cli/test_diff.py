@@ -0,0 +1,138 @@
+"""Tests for diff previews (generate --diff)."""
+
+import pytest
+from click.testing import CliRunner
+
+from promptrek.cli.commands.diff import ADDED, CHANGED, UNCHANGED, compare_output
+from promptrek.cli.main import cli
+from promptrek.utils.output_plan import OutputPlan
+from promptrek.utils.outputs import (
+    update_generated_file,
+    virtual_output,
+    write_generated_file,
+)
+
+UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Diff
+  description: Diff project
+content: |
+  # Guidelines
+
+  Use {{{ STYLE }}} style.
+variables:
+  STYLE: functional
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with a UPF file."""
+    (tmp_path / "project.promptrek.yaml").write_text(UPF_CONTENT)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def planned_write(write):
+    """Plan the writes of a function and return the single planned write."""
+    plan = OutputPlan()
+    with virtual_output() as output:
+        write()
+    plan.add("editor", output)
+    (planned,) = plan.writes.values()
+    return planned
+
+
+class TestCompareOutput:
+    """Test comparing planned files with the files on disk."""
+
+    def test_added(self, project):
+        """Test that missing files are reported as added."""
+        target = project / "new.md"
+        status, lines = compare_output(
+            planned_write(lambda: write_generated_file(target, "a\n"))
+        )
+
+        assert status == ADDED
+        assert lines[0] == "--- /dev/null\n"
+        assert "+a\n" in lines
+
+    def test_same_size_different_content(self, project):
+        """Test that a digest mismatch is found for files of equal size."""
+        target = project / "rules.md"
+        target.write_text("abc\n")
+        status, lines = compare_output(
+            planned_write(lambda: write_generated_file(target, "abd\n"))
+        )
+
+        assert status == CHANGED
+        assert lines[:2] == ["--- a/rules.md\n", "+++ b/rules.md\n"]
+        assert "-abc\n" in lines and "+abd\n" in lines
+
+    def test_unchanged(self, project):
+        """Test that identical files produce no diff."""
+        target = project / "rules.md"
+        target.write_text("same\n")
+
+        assert compare_output(
+            planned_write(lambda: write_generated_file(target, "same\n"))
+        ) == (UNCHANGED, [])
+
+    def test_merge_against_current_file(self, project):
+        """Test that merged files are diffed after merging the current file."""
+        target = project / "settings.json"
+        target.write_text("user\n")
+        planned = planned_write(
+            lambda: update_generated_file(target, lambda existing: existing + "gen\n")
+        )
+        target.write_text("user edited\n")
+
+        status, lines = compare_output(planned)
+
+        assert status == CHANGED
+        assert "+gen\n" in lines
+        assert " user edited\n" in lines
+
+
+class TestGenerateDiff:
+    """Test the generate --diff option."""
+
+    def test_diff_writes_nothing(self, project):
+        """Test that --diff reports changes without writing files."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["generate", "--editor", "claude"])
+        assert result.exit_code == 0, result.output
+        claude_md = project / ".claude" / "CLAUDE.md"
+        before = claude_md.read_text()
+
+        result = runner.invoke(
+            cli, ["generate", "--editor", "claude", "--diff", "-V", "STYLE=terse"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "-Use functional style." in result.output
+        assert "+Use terse style." in result.output
+        assert "0 added, 1 changed, 0 unchanged" in result.output
+        assert claude_md.read_text() == before
+
+    def test_diff_rejects_dry_run(self, project):
+        """Test that --diff and --dry-run cannot be combined."""
+        result = CliRunner().invoke(
+            cli, ["generate", "--editor", "claude", "--diff", "--dry-run"]
+        )
+
+        assert result.exit_code == 1
+        assert "--diff cannot be combined" in result.output
+
+    def test_diff_writes_no_scan_cache(self, project):
+        """Test that --diff does not leave the repository scan cache behind."""
+        (project / "project.promptrek.yaml").write_text(
+            UPF_CONTENT + "repository_scan: {}\n"
+        )
+
+        result = CliRunner().invoke(cli, ["generate", "--editor", "cursor", "--diff"])
+
+        assert result.exit_code == 0, result.output
+        assert ".cursorignore" in result.output
+        assert not (project / ".promptrek").exists()
+        assert not (project / ".cursorignore").exists()
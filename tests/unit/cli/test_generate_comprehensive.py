@@ -7,11 +7,11 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from click.testing import CliRunner
 
-from promptrek.adapters.registry import AdapterCapability
+from promptrek.adapters.registry import AdapterCapability, AdapterDescriptor
 from promptrek.cli.commands.generate import (
-    _adapter_supports_headless,
     _generate_for_editor,
     _generate_for_editor_multiple,
+    _output_dependencies,
     _parse_and_validate_file,
     generate_command,
 )
@@ -20,54 +20,6 @@ from promptrek.core.exceptions import AdapterNotFoundError, CLIError, UPFParsing
 from promptrek.core.models import Instructions, PromptMetadata, UniversalPrompt
 
 
-class TestAdapterSupportsHeadless:
-    """Test _adapter_supports_headless helper function."""
-
-    def test_supports_headless_with_parameter(self):
-        """Test adapter with headless parameter."""
-
-        class MockAdapter:
-            def generate(
-                self, prompt, output_dir, dry_run, verbose, variables, headless=False
-            ):
-                pass
-
-        adapter = MockAdapter()
-        assert _adapter_supports_headless(adapter, "generate") is True
-
-    def test_supports_headless_without_parameter(self):
-        """Test adapter without headless parameter."""
-
-        class MockAdapter:
-            def generate(self, prompt, output_dir, dry_run, verbose, variables):
-                pass
-
-        adapter = MockAdapter()
-        assert _adapter_supports_headless(adapter, "generate") is False
-
-    def test_supports_headless_no_method(self):
-        """Test adapter without the method."""
-
-        class MockAdapter:
-            pass
-
-        adapter = MockAdapter()
-        assert _adapter_supports_headless(adapter, "generate") is False
-
-    def test_supports_headless_signature_error(self):
-        """Test handling of signature inspection errors."""
-
-        class MockAdapter:
-            @property
-            def generate(self):
-                return None
-
-        adapter = MockAdapter()
-        # Should return False when signature inspection fails
-        result = _adapter_supports_headless(adapter, "generate")
-        assert result is False
-
-
 class TestParseAndValidateFile:
     """Test _parse_and_validate_file function."""
 
@@ -135,44 +87,32 @@ class TestGenerateForEditor:
     def test_generate_basic(self, mock_registry, sample_prompt):
         """Test basic generation."""
         mock_adapter = Mock()
-        mock_adapter.generate = Mock()
         mock_registry.get.return_value = mock_adapter
+        mock_registry.get_descriptor.return_value = AdapterDescriptor(headless=True)
 
         output_dir = Path("/tmp/output")
         _generate_for_editor(
             sample_prompt, "copilot", output_dir, False, False, None, None, False
         )
 
-        mock_adapter.generate.assert_called_once()
+        mock_adapter.generate.assert_called_once_with(
+            sample_prompt, output_dir, False, False, None, headless=False
+        )
 
     @patch("promptrek.cli.commands.generate.registry")
     def test_generate_with_headless_support(self, mock_registry, sample_prompt):
         """Test generation with headless mode support."""
-
-        class MockAdapter:
-            def generate(
-                self, prompt, output_dir, dry_run, verbose, variables, headless=False
-            ):
-                return []
-
-        mock_adapter = MockAdapter()
-        mock_adapter.generate = Mock(return_value=[])
+        mock_adapter = Mock()
         mock_registry.get.return_value = mock_adapter
+        mock_registry.get_descriptor.return_value = AdapterDescriptor(headless=True)
 
         output_dir = Path("/tmp/output")
         _generate_for_editor(
             sample_prompt, "copilot", output_dir, False, False, None, None, True
         )
 
-        # Should call with headless=True
-        assert mock_adapter.generate.called
-        # Check either positional or keyword arguments
-        call_args, call_kwargs = mock_adapter.generate.call_args
-        # headless is typically the 6th positional or a keyword arg
-        if "headless" in call_kwargs:
-            assert call_kwargs["headless"] is True
-        elif len(call_args) > 5:
-            assert call_args[5] is True  # headless is 6th param (0-indexed)
+        _, call_kwargs = mock_adapter.generate.call_args
+        assert call_kwargs["headless"] is True
 
     @patch("promptrek.cli.commands.generate.registry")
     @patch("click.echo")
@@ -180,22 +120,18 @@ class TestGenerateForEditor:
         self, mock_echo, mock_registry, sample_prompt
     ):
         """Test generation with headless mode when adapter doesn't support it."""
-
-        class MockAdapter:
-            def generate(self, prompt, output_dir, dry_run, verbose, variables):
-                pass
-
-        mock_adapter = MockAdapter()
-        mock_adapter.generate = Mock()
+        mock_adapter = Mock()
         mock_registry.get.return_value = mock_adapter
+        mock_registry.get_descriptor.return_value = AdapterDescriptor()
 
         output_dir = Path("/tmp/output")
         _generate_for_editor(
             sample_prompt, "copilot", output_dir, False, False, None, None, True
         )
 
-        # Should warn about unsupported headless mode
-        mock_echo.assert_called()
+        # Should not pass headless and warn about unsupported headless mode
+        _, call_kwargs = mock_adapter.generate.call_args
+        assert "headless" not in call_kwargs
         warning_calls = [
             call for call in mock_echo.call_args_list if "Warning" in str(call)
         ]
@@ -219,8 +155,8 @@ class TestGenerateForEditorMultiple:
     def test_generate_single_file(self, mock_registry, sample_prompt):
         """Test generation with single file."""
         mock_adapter = Mock()
-        mock_adapter.generate = Mock()
         mock_registry.get.return_value = mock_adapter
+        mock_registry.get_descriptor.return_value = AdapterDescriptor(merged=True)
 
         prompt_files = [(sample_prompt, Path("test.yaml"))]
         _generate_for_editor_multiple(
@@ -228,53 +164,55 @@ class TestGenerateForEditorMultiple:
         )
 
         mock_adapter.generate.assert_called_once()
+        mock_adapter.generate_merged.assert_not_called()
 
     @patch("promptrek.cli.commands.generate.registry")
     def test_generate_multiple_with_merge_support(self, mock_registry, sample_prompt):
         """Test generation with multiple files and merge support."""
         mock_adapter = Mock()
-        mock_adapter.generate_merged = Mock(return_value=[])
-        mock_adapter.generate_multiple = None  # Not present
         mock_registry.get.return_value = mock_adapter
-        mock_registry.has_capability.return_value = False  # No multiple file capability
+        mock_registry.get_descriptor.return_value = AdapterDescriptor(
+            headless=True, merged=True
+        )
 
         prompt_files = [
             (sample_prompt, Path("test1.yaml")),
             (sample_prompt, Path("test2.yaml")),
         ]
         _generate_for_editor_multiple(
-            prompt_files, "copilot", Path("/tmp"), False, False, None, False
+            prompt_files, "copilot", Path("/tmp"), False, False, None, True
         )
 
         mock_adapter.generate_merged.assert_called_once()
+        assert mock_adapter.generate_merged.call_args.kwargs["headless"] is True
 
     @patch("promptrek.cli.commands.generate.registry")
     def test_generate_multiple_with_capability(self, mock_registry, sample_prompt):
-        """Test generation with multiple files and multiple file capability."""
+        """Test generation with multiple files and multiple file support."""
         mock_adapter = Mock()
-        mock_adapter.generate_multiple = Mock()
         mock_registry.get.return_value = mock_adapter
-        mock_registry.has_capability.return_value = True
+        mock_registry.get_descriptor.return_value = AdapterDescriptor(
+            merged=True, multiple=True
+        )
 
         prompt_files = [
             (sample_prompt, Path("test1.yaml")),
             (sample_prompt, Path("test2.yaml")),
         ]
         _generate_for_editor_multiple(
-            prompt_files, "copilot", Path("/tmp"), False, False, None, False
+            prompt_files, "claude", Path("/tmp"), False, False, None, False
         )
 
         mock_adapter.generate_multiple.assert_called_once()
+        mock_adapter.generate_merged.assert_not_called()
 
     @patch("promptrek.cli.commands.generate.registry")
     @patch("click.echo")
     def test_generate_multiple_fallback(self, mock_echo, mock_registry, sample_prompt):
-        """Test generation fallback when merge not supported."""
+        """Test generation from the last file when merging is not supported."""
         mock_adapter = Mock()
-        mock_adapter.generate = Mock()
-        mock_adapter.generate_merged = Mock(side_effect=NotImplementedError)
         mock_registry.get.return_value = mock_adapter
-        mock_registry.has_capability.return_value = False
+        mock_registry.get_descriptor.return_value = AdapterDescriptor()
 
         prompt_files = [
             (sample_prompt, Path("test1.yaml")),
@@ -284,8 +222,9 @@ class TestGenerateForEditorMultiple:
             prompt_files, "copilot", Path("/tmp"), False, False, None, False
         )
 
-        # Should fall back to generate
+        # Should generate from the last file without trying to merge
         mock_adapter.generate.assert_called_once()
+        mock_adapter.generate_merged.assert_not_called()
         # Should warn about fallback
         warning_calls = [
             call
@@ -990,3 +929,66 @@ class TestGenerateCLIIntegration:
 
         # Should complete without error
         assert result.exit_code == 0
+
+
+class TestOutputDependencies:
+    """Test per-output variable dependency detection."""
+
+    def test_placeholder_dependency_requires_value_in_content(self):
+        """Test that placeholders count only when their value reaches the output."""
+        source = "Owner {{{ OWNER }}} on {{{ CURRENT_DATE }}}"
+        variables = {"OWNER": "alice", "CURRENT_DATE": "2025-01-01", "YEAR": "2025"}
+
+        assert _output_dependencies(source, "Owner alice", variables) == ["OWNER"]
+        assert _output_dependencies(source, "Owner alice on 2025-01-01", variables) == [
+            "CURRENT_DATE",
+            "OWNER",
+        ]
+
+    def test_bare_reference_is_always_dependency(self):
+        """Test that names used outside placeholders (e.g. conditions) count."""
+        source = "if: \"EDITOR == 'claude'\""
+
+        assert _output_dependencies(source, "text", {"EDITOR": "claude"}) == ["EDITOR"]
+
+    def test_undefined_placeholder_is_dependency(self):
+        """Test that undefined placeholders are tracked for later definition."""
+        assert _output_dependencies("{{{ MISSING }}}", "{{{ MISSING }}}", {}) == [
+            "MISSING"
+        ]
+
+    def test_generate_records_outputs_in_metadata(self, tmp_path, monkeypatch):
+        """Test that generation saves output records with dependencies."""
+        import yaml
+
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "project.promptrek.yaml"
+        source.write_text(
+            "schema_version: 3.0.0\n"
+            "metadata:\n  title: T\n  description: D\n"
+            "content: 'Owner {{{ OWNER }}}'\n"
+        )
+        ctx = Mock()
+        ctx.obj = {"verbose": False}
+
+        generate_command(
+            ctx,
+            files=(source,),
+            directory=None,
+            recursive=False,
+            editor="claude",
+            output=tmp_path,
+            dry_run=False,
+            all_editors=False,
+            variables={"OWNER": "alice"},
+        )
+
+        metadata = yaml.safe_load(
+            (tmp_path / ".promptrek" / "last-generation.yaml").read_text()
+        )
+        records = metadata["outputs"]
+        assert records
+        assert all(r["editor"] == "claude" for r in records.values())
+        assert any("OWNER" in r["variables"] for r in records.values())
+        assert "OWNER" in metadata["variable_digests"]
+        assert "alice" not in str(metadata["variable_digests"])
@@ -0,0 +1,214 @@
+"""Tests for matrix generation (generate --matrix)."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from promptrek.cli.commands.matrix import load_matrix
+from promptrek.cli.main import cli
+from promptrek.core.exceptions import CLIError
+
+UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Matrix
+  description: Matrix project
+content: |
+  # Guidelines
+
+  Team: {{{ TEAM }}}
+  Environment: {{{ ENVIRONMENT }}}
+variables:
+  TEAM: default
+  ENVIRONMENT: development
+"""
+
+MATRIX_CONTENT = """variants:
+  - name: team-a
+    output: out/team-a
+    variables:
+      TEAM: a
+  - name: team-b
+    output: out/team-b
+    variables:
+      TEAM: b
+      ENVIRONMENT: production
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project with a UPF file and a matrix file."""
+    (tmp_path / "project.promptrek.yaml").write_text(UPF_CONTENT)
+    (tmp_path / "matrix.yaml").write_text(MATRIX_CONTENT)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestLoadMatrix:
+    """Test matrix file loading."""
+
+    def test_resolves_outputs_relative_to_matrix_file(self, project):
+        """Test that variants are loaded with absolute output directories."""
+        variants = load_matrix(project / "matrix.yaml")
+
+        assert [v.name for v in variants] == ["team-a", "team-b"]
+        assert variants[0].output == (project / "out" / "team-a").resolve()
+        assert variants[1].variables == {"TEAM": "b", "ENVIRONMENT": "production"}
+
+    def test_missing_output(self, tmp_path):
+        """Test that every variant needs an output directory."""
+        matrix = tmp_path / "matrix.yaml"
+        matrix.write_text("variants:\n  - name: a\n")
+
+        with pytest.raises(CLIError, match="must define an 'output'"):
+            load_matrix(matrix)
+
+    def test_duplicate_outputs(self, tmp_path):
+        """Test that variants cannot share an output directory."""
+        matrix = tmp_path / "matrix.yaml"
+        matrix.write_text("- output: out\n- output: ./out\n")
+
+        with pytest.raises(CLIError, match="share the output directory"):
+            load_matrix(matrix)
+
+
+class TestMatrixGenerate:
+    """Test the generate --matrix command."""
+
+    def test_renders_every_variant(self, project):
+        """Test that each variant gets its own layered variables."""
+        result = CliRunner().invoke(
+            cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude"]
+        )
+
+        assert result.exit_code == 0, result.output
+        team_a = (project / "out" / "team-a" / ".claude" / "CLAUDE.md").read_text()
+        team_b = (project / "out" / "team-b" / ".claude" / "CLAUDE.md").read_text()
+        assert "Team: a" in team_a and "Environment: development" in team_a
+        assert "Team: b" in team_b and "Environment: production" in team_b
+
+    def test_variant_variables_override_cli(self, project):
+        """Test precedence of variant variables over -V overrides."""
+        result = CliRunner().invoke(
+            cli,
+            [
+                "generate",
+                "--matrix",
+                "matrix.yaml",
+                "-e",
+                "claude",
+                "-V",
+                "TEAM=cli",
+                "-V",
+                "ENVIRONMENT=staging",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        team_a = (project / "out" / "team-a" / ".claude" / "CLAUDE.md").read_text()
+        assert "Team: a" in team_a and "Environment: staging" in team_a
+
+    def test_parses_once(self, project):
+        """Test that the prompt is parsed a single time for all variants."""
+        from promptrek.core.parser import UPFParser
+
+        with patch.object(
+            UPFParser, "parse_file", autospec=True, side_effect=UPFParser.parse_file
+        ) as parse_file:
+            result = CliRunner().invoke(
+                cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert parse_file.call_count == 1
+
+    def test_placeholder_index_built_once(self, project):
+        """Test that variants share the placeholder index of a v1 prompt."""
+        from promptrek.core.models import UniversalPrompt
+        from promptrek.utils.variables import VariableSubstitution
+
+        (project / "project.promptrek.yaml").write_text(
+            'schema_version: "1.0.0"\n'
+            "metadata:\n  title: Matrix\n  description: Matrix project\n"
+            '  version: "1.0.0"\n  author: test@example.com\n'
+            '  created: "2024-01-01"\n  updated: "2024-01-01"\n'
+            "targets: [claude]\n"
+            "instructions:\n  general:\n    - Team {{{ TEAM }}}\n"
+        )
+
+        with patch.object(
+            VariableSubstitution,
+            "_build_placeholder_index",
+            autospec=True,
+            side_effect=VariableSubstitution._build_placeholder_index,
+        ) as build:
+            result = CliRunner().invoke(
+                cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude"]
+            )
+
+        assert result.exit_code == 0, result.output
+        roots = [
+            c for c in build.call_args_list if isinstance(c.args[1], UniversalPrompt)
+        ]
+        assert len(roots) == 1
+        assert "Team b" in (project / "out/team-b/.claude/CLAUDE.md").read_text()
+
+    def test_dry_run_writes_nothing(self, project):
+        """Test that dry-run lists files without writing them."""
+        result = CliRunner().invoke(
+            cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude", "--dry-run"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "CLAUDE.md" in result.output
+        assert not (project / "out").exists()
+
+    def test_unchanged_files_not_rewritten(self, project):
+        """Test that a second run leaves identical files untouched."""
+        args = ["generate", "--matrix", "matrix.yaml", "-e", "claude"]
+        CliRunner().invoke(cli, args)
+
+        result = CliRunner().invoke(cli, args)
+
+        assert "0 file(s) written" in result.output
+
+    def test_merged_files_merge_with_disk_when_written(self, project):
+        """Test that merged files are merged at write time, under the lock."""
+        from promptrek.utils.output_plan import OutputPlan
+
+        (project / "project.promptrek.yaml").write_text(
+            UPF_CONTENT
+            + "hooks:\n  - name: lint\n    event: PreToolUse\n"
+            + "    command: make lint\n    conditions:\n      matcher: Bash\n"
+        )
+        settings = project / "out" / "team-a" / ".claude" / "settings.local.json"
+        settings.parent.mkdir(parents=True)
+        settings.write_text(json.dumps({"model": "opus"}))
+        execute = OutputPlan.execute
+
+        def edit_then_execute(plan, *args, **kwargs):
+            # The user edits the file after the variants were rendered
+            if settings in plan.writes:
+                settings.write_text(json.dumps({"model": "opus", "theme": "dark"}))
+            return execute(plan, *args, **kwargs)
+
+        with patch.object(OutputPlan, "execute", edit_then_execute):
+            result = CliRunner().invoke(
+                cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude"]
+            )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(settings.read_text())
+        assert data["theme"] == "dark"
+        assert "make lint" in json.dumps(data)
+
+    def test_rejects_output_option(self, project):
+        """Test that --output cannot be combined with --matrix."""
+        result = CliRunner().invoke(
+            cli, ["generate", "--matrix", "matrix.yaml", "-e", "claude", "-o", "x"]
+        )
+
+        assert result.exit_code == 1
+        assert "--matrix cannot be combined" in result.output
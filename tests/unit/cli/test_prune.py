@@ -0,0 +1,188 @@
+"""Tests for pruning stale generated outputs."""
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from promptrek.cli.commands.prune import (
+    is_protected,
+    prune_stale_outputs,
+    stale_outputs,
+)
+from promptrek.cli.main import cli
+from promptrek.core.models import GenerationMetadata, OutputRecord
+from promptrek.utils.outputs import content_digest
+
+UPF_TEMPLATE = """schema_version: 3.0.0
+metadata:
+  title: Prune
+  description: Prune project
+content: |
+  # Guidelines
+agents:
+  - name: {agent}
+    description: Reviews code
+    prompt: Review the code.
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Create a project directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def previous_run(output_dir, files, editor="claude", merged=()):
+    """Create metadata recording the given files as generated."""
+    return GenerationMetadata(
+        timestamp="2025-01-01T00:00:00",
+        source_file="project.promptrek.yaml",
+        editors=[editor],
+        output_dir=str(output_dir),
+        outputs={
+            str(path): OutputRecord(
+                editor=editor,
+                hash=content_digest(content),
+                merged=path in merged,
+            )
+            for path, content in files.items()
+        },
+    )
+
+
+class TestPruneStaleOutputs:
+    """Test removal of files that are no longer generated."""
+
+    def test_removes_unedited_stale_files(self, project):
+        """Test that stale files are removed with their empty directories."""
+        stale = project / ".claude" / "agents" / "old.md"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old agent")
+        current = project / ".claude" / "CLAUDE.md"
+        current.write_text("main")
+
+        stale_records = stale_outputs(
+            previous_run(project, {stale: "old agent", current: "main"}),
+            {"claude": {current: "main"}},
+            project,
+        )
+        removed, kept = prune_stale_outputs(stale_records, project)
+
+        assert removed == [stale]
+        assert kept == []
+        assert not stale.parent.exists()
+        assert current.exists()
+
+    def test_keeps_edited_merged_and_other_editor_files(self, project):
+        """Test that only unedited files of regenerated editors are removed."""
+        edited = project / "edited.md"
+        edited.write_text("changed by hand")
+        merged = project / ".mcp.json"
+        merged.write_text("{}")
+
+        stale_records = stale_outputs(
+            previous_run(project, {edited: "generated", merged: "{}"}, merged={merged}),
+            {"claude": {project / "CLAUDE.md": "main"}},
+            project,
+        )
+        assert list(stale_records) == [str(edited)]
+        assert prune_stale_outputs(stale_records, project) == ([], [edited])
+        assert merged.exists()
+
+        other_editor = previous_run(project, {edited: "changed by hand"})
+        assert stale_outputs(other_editor, {"cursor": {}}, project) == {}
+        # Nor are the files of an editor that generated nothing
+        assert stale_outputs(other_editor, {"claude": {}}, project) == {}
+
+    def test_protected_files(self, project):
+        """Test that PrompTrek, git and prompt files are protected."""
+        assert is_protected(project / ".gitignore")
+        assert is_protected(project / ".promptrek" / "variables.promptrek.yaml")
+        assert is_protected(project / "team.promptrek.yaml")
+        assert is_protected(project / "prompt.yaml", [project / "prompt.yaml"])
+        assert not is_protected(project / ".cursor" / "rules" / "old.mdc")
+
+
+class TestGeneratePrune:
+    """Test the generate --prune/--no-prune option."""
+
+    def test_renamed_agent(self, project):
+        """Test that renaming an agent removes the old agent file."""
+        upf = project / "project.promptrek.yaml"
+        upf.write_text(UPF_TEMPLATE.format(agent="reviewer"))
+        runner = CliRunner()
+        assert runner.invoke(cli, ["generate", "-e", "claude"]).exit_code == 0
+        old_agent = project / ".claude" / "agents" / "reviewer.md"
+        assert old_agent.exists()
+
+        # Kept with --no-prune, and still removed by a later run
+        upf.write_text(UPF_TEMPLATE.format(agent="critic"))
+        result = runner.invoke(cli, ["generate", "-e", "claude", "--no-prune"])
+        assert result.exit_code == 0, result.output
+        assert old_agent.exists()
+
+        result = runner.invoke(cli, ["generate", "-e", "claude"])
+        assert result.exit_code == 0, result.output
+        assert "Removed 1 stale generated file(s)" in result.output
+        assert not old_agent.exists()
+        assert (project / ".claude" / "agents" / "critic.md").exists()
+
+    def test_diff_shows_pruned_files_as_removed(self, project):
+        """Test that --diff lists stale files pruning would delete."""
+        upf = project / "project.promptrek.yaml"
+        upf.write_text(UPF_TEMPLATE.format(agent="reviewer"))
+        runner = CliRunner()
+        assert runner.invoke(cli, ["generate", "-e", "claude"]).exit_code == 0
+        old_agent = project / ".claude" / "agents" / "reviewer.md"
+
+        upf.write_text(UPF_TEMPLATE.format(agent="critic"))
+        result = runner.invoke(cli, ["generate", "-e", "claude", "--diff"])
+
+        assert result.exit_code == 0, result.output
+        assert "--- a/.claude/agents/reviewer.md" in result.output
+        assert "1 removed" in result.output
+        assert old_agent.exists()
+
+        result = runner.invoke(
+            cli, ["generate", "-e", "claude", "--diff", "--no-prune"]
+        )
+        assert "reviewer.md" not in result.output
+        assert "removed" not in result.output
+
+    def test_declined_editor_keeps_its_files(self, project):
+        """Test that an editor that generated nothing prunes nothing."""
+        # Small v1 prompts generate .clinerules as a single file
+        (project / "project.promptrek.yaml").write_text(
+            'schema_version: "1.0.0"\n'
+            "metadata:\n  title: Prune\n  description: Prune project\n"
+            '  version: "1.0.0"\n  author: test@example.com\n'
+            '  created: "2024-01-01"\n  updated: "2024-01-01"\n'
+            "targets: [cline]\n"
+            "instructions:\n  general:\n    - Write tests\n"
+        )
+        # A previous run generated .clinerules/ as a directory of rule files
+        rules = project / ".clinerules" / "01-guidelines.md"
+        rules.parent.mkdir()
+        rules.write_text("# Guidelines")
+        metadata = previous_run(project, {rules: "# Guidelines"}, editor="cline")
+        (project / ".promptrek").mkdir()
+        metadata_file = project / ".promptrek" / "last-generation.yaml"
+        metadata_file.write_text(yaml.safe_dump(metadata.model_dump()))
+
+        # Replacing the directory with a single file is declined
+        runner = CliRunner()
+        result = runner.invoke(cli, ["generate", "-e", "cline"], input="n\n")
+
+        assert result.exit_code == 0, result.output
+        assert "Skipped generation" in result.output
+        assert rules.read_text() == "# Guidelines"
+        outputs = yaml.safe_load(metadata_file.read_text())["outputs"]
+        assert str(rules) in outputs
+
+        # Once the directory is replaced, its records are dropped
+        result = runner.invoke(cli, ["generate", "-e", "cline"], input="y\n")
+        assert result.exit_code == 0, result.output
+        assert (project / ".clinerules").is_file()
+        outputs = yaml.safe_load(metadata_file.read_text())["outputs"]
+        assert list(outputs) == [str(project / ".clinerules")]
@@ -537,3 +537,103 @@ class TestRefreshCommand:
 
             # Should print verbose output
             assert mock_echo.call_count > 5  # Multiple messages in verbose mode
+
+
+class TestSelectiveRefresh:
+    """Test refresh using per-output variable dependencies."""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """Create a project with output-level generation metadata."""
+        from promptrek.utils.outputs import content_digest
+
+        monkeypatch.chdir(tmp_path)
+        source_file = tmp_path / "project.promptrek.yaml"
+        source_file.write_text("schema_version: 3.0.0\ncontent: '{{{ OWNER }}}'")
+        (tmp_path / "CLAUDE.md").write_text("alice")
+        (tmp_path / "cursor.mdc").write_text("static")
+
+        metadata = {
+            "source_file": str(source_file),
+            "timestamp": "2025-01-01T00:00:00",
+            "editors": ["claude", "cursor"],
+            "output_dir": str(tmp_path),
+            "source_hashes": {
+                str(source_file): content_digest(source_file.read_text())
+            },
+            "variable_digests": {"OWNER": content_digest("alice")},
+            "outputs": {
+                str(tmp_path / "CLAUDE.md"): {
+                    "editor": "claude",
+                    "variables": ["OWNER"],
+                    "hash": content_digest("alice"),
+                },
+                str(tmp_path / "cursor.mdc"): {
+                    "editor": "cursor",
+                    "variables": [],
+                    "hash": content_digest("static"),
+                },
+            },
+        }
+        (tmp_path / ".promptrek").mkdir()
+        (tmp_path / ".promptrek" / "last-generation.yaml").write_text(
+            yaml.dump(metadata)
+        )
+        return tmp_path
+
+    def _refresh(self, current_vars):
+        ctx = Mock()
+        ctx.obj = {"verbose": False}
+        with patch(
+            "promptrek.cli.commands.refresh.VariableSubstitution.load_and_evaluate_variables",
+            return_value=current_vars,
+        ) as mock_load:
+            with patch(
+                "promptrek.cli.commands.generate.generate_command"
+            ) as mock_generate:
+                with patch("click.echo"):
+                    refresh_command(
+                        ctx,
+                        editor=None,
+                        all_editors=False,
+                        dry_run=False,
+                        clear_cache=False,
+                        variables=None,
+                    )
+        return mock_generate, mock_load
+
+    def test_only_affected_editor_regenerated(self, project):
+        """Test that only outputs referencing a changed variable are refreshed."""
+        mock_generate, mock_load = self._refresh({"OWNER": "bob"})
+
+        mock_load.assert_called_once()
+        assert mock_generate.call_count == 1
+        kwargs = mock_generate.call_args[1]
+        assert kwargs["editor"] == "claude"
+        assert kwargs["base_variables"] == {"OWNER": "bob"}
+        assert kwargs["merge_metadata"] is True
+
+    def test_nothing_regenerated_when_unchanged(self, project):
+        """Test that nothing is regenerated when no referenced value changed."""
+        mock_generate, _ = self._refresh({"OWNER": "alice", "CURRENT_DATE": "x"})
+
+        mock_generate.assert_not_called()
+
+    def test_missing_output_is_regenerated(self, project):
+        """Test that a deleted output triggers regeneration of its editor."""
+        (project / "cursor.mdc").unlink()
+
+        mock_generate, _ = self._refresh({"OWNER": "alice"})
+
+        assert mock_generate.call_count == 1
+        assert mock_generate.call_args[1]["editor"] == "cursor"
+
+    def test_source_change_regenerates_all(self, project):
+        """Test that a changed source file regenerates every editor."""
+        (project / "project.promptrek.yaml").write_text(
+            "schema_version: 3.0.0\ncontent: changed"
+        )
+
+        mock_generate, _ = self._refresh({"OWNER": "alice"})
+
+        assert mock_generate.call_count == 2
@@ -0,0 +1,291 @@
+"""Tests for the PrompTrek daemon and its thin client."""
+
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from promptrek.cli.daemon import DaemonServer
+from promptrek.client import DaemonError, DaemonUnavailableError, main, request
+from promptrek.core.parser import UPFParser
+from promptrek.utils.variables import BuiltInVariables
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="Unix sockets not available"
+)
+
+UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Test
+  description: Test project
+content: |
+  # Test
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project directory with a UPF file."""
+    (tmp_path / "project.promptrek.yaml").write_text(UPF_CONTENT)
+    return tmp_path
+
+
+@pytest.fixture
+def fake_daemon(tmp_path):
+    """Listen on a socket and answer every request with a canned reply."""
+    socket_path = tmp_path / "fake.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen()
+    connections = []
+
+    def serve(reply):
+        conn, _ = listener.accept()
+        connections.append(conn)
+        conn.makefile("rb").readline()
+        if reply is not None:
+            conn.sendall(reply)
+            conn.close()
+
+    def start(reply):
+        threading.Thread(target=serve, args=(reply,), daemon=True).start()
+        return socket_path
+
+    yield start
+    for conn in connections:
+        conn.close()
+    listener.close()
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Start a daemon on a temporary socket."""
+    socket_path = tmp_path / "d.sock"
+    server = DaemonServer(socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(100):
+        if socket_path.exists():
+            break
+        time.sleep(0.01)
+    yield server, socket_path
+    try:
+        request("shutdown", socket_path=socket_path)
+    except DaemonUnavailableError:
+        pass
+    thread.join(timeout=5)
+
+
+class TestDaemonServer:
+    """Test DaemonServer request handling."""
+
+    def test_ping(self, tmp_path):
+        """Test ping control request."""
+        response = DaemonServer(tmp_path / "d.sock").handle_request(
+            {"id": 7, "command": "ping"}
+        )
+
+        assert response["ok"] is True
+        assert response["id"] == 7
+        assert response["pid"] == os.getpid()
+
+    def test_socket_is_private(self, running_daemon):
+        """Test that the socket is created accessible to its owner only."""
+        _, socket_path = running_daemon
+
+        assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
+
+    def test_unknown_command(self, tmp_path):
+        """Test that unsupported commands are rejected."""
+        response = DaemonServer(tmp_path / "d.sock").handle_request({"command": "init"})
+
+        assert response["ok"] is False
+        assert response["exit_code"] == 2
+        assert "Unknown command" in response["error"]
+
+    def test_invalid_args(self, tmp_path):
+        """Test that non-string arguments are rejected."""
+        response = DaemonServer(tmp_path / "d.sock").handle_request(
+            {"command": "validate", "args": [1]}
+        )
+
+        assert response["exit_code"] == 2
+
+    def test_validate_runs_in_requested_directory(self, project, tmp_path):
+        """Test executing a command with captured output in the client's cwd."""
+        cwd = os.getcwd()
+        response = DaemonServer(tmp_path / "d.sock").handle_request(
+            {
+                "command": "validate",
+                "args": ["project.promptrek.yaml"],
+                "cwd": str(project),
+            }
+        )
+
+        assert response["exit_code"] == 0
+        assert "Validation passed" in response["stdout"]
+        assert os.getcwd() == cwd
+
+    def test_failing_command_reports_exit_code(self, project, tmp_path):
+        """Test that command failures are reported with a non-zero exit code."""
+        response = DaemonServer(tmp_path / "d.sock").handle_request(
+            {"command": "validate", "args": ["missing.yaml"], "cwd": str(project)}
+        )
+
+        assert response["ok"] is False
+        assert response["exit_code"] != 0
+
+
+class TestDaemonSocket:
+    """Test the JSON-lines protocol over a real socket."""
+
+    def test_round_trip(self, running_daemon, project):
+        """Test that requests are answered over the socket."""
+        _, socket_path = running_daemon
+
+        response = request(
+            "generate",
+            ["project.promptrek.yaml", "-e", "claude"],
+            cwd=str(project),
+            socket_path=socket_path,
+        )
+
+        assert response["exit_code"] == 0
+        assert (project / ".claude" / "CLAUDE.md").exists()
+
+    def test_refuses_second_daemon(self, running_daemon):
+        """Test that a second daemon cannot take over a live socket."""
+        from promptrek.core.exceptions import CLIError
+
+        _, socket_path = running_daemon
+
+        with pytest.raises(CLIError, match="already listening"):
+            DaemonServer(socket_path).serve_forever()
+
+    def test_shutdown_removes_socket(self, tmp_path):
+        """Test that shutdown stops the server and removes the socket."""
+        socket_path = tmp_path / "d.sock"
+        server = DaemonServer(socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        for _ in range(100):
+            if socket_path.exists():
+                break
+            time.sleep(0.01)
+
+        request("shutdown", socket_path=socket_path)
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+class TestClient:
+    """Test the thin client."""
+
+    def test_request_without_daemon(self, tmp_path):
+        """Test that a missing daemon raises DaemonUnavailableError."""
+        with pytest.raises(DaemonUnavailableError):
+            request("ping", socket_path=tmp_path / "missing.sock")
+
+    def test_main_falls_back_to_local_cli(self, project, monkeypatch, capsys):
+        """Test that commands run in-process when no daemon is listening."""
+        monkeypatch.setenv("PROMPTREK_SOCKET", str(project / "missing.sock"))
+        monkeypatch.chdir(project)
+
+        exit_code = main(["validate", "project.promptrek.yaml"])
+
+        assert exit_code == 0
+        assert "Validation passed" in capsys.readouterr().out
+
+    def test_request_timeout_is_an_error(self, fake_daemon):
+        """Test that a daemon that never answers raises DaemonError."""
+        socket_path = fake_daemon(None)
+
+        with pytest.raises(DaemonError, match="No response"):
+            request("ping", socket_path=socket_path, timeout=0.2)
+
+    @pytest.mark.parametrize("reply", [b"not json\n", b'{"exit_code": 0', b"[]\n"])
+    def test_request_invalid_response(self, fake_daemon, reply):
+        """Test that truncated or malformed replies raise DaemonError."""
+        socket_path = fake_daemon(reply)
+
+        with pytest.raises(DaemonError):
+            request("ping", socket_path=socket_path, timeout=5)
+
+    def test_main_does_not_rerun_after_daemon_error(
+        self, project, fake_daemon, monkeypatch, capsys
+    ):
+        """Test that a failed daemon request is reported, not run locally."""
+        monkeypatch.setenv("PROMPTREK_SOCKET", str(fake_daemon(b"garbage\n")))
+        monkeypatch.chdir(project)
+
+        exit_code = main(["validate", "project.promptrek.yaml"])
+
+        captured = capsys.readouterr()
+        assert exit_code == 1
+        assert "Invalid response" in captured.err
+        assert "Validation passed" not in captured.out
+
+    def test_main_rejects_unsupported_command(self, capsys):
+        """Test that unsupported commands are rejected by the client."""
+        assert main(["init"]) == 2
+
+
+class TestWarmCaches:
+    """Test caches enabled by the daemon."""
+
+    def test_parser_cache_reuses_unchanged_file(self, project):
+        """Test that unchanged files are served from the parse cache."""
+        upf_file = project / "project.promptrek.yaml"
+        UPFParser.enable_cache()
+        try:
+            first = UPFParser().parse_file(upf_file)
+            first.content = "mutated"
+            second = UPFParser().parse_file(upf_file)
+            assert second.content == "# Test\n"
+
+            upf_file.write_text(UPF_CONTENT.replace("# Test", "# Changed!"))
+            third = UPFParser().parse_file(upf_file)
+            assert third.content == "# Changed!\n"
+        finally:
+            UPFParser.enable_cache(False)
+
+    def test_project_variables_cached_until_git_state_changes(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that git probing is skipped while the repository is unchanged."""
+        monkeypatch.chdir(tmp_path)
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+
+        calls = []
+
+        def fake_project_name(verbose=False):
+            calls.append(1)
+            return "demo"
+
+        monkeypatch.setattr(
+            BuiltInVariables, "_get_project_name", staticmethod(fake_project_name)
+        )
+        monkeypatch.setattr(
+            BuiltInVariables, "_get_git_variables", staticmethod(lambda v=False: {})
+        )
+
+        BuiltInVariables.enable_cache()
+        try:
+            BuiltInVariables.get_all()
+            BuiltInVariables.get_all()
+            assert len(calls) == 1
+
+            head = git_dir / "HEAD"
+            stat = head.stat()
+            os.utime(head, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            BuiltInVariables.get_all()
+            assert len(calls) == 2
+        finally:
+            BuiltInVariables.enable_cache(False)
@@ -0,0 +1,195 @@
+"""Tests for workspace generation (generate --workspace)."""
+
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from promptrek.adapters.claude import ClaudeAdapter
+from promptrek.cli.commands.workspace import (
+    find_project_roots,
+    resolve_project_variables,
+)
+from promptrek.cli.main import cli
+from promptrek.core.parser import UPFParser
+from promptrek.utils import outputs
+
+UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: {title}
+  description: Workspace project
+content: |
+  # {title}
+
+  Team: {{{{{{ TEAM }}}}}}
+  Scope: {{{{{{ SCOPE }}}}}}
+"""
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Create a monorepo with shared and per-package variables."""
+    root = tmp_path / "repo"
+    _write(
+        root / ".promptrek" / "variables.promptrek.yaml",
+        "TEAM: platform\nSCOPE: shared\n",
+    )
+    _write(
+        root / "packages" / "api" / "project.promptrek.yaml",
+        UPF_CONTENT.format(title="API"),
+    )
+    _write(
+        root / "packages" / "web" / "project.promptrek.yaml",
+        UPF_CONTENT.format(title="Web"),
+    )
+    _write(
+        root / "packages" / "web" / ".promptrek" / "variables.promptrek.yaml",
+        "SCOPE: web\n",
+    )
+    _write(
+        root / "node_modules" / "dep" / "project.promptrek.yaml",
+        UPF_CONTENT.format(title="Dependency"),
+    )
+    return root
+
+
+class TestFindProjectRoots:
+    """Test project root discovery."""
+
+    def test_finds_projects_and_skips_dependencies(self, workspace):
+        """Test that dependency and hidden directories are skipped."""
+        roots = [path for path, _ in find_project_roots(workspace)]
+
+        assert roots == [
+            workspace / "packages" / "api",
+            workspace / "packages" / "web",
+        ]
+
+
+class TestResolveProjectVariables:
+    """Test variable inheritance between workspace layers."""
+
+    def test_nested_projects_inherit_and_override(self, workspace):
+        """Test that child variable files override shared ones."""
+        cache: dict = {}
+        builtins = {"PROJECT_NAME": workspace.name, "PROJECT_ROOT": str(workspace)}
+
+        api = resolve_project_variables(
+            workspace, workspace / "packages" / "api", builtins, False, cache
+        )
+        web = resolve_project_variables(
+            workspace, workspace / "packages" / "web", builtins, False, cache
+        )
+
+        assert api["TEAM"] == web["TEAM"] == "platform"
+        assert api["SCOPE"] == "shared"
+        assert web["SCOPE"] == "web"
+        assert api["PROJECT_NAME"] == "api"
+        assert web["PROJECT_ROOT"] == str(workspace / "packages" / "web")
+        # Shared file evaluated once, plus the web override
+        assert len(cache) == 2
+
+
+class TestWorkspaceGenerate:
+    """Test the generate --workspace command."""
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_generates_every_project(self, workspace, jobs):
+        """Test generating all projects serially and in a process pool."""
+        result = CliRunner().invoke(
+            cli, ["generate", "--workspace", str(workspace), "-e", "claude", "-j", jobs]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "2 project(s)" in result.output
+        assert "for 2/2 project(s)" in result.output
+
+        api = (workspace / "packages" / "api" / ".claude" / "CLAUDE.md").read_text()
+        web = (workspace / "packages" / "web" / ".claude" / "CLAUDE.md").read_text()
+        assert "Team: platform" in api and "Scope: shared" in api
+        assert "Team: platform" in web and "Scope: web" in web
+        assert not (workspace / "node_modules" / "dep" / ".claude").exists()
+
+    @pytest.mark.parametrize("dry_run", [False, True])
+    def test_prompts_use_defaults(self, workspace, monkeypatch, dry_run):
+        """Test that adapter prompts are answered with their defaults."""
+        answers = []
+        generate = ClaudeAdapter.generate
+
+        def prompting_generate(self, *args, **kwargs):
+            answers.append(outputs.confirm("Overwrite?", default=True))
+            return generate(self, *args, **kwargs)
+
+        monkeypatch.setattr(ClaudeAdapter, "generate", prompting_generate)
+        args = ["generate", "--workspace", str(workspace), "-e", "claude", "-j", "1"]
+
+        result = CliRunner().invoke(cli, args + (["--dry-run"] if dry_run else []))
+
+        assert result.exit_code == 0, result.output
+        assert answers == [True, True]
+        assert "Overwrite?" not in result.output
+
+    def test_dry_run_counts_planned_files(self, workspace):
+        """Test that a dry run reports the files it would generate."""
+        result = CliRunner().invoke(
+            cli,
+            ["generate", "--workspace", str(workspace), "-e", "claude", "--dry-run"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "(1 file(s))" in result.output
+        assert "Would generate 2 file(s) for 2/2 project(s)" in result.output
+        assert not (workspace / "packages" / "api" / ".claude").exists()
+
+    def test_failed_project_sets_exit_code(self, workspace):
+        """Test that one failing project is reported without stopping others."""
+        _write(
+            workspace / "packages" / "broken" / "project.promptrek.yaml",
+            "schema_version: 3.0.0\nmetadata: [",
+        )
+
+        result = CliRunner().invoke(
+            cli, ["generate", "--workspace", str(workspace), "-e", "claude", "-j", "1"]
+        )
+
+        assert result.exit_code == 1
+        assert "❌ packages/broken" in result.output
+        assert (workspace / "packages" / "api" / ".claude" / "CLAUDE.md").exists()
+
+    def test_requires_editor(self, workspace):
+        """Test that an editor or --all is required."""
+        result = CliRunner().invoke(cli, ["generate", "--workspace", str(workspace)])
+
+        assert result.exit_code == 1
+        assert "Must specify either --editor or --all" in result.output
+
+    def test_rejects_output_option(self, workspace, tmp_path):
+        """Test that --output cannot be combined with --workspace."""
+        result = CliRunner().invoke(
+            cli,
+            [
+                "generate",
+                "--workspace",
+                str(workspace),
+                "-e",
+                "claude",
+                "-o",
+                str(tmp_path / "out"),
+            ],
+        )
+
+        assert result.exit_code == 1
+        assert "--workspace cannot be combined" in result.output
+
+    def test_parse_cache_restored(self, workspace):
+        """Test that the parse cache is disabled again afterwards."""
+        CliRunner().invoke(
+            cli, ["generate", "--workspace", str(workspace), "-e", "claude", "-j", "1"]
+        )
+
+        assert not UPFParser.is_cache_enabled()
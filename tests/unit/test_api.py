@@ -0,0 +1,143 @@
+"""Tests for the in-memory generation API."""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import promptrek
+from promptrek.api import generate, load_prompt, render
+from promptrek.core.exceptions import AdapterNotFoundError
+from promptrek.core.models import UniversalPromptV3
+from promptrek.utils.outputs import confirm, ensure_directory, virtual_output
+
+PROMPT_DATA = {
+    "schema_version": "3.0.0",
+    "metadata": {
+        "title": "API Test",
+        "description": "Prompt used by API tests",
+    },
+    "content": "# {{{ PROJECT }}}\n\nFollow the coding standards.",
+    "variables": {"PROJECT": "Default"},
+}
+
+
+class TestGenerate:
+    """Test generate function."""
+
+    def test_returns_files_without_writing(self, tmp_path):
+        """Test that files are rendered in memory only."""
+        files = generate(PROMPT_DATA, "claude", output_dir=tmp_path)
+
+        assert tmp_path / "CLAUDE.md" in files or any(
+            path.name.endswith(".md") for path in files
+        )
+        assert all(isinstance(content, bytes) for content in files.values())
+        assert list(tmp_path.iterdir()) == []
+
+    def test_variables_override_prompt_variables(self, tmp_path):
+        """Test that explicit variables take precedence."""
+        files = generate(PROMPT_DATA, ["claude"], {"PROJECT": "Override"}, tmp_path)
+
+        rendered = b"".join(files.values())
+        assert b"Override" in rendered
+        assert b"Default" not in rendered
+
+    def test_multiple_editors(self, tmp_path):
+        """Test rendering several editors in one call."""
+        files = generate(PROMPT_DATA, ["claude", "cursor"], output_dir=tmp_path)
+
+        top_level = {path.relative_to(tmp_path).parts[0] for path in files}
+        assert ".claude" in top_level or "CLAUDE.md" in top_level
+        assert ".cursor" in top_level
+
+    def test_unknown_editor(self):
+        """Test that unknown editors raise AdapterNotFoundError."""
+        with pytest.raises(AdapterNotFoundError):
+            generate(PROMPT_DATA, "nonexistent")
+
+    def test_accepts_file_path(self, tmp_path):
+        """Test loading the prompt from a file."""
+        import yaml
+
+        source = tmp_path / "project.promptrek.yaml"
+        source.write_text(yaml.safe_dump(PROMPT_DATA))
+        out = tmp_path / "out"
+
+        files = generate(str(source), "claude", output_dir=out)
+
+        assert files
+        assert not out.exists()
+
+    def test_lazy_package_export(self):
+        """Test that generate is exported from the package."""
+        assert promptrek.generate is generate
+        assert promptrek.render is render
+
+    def test_concurrent_renders_are_isolated(self, tmp_path):
+        """Test that concurrent calls share adapters without mixing output."""
+
+        def run(index: int) -> bytes:
+            files = generate(PROMPT_DATA, "claude", {"PROJECT": f"P{index}"}, tmp_path)
+            return b"".join(files.values())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run, range(16)))
+
+        for index, rendered in enumerate(results):
+            assert f"P{index}\n".encode() in rendered
+            others = [f"# P{i}\n".encode() for i in range(16) if i != index]
+            assert not any(other in rendered for other in others)
+
+
+class TestRender:
+    """Test render function."""
+
+    def test_records_write_and_message_events(self, tmp_path):
+        """Test that console output becomes structured events."""
+        output = render(PROMPT_DATA, "claude", output_dir=tmp_path)
+
+        writes = [e for e in output.events if e.kind == "write"]
+        assert {e.path for e in writes} == set(output.files)
+        assert output.messages()
+
+    def test_dry_run_renders_no_files(self, tmp_path):
+        """Test that dry-run mode reports without rendering files."""
+        output = render(PROMPT_DATA, "claude", output_dir=tmp_path, dry_run=True)
+
+        assert output.files == {}
+
+
+class TestLoadPrompt:
+    """Test load_prompt function."""
+
+    def test_passes_models_through(self):
+        """Test that prompt models are returned unchanged."""
+        prompt = load_prompt(PROMPT_DATA)
+
+        assert isinstance(prompt, UniversalPromptV3)
+        assert load_prompt(prompt) is prompt
+
+
+class TestVirtualOutputHelpers:
+    """Test console and filesystem helpers in virtual mode."""
+
+    def test_confirm_returns_default(self):
+        """Test that prompts resolve to their default answer."""
+        with virtual_output() as output:
+            assert confirm("Overwrite?", default=True) is True
+
+        assert output.events[0].kind == "prompt"
+
+    def test_ensure_directory_is_noop(self, tmp_path):
+        """Test that no directories are created."""
+        with virtual_output():
+            ensure_directory(tmp_path / "new")
+
+        assert not (tmp_path / "new").exists()
+
+    def test_outside_context_writes_directories(self, tmp_path):
+        """Test that directories are created outside virtual mode."""
+        ensure_directory(Path(tmp_path) / "new")
+
+        assert (tmp_path / "new").is_dir()
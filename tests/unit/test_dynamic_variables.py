@@ -1,7 +1,8 @@
 """Tests for dynamic variables functionality."""
 
 import subprocess
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -12,6 +13,7 @@ from promptrek.utils.variables import (
     BuiltInVariables,
     CommandExecutor,
     DynamicVariable,
+    ShellSession,
     VariableSubstitution,
 )
 
@@ -72,6 +74,67 @@ class TestCommandExecutor:
             executor.execute("false")
 
 
+@pytest.mark.skipif(
+    not ShellSession.is_supported(), reason="Shell sessions require a POSIX shell"
+)
+class TestShellSession:
+    """Test running commands in one persistent shell."""
+
+    def test_commands_share_one_shell(self):
+        """Test that commands run in the same shell, isolated from each other."""
+        session = ShellSession()
+        try:
+            first = session.run("cd / && echo $$ && pwd", timeout=5)
+            second = session.run("echo $$; pwd", timeout=5)
+        finally:
+            session.close()
+
+        assert first.returncode == 0
+        shell_pid, directory = first.stdout.split()
+        assert directory == "/"
+        # Same shell, but the first command's cd did not leak
+        assert second.stdout.split() == [shell_pid, str(Path.cwd())]
+
+    def test_exit_status_and_output(self):
+        """Test that exit status, stdout and stderr are captured per command."""
+        session = ShellSession()
+        try:
+            result = session.run("printf 'no newline'; echo oops >&2; exit 4", 5)
+            syntax_error = session.run("if then", timeout=5)
+            after = session.run("echo still running", timeout=5)
+        finally:
+            session.close()
+
+        assert result.returncode == 4
+        assert result.stdout == "no newline"
+        assert result.stderr == "oops\n"
+        assert syntax_error.returncode != 0
+        assert after.stdout == "still running\n"
+
+    def test_timeout_restarts_session(self):
+        """Test that a timed out command is stopped and the session restarts."""
+        session = ShellSession()
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                session.run("sleep 10", timeout=0.2)
+            assert session.run("echo ok", timeout=5).stdout == "ok\n"
+        finally:
+            session.close()
+
+    def test_persistent_executor_reports_errors(self):
+        """Test that a persistent executor keeps the gate and error reporting."""
+        with CommandExecutor(allow_commands=False, persistent=True) as executor:
+            with pytest.raises(TemplateError, match="Command execution is disabled"):
+                executor.execute("echo test")
+
+        with CommandExecutor(allow_commands=True, timeout=1, persistent=True) as ex:
+            assert ex.execute("echo test") == "test"
+            with pytest.raises(TemplateError, match="exit code 2.*\n.*bad"):
+                ex.execute("echo bad >&2; exit 2")
+            with pytest.raises(TemplateError, match="Command timed out after 1s"):
+                ex.execute("sleep 5")
+
+
 class TestDynamicVariable:
     """Test DynamicVariable class."""
 
@@ -307,8 +370,7 @@ class TestVariableSubstitutionWithDynamicVars:
         assert "CURRENT_DATE" not in vars_dict
         assert "PROJECT_NAME" not in vars_dict
 
-    @patch("promptrek.utils.variables.subprocess.run")
-    def test_load_and_evaluate_with_dynamic_vars(self, mock_run, tmp_path, monkeypatch):
+    def test_load_and_evaluate_with_dynamic_vars(self, tmp_path, monkeypatch):
         """Test loading and evaluating dynamic variables."""
         monkeypatch.chdir(tmp_path)
 
@@ -322,16 +384,17 @@ class TestVariableSubstitutionWithDynamicVars:
 STATIC_VAR: static value
 DYNAMIC_VAR:
   type: command
-  value: echo dynamic
+  value: echo dynamic output
   cache: false
+FAILING_VAR:
+  type: command
+  value: exit 3
+OTHER_VAR:
+  type: command
+  value: echo other
 """
         )
 
-        # Mock command execution
-        mock_result = Mock()
-        mock_result.stdout = "dynamic output"
-        mock_run.return_value = mock_result
-
         var_sub = VariableSubstitution()
         vars_dict = var_sub.load_and_evaluate_variables(
             allow_commands=True, include_builtins=False
@@ -339,6 +402,9 @@ DYNAMIC_VAR:
 
         assert vars_dict["STATIC_VAR"] == "static value"
         assert vars_dict["DYNAMIC_VAR"] == "dynamic output"
+        # A failing command does not stop the others
+        assert "FAILING_VAR" not in vars_dict
+        assert vars_dict["OTHER_VAR"] == "other"
 
     def test_load_and_evaluate_without_allow_commands(self, tmp_path, monkeypatch):
         """Test that dynamic variables fail without allow_commands."""
@@ -532,3 +598,91 @@ CUSTOM_VAR: from-file
             assert "CURRENT_DATE" in final_vars  # Built-in present
         finally:
             os.chdir(original_cwd)
+
+
+class TestStableBuiltInVariables:
+    """Test stable build mode for built-in variables."""
+
+    def test_source_date_epoch_pins_time(self, monkeypatch):
+        """Test that SOURCE_DATE_EPOCH pins all time-based values."""
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+
+        vars_dict = BuiltInVariables.get_all()
+
+        assert vars_dict["CURRENT_DATE"] == "2023-11-14"
+        assert vars_dict["CURRENT_TIME"] == "22:13:20"
+        assert vars_dict["CURRENT_DATETIME"] == "2023-11-14T22:13:20Z"
+
+    def test_invalid_source_date_epoch_ignored(self, monkeypatch):
+        """Test that an invalid SOURCE_DATE_EPOCH falls back to the clock."""
+        monkeypatch.setenv("SOURCE_DATE_EPOCH", "not-a-number")
+
+        vars_dict = BuiltInVariables.get_all()
+
+        assert vars_dict["CURRENT_DATE"] == datetime.now().strftime("%Y-%m-%d")
+
+    @pytest.mark.parametrize(
+        "granularity,expected_time",
+        [("day", "00:00:00"), ("hour", "14:00:00"), ("minute", "14:30:00")],
+    )
+    def test_granularity_truncates_time(self, monkeypatch, granularity, expected_time):
+        """Test that stable granularities truncate the current time."""
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+        fixed = datetime(2025, 10, 26, 14, 30, 45)
+
+        with patch("promptrek.utils.variables.datetime") as mock_datetime:
+            mock_datetime.now.return_value = fixed
+            now = BuiltInVariables._get_reference_time(granularity)
+
+        assert now.strftime("%H:%M:%S") == expected_time
+        assert now.date() == fixed.date()
+
+    def test_commit_granularity_uses_commit_time(self, monkeypatch):
+        """Test that 'commit' granularity uses the HEAD commit timestamp."""
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+
+        with patch.object(
+            BuiltInVariables,
+            "_get_commit_time",
+            return_value=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ):
+            now = BuiltInVariables._get_reference_time("commit")
+
+        assert now == datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="Needs time.tzset")
+    @pytest.mark.parametrize("tz", ["UTC", "America/Los_Angeles", "Asia/Tokyo"])
+    def test_stable_values_independent_of_timezone(self, monkeypatch, tz):
+        """Test that every pinned time value is derived from UTC."""
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+        monkeypatch.setenv("TZ", tz)
+        time.tzset()
+        try:
+            before = datetime.now(timezone.utc)
+            variables = BuiltInVariables.get_all(stable="hour")
+            after = datetime.now(timezone.utc)
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert variables["CURRENT_DATETIME"] == (
+            f"{variables['CURRENT_DATE']}T{variables['CURRENT_TIME']}Z"
+        )
+        assert variables["CURRENT_DATETIME"] in {
+            moment.strftime("%Y-%m-%dT%H:00:00Z") for moment in (before, after)
+        }
+
+    def test_invalid_granularity_raises(self):
+        """Test that unknown granularities are rejected."""
+        with pytest.raises(ValueError, match="Invalid stable build granularity"):
+            BuiltInVariables._get_reference_time("week")
+
+    def test_stable_builtins_passed_through_loader(self, monkeypatch, tmp_path):
+        """Test that load_and_evaluate_variables honors stable_builtins."""
+        monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+
+        variables = VariableSubstitution().load_and_evaluate_variables(
+            search_dir=tmp_path, stable_builtins="day"
+        )
+
+        assert variables["CURRENT_TIME"] == "00:00:00"
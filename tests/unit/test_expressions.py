@@ -0,0 +1,139 @@
+"""Tests for the condition expression compiler."""
+
+import pytest
+
+from promptrek.core.exceptions import ConditionSyntaxError
+from promptrek.core.expressions import compile_condition
+from promptrek.core.models import Condition
+
+
+class TestCompileCondition:
+    """Test compile_condition function."""
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [
+            ('EDITOR == "claude"', True),
+            ("EDITOR == claude", True),
+            ("EDITOR != 'claude'", False),
+            ('EDITOR in ["cursor", "claude"]', True),
+            ('EDITOR not in ["cursor", "claude"]', False),
+            ("DEBUG", True),
+            ("MISSING", False),
+            ("not MISSING", True),
+            ('EDITOR == "claude" and DEBUG', True),
+            ('EDITOR == "cursor" or DEBUG', True),
+            ('EDITOR == "cursor" or (DEBUG and not STRICT)', True),
+            ("not (DEBUG or STRICT)", False),
+            ("COUNT >= 3", True),
+            ("COUNT > 3", False),
+            ("COUNT < 3.5", True),
+            ("COUNT == 3", True),
+            ("VERSION == 1.2.3", True),
+            ("RELEASE == 1.10", False),
+            ("RELEASE == 1.1", True),
+            ("LIMIT == 3.0", True),
+            ("COUNT == 3.0", False),
+            ("EDITOR > 3", False),
+            ("true and not false", True),
+        ],
+    )
+    def test_evaluate(self, expression, expected):
+        """Test evaluating compiled expressions."""
+        variables = {
+            "EDITOR": "claude",
+            "DEBUG": True,
+            "STRICT": False,
+            "COUNT": "3",
+            "VERSION": "1.2.3",
+            "RELEASE": "1.1",
+            "LIMIT": 3,
+        }
+
+        assert compile_condition(expression).evaluate(variables) is expected
+
+    def test_and_binds_tighter_than_or(self):
+        """Test operator precedence."""
+        node = compile_condition("A or B and C")
+
+        assert node.evaluate({"A": True}) is True
+        assert node.evaluate({"B": True}) is False
+        assert node.evaluate({"B": True, "C": True}) is True
+
+    def test_names(self):
+        """Test that referenced variable names are reported."""
+        node = compile_condition('A == "x" and (B or not C in [1, 2])')
+
+        assert node.names() == ["A", "B", "C"]
+
+    @pytest.mark.parametrize(
+        "expression,expected",
+        [
+            ("PROJECT_TYPE == web app", True),
+            ("PROJECT_TYPE != web app", False),
+            ("PROJECT_TYPE == web app and more", False),
+            ("URL == http://example.com", True),
+        ],
+    )
+    def test_unquoted_text_fallback(self, expression, expected):
+        """Test that unquoted text with spaces compares as raw text."""
+        node = compile_condition(expression)
+
+        assert node.unquoted is True
+        variables = {"PROJECT_TYPE": "web app", "URL": "http://example.com"}
+
+        assert node.evaluate(variables) is expected
+
+    @pytest.mark.parametrize(
+        "expression,continued_by",
+        [
+            ("TEAM == research and development", ["and"]),
+            ("A == x or B != 2 and C", ["or", "and"]),
+            ('TEAM == "research" and development', [None]),
+            ("TEAM == research", [None]),
+            ("COUNT > 3 and DEBUG", [None]),
+        ],
+    )
+    def test_unquoted_value_before_boolean_operator(self, expression, continued_by):
+        """Test that bare values followed by and/or are flagged."""
+        node = compile_condition(expression)
+
+        assert [c.continued_by for c in node.comparisons()] == continued_by
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["", "A ==", "(A", "A == [1, 2]", "A in B", "A B", 'A == "x" !'],
+    )
+    def test_syntax_errors(self, expression):
+        """Test that malformed expressions raise ConditionSyntaxError."""
+        with pytest.raises(ConditionSyntaxError):
+            compile_condition(expression)
+
+
+class TestConditionModel:
+    """Test compiled expressions cached on the Condition model."""
+
+    def test_compiled_at_load_time(self):
+        """Test that the expression is compiled when the model is created."""
+        condition = Condition.model_validate(
+            {"if": 'EDITOR == "claude"', "then": {"a": 1}}
+        )
+
+        assert condition.compiled is not None
+        assert condition.compile_error is None
+        assert condition.evaluate({"EDITOR": "claude"}) is True
+
+    def test_invalid_expression_never_matches(self):
+        """Test that invalid expressions evaluate to False."""
+        condition = Condition.model_validate({"if": "EDITOR ==", "then": {}})
+
+        assert condition.compiled is None
+        assert "Invalid condition" in condition.compile_error
+        assert condition.evaluate({"EDITOR": ""}) is False
+
+    def test_recompiled_after_change(self):
+        """Test that changing the expression recompiles it."""
+        condition = Condition.model_validate({"if": "A", "then": {}})
+        condition.if_condition = "not A"
+
+        assert condition.evaluate({"A": True}) is False
@@ -0,0 +1,170 @@
+"""Tests for file locking and atomic replace."""
+
+import json
+import os
+import stat
+import tempfile
+import threading
+
+import pytest
+
+from promptrek.core.exceptions import FileLockError
+from promptrek.utils.gitignore import add_patterns_to_gitignore
+from promptrek.utils.locking import atomic_write, file_lock
+from promptrek.utils.outputs import update_generated_file, virtual_output
+
+
+class TestFileLock:
+    """Test advisory file locks."""
+
+    def test_times_out_while_held(self, tmp_path):
+        """Test that a lock held by another thread raises after the timeout."""
+        target = tmp_path / "shared.json"
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with file_lock(target):
+                acquired.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        try:
+            acquired.wait(5)
+            with pytest.raises(FileLockError, match="Timed out"):
+                with file_lock(target, timeout=0.1):
+                    pass
+        finally:
+            release.set()
+            holder.join()
+
+        with file_lock(target, timeout=0.1):
+            pass
+
+    def test_reentrant_within_thread(self, tmp_path):
+        """Test that nested locks on the same file do not deadlock."""
+        target = tmp_path / "shared.json"
+
+        with file_lock(target, timeout=0.1):
+            with file_lock(target, timeout=0.1):
+                pass
+
+    def test_lock_files_outside_project(self, tmp_path):
+        """Test that locking creates nothing next to the target file."""
+        project = tmp_path / "project"
+        project.mkdir()
+
+        with file_lock(project / ".gitignore"):
+            pass
+
+        assert list(project.iterdir()) == []
+
+    def test_lock_files_removed_on_release(self, tmp_path, lock_dir):
+        """Test that released locks leave no lock files behind."""
+
+        def update():
+            for _ in range(20):
+                with file_lock(tmp_path / "shared.json"):
+                    pass
+
+        workers = [threading.Thread(target=update) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert list(lock_dir.iterdir()) == []
+
+    def test_default_lock_dir_is_private(self, tmp_path, monkeypatch):
+        """Test that the default lock directory is per user and private."""
+        monkeypatch.delenv("PROMPTREK_LOCK_DIR")
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        with file_lock(tmp_path / "target"):
+            (lock_dir,) = tmp_path.glob("promptrek-locks-*")
+            assert stat.S_IMODE(lock_dir.stat().st_mode) == 0o700
+
+
+class TestAtomicWrite:
+    """Test atomic file replacement."""
+
+    def test_preserves_mode(self, tmp_path):
+        """Test that replacing a file keeps its permissions."""
+        target = tmp_path / "script.sh"
+        target.write_text("old")
+        os.chmod(target, 0o750)
+
+        atomic_write(target, "new")
+
+        assert target.read_text() == "new"
+        assert stat.S_IMODE(target.stat().st_mode) == 0o750
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+    def test_writes_through_symlink(self, tmp_path):
+        """Test that a symlinked target keeps its link."""
+        real = tmp_path / "shared" / "CLAUDE.md"
+        real.parent.mkdir()
+        real.write_text("old")
+        link = tmp_path / "CLAUDE.md"
+        link.symlink_to(real)
+
+        atomic_write(link, "new")
+
+        assert link.is_symlink()
+        assert real.read_text() == "new"
+        assert not list(real.parent.glob("*.tmp"))
+
+
+class TestUpdateGeneratedFile:
+    """Test locked read-modify-write of generated files."""
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path):
+        """Test that parallel updates of one file all take effect."""
+        target = tmp_path / "counter.json"
+        target.write_text(json.dumps({"count": 0}))
+
+        def increment(existing):
+            data = json.loads(existing)
+            data["count"] += 1
+            return json.dumps(data)
+
+        threads = [
+            threading.Thread(target=update_generated_file, args=(target, increment))
+            for _ in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert json.loads(target.read_text()) == {"count": 20}
+
+    def test_virtual_output_reads_pending_writes(self, tmp_path):
+        """Test that virtual updates build on earlier virtual writes."""
+        target = tmp_path / "settings.json"
+
+        with virtual_output() as virtual:
+            update_generated_file(target, lambda existing: "a")
+            update_generated_file(target, lambda existing: existing + "b")
+
+        assert virtual.files[target] == b"ab"
+        assert not target.exists()
+
+    def test_gitignore_concurrent_additions(self, tmp_path):
+        """Test that parallel .gitignore updates keep every pattern."""
+        gitignore = tmp_path / ".gitignore"
+        threads = [
+            threading.Thread(
+                target=add_patterns_to_gitignore, args=(gitignore, [f"dir{i}/"])
+            )
+            for i in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        lines = gitignore.read_text().splitlines()
+        assert sorted(lines) == sorted(f"dir{i}/" for i in range(10))
@@ -0,0 +1,110 @@
+"""Tests for the shared markdown and frontmatter tokenizer."""
+
+import pytest
+import yaml
+
+from promptrek.utils.markdown import (
+    extract_frontmatter,
+    parse_frontmatter,
+    parse_markdown,
+    split_frontmatter,
+    tokenize,
+)
+
+
+class TestSplitFrontmatter:
+    """Test frontmatter splitting."""
+
+    def test_splits_on_delimiter_lines(self):
+        """Test that only whole `---` lines delimit the frontmatter."""
+        text, body = split_frontmatter(
+            "---\ndescription: a --- b\n---\n# Title\n---\nmore"
+        )
+
+        assert text == "description: a --- b\n"
+        assert body == "# Title\n---\nmore"
+
+    @pytest.mark.parametrize("content", ["# Title", "---\nname: x", "---name: x\n---"])
+    def test_no_frontmatter(self, content):
+        """Test content without a complete frontmatter block."""
+        assert split_frontmatter(content) == (None, content)
+
+
+class TestParseFrontmatter:
+    """Test frontmatter parsing."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "name: rules\ndescription: Use for api, web\nalwaysApply: true",
+            "count: 12\nenabled: off\nempty:\nnothing: ~\nurl: http://x.y/z",
+            "version: 1.0\ncreated: 2024-01-01\nold: 012",
+            "tags:\n  - a\n  - b\n# comment\nname: 'quoted'",
+            "description: value # trailing comment",
+        ],
+    )
+    def test_matches_yaml(self, text):
+        """Test that the fast path and YAML fallback agree with PyYAML."""
+        assert parse_frontmatter(text) == yaml.safe_load(text)
+
+    def test_invalid_yaml_raises(self):
+        """Test that invalid YAML is an error unless lenient."""
+        with pytest.raises(yaml.YAMLError):
+            parse_frontmatter("description: Use when: reviewing code")
+
+    def test_lenient_fallback(self):
+        """Test line-based parsing of YAML-incompatible values."""
+        result = parse_frontmatter(
+            "name: reviewer\ndescription: Use when: asked: review code\ntools: [Read]",
+            lenient=True,
+        )
+
+        assert result == {
+            "name": "reviewer",
+            "description": "Use when: asked: review code",
+            "tools": ["Read"],
+        }
+
+    def test_extract_invalid_returns_content(self):
+        """Test that unparsable frontmatter leaves the content unchanged."""
+        content = "---\nkey: [unclosed\n---\nbody"
+
+        assert extract_frontmatter(content) == (None, content)
+
+
+class TestTokenize:
+    """Test markdown tokenization."""
+
+    def test_token_kinds(self):
+        """Test headings, bullets and text in a single pass."""
+        tokens = list(tokenize("# Title\n\n## C#\n- one\n  * two\n+ three\ntext"))
+
+        assert [t.kind for t in tokens] == [
+            "heading",
+            "blank",
+            "heading",
+            "bullet",
+            "bullet",
+            "bullet",
+            "text",
+        ]
+        assert (tokens[2].text, tokens[2].level) == ("C#", 2)
+        assert [(t.text, t.marker, t.level) for t in tokens[3:6]] == [
+            ("one", "-", 0),
+            ("two", "*", 2),
+            ("three", "+", 0),
+        ]
+
+    def test_code_blocks_are_opaque(self):
+        """Test that fenced code is not parsed as headings or bullets."""
+        tokens = list(tokenize("```bash\n# comment\n- item\n```\n- real"))
+
+        assert [t.kind for t in tokens] == ["fence", "code", "code", "fence", "bullet"]
+
+    def test_parse_markdown(self):
+        """Test parsing a whole document."""
+        document = parse_markdown("---\nname: x\n---\n# Title\n- a\n* b\n+ c")
+
+        assert document.frontmatter == {"name": "x"}
+        assert document.title == "Title"
+        assert document.bullets() == ["a", "b"]
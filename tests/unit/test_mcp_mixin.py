@@ -555,7 +555,7 @@ class TestUserLevelMCPHelpers:
         conflicts = adapter.detect_conflicting_servers(new_servers, existing_config)
         assert len(conflicts) == 0
 
-    @patch("promptrek.adapters.mcp_mixin.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     def test_prompt_mcp_server_overwrite_accepts(self, mock_confirm, adapter):
         """Test prompting for server overwrite when user accepts."""
         mock_confirm.return_value = True
@@ -571,7 +571,7 @@ class TestUserLevelMCPHelpers:
         assert result is True
         mock_confirm.assert_called_once()
 
-    @patch("promptrek.adapters.mcp_mixin.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     def test_prompt_mcp_server_overwrite_declines(self, mock_confirm, adapter):
         """Test prompting for server overwrite when user declines."""
         mock_confirm.return_value = False
@@ -600,7 +600,7 @@ class TestUserLevelMCPHelpers:
         # Should return True in dry run without prompting
         assert result is True
 
-    @patch("promptrek.adapters.mcp_mixin.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     def test_warn_user_level_operations_accepts(self, mock_confirm, adapter):
         """Test user-level operations warning when user accepts."""
         mock_confirm.return_value = True
@@ -613,7 +613,7 @@ class TestUserLevelMCPHelpers:
         assert result is True
         mock_confirm.assert_called_once()
 
-    @patch("promptrek.adapters.mcp_mixin.click.confirm")
+    @patch("promptrek.utils.outputs.click.confirm")
     def test_warn_user_level_operations_declines(self, mock_confirm, adapter):
         """Test user-level operations warning when user declines."""
         mock_confirm.return_value = False
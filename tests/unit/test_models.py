@@ -624,6 +624,18 @@ class TestModelValidationErrors:
                 content="",  # Empty content
             )
 
+    def test_v3_invalid_stable_builtins(self):
+        """Test V3 stable_builtins granularity validation."""
+        from promptrek.core.models import UniversalPromptV3
+
+        with pytest.raises(ValidationError, match="stable_builtins must be one of"):
+            UniversalPromptV3(
+                schema_version="3.0.0",
+                metadata=PromptMetadata(title="Test", description="Test"),
+                content="# Test",
+                stable_builtins="week",
+            )
+
     def test_schema_version_invalid_format(self):
         """Test schema version with invalid format."""
         from promptrek.core.models import UniversalPromptV2
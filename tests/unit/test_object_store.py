@@ -0,0 +1,158 @@
+"""Tests for the content-addressed output store."""
+
+import hashlib
+import os
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from promptrek.cli.main import cli
+from promptrek.utils.object_store import ObjectStore
+from promptrek.utils.outputs import write_generated_file
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a store linking files into place."""
+    return ObjectStore(tmp_path / ".promptrek" / "objects", "hardlink")
+
+
+class TestObjectStore:
+    """Test storing and materializing generated files."""
+
+    def test_identical_content_stored_once(self, store, tmp_path):
+        """Test that identical files in several directories share one object."""
+        first = tmp_path / "a" / ".cursor" / "rules" / "index.mdc"
+        second = tmp_path / "b" / ".cursor" / "rules" / "index.mdc"
+
+        assert store.materialize(first, "# Rules\n")
+        assert store.materialize(second, "# Rules\n")
+
+        objects = list(store.root.glob("*/*"))
+        assert len(objects) == 1
+        assert os.path.samefile(first, objects[0])
+        assert os.path.samefile(second, objects[0])
+        assert not objects[0].stat().st_mode & 0o222  # Read-only
+        assert store.counts == {"hardlink": 2}
+
+    def test_unchanged_and_changed_files(self, store, tmp_path):
+        """Test that linked files are unchanged and new content is re-linked."""
+        path = tmp_path / "CLAUDE.md"
+        store.materialize(path, "v1")
+        assert store.materialize(path, "v1") is False
+
+        assert store.materialize(path, "v2") is True
+        assert path.read_text() == "v2"
+        # The previous object is left intact
+        old = store.object_path(hashlib.sha256(b"v1").hexdigest())
+        assert old.read_text() == "v1"
+
+    def test_existing_copy_is_linked(self, store, tmp_path):
+        """Test that a file with the same content is replaced by a link."""
+        path = tmp_path / "AGENTS.md"
+        path.write_text("# Agents\n")
+        assert store.materialize(path, "# Agents\n") is True
+        assert path.stat().st_nlink == 2
+
+    def test_reflink_mode_falls_back_to_copy(self, tmp_path):
+        """Test that reflinks produce independent, writable files."""
+        store = ObjectStore(tmp_path / "objects", "reflink")
+        path = tmp_path / "rules.md"
+
+        assert store.materialize(path, "# Rules\n")
+        assert store.materialize(path, "# Rules\n") is False
+        assert path.stat().st_nlink == 1
+        assert os.access(path, os.W_OK)
+        assert set(store.counts) <= {"reflink", "copy"}
+
+    def test_plain_write_does_not_write_through_link(self, store, tmp_path):
+        """Test that a later write without the store breaks the link."""
+        path = tmp_path / "CLAUDE.md"
+        store.materialize(path, "stored")
+        (source,) = store.root.glob("*/*")
+
+        assert write_generated_file(path, "edited")
+        assert path.read_text() == "edited"
+        assert source.read_text() == "stored"
+
+    def test_store_is_gitignored(self, store, tmp_path):
+        """Test that the store keeps its objects out of git."""
+        store.materialize(tmp_path / "CLAUDE.md", "stored")
+        assert (store.root / ".gitignore").read_text() == "*\n"
+
+    def test_collect_removes_unused_objects(self, store, tmp_path):
+        """Test that only objects nothing links to or references are removed."""
+        linked, copied = tmp_path / "CLAUDE.md", tmp_path / "AGENTS.md"
+        store.materialize(linked, "v1")
+        store.materialize(linked, "v2")
+        store.materialize(copied, "copy")
+        copied.unlink()
+        copied.write_text("copy")  # Replaced by a copy (as with reflinks)
+
+        later = ObjectStore(store.root, "hardlink")
+        copy_digest = hashlib.sha256(b"copy").hexdigest()
+        assert later.collect({copy_digest}) == 1
+
+        assert not store.object_path(hashlib.sha256(b"v1").hexdigest()).exists()
+        assert os.path.samefile(
+            linked, store.object_path(hashlib.sha256(b"v2").hexdigest())
+        )
+        assert store.object_path(copy_digest).exists()
+        assert (store.root / ".gitignore").exists()
+
+        # Objects used by the collecting run are kept as well
+        assert store.collect() == 0
+        assert later.collect() == 1
+
+    def test_invalid_mode(self, tmp_path):
+        """Test that unknown link modes are rejected."""
+        with pytest.raises(ValueError):
+            ObjectStore(tmp_path, "symlink")
+
+
+class TestGenerateObjectStore:
+    """Test generate --object-store."""
+
+    def test_generate_links_outputs(self, tmp_path, monkeypatch):
+        """Test that generated files are materialized from the store."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "project.promptrek.yaml").write_text(
+            "schema_version: 3.0.0\n"
+            "metadata:\n  title: Store\n  description: Store project\n"
+            "content: |\n  # Guidelines\n"
+        )
+        runner = CliRunner()
+        args = ["generate", "-e", "claude", "--object-store", "hardlink"]
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        claude = tmp_path / ".claude" / "CLAUDE.md"
+        assert claude.stat().st_nlink == 2
+
+        inode = claude.stat().st_ino
+        assert runner.invoke(cli, args).exit_code == 0
+        assert claude.stat().st_ino == inode
+
+    def test_generate_collects_unused_objects(self, tmp_path, monkeypatch):
+        """Test that objects of content no longer generated are removed."""
+        monkeypatch.chdir(tmp_path)
+        upf = tmp_path / "project.promptrek.yaml"
+        upf.write_text(
+            "schema_version: 3.0.0\n"
+            "metadata:\n  title: Store\n  description: Store project\n"
+            "content: |\n  # Guidelines\n"
+        )
+        runner = CliRunner()
+        args = ["generate", "-e", "claude", "--object-store", "reflink"]
+        assert runner.invoke(cli, args).exit_code == 0
+        objects = set(Path(".promptrek/objects").glob("*/*"))
+
+        assert runner.invoke(cli, args).exit_code == 0
+        assert set(Path(".promptrek/objects").glob("*/*")) == objects
+
+        upf.write_text(upf.read_text().replace("Guidelines", "Rules"))
+        assert runner.invoke(cli, args).exit_code == 0
+        remaining = set(Path(".promptrek/objects").glob("*/*"))
+        assert len(remaining) == len(objects)
+        assert remaining != objects
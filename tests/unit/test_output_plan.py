@@ -0,0 +1,132 @@
+"""Tests for planning and executing generated writes."""
+
+import json
+
+import pytest
+
+from promptrek.core.exceptions import OutputConflictError
+from promptrek.utils.output_plan import MERGE, REPLACE, OutputPlan
+from promptrek.utils.outputs import (
+    remove_directory,
+    update_generated_file,
+    virtual_output,
+    write_generated_file,
+)
+
+
+def render(write):
+    """Render writes into memory, as the plan phase of generate does."""
+    with virtual_output() as output:
+        write()
+    return output
+
+
+def merge_servers(name):
+    """Get an update adding an MCP server to a JSON configuration."""
+
+    def update(existing):
+        config = json.loads(existing) if existing else {"mcpServers": {}}
+        config["mcpServers"][name] = {"command": name}
+        return json.dumps(config)
+
+    return update
+
+
+class TestOutputPlan:
+    """Test conflict detection and execution of output plans."""
+
+    def test_identical_writes_are_deduplicated(self, tmp_path):
+        """Test that the same content planned twice is written once."""
+        target = tmp_path / "AGENTS.md"
+        plan = OutputPlan()
+        plan.add("cursor", render(lambda: write_generated_file(target, "same")))
+        plan.add("agents", render(lambda: write_generated_file(target, "same")))
+
+        assert plan.execute() == 1
+        assert plan.writes[target].policy == REPLACE
+        assert plan.writes[target].editors == ["cursor", "agents"]
+        assert target.read_text() == "same"
+
+    def test_conflicting_writes_write_nothing(self, tmp_path):
+        """Test that different content for one file aborts before writing."""
+        shared = tmp_path / "AGENTS.md"
+        other = tmp_path / "rules" / "index.mdc"
+
+        def cursor():
+            write_generated_file(other, "rules")
+            write_generated_file(shared, "cursor")
+
+        plan = OutputPlan()
+        plan.add("cursor", render(cursor))
+        plan.add("agents", render(lambda: write_generated_file(shared, "agents")))
+
+        with pytest.raises(OutputConflictError, match="AGENTS.md: cursor, agents"):
+            plan.execute()
+        assert not shared.exists()
+        assert not other.parent.exists()
+
+    def test_merges_compose_across_editors(self, tmp_path):
+        """Test that merge updates of several editors are all applied."""
+        target = tmp_path / ".vscode" / "mcp.json"
+        plan = OutputPlan()
+        plan.add("a", render(lambda: update_generated_file(target, merge_servers("a"))))
+        plan.add("b", render(lambda: update_generated_file(target, merge_servers("b"))))
+        # Written by someone else after planning
+        target.parent.mkdir()
+        target.write_text(json.dumps({"mcpServers": {"user": {}}}))
+
+        plan.execute()
+
+        assert plan.writes[target].policy == MERGE
+        servers = json.loads(target.read_text())["mcpServers"]
+        assert sorted(servers) == ["a", "b", "user"]
+        assert json.loads(plan.writes[target].content)["mcpServers"] == servers
+
+    def test_replace_then_merge_is_not_a_conflict(self, tmp_path):
+        """Test that a merge applies on top of a file written in full."""
+        target = tmp_path / "mcp.json"
+        plan = OutputPlan()
+        plan.add(
+            "a",
+            render(lambda: write_generated_file(target, '{"mcpServers": {}}')),
+        )
+        plan.add("b", render(lambda: update_generated_file(target, merge_servers("b"))))
+
+        plan.execute()
+
+        assert json.loads(target.read_text()) == {"mcpServers": {"b": {"command": "b"}}}
+
+    def test_directory_removed_only_when_executed(self, tmp_path):
+        """Test that a directory replaced by a file survives a conflict."""
+        target = tmp_path / ".clinerules"
+        (target / "rules.md").parent.mkdir()
+        (target / "rules.md").write_text("keep")
+        shared = tmp_path / "AGENTS.md"
+
+        def cline():
+            remove_directory(target)
+            write_generated_file(target, "rules")
+            write_generated_file(shared, "cline")
+
+        plan = OutputPlan()
+        plan.add("cline", render(cline))
+        plan.add("agents", render(lambda: write_generated_file(shared, "agents")))
+
+        with pytest.raises(OutputConflictError):
+            plan.execute()
+        assert (target / "rules.md").read_text() == "keep"
+
+        plan = OutputPlan()
+        plan.add("cline", render(cline))
+        plan.execute()
+        assert target.read_text() == "rules"
+
+    def test_unchanged_files_are_not_rewritten(self, tmp_path):
+        """Test that executing a plan skips files already up to date."""
+        target = tmp_path / "CLAUDE.md"
+        target.write_text("content")
+        plan = OutputPlan()
+        plan.add("claude", render(lambda: write_generated_file(target, "content")))
+
+        assert plan.execute() == 0
+        assert plan.writes[target].written is False
@@ -0,0 +1,64 @@
+"""Tests for generated output utilities."""
+
+from promptrek.utils.outputs import (
+    content_digest,
+    record_outputs,
+    write_generated_file,
+)
+
+
+class TestWriteGeneratedFile:
+    """Test write_generated_file function."""
+
+    def test_creates_missing_parent_directories(self, tmp_path):
+        """Test that missing parent directories are created."""
+        target = tmp_path / "a" / "b" / "file.md"
+
+        assert write_generated_file(target, "hello") is True
+        assert target.read_text(encoding="utf-8") == "hello"
+
+    def test_skips_unchanged_content(self, tmp_path):
+        """Test that identical content is not rewritten."""
+        target = tmp_path / "file.md"
+        write_generated_file(target, "hello")
+        mtime = target.stat().st_mtime_ns
+
+        assert write_generated_file(target, "hello") is False
+        assert target.stat().st_mtime_ns == mtime
+
+    def test_rewrites_changed_content(self, tmp_path):
+        """Test that changed content is written."""
+        target = tmp_path / "file.md"
+        write_generated_file(target, "hello")
+
+        assert write_generated_file(target, "world") is True
+        assert target.read_text(encoding="utf-8") == "world"
+
+
+class TestRecordOutputs:
+    """Test record_outputs context manager."""
+
+    def test_records_written_and_unchanged_files(self, tmp_path):
+        """Test that every output is recorded, even when not rewritten."""
+        first = tmp_path / "first.md"
+        first.write_text("same", encoding="utf-8")
+        second = tmp_path / "second.md"
+
+        with record_outputs() as recorded:
+            write_generated_file(first, "same")
+            write_generated_file(second, "new")
+
+        assert recorded == {first: "same", second: "new"}
+
+    def test_no_recording_outside_context(self, tmp_path):
+        """Test that writes outside the context are not recorded."""
+        with record_outputs() as recorded:
+            pass
+        write_generated_file(tmp_path / "file.md", "content")
+
+        assert recorded == {}
+
+    def test_content_digest_is_stable(self):
+        """Test that content digests are deterministic."""
+        assert content_digest("abc") == content_digest("abc")
+        assert content_digest("abc") != content_digest("abd")
@@ -208,6 +208,34 @@ class TestUPFParser:
         with pytest.raises(UPFParsingError, match="No .promptrek.yaml files found"):
             parser.parse_directory(tmp_path)
 
+    def test_parse_directory_many_fragments(self, tmp_path):
+        """Test merging many fragments in order in a single pass."""
+        for i in range(50):
+            data = {
+                "schema_version": "1.0.0",
+                "metadata": {"title": f"Fragment {i}", "description": "Part"},
+                "context": {"technologies": ["python", f"lib{i % 5}"]},
+                "instructions": {"general": [f"Rule {i}"]},
+                "variables": {"LAST": str(i), f"VAR_{i}": "set"},
+                "conditions": [
+                    {"if": f"EDITOR == 'cursor{i}'", "then": {"general": ["x"]}}
+                ],
+                "targets": ["claude", "cursor"] if i % 2 else ["cursor"],
+            }
+            (tmp_path / f"part{i:03d}.promptrek.yaml").write_text(yaml.dump(data))
+
+        merged = UPFParser().parse_directory(tmp_path)
+
+        assert merged.metadata.title == "Fragment 49"
+        assert merged.instructions.general == [f"Rule {i}" for i in range(50)]
+        assert merged.context.technologies == ["python"] + [f"lib{i}" for i in range(5)]
+        assert merged.variables["LAST"] == "49"
+        assert len(merged.variables) == 51
+        assert [c.if_condition for c in merged.conditions] == [
+            f"EDITOR == 'cursor{i}'" for i in range(50)
+        ]
+        assert merged.targets == ["cursor", "claude"]
+
     def test_merge_prompts_complex(self):
         """Test complex prompt merging scenarios."""
         from promptrek.core.models import UniversalPrompt
@@ -0,0 +1,96 @@
+"""Tests for the repository scan behind Cursor ignore files."""
+
+import subprocess
+
+import pytest
+
+from promptrek.core.models import RepositoryScanConfig
+from promptrek.utils import repo_scan
+from promptrek.utils.repo_scan import (
+    CACHE_FILE,
+    list_repository_files,
+    scan_repository,
+)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with vendored, generated, large and binary files."""
+    files = {
+        "src/app.py": b"print('app')\n",
+        "vendor/lib/lib.py": b"vendored\n",
+        "web/dist/bundle.js": b"bundle\n",
+        "web/app.min.js": b"minified\n",
+        "data/dump.sql": b"x" * 5000,
+        "assets/logo.png": b"\x89PNG",
+        "assets/model.bin": b"\x00\x01\x02",
+        "ignored/secret.txt": b"secret\n",
+        ".gitignore": b"ignored/\n",
+    }
+    files.update({f"fixtures/case{i}.json": b"{}" for i in range(6)})
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    return tmp_path
+
+
+def scan(root, write_cache=True):
+    """Scan with small thresholds."""
+    config = RepositoryScanConfig(max_file_size=4000, max_directory_files=5)
+    return scan_repository(root, config, write_cache=write_cache)
+
+
+class TestScanRepository:
+    """Test classification of repository paths."""
+
+    def test_classifies_paths(self, repo):
+        """Test that each kind of path ends up in the right ignore file."""
+        result = scan(repo)
+
+        assert result.ignore == {
+            "Vendored code": ["/vendor/"],
+            "Generated files": ["/web/app.min.js", "/web/dist/"],
+            "Files over the size limit": ["/data/dump.sql"],
+        }
+        assert result.indexing_ignore == {
+            "Binary files": ["*.png", "/assets/model.bin"],
+            "Directories with many files": ["/fixtures/"],
+        }
+
+    def test_honors_gitignore(self, repo):
+        """Test that gitignored files are not scanned, with or without git."""
+        assert "ignored/secret.txt" not in list_repository_files(repo)
+
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        names = list_repository_files(repo)
+        assert "ignored/secret.txt" not in names
+        assert "src/app.py" in names
+
+    def test_cache_avoids_reading_unchanged_files(self, repo):
+        """Test that only new or changed files are read on later scans."""
+        first = scan(repo)
+        assert first.sniffed > 0
+        assert (repo / CACHE_FILE).exists()
+        assert (repo / CACHE_FILE).parent.joinpath(".gitignore").read_text() == "*\n"
+
+        assert scan(repo).sniffed == 0
+
+        (repo / "src" / "app.py").write_bytes(b"changed\0binary")
+        second = scan(repo)
+        assert second.sniffed == 1
+        assert "/src/app.py" in second.indexing_ignore["Binary files"]
+
+    def test_no_cache_written_when_disabled(self, repo):
+        """Test that a scan can leave the tree untouched."""
+        scan(repo, write_cache=False)
+        assert not (repo / CACHE_FILE).exists()
+
+    def test_binary_files_option(self, repo):
+        """Test that binary files can be left to indexing."""
+        config = RepositoryScanConfig(binary_files=False)
+        result = scan_repository(repo, config)
+        assert result.indexing_ignore["Binary files"] == []
+        assert repo_scan.ScanResult.format_sections(result.ignore)[0] == (
+            "# Vendored code (repository scan)"
+        )
@@ -0,0 +1,120 @@
+"""Tests for splitting oversized rule files."""
+
+from pathlib import Path
+
+import pytest
+
+from promptrek.utils.splitter import (
+    _fits,
+    group_part_files,
+    join_parts,
+    part_path,
+    split_content,
+    split_markdown,
+)
+
+DOCUMENT = """---
+description: Testing guidelines
+alwaysApply: false
+---
+# Testing
+
+Write tests for every change.
+
+## Unit tests
+
+- Keep them fast
+- Mock external services
+
+## Fixtures
+
+```python
+@pytest.fixture
+def project(tmp_path):
+    return tmp_path
+```
+
+## Coverage
+
+Aim for high coverage of core modules.
+"""
+
+
+class TestSplitContent:
+    """Test splitting of file content."""
+
+    def test_content_within_limits_is_unchanged(self):
+        """Test that content within the limits is one part."""
+        assert split_content(DOCUMENT) == [DOCUMENT]
+        assert split_content(DOCUMENT, max_chars=len(DOCUMENT)) == [DOCUMENT]
+
+    def test_splits_at_headings_with_frontmatter(self):
+        """Test that parts start at headings and repeat the frontmatter."""
+        parts = split_content(DOCUMENT, max_chars=160)
+
+        assert len(parts) > 1
+        for part in parts:
+            assert len(part) <= 160
+            assert part.startswith("---\ndescription: Testing guidelines\n")
+            body = part.split("---\n", 2)[2]
+            assert body.startswith("#")
+        # The code block is kept whole
+        assert any("```python" in part and "return tmp_path" in part for part in parts)
+
+    def test_line_limit(self):
+        """Test that parts respect a line limit."""
+        parts = split_content(DOCUMENT, max_lines=12)
+        assert len(parts) > 1
+        assert all(part.count("\n") <= 12 for part in parts)
+
+    @pytest.mark.parametrize("frontmatter", ["", "---\ndescription: Rules\n---\n"])
+    def test_parts_fit_with_trailing_newline(self, frontmatter):
+        """Test that the trailing newline counts towards each part's limits."""
+        content = frontmatter + "\n\n".join("x" * 2999 for _ in range(3)) + "\n"
+
+        lines = 3 + frontmatter.count("\n")
+        for max_chars, max_lines in [(6000, None), (None, lines), (6000, lines)]:
+            parts = split_content(content, max_chars=max_chars, max_lines=max_lines)
+
+            assert len(parts) > 1
+            assert all(_fits(part, max_chars, max_lines) for part in parts)
+
+    def test_heading_stays_with_its_content(self):
+        """Test that a section is split between paragraphs, not after its heading."""
+        body = "## Rules\n\n" + "\n\n".join(f"Rule number {n}." for n in range(6))
+        parts = split_markdown(body, max_chars=60)
+
+        assert parts[0].startswith("## Rules\n\nRule number 0.")
+        assert "\n\n".join(parts) == body
+
+
+class TestPartFiles:
+    """Test naming, grouping and joining of part files."""
+
+    def test_part_path(self):
+        """Test that parts are numbered before the suffix."""
+        path = Path(".windsurf/rules/testing.md")
+        assert part_path(path, 2) == Path(".windsurf/rules/testing-part-2.md")
+
+    def test_group_part_files(self):
+        """Test that complete part sequences are grouped in order."""
+        files = [
+            Path("rules/testing-part-2.md"),
+            Path("rules/general.md"),
+            Path("rules/testing-part-1.md"),
+            Path("rules/notes-part-2.md"),
+        ]
+        assert group_part_files(files) == [
+            ("general", [Path("rules/general.md")]),
+            ("notes-part-2", [Path("rules/notes-part-2.md")]),
+            (
+                "testing",
+                [Path("rules/testing-part-1.md"), Path("rules/testing-part-2.md")],
+            ),
+        ]
+
+    def test_join_parts_round_trip(self):
+        """Test that joining the parts gives back the document."""
+        parts = split_content(DOCUMENT, max_chars=160)
+        assert join_parts(parts) == DOCUMENT
+        assert join_parts([DOCUMENT]) == DOCUMENT
@@ -500,3 +500,241 @@ This is a test project with multiple lines.
         # Also verify it can be parsed back correctly
         parsed_data = yaml.safe_load(yaml_content)
         assert parsed_data["content"] == content
+
+
+class TestSyncAllCommand:
+    """Test sync --all across several editors."""
+
+    UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Sync Test
+  description: Sync from all editors
+content: |
+  # Guidelines
+
+  Use {{{ LANG }}} everywhere.
+variables:
+  LANG: Python
+"""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """Create a project with generated claude, copilot and cursor files."""
+        from promptrek.api import generate
+
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "project.promptrek.yaml"
+        source.write_text(self.UPF_CONTENT)
+        files = generate(source, ["claude", "copilot", "cursor"], output_dir=tmp_path)
+        for path, content in files.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        return tmp_path
+
+    def _ctx(self):
+        ctx = MagicMock()
+        ctx.obj = {"verbose": False}
+        return ctx
+
+    def test_detects_editors_with_files(self, project):
+        """Test that only editors with files present are synced."""
+        from promptrek.cli.commands.sync import _detect_sync_editors
+
+        editors = _detect_sync_editors(project)
+
+        assert {"claude", "copilot", "cursor"} <= set(editors)
+        assert "windsurf" not in editors
+
+    def test_edit_in_one_editor_is_kept(self, project):
+        """Test that unchanged editors don't revert another editor's edit."""
+        from promptrek.cli.commands.sync import sync_all_command
+
+        copilot = project / ".github" / "copilot-instructions.md"
+        copilot.write_text(copilot.read_text() + "\nAlways add tests.\n")
+        output = project / "project.promptrek.yaml"
+
+        with patch(
+            "promptrek.cli.commands.sync._write_prompt_file",
+            wraps=_write_prompt_file,
+        ) as write:
+            sync_all_command(self._ctx(), project, output, False, True)
+
+        assert write.call_count == 1
+        data = yaml.safe_load(output.read_text())
+        assert "Always add tests." in data["content"]
+        assert "{{{ LANG }}}" in data["content"]
+
+    def test_unchanged_editors_are_skipped(self, tmp_path, monkeypatch, capsys):
+        """Test that editors whose files still match the prompt are skipped."""
+        from promptrek.api import generate
+        from promptrek.cli.commands.sync import sync_all_command
+
+        # Claude and Copilot files hold no documents, which must not count
+        # as removing the prompt's documents
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "project.promptrek.yaml"
+        source.write_text(
+            self.UPF_CONTENT
+            + "documents:\n  - name: testing\n    content: |\n"
+            + "      Write tests in {{{ LANG }}}.\n"
+        )
+        files = generate(source, ["claude", "copilot"], output_dir=tmp_path)
+        for path, content in files.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+        ctx = self._ctx()
+        ctx.obj["verbose"] = True
+
+        sync_all_command(ctx, tmp_path, source, False, True, full=True)
+
+        output = capsys.readouterr().out
+        assert "claude: no changes" in output
+        assert "copilot: no changes" in output
+        assert "Synced no configuration" in output
+
+    def test_variables_evaluated_once(self, project):
+        """Test that variables are loaded once for all editors."""
+        from promptrek.cli.commands.sync import sync_all_command
+        from promptrek.utils.variables import VariableSubstitution
+
+        with patch.object(
+            VariableSubstitution,
+            "load_and_evaluate_variables",
+            autospec=True,
+            return_value={"LANG": "Python"},
+        ) as load:
+            sync_all_command(
+                self._ctx(), project, project / "project.promptrek.yaml", False, True
+            )
+
+        assert load.call_count == 1
+
+    def test_no_editor_files(self, tmp_path):
+        """Test error when no editor files exist."""
+        from promptrek.cli.commands.sync import sync_all_command
+
+        with pytest.raises(PrompTrekError, match="No editor files found"):
+            sync_all_command(self._ctx(), tmp_path, None, True, True)
+
+    def test_cli_requires_editor_or_all(self, tmp_path):
+        """Test that sync needs --editor or --all."""
+        from click.testing import CliRunner
+
+        from promptrek.cli.main import cli
+
+        result = CliRunner().invoke(cli, ["sync", "--source-dir", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Must specify either --editor or --all" in result.output
+
+
+class TestIncrementalSync:
+    """Test change-aware sync using generation hashes."""
+
+    UPF_CONTENT = """schema_version: 3.0.0
+metadata:
+  title: Incremental
+  description: Incremental sync
+content: |
+  # Guidelines
+documents:
+  - name: api
+    content: "# API\\n- Use REST"
+  - name: web
+    content: "# Web\\n- Use React"
+"""
+
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """Generate windsurf files with recorded output hashes."""
+        from click.testing import CliRunner
+
+        from promptrek.cli.main import cli
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "project.promptrek.yaml").write_text(self.UPF_CONTENT)
+        result = CliRunner().invoke(cli, ["generate", "-e", "windsurf"])
+        assert result.exit_code == 0, result.output
+        return tmp_path
+
+    def _sync(self, *extra):
+        from click.testing import CliRunner
+
+        from promptrek.cli.main import cli
+
+        return CliRunner().invoke(cli, ["sync", "-e", "windsurf", "-f", *extra])
+
+    def test_unmodified_outputs_are_not_parsed(self, project):
+        """Test that sync is skipped when no generated file was edited."""
+        from promptrek.adapters.windsurf import WindsurfAdapter
+
+        with patch.object(WindsurfAdapter, "parse_files") as parse_files:
+            result = self._sync()
+
+        assert result.exit_code == 0, result.output
+        assert "No windsurf files changed" in result.output
+        parse_files.assert_not_called()
+
+    def test_only_edited_files_are_merged(self, project):
+        """Test that unchanged outputs don't revert edits made to the config."""
+        config = project / "project.promptrek.yaml"
+        config.write_text(config.read_text().replace("Use REST", "Use gRPC"))
+        web = project / ".windsurf" / "rules" / "web.md"
+        web.write_text(web.read_text() + "\n- Use TypeScript\n")
+
+        result = self._sync()
+
+        assert result.exit_code == 0, result.output
+        documents = {
+            doc["name"]: doc["content"]
+            for doc in yaml.safe_load(config.read_text())["documents"]
+        }
+        assert "Use gRPC" in documents["api"]
+        assert "Use TypeScript" in documents["web"]
+
+    def test_full_parses_every_file(self, project):
+        """Test that --full ignores the generation hashes."""
+        from promptrek.adapters.windsurf import WindsurfAdapter
+
+        with patch.object(
+            WindsurfAdapter,
+            "parse_files",
+            autospec=True,
+            side_effect=WindsurfAdapter.parse_files,
+        ) as parse_files:
+            result = self._sync("--full")
+
+        assert result.exit_code == 0, result.output
+        assert parse_files.call_count == 1
+
+    def test_records_of_other_output_directory(self, project):
+        """Test that records are found when generate wrote elsewhere (-o)."""
+        from click.testing import CliRunner
+
+        from promptrek.adapters.windsurf import WindsurfAdapter
+        from promptrek.cli.main import cli
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["generate", "-e", "windsurf", "-o", "out"])
+        assert result.exit_code == 0, result.output
+
+        with patch.object(WindsurfAdapter, "parse_files") as parse_files:
+            result = runner.invoke(
+                cli,
+                ["sync", "-e", "windsurf", "-f", "--source-dir", "out"]
+                + ["-o", "project.promptrek.yaml"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "No windsurf files changed" in result.output
+        parse_files.assert_not_called()
+
+    def test_new_file_is_parsed(self, project):
+        """Test that files not produced by generation count as changed."""
+        (project / ".windsurf" / "rules" / "docs.md").write_text("# Docs\n- Write docs")
+
+        result = self._sync()
+
+        assert result.exit_code == 0, result.output
+        config = yaml.safe_load((project / "project.promptrek.yaml").read_text())
+        assert [doc["name"] for doc in config["documents"]] == ["api", "web", "docs"]
@@ -0,0 +1,30 @@
+"""Tests for local token estimates."""
+
+from promptrek.utils.tokens import estimate_tokens
+
+
+class TestEstimateTokens:
+    """Test the token estimator."""
+
+    def test_empty(self):
+        """Test that empty text has no tokens."""
+        assert estimate_tokens("") == 0
+
+    def test_words_and_punctuation(self):
+        """Test that short words and punctuation are a token each."""
+        assert estimate_tokens("Hello world, this is a test.") == 8
+
+    def test_long_words_and_numbers(self):
+        """Test that long words and numbers split into several tokens."""
+        assert estimate_tokens("internationalization") == 4
+        assert estimate_tokens("1234567") == 3
+
+    def test_markdown_structure(self):
+        """Test that markers, line breaks and indentation are counted."""
+        assert estimate_tokens("## Rules\n\n- one\n    - two") == 8
+        assert estimate_tokens("-" * 40) == 10
+
+    def test_grows_with_content(self):
+        """Test that repeating content scales the estimate."""
+        text = "Use type hints for all public functions.\n"
+        assert estimate_tokens(text * 10) == 10 * estimate_tokens(text)
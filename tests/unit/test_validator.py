@@ -158,6 +158,51 @@ class TestUPFValidator:
         assert result.is_valid is False
         assert any("empty 'if' clause" in error for error in result.errors)
 
+    def test_validate_unquoted_condition_value(self):
+        """Test validation suggests quoting unquoted text with spaces."""
+        from promptrek.core.models import Condition, PromptMetadata, UniversalPrompt
+
+        prompt = UniversalPrompt(
+            schema_version="1.0.0",
+            metadata=PromptMetadata(
+                title="Test", description="Test", version="1.0.0", author="Test"
+            ),
+            targets=["claude"],
+            conditions=[
+                Condition.model_validate(
+                    {"if": "PROJECT_TYPE == web app", "then": {"a": 1}}
+                )
+            ],
+        )
+        result = UPFValidator().validate(prompt)
+
+        assert result.is_valid is True
+        assert any("quote the value" in warning for warning in result.warnings)
+
+    def test_validate_unquoted_value_before_and(self):
+        """Test validation warns when and/or follows an unquoted value."""
+        from promptrek.core.models import Condition, PromptMetadata, UniversalPrompt
+
+        prompt = UniversalPrompt(
+            schema_version="1.0.0",
+            metadata=PromptMetadata(
+                title="Test", description="Test", version="1.0.0", author="Test"
+            ),
+            targets=["claude"],
+            conditions=[
+                Condition.model_validate(
+                    {"if": "TEAM == research and development", "then": {"a": 1}}
+                )
+            ],
+        )
+        result = UPFValidator().validate(prompt)
+
+        assert result.is_valid is True
+        assert any(
+            "compares TEAM with 'research' and then applies 'and'" in warning
+            for warning in result.warnings
+        )
+
     def test_validate_empty_import_path(self):
         """Test validation catches empty import path."""
         from promptrek.core.models import ImportConfig, PromptMetadata, UniversalPrompt
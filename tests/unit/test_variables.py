@@ -121,6 +121,62 @@ class TestVariableSubstitution:
         assert result.metadata.title == "Test My App"
         assert result.metadata.description == "Version 2.0.0"
 
+    def test_substitute_prompt_shares_unchanged_parts(self):
+        """Test that only the path to substituted strings is copied."""
+        vs = VariableSubstitution()
+
+        prompt = UniversalPrompt.model_validate(
+            {
+                "schema_version": "1.0.0",
+                "metadata": {"title": "{{{ NAME }}}", "description": "Plain"},
+                "instructions": {
+                    "general": ["Plain rule"],
+                    "testing": ["Test {{{ NAME }}}"],
+                },
+                "editor_specific": {
+                    "cursor": {"extra_rules": ["Use {{{ NAME }}}"]},
+                    "copilot": {"extra_rules": ["Plain"]},
+                },
+                "conditions": [
+                    {"if": "EDITOR == 'cursor'", "then": {"note": "{{{ NAME }}}"}}
+                ],
+                "variables": {"NAME": "App"},
+            }
+        )
+
+        result = vs.substitute_prompt(prompt)
+
+        assert result.metadata.title == "App"
+        assert result.instructions.testing == ["Test App"]
+        assert result.editor_specific["cursor"].extra_rules == ["Use App"]
+        assert result.conditions[0].then == {"note": "App"}
+        assert result.instructions.general is prompt.instructions.general
+        assert result.editor_specific["copilot"] is prompt.editor_specific["copilot"]
+        # The original prompt is left untouched
+        assert prompt.metadata.title == "{{{ NAME }}}"
+        assert prompt.editor_specific["cursor"].extra_rules == ["Use {{{ NAME }}}"]
+
+    def test_substitute_prompt_without_placeholders(self):
+        """Test that a prompt without placeholders is returned as-is."""
+        vs = VariableSubstitution()
+        prompt = UniversalPrompt(
+            schema_version="1.0.0",
+            metadata=PromptMetadata(title="Plain", description="No variables"),
+        )
+
+        assert vs.substitute_prompt(prompt, {"NAME": "App"}) is prompt
+
+    def test_substitute_prompt_strict_mode(self):
+        """Test that strict mode still reports undefined variables in prompts."""
+        vs = VariableSubstitution()
+        prompt = UniversalPrompt(
+            schema_version="1.0.0",
+            metadata=PromptMetadata(title="{{{ MISSING }}}", description="Test"),
+        )
+
+        with pytest.raises(TemplateError, match="Undefined variable: MISSING"):
+            vs.substitute_prompt(prompt, strict=True)
+
     def test_nested_data_substitution(self):
         """Test substitution in nested data structures."""
         vs = VariableSubstitution()